@@ -180,6 +180,9 @@ ODDS_DISABLED_THRESHOLD = 0.95  # 95% - Only critical calls allowed
 # Enable/disable Smart Frequency Strategy (default: True for production)
 ODDS_SMART_FREQUENCY_ENABLED = os.getenv("ODDS_SMART_FREQUENCY_ENABLED", "true").lower() == "true"
 
+# Leagues fetched concurrently per ingestion run (V1.2); 1 = sequential fetching
+ODDS_FETCH_MAX_WORKERS = int(os.getenv("ODDS_FETCH_MAX_WORKERS", "6"))
+
 # ========================================
 # BACKGROUND SERVICES CONTROL (V1.0)
 # ========================================
@@ -190,6 +193,38 @@ BROWSER_MONITOR_ENABLED = os.getenv("BROWSER_MONITOR_ENABLED", "True").lower() =
 NEWS_RADAR_ENABLED = os.getenv("NEWS_RADAR_ENABLED", "True").lower() == "true"
 HEALTH_MONITOR_ENABLED = os.getenv("HEALTH_MONITOR_ENABLED", "True").lower() == "true"
 
+# News Radar content pipeline (V16.0): max DeepSeek analyses in flight per scan cycle.
+# Prefilter/dedup runs on every extracted page first; Telegram sends stay serialized.
+NEWS_RADAR_ANALYSIS_CONCURRENCY = int(os.getenv("NEWS_RADAR_ANALYSIS_CONCURRENCY", "4"))
+
+# News Radar browser fallback pool (V16.0): Playwright pages used in parallel for URLs
+# that HTTP extraction could not read. Each page gets its own browser context and is
+# closed and replaced after MAX_NAVIGATIONS pages to keep Chromium memory bounded.
+NEWS_RADAR_BROWSER_POOL_SIZE = int(os.getenv("NEWS_RADAR_BROWSER_POOL_SIZE", "3"))
+NEWS_RADAR_BROWSER_PAGE_MAX_NAVIGATIONS = int(
+    os.getenv("NEWS_RADAR_BROWSER_PAGE_MAX_NAVIGATIONS", "20")
+)
+
+# Conditional fetch state (src/utils/fetch_state.py, V1.0): per-URL ETag, Last-Modified
+# and raw-body fingerprint for News Radar and Browser Monitor sources. Unchanged pages
+# (304 or identical bytes) skip extraction and analysis. Kept on disk so validators
+# survive restarts.
+FETCH_STATE_PERSISTENT_ENABLED = (
+    os.getenv("FETCH_STATE_PERSISTENT_ENABLED", "true").lower() == "true"
+)
+FETCH_STATE_PERSISTENT_PATH = os.getenv("FETCH_STATE_PERSISTENT_PATH", "data/cache/fetch_state.db")
+
+# Telegram squad image OCR (src/analysis/ocr_pool.py, V1.0): Tesseract runs in worker
+# processes instead of the Telethon event loop. At most WORKERS + QUEUE_DEPTH images are
+# in flight (extra ones are skipped); TIMEOUT covers queueing and OCR. Results are cached
+# by image content hash so reposted graphics are not OCR'd again.
+OCR_WORKERS = int(os.getenv("OCR_WORKERS", "2"))
+OCR_QUEUE_DEPTH = int(os.getenv("OCR_QUEUE_DEPTH", "8"))
+OCR_TIMEOUT_SECONDS = float(os.getenv("OCR_TIMEOUT_SECONDS", "60"))
+OCR_CROP_TO_TEXT = os.getenv("OCR_CROP_TO_TEXT", "false").lower() == "true"
+OCR_CACHE_MAX_ENTRIES = int(os.getenv("OCR_CACHE_MAX_ENTRIES", "512"))
+OCR_CACHE_TTL_HOURS = float(os.getenv("OCR_CACHE_TTL_HOURS", "48"))
+
 # ========================================
 # CONTRACT VALIDATION CONTROL (V1.0)
 # ========================================
@@ -199,6 +234,44 @@ HEALTH_MONITOR_ENABLED = os.getenv("HEALTH_MONITOR_ENABLED", "True").lower() ==
 
 CONTRACT_VALIDATION_ENABLED = os.getenv("CONTRACT_VALIDATION_ENABLED", "True").lower() == "true"
 
+# ========================================
+# MATCH ANALYSIS SCHEDULER (V15.0)
+# ========================================
+# run_pipeline() analyzes independent matches in parallel (src/core/match_scheduler.py).
+# Matches are started in kickoff order; once the cycle deadline passes, matches that
+# have not started yet are skipped and picked up again by the next cycle.
+# Keep MAX_WORKERS below the SQLAlchemy pool size (5 + 5 overflow): each worker holds a session.
+
+MATCH_ANALYSIS_MAX_WORKERS = int(os.getenv("MATCH_ANALYSIS_MAX_WORKERS", "4"))
+MATCH_ANALYSIS_CYCLE_DEADLINE_SECONDS = int(
+    os.getenv("MATCH_ANALYSIS_CYCLE_DEADLINE_SECONDS", "1500")
+)  # 25 minutes
+
+# Max threads allowed inside each external provider at once (src/utils/provider_limiter.py)
+# FotMob requests are additionally spaced by the global FotMob rate limiter.
+PROVIDER_CONCURRENCY_LIMITS = {
+    "fotmob": int(os.getenv("PROVIDER_LIMIT_FOTMOB", "2")),
+    "search": int(os.getenv("PROVIDER_LIMIT_SEARCH", "3")),
+    "deepseek": int(os.getenv("PROVIDER_LIMIT_DEEPSEEK", "2")),
+    "telegram": int(os.getenv("PROVIDER_LIMIT_TELEGRAM", "1")),
+}
+
+# ========================================
+# FOTMOB SWR CACHE (V15.0)
+# ========================================
+# In-memory FotMob cache (src/utils/smart_cache.py). Least recently used entries are
+# evicted once either bound is reached; MAX_BYTES is an estimate of payload size
+# (0 = entry bound only).
+FOTMOB_SWR_CACHE_MAX_ENTRIES = int(os.getenv("FOTMOB_SWR_CACHE_MAX_ENTRIES", "2000"))
+FOTMOB_SWR_CACHE_MAX_BYTES = int(
+    os.getenv("FOTMOB_SWR_CACHE_MAX_BYTES", str(64 * 1024 * 1024))
+)  # 64 MB
+# On-disk second tier (src/utils/persistent_cache.py): SWR entries survive restarts so a
+# warm start serves cached FotMob data instead of re-fetching at 2s+ per request.
+FOTMOB_SWR_PERSISTENT_ENABLED = os.getenv("FOTMOB_SWR_PERSISTENT_ENABLED", "true").lower() == "true"
+FOTMOB_SWR_PERSISTENT_PATH = os.getenv("FOTMOB_SWR_PERSISTENT_PATH", "data/cache/fotmob_swr.db")
+FOTMOB_SWR_PERSISTENT_MAX_ENTRIES = int(os.getenv("FOTMOB_SWR_PERSISTENT_MAX_ENTRIES", "20000"))
+
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", "")
 BRAVE_API_KEY = os.getenv("BRAVE_API_KEY", "")
 MEDIASTACK_API_KEY = os.getenv("MEDIASTACK_API_KEY", "")
@@ -342,6 +415,21 @@ ANALYSIS_WINDOW_HOURS = 72  # 72h = 3 days (captures weekend fixtures early)
 ALERT_THRESHOLD_HIGH = 8.0  # Min score for alerts (V11.1: Relaxed from 9.0 to 8.0)
 ALERT_THRESHOLD_RADAR = 6.5  # Lower when forced_narrative present (V11.1: Relaxed from 7.5 to 6.5)
 SETTLEMENT_MIN_SCORE = 7.0  # Minimum highest_score_sent to include in settlement
+# Settlement result fetching (V1.1): concurrent FotMob lookups + on-disk store of
+# finished-match results so re-running settlement does not refetch them
+SETTLEMENT_FETCH_MAX_WORKERS = int(os.getenv("SETTLEMENT_FETCH_MAX_WORKERS", "4"))
+SETTLEMENT_RESULT_STORE_ENABLED = (
+    os.getenv("SETTLEMENT_RESULT_STORE_ENABLED", "true").lower() == "true"
+)
+SETTLEMENT_RESULT_STORE_PATH = os.getenv(
+    "SETTLEMENT_RESULT_STORE_PATH", "data/cache/settlement_results.db"
+)
+# Optimizer risk metrics (V15.0): half-life in bets for exponentially decayed
+# Sharpe/Sortino; 0 = plain bounded window (last 100 bets)
+OPTIMIZER_RISK_DECAY_HALFLIFE = float(os.getenv("OPTIMIZER_RISK_DECAY_HALFLIFE", "0"))
+# Optimizer state storage (V15.1): "sqlite" = one row per strategy in the main DB
+# (migrated once from data/optimizer_weights.json), "json" = whole-file rewrites
+OPTIMIZER_STATE_BACKEND = os.getenv("OPTIMIZER_STATE_BACKEND", "sqlite").lower()
 
 # Alpha Hunter V12.1 Configuration (News-Driven Architecture)
 ALPHA_HUNTER_MIN_CONFIDENCE = 0.6  # Minimum confidence threshold for Alpha Hunter signals
@@ -713,6 +801,22 @@ TAVILY_CACHE_TTL_SECONDS = 1800
 # AI responses are more stable than web search results
 DEEPSEEK_CACHE_TTL_SECONDS = 3600
 
+# Shared provider response cache (src/utils/response_cache.py, V1.0): DeepSeek, Tavily,
+# Brave and Perplexity responses under canonical query keys. LRU in memory, plus an
+# on-disk SQLite tier so paid responses survive restarts.
+BRAVE_CACHE_TTL_SECONDS = int(os.getenv("BRAVE_CACHE_TTL_SECONDS", "1800"))
+PERPLEXITY_CACHE_TTL_SECONDS = int(os.getenv("PERPLEXITY_CACHE_TTL_SECONDS", "3600"))
+RESPONSE_CACHE_MEMORY_ENTRIES = int(os.getenv("RESPONSE_CACHE_MEMORY_ENTRIES", "1000"))
+RESPONSE_CACHE_PERSISTENT_ENABLED = (
+    os.getenv("RESPONSE_CACHE_PERSISTENT_ENABLED", "true").lower() == "true"
+)
+RESPONSE_CACHE_PERSISTENT_PATH = os.getenv(
+    "RESPONSE_CACHE_PERSISTENT_PATH", "data/cache/provider_responses.db"
+)
+RESPONSE_CACHE_PERSISTENT_MAX_ENTRIES = int(
+    os.getenv("RESPONSE_CACHE_PERSISTENT_MAX_ENTRIES", "20000")
+)
+
 # Budget allocation per component (calls/month)
 TAVILY_BUDGET_ALLOCATION = {
     "main_pipeline": 2100,  # 30% - Match enrichment
@@ -881,8 +985,34 @@ __all__ = [
     "ALERT_THRESHOLD_HIGH",
     "ALERT_THRESHOLD_RADAR",
     "SETTLEMENT_MIN_SCORE",
+    "SETTLEMENT_FETCH_MAX_WORKERS",
+    "SETTLEMENT_RESULT_STORE_ENABLED",
+    "SETTLEMENT_RESULT_STORE_PATH",
+    "OPTIMIZER_RISK_DECAY_HALFLIFE",
+    "OPTIMIZER_STATE_BACKEND",
     "MATCH_LOOKAHEAD_HOURS",
     "ANALYSIS_WINDOW_HOURS",
+    # Match Analysis Scheduler
+    "MATCH_ANALYSIS_MAX_WORKERS",
+    "MATCH_ANALYSIS_CYCLE_DEADLINE_SECONDS",
+    "PROVIDER_CONCURRENCY_LIMITS",
+    "NEWS_RADAR_ANALYSIS_CONCURRENCY",
+    "NEWS_RADAR_BROWSER_POOL_SIZE",
+    "NEWS_RADAR_BROWSER_PAGE_MAX_NAVIGATIONS",
+    "FETCH_STATE_PERSISTENT_ENABLED",
+    "FETCH_STATE_PERSISTENT_PATH",
+    "OCR_WORKERS",
+    "OCR_QUEUE_DEPTH",
+    "OCR_TIMEOUT_SECONDS",
+    "OCR_CROP_TO_TEXT",
+    "OCR_CACHE_MAX_ENTRIES",
+    "OCR_CACHE_TTL_HOURS",
+    "FOTMOB_SWR_CACHE_MAX_ENTRIES",
+    "FOTMOB_SWR_CACHE_MAX_BYTES",
+    "FOTMOB_SWR_PERSISTENT_ENABLED",
+    "FOTMOB_SWR_PERSISTENT_PATH",
+    "FOTMOB_SWR_PERSISTENT_MAX_ENTRIES",
+    "ODDS_FETCH_MAX_WORKERS",
     # Home Advantage
     "HOME_ADVANTAGE_BY_LEAGUE",
     "DEFAULT_HOME_ADVANTAGE",
@@ -910,6 +1040,12 @@ __all__ = [
     # Providers
     "DEEPSEEK_INTEL_ENABLED",
     "DEEPSEEK_CACHE_TTL_SECONDS",
+    "BRAVE_CACHE_TTL_SECONDS",
+    "PERPLEXITY_CACHE_TTL_SECONDS",
+    "RESPONSE_CACHE_MEMORY_ENTRIES",
+    "RESPONSE_CACHE_PERSISTENT_ENABLED",
+    "RESPONSE_CACHE_PERSISTENT_PATH",
+    "RESPONSE_CACHE_PERSISTENT_MAX_ENTRIES",
     "PERPLEXITY_ENABLED",
     "TAVILY_ENABLED",
     # Tavily Config
@@ -48,6 +48,14 @@ except ImportError:
     logger = logging.getLogger(__name__)
     logger.warning("⚠️ GlobalOrchestrator not available, active leagues count will be 0")
 
+# V12.3: Provider response cache stats (hits, misses, quota saved)
+try:
+    from src.utils.response_cache import peek_response_cache
+
+    _RESPONSE_CACHE_AVAILABLE = True
+except ImportError:
+    _RESPONSE_CACHE_AVAILABLE = False
+
 # Import notifier for sending alerts to Telegram - Recommendation #1 fix
 # Import is optional and will not fail if notifier is not available
 try:
@@ -82,6 +90,7 @@ ORCHESTRATION_METRICS_INTERVAL = 60  # 1 minute
 BUSINESS_METRICS_INTERVAL = 600  # 10 minutes
 LOCK_CONTENTION_METRICS_INTERVAL = 30  # 30 seconds (was 300 - Issue 4 fix)
 LOCK_CONTENTION_STATS_RESET_INTERVAL = 3600  # 1 hour - Issue 2 fix
+RESPONSE_CACHE_METRICS_INTERVAL = 600  # 10 minutes - V12.3
 METRICS_RETENTION_DAYS = int(
     os.getenv("METRICS_RETENTION_DAYS", "7")
 )  # Keep 7 days of metrics - Issue 2 fix
@@ -342,6 +351,7 @@ class OrchestrationMetricsCollector:
         last_orchestration_collection = 0
         last_business_collection = 0
         last_lock_contention_collection = 0
+        last_response_cache_collection = 0
         last_cleanup = 0
 
         while self._running:
@@ -391,6 +401,14 @@ class OrchestrationMetricsCollector:
                 except Exception as e:
                     logger.error(f"❌ Failed to collect lock contention metrics: {e}")
 
+            # Collect provider response cache metrics every 10 minutes - V12.3
+            if now - last_response_cache_collection >= RESPONSE_CACHE_METRICS_INTERVAL:
+                try:
+                    self.record_response_cache_metrics()
+                    last_response_cache_collection = now
+                except Exception as e:
+                    logger.error(f"❌ Failed to collect response cache metrics: {e}")
+
             # Reset lock stats every hour - Issue 2 fix
             if now - self._last_lock_stats_reset >= LOCK_CONTENTION_STATS_RESET_INTERVAL:
                 try:
@@ -842,6 +860,27 @@ class OrchestrationMetricsCollector:
             f"❌ [ORCHESTRATION-METRICS] Cache corruption recorded: {cache_name} - {error}"
         )
 
+    def record_response_cache_metrics(self, stats: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Store provider response cache counters (hits, misses, quota saved per provider).
+
+        V12.3: Added so cache effectiveness on paid APIs (DeepSeek, Tavily, Brave,
+        Perplexity) can be queried alongside the other orchestration metrics.
+
+        Args:
+            stats: ResponseCache.get_stats() output; defaults to the shared cache's
+
+        Returns:
+            True if metrics were stored, False if no cache is active
+        """
+        if stats is None:
+            cache = peek_response_cache() if _RESPONSE_CACHE_AVAILABLE else None
+            if cache is None:
+                return False
+            stats = cache.get_stats()
+        self._store_metrics("response_cache", stats)
+        return True
+
     def _check_system_alerts(self, metrics: SystemMetrics):
         """
         Check system metrics against thresholds and send alerts.
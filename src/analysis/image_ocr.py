@@ -249,12 +249,152 @@ def _is_valid_ocr_text(text: str, channel_info: dict | None = None) -> tuple[boo
     return False, "No intent keywords detected and quality insufficient for permissive pass"
 
 
+# ============================================
+# IMAGE PRE-PROCESSING + OCR (V5.2)
+# ============================================
+# Tesseract languages: Turkish, Italian, Polish, English
+OCR_LANGUAGES = "tur+ita+pol+eng"
+OCR_CONFIG = "--psm 6"  # Assume uniform block of text
+OCR_MIN_WIDTH = 1000  # Smaller images are upscaled (OCR works better on larger text)
+OCR_MAX_WIDTH = 2000  # V5.2: with crop_to_text, larger crops are downscaled
+TEXT_REGION_EDGE_THRESHOLD = 60
+TEXT_REGION_MARGIN = 16
+
+
+def download_image(url: str) -> bytes:
+    """V5.2: Fetch an image body over http(s). Raises requests.HTTPError on non-200."""
+    response = requests.get(url, timeout=10)
+    if response.status_code != 200:
+        raise requests.HTTPError(f"Failed to download image: {response.status_code}")
+    return response.content
+
+
+def load_image(source: str | bytes) -> Image.Image:
+    """
+    V5.2: Open an image from a local path, file:// URL, http(s) URL or raw bytes.
+
+    Raises:
+        FileNotFoundError, requests.RequestException, PIL.UnidentifiedImageError
+    """
+    if isinstance(source, bytes):
+        return Image.open(BytesIO(source))
+    if source.startswith("file://"):
+        source = source[7:]  # Remove 'file://' prefix
+    if source.startswith(("http://", "https://")):
+        return Image.open(BytesIO(download_image(source)))
+    if not os.path.exists(source):
+        raise FileNotFoundError(f"Local file not found: {source}")
+    return Image.open(source)
+
+
+def crop_to_text_region(img: Image.Image) -> Image.Image:
+    """
+    V5.2: Crop a grayscale image to the bounding box of its edges (the text block).
+
+    Lineup graphics are mostly flat background around the text; Tesseract time
+    grows with the pixel count. Images whose edges cover almost everything
+    (photos) are returned unchanged.
+    """
+    width, height = img.size
+    if width < 3 or height < 3:
+        return img
+    # Border pixels are copied unfiltered by FIND_EDGES: leave them out of the bbox
+    edges = img.filter(ImageFilter.FIND_EDGES).crop((1, 1, width - 1, height - 1))
+    bbox = edges.point(lambda p: 255 if p > TEXT_REGION_EDGE_THRESHOLD else 0).getbbox()
+    if not bbox:
+        return img
+    left = max(0, bbox[0] + 1 - TEXT_REGION_MARGIN)
+    top = max(0, bbox[1] + 1 - TEXT_REGION_MARGIN)
+    right = min(width, bbox[2] + 1 + TEXT_REGION_MARGIN)
+    bottom = min(height, bbox[3] + 1 + TEXT_REGION_MARGIN)
+    if (right - left) * (bottom - top) > 0.9 * width * height:
+        return img
+    return img.crop((left, top, right, bottom))
+
+
+def preprocess_for_ocr(img: Image.Image, crop_to_text: bool = False) -> Image.Image:
+    """
+    Pre-process image for better OCR accuracy.
+
+    V5.2: Optional crop to the text region and downscale to OCR_MAX_WIDTH.
+    """
+    # 1. Convert to grayscale
+    img = img.convert("L")
+    if crop_to_text:
+        img = crop_to_text_region(img)
+
+    # 2. Increase contrast
+    enhancer = ImageEnhance.Contrast(img)
+    img = enhancer.enhance(2.0)
+
+    # 3. Sharpen
+    img = img.filter(ImageFilter.SHARPEN)
+
+    # 4. Resize if too small (OCR works better on larger text), or too large when cropping
+    width, height = img.size
+    if width < OCR_MIN_WIDTH:
+        scale = OCR_MIN_WIDTH / width
+        img = img.resize((int(width * scale), int(height * scale)), Image.Resampling.LANCZOS)
+    elif crop_to_text and width > OCR_MAX_WIDTH:
+        scale = OCR_MAX_WIDTH / width
+        img = img.resize((OCR_MAX_WIDTH, int(height * scale)), Image.Resampling.LANCZOS)
+    return img
+
+
+def ocr_image(source: str | bytes, crop_to_text: bool = False, timeout: float = 0) -> str:
+    """
+    V5.2: Load, pre-process and OCR one image. Returns the raw text (stripped, uppercase).
+
+    Module-level so it can run in an OCR worker process (src/analysis/ocr_pool.py).
+
+    Args:
+        source: Local path, file:// or http(s) URL, or raw image bytes
+        crop_to_text: Crop/downscale to the text region before OCR
+        timeout: Seconds before Tesseract is killed (0 = no limit)
+    """
+    img = preprocess_for_ocr(load_image(source), crop_to_text=crop_to_text)
+
+    # Run OCR with multiple languages
+    extracted_text = pytesseract.image_to_string(
+        img, lang=OCR_LANGUAGES, config=OCR_CONFIG, timeout=timeout
+    )
+
+    # Clean and normalize
+    return extracted_text.strip().upper()
+
+
+def validate_ocr_text(text: str, channel_info: dict | None = None) -> str | None:
+    """
+    V5.2: Apply the intent-based validation to raw OCR text.
+
+    Returns:
+        The text if it passes, else None
+    """
+    logging.info(f"📝 OCR Raw: {len(text)} characters")
+    logging.debug(f"OCR Text Preview: {text[:200]}")
+
+    # ============================================
+    # V5.0: INTENT-BASED VALIDATION - Smartly Permissive
+    # ============================================
+    is_valid, reason = _is_valid_ocr_text(text, channel_info)
+
+    if not is_valid:
+        logging.warning(f"🗑️ OCR DISCARDED: {reason}")
+        return None
+
+    logging.info(f"✅ OCR VALID: {reason} ({len(text)} chars)")
+    return text
+
+
 def process_squad_image(image_url: str, channel_info: dict | None = None) -> str | None:
     """
     Download and extract text from squad list image using OCR.
     V5.1: OCR LENGTH FILTER HOTFIX - Golden Keyword Bypass
     V5.0: INTENT-BASED VALIDATION - Shift from "Identity" to "Intent".
 
+    V5.2: Blocking; async callers use ocr_pool.process_squad_image_async(), which
+    runs the same OCR in a worker process and caches results by image hash.
+
     V5.1 Changes (Hotfix):
     - Golden Keyword Bypass: Check for high-value keywords BEFORE length filter
     - Reduced MIN_TEXT_LENGTH from 30 to 20 characters
@@ -278,95 +418,38 @@ def process_squad_image(image_url: str, channel_info: dict | None = None) -> str
     """
     try:
         logging.info(f"📸 Processing squad image: {image_url}")
-
-        # Handle local file paths (file:// protocol)
-        if image_url.startswith("file://"):
-            local_path = image_url[7:]  # Remove 'file://' prefix
-            if not os.path.exists(local_path):
-                logging.error(f"Local file not found: {local_path}")
-                return None
-            img = Image.open(local_path)
-        else:
-            # Download image from URL
-            response = requests.get(image_url, timeout=10)
-            if response.status_code != 200:
-                logging.error(f"Failed to download image: {response.status_code}")
-                return None
-            img = Image.open(BytesIO(response.content))
-
-        # Pre-process image for better OCR accuracy
-        # 1. Convert to grayscale
-        img = img.convert("L")
-
-        # 2. Increase contrast
-        enhancer = ImageEnhance.Contrast(img)
-        img = enhancer.enhance(2.0)
-
-        # 3. Sharpen
-        img = img.filter(ImageFilter.SHARPEN)
-
-        # 4. Resize if too small (OCR works better on larger text)
-        width, height = img.size
-        if width < 1000:
-            scale = 1000 / width
-            img = img.resize((int(width * scale), int(height * scale)), Image.Resampling.LANCZOS)
-
-        # Run OCR with multiple languages
-        # Turkish, Italian, Polish, English
-        extracted_text = pytesseract.image_to_string(
-            img,
-            lang="tur+ita+pol+eng",
-            config="--psm 6",  # Assume uniform block of text
-        )
-
-        # Clean and normalize
-        text = extracted_text.strip().upper()
-
-        logging.info(f"📝 OCR Raw: {len(text)} characters")
-        logging.debug(f"OCR Text Preview: {text[:200]}")
-
-        # ============================================
-        # V5.0: INTENT-BASED VALIDATION - Smartly Permissive
-        # ============================================
-        is_valid, reason = _is_valid_ocr_text(text, channel_info)
-
-        if not is_valid:
-            logging.warning(f"🗑️ OCR DISCARDED: {reason}")
-            return None
-
-        logging.info(f"✅ OCR VALID: {reason} ({len(text)} chars)")
-        return text
-
-    except (FileNotFoundError, IsADirectoryError) as path_err:
-        logging.warning(f"Invalid file path: {path_err}")
-        return None
-
-    except Image.UnidentifiedImageError as img_err:
-        logging.warning(f"Invalid image format: {img_err}")
-        return None
-
-    except requests.Timeout as timeout_err:
-        logging.warning(f"Network timeout downloading image: {timeout_err}")
-        return None
-
-    except requests.ConnectionError as conn_err:
-        logging.warning(f"Network error downloading image: {conn_err}")
-        return None
-
-    except pytesseract.TesseractError as tess_err:
-        logging.error(f"Tesseract OCR error (check language packs): {tess_err}")
+        return validate_ocr_text(ocr_image(image_url), channel_info)
+    except Exception as e:
+        return handle_ocr_error(e)
+
+
+def handle_ocr_error(error: Exception) -> None:
+    """V5.2: Log an OCR failure the way process_squad_image() always has. Returns None."""
+    if isinstance(error, (FileNotFoundError, IsADirectoryError)):
+        logging.warning(f"Invalid file path: {error}")
+    elif isinstance(error, Image.UnidentifiedImageError):
+        logging.warning(f"Invalid image format: {error}")
+    elif isinstance(error, requests.Timeout):
+        logging.warning(f"Network timeout downloading image: {error}")
+    elif isinstance(error, requests.ConnectionError):
+        logging.warning(f"Network error downloading image: {error}")
+    elif isinstance(error, requests.HTTPError):
+        logging.error(str(error))
+    elif isinstance(error, pytesseract.TesseractError):
+        logging.error(f"Tesseract OCR error (check language packs): {error}")
         logging.error(
             "Install missing language packs: sudo apt-get install "
             "tesseract-ocr-tur tesseract-ocr-ita tesseract-ocr-pol"
         )
-        return None
-
-    except Exception as e:
-        logging.error(f"Unexpected error processing squad image: {e}")
+    else:
+        logging.error(f"Unexpected error processing squad image: {error}")
         import traceback
 
-        logging.error(f"Traceback: {traceback.format_exc()}")
-        return None
+        logging.error(
+            "Traceback: "
+            + "".join(traceback.format_exception(type(error), error, error.__traceback__))
+        )
+    return None
 
 
 def extract_player_names(ocr_text: str) -> list:
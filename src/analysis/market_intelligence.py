@@ -25,7 +25,7 @@ from datetime import datetime, timedelta, timezone
 
 logger = logging.getLogger(__name__)
 
-from sqlalchemy import Column, DateTime, Float, Index, Integer, String
+from sqlalchemy import Column, DateTime, Float, Index, Integer, String, insert
 
 from src.database.models import Base, Match, SessionLocal, engine
 
@@ -986,6 +986,59 @@ def save_odds_snapshot(
         db.close()
 
 
+def save_odds_snapshots(snapshots: list[dict], db=None) -> int:
+    """
+    Save many odds snapshots with a single executemany INSERT.
+
+    Bulk counterpart of save_odds_snapshot() used by fixture ingestion.
+
+    Args:
+        snapshots: Dicts with match_id, home/draw/away_odd and optional sharp_* keys
+        db: Optional session; rows join its transaction and the caller commits.
+            Without it a dedicated session is opened and committed.
+
+    Returns:
+        Number of snapshots written
+    """
+    now = datetime.now(timezone.utc)
+    rows = [
+        {
+            "match_id": snap["match_id"],
+            "timestamp": snap.get("timestamp") or now,
+            "home_odd": snap.get("home_odd"),
+            "draw_odd": snap.get("draw_odd"),
+            "away_odd": snap.get("away_odd"),
+            "sharp_home_odd": snap.get("sharp_home_odd"),
+            "sharp_draw_odd": snap.get("sharp_draw_odd"),
+            "sharp_away_odd": snap.get("sharp_away_odd"),
+            "sharp_bookie": snap.get("sharp_bookie"),
+        }
+        for snap in snapshots
+        if snap.get("match_id")
+    ]
+    if not rows:
+        return 0
+
+    if db is not None:
+        db.execute(insert(OddsSnapshot.__table__), rows)
+        return len(rows)
+
+    session = SessionLocal()
+    try:
+        session.execute(insert(OddsSnapshot.__table__), rows)
+        session.commit()
+        return len(rows)
+    except Exception as e:
+        logger.error(f"Failed to save {len(rows)} odds snapshots: {e}")
+        try:
+            session.rollback()
+        except Exception as rollback_error:
+            logger.error(f"❌ Rollback failed: {rollback_error}")
+        return 0
+    finally:
+        session.close()
+
+
 def cleanup_old_snapshots(days_to_keep: int = None) -> int:
     """
     Clean up old odds snapshots to prevent database bloat.
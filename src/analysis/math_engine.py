@@ -16,13 +16,26 @@ V4.3 Enhancements:
 V4.2 Enhancements:
 - Dixon-Coles correction for low-scoring games (0-0, 1-0, 0-1, 1-1)
 - Shrinkage Kelly using confidence intervals
+
+V15.0 Enhancements:
+- Vectorized batch engine (simulate_batch / batch_poisson) built on
+  outer-product PMF matrices for scoring many fixtures in one call
 """
 
 import logging
 import math
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Optional
 
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 # League average goals per team per match (typical European leagues)
@@ -68,6 +81,63 @@ class PoissonResult:
             self.away_win_prob /= total
 
 
+@dataclass
+class BatchPoissonResult:
+    """
+    V15.0: Result of a vectorized Poisson simulation over N fixtures.
+
+    Every field is a NumPy array of length N aligned with the input order.
+    Rows whose inputs were invalid (None, NaN or negative) are flagged in
+    ``valid`` and carry NaN probabilities / -1 scores.
+    """
+
+    home_win_prob: "np.ndarray"
+    draw_prob: "np.ndarray"
+    away_win_prob: "np.ndarray"
+    home_lambda: "np.ndarray"
+    away_lambda: "np.ndarray"
+    most_likely_home_goals: "np.ndarray"
+    most_likely_away_goals: "np.ndarray"
+    over_25_prob: "np.ndarray"
+    under_25_prob: "np.ndarray"
+    btts_prob: "np.ndarray"
+    valid: "np.ndarray"
+
+    def __len__(self) -> int:
+        return len(self.valid)
+
+    def most_likely_scores(self) -> list[str]:
+        """Most likely scorelines formatted like PoissonResult ("H-A"), "" if invalid."""
+        return [
+            f"{h}-{a}" if ok else ""
+            for h, a, ok in zip(
+                self.most_likely_home_goals.tolist(),
+                self.most_likely_away_goals.tolist(),
+                self.valid.tolist(),
+                strict=True,
+            )
+        ]
+
+    def to_result(self, index: int) -> PoissonResult | None:
+        """Build the scalar PoissonResult for one fixture (None if its inputs were invalid)."""
+        if not self.valid[index]:
+            return None
+        return PoissonResult(
+            home_win_prob=float(self.home_win_prob[index]),
+            draw_prob=float(self.draw_prob[index]),
+            away_win_prob=float(self.away_win_prob[index]),
+            home_lambda=float(self.home_lambda[index]),
+            away_lambda=float(self.away_lambda[index]),
+            most_likely_score=(
+                f"{int(self.most_likely_home_goals[index])}-"
+                f"{int(self.most_likely_away_goals[index])}"
+            ),
+            over_25_prob=float(self.over_25_prob[index]),
+            under_25_prob=float(self.under_25_prob[index]),
+            btts_prob=float(self.btts_prob[index]),
+        )
+
+
 @dataclass
 class EdgeResult:
     """
@@ -438,6 +508,136 @@ class MathPredictor:
             btts_prob=btts_prob,
         )
 
+    def simulate_batch(
+        self,
+        home_scored: Sequence[float],
+        home_conceded: Sequence[float],
+        away_scored: Sequence[float],
+        away_conceded: Sequence[float],
+        league_keys: Optional[Sequence[Optional[str]]] = None,
+        max_goals: int = 6,
+        use_dixon_coles: bool = True,
+        apply_home_advantage: bool = True,
+    ) -> BatchPoissonResult:
+        """
+        V15.0: Vectorized equivalent of simulate_match() for N fixtures at once.
+
+        Builds one (N, G, G) scoreline tensor from the outer product of the
+        home and away Poisson PMF vectors (G = max_goals + 1), applies the
+        Dixon-Coles factors to the four low-score cells, and reduces it with
+        precomputed outcome masks. Results match simulate_match() row by row.
+
+        Args:
+            home_scored/home_conceded: Home team avg goals per match (length N)
+            away_scored/away_conceded: Away team avg goals per match (length N)
+            league_keys: Optional per-fixture league keys for league-specific HA.
+                         If None, this predictor's own home advantage is used.
+            max_goals: Maximum goals to simulate per team (default 6)
+            use_dixon_coles: Apply Dixon-Coles correction (default True)
+            apply_home_advantage: Apply league-specific HA (default True)
+
+        Returns:
+            BatchPoissonResult with one entry per fixture
+
+        Raises:
+            ImportError: If NumPy is not installed
+            ValueError: If the input arrays have different lengths
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError("numpy is required for MathPredictor.simulate_batch()")
+
+        stats = np.array([home_scored, home_conceded, away_scored, away_conceded], dtype=np.float64)
+        if stats.ndim != 2:
+            raise ValueError("simulate_batch() expects four 1-D sequences of equal length")
+        n = stats.shape[1]
+        if league_keys is not None and len(league_keys) != n:
+            raise ValueError(f"league_keys has {len(league_keys)} entries, expected {n}")
+
+        # Invalid rows (None -> NaN, negative values) mirror simulate_match() returning None
+        valid = np.all(np.isfinite(stats) & (stats >= 0), axis=0)
+        if not valid.all():
+            invalid = int(n - valid.sum())
+            logger.warning(f"Invalid stats for {invalid}/{n} fixtures in batch Poisson")
+        stats = np.where(valid, stats, 0.0)
+
+        # Strength and expected goals (same formulas as calculate_strength())
+        if self.league_avg > 0:
+            h_att, h_def, a_att, a_def = stats / self.league_avg
+        else:
+            h_att = h_def = a_att = a_def = np.ones(n)
+        home_lambda = h_att * a_def * self.league_avg
+        away_lambda = a_att * h_def * self.league_avg
+
+        if apply_home_advantage:
+            if league_keys is None:
+                home_adv = np.full(n, self.home_advantage)
+            else:
+                ha_by_key: dict = {}
+                for key in league_keys:
+                    if key not in ha_by_key:
+                        ha_by_key[key] = self._get_home_advantage(key)
+                home_adv = np.fromiter(
+                    (ha_by_key[key] for key in league_keys), dtype=np.float64, count=n
+                )
+            home_lambda = home_lambda + np.where(home_adv > 0, home_adv, 0.0)
+
+        home_lambda = np.clip(home_lambda, 0.1, 5.0)
+        away_lambda = np.clip(away_lambda, 0.1, 5.0)
+
+        # PMF vectors P(X=k) for k in 0..max_goals, shape (N, G)
+        goals = np.arange(max_goals + 1)
+        log_fact = np.array([math.lgamma(k + 1) for k in goals])
+        home_pmf = np.exp(goals * np.log(home_lambda)[:, None] - home_lambda[:, None] - log_fact)
+        away_pmf = np.exp(goals * np.log(away_lambda)[:, None] - away_lambda[:, None] - log_fact)
+
+        # Scoreline grid via outer product, shape (N, G, G) indexed [fixture, home, away]
+        grid = home_pmf[:, :, None] * away_pmf[:, None, :]
+
+        if use_dixon_coles and max_goals >= 1:
+            rho = DIXON_COLES_RHO
+            grid[:, 0, 0] *= np.clip(1.0 - home_lambda * away_lambda * rho, 0.01, 2.0)
+            grid[:, 0, 1] *= np.clip(1.0 + home_lambda * rho, 0.01, 2.0)
+            grid[:, 1, 0] *= np.clip(1.0 + away_lambda * rho, 0.01, 2.0)
+            grid[:, 1, 1] *= max(0.01, min(1.0 - rho, 2.0))
+
+        home_goals = goals[:, None]
+        away_goals = goals[None, :]
+        flat = grid.reshape(n, (max_goals + 1) ** 2)
+
+        def _masked_sum(mask) -> "np.ndarray":
+            return flat @ mask.reshape(-1).astype(np.float64)
+
+        home_win = _masked_sum(home_goals > away_goals)
+        draw = _masked_sum(home_goals == away_goals)
+        away_win = _masked_sum(home_goals < away_goals)
+        over_25 = _masked_sum(home_goals + away_goals > 2)
+        under_25 = _masked_sum(home_goals + away_goals <= 2)
+        btts = _masked_sum((home_goals > 0) & (away_goals > 0))
+
+        # Normalize 1X2 like PoissonResult.__post_init__
+        total = home_win + draw + away_win
+        safe_total = np.where(total > 0, total, 1.0)
+        home_win, draw, away_win = home_win / safe_total, draw / safe_total, away_win / safe_total
+
+        # argmax returns the first maximum in row-major order, same tie-break as simulate_match()
+        best = flat.argmax(axis=1) if n else np.zeros(0, dtype=np.int64)
+        best_home, best_away = np.divmod(best, max_goals + 1)
+
+        nan = np.nan
+        return BatchPoissonResult(
+            home_win_prob=np.where(valid, home_win, nan),
+            draw_prob=np.where(valid, draw, nan),
+            away_win_prob=np.where(valid, away_win, nan),
+            home_lambda=np.where(valid, home_lambda, nan),
+            away_lambda=np.where(valid, away_lambda, nan),
+            most_likely_home_goals=np.where(valid, best_home, -1),
+            most_likely_away_goals=np.where(valid, best_away, -1),
+            over_25_prob=np.where(valid, over_25, nan),
+            under_25_prob=np.where(valid, under_25, nan),
+            btts_prob=np.where(valid, btts, nan),
+            valid=valid,
+        )
+
     @staticmethod
     def calculate_edge(
         math_prob: float,
@@ -766,6 +966,24 @@ def quick_poisson(
     return predictor.simulate_match(home_scored, home_conceded, away_scored, away_conceded)
 
 
+def batch_poisson(
+    home_scored: Sequence[float],
+    home_conceded: Sequence[float],
+    away_scored: Sequence[float],
+    away_conceded: Sequence[float],
+    league_keys: Optional[Sequence[Optional[str]]] = None,
+    league_avg: float = DEFAULT_LEAGUE_AVG,
+) -> BatchPoissonResult:
+    """Vectorized Poisson simulation for many fixtures at once.
+
+    V15.0: Batch counterpart of quick_poisson(); league_keys drive per-fixture HA.
+    """
+    predictor = MathPredictor(league_avg=league_avg)
+    return predictor.simulate_batch(
+        home_scored, home_conceded, away_scored, away_conceded, league_keys=league_keys
+    )
+
+
 def calculate_btts_trend(h2h_matches: list) -> dict:
     """
     Calculate BTTS (Both Teams To Score) trend from H2H history.
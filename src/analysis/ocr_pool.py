@@ -0,0 +1,396 @@
+"""
+EarlyBird OCR Worker Pool V1.0
+
+Squad-image OCR off the event loop, with a content-hash result cache.
+
+fetch_squad_images() called process_squad_image() inside the Telethon event
+loop: PIL enhancement, LANCZOS upscaling and a four-language Tesseract pass
+blocked every other coroutine for seconds per photo, and the same lineup
+graphic reposted by several channels was OCR'd every time.
+
+- OcrWorkerPool: ProcessPoolExecutor with a bounded number of images in
+  flight (workers + queue depth; extra images are rejected instead of piling
+  up) and a per-image timeout. Tesseract gets the same timeout, so a stuck
+  OCR is killed instead of holding a worker.
+- OcrResultCache: raw OCR text keyed by a blake2b hash of the image bytes.
+  Forwarded/reposted photos are byte-identical and reuse the text; validation
+  still runs per message, since it depends on the channel. (Perceptual hashes
+  are not used: lineup cards built on the same template hash alike even when
+  the team and player names differ.)
+- process_squad_image_async(): hash + cache lookup in a thread, OCR in the
+  pool, then the same validation as image_ocr.process_squad_image().
+
+Usage:
+    text = await process_squad_image_async(f"file://{path}", channel_info=info)
+    get_ocr_pool().get_stats()
+
+V1.0: Initial implementation
+"""
+
+import asyncio
+import atexit
+import hashlib
+import logging
+import multiprocessing
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
+
+from src.analysis.image_ocr import (
+    download_image,
+    handle_ocr_error,
+    ocr_image,
+    validate_ocr_text,
+)
+
+logger = logging.getLogger(__name__)
+
+try:
+    from config.settings import (
+        OCR_CACHE_MAX_ENTRIES,
+        OCR_CACHE_TTL_HOURS,
+        OCR_CROP_TO_TEXT,
+        OCR_QUEUE_DEPTH,
+        OCR_TIMEOUT_SECONDS,
+        OCR_WORKERS,
+    )
+except ImportError:
+    OCR_WORKERS = 2
+    OCR_QUEUE_DEPTH = 8
+    OCR_TIMEOUT_SECONDS = 60.0
+    OCR_CROP_TO_TEXT = False
+    OCR_CACHE_MAX_ENTRIES = 512
+    OCR_CACHE_TTL_HOURS = 48.0
+
+
+class OcrPoolFullError(RuntimeError):
+    """Raised when workers + queue depth images are already in flight."""
+
+
+# Failures that say nothing about the image: the same photo may OCR fine later
+TRANSIENT_OCR_ERRORS = (OcrPoolFullError, asyncio.TimeoutError, BrokenProcessPool)
+
+
+# ============================================
+# CONTENT HASH
+# ============================================
+
+
+def image_fingerprint(source: str | bytes) -> str:
+    """
+    Hex blake2b digest of the image bytes (local path, file:// URL or raw bytes).
+
+    Only byte-identical images share a fingerprint, so a cached OCR text is
+    never reused for a different image.
+    """
+    if isinstance(source, str):
+        path = source[7:] if source.startswith("file://") else source
+        with open(path, "rb") as f:
+            source = f.read()
+    return hashlib.blake2b(source, digest_size=16).hexdigest()
+
+
+# ============================================
+# RESULT CACHE
+# ============================================
+
+
+class OcrResultCache:
+    """
+    Raw OCR text by image content hash, LRU-bounded with a TTL.
+
+    Thread-safe.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = OCR_CACHE_MAX_ENTRIES,
+        ttl_seconds: float = OCR_CACHE_TTL_HOURS * 3600,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, fingerprint: str) -> str | None:
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(fingerprint)
+            if entry is not None and now - entry[1] > self.ttl_seconds:
+                del self._entries[fingerprint]
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(fingerprint)
+            self._hits += 1
+            return entry[0]
+
+    def put(self, fingerprint: str, text: str) -> None:
+        with self._lock:
+            self._entries[fingerprint] = (text, self._clock())
+            self._entries.move_to_end(fingerprint)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate_percent": round(self._hits / lookups * 100 if lookups else 0.0, 1),
+            }
+
+
+# ============================================
+# WORKER POOL
+# ============================================
+
+
+class OcrWorkerPool:
+    """
+    Bounded executor for OCR jobs.
+
+    Worker processes are started lazily with the "spawn" method (the caller
+    is a threaded process running Telethon). If processes cannot be started,
+    the pool falls back to threads: the event loop stays free either way.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = OCR_WORKERS,
+        queue_depth: int = OCR_QUEUE_DEPTH,
+        timeout_seconds: float = OCR_TIMEOUT_SECONDS,
+        use_processes: bool = True,
+    ):
+        self.max_workers = max(1, max_workers)
+        self.queue_depth = max(0, queue_depth)
+        self.timeout_seconds = timeout_seconds
+        self._use_processes = use_processes
+        self._executor: Executor | None = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._stats = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "timeouts": 0,
+            "rejected": 0,
+            "pool_restarts": 0,
+        }
+        self._ocr_seconds = 0.0
+
+    @property
+    def capacity(self) -> int:
+        return self.max_workers + self.queue_depth
+
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                if self._use_processes:
+                    try:
+                        self._executor = ProcessPoolExecutor(
+                            max_workers=self.max_workers,
+                            mp_context=multiprocessing.get_context("spawn"),
+                        )
+                    except (OSError, NotImplementedError, ValueError) as e:
+                        logger.warning(
+                            f"⚠️ [OCR-POOL] Worker processes unavailable ({e}), using threads"
+                        )
+                        self._use_processes = False
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix="ocr"
+                    )
+            return self._executor
+
+    def _release(self, _future: Any = None) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run fn(*args) in the pool.
+
+        The slot is held until the job really finishes (a timed-out job keeps
+        its worker busy until Tesseract's own timeout kills it).
+
+        Raises:
+            OcrPoolFullError: capacity images already in flight
+            asyncio.TimeoutError: no result within timeout_seconds (queueing included)
+        """
+        with self._lock:
+            if self._in_flight >= self.capacity:
+                self._stats["rejected"] += 1
+                raise OcrPoolFullError(f"{self._in_flight} OCR jobs in flight")
+            self._in_flight += 1
+            self._stats["submitted"] += 1
+
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except Exception:
+            self._release()
+            raise
+        future.add_done_callback(self._release)
+
+        started = time.perf_counter()
+        try:
+            result = await asyncio.wait_for(
+                asyncio.wrap_future(future), timeout=self.timeout_seconds
+            )
+        except asyncio.TimeoutError:
+            with self._lock:
+                self._stats["timeouts"] += 1
+            raise
+        except BrokenProcessPool:
+            self._reset_executor()
+            with self._lock:
+                self._stats["failed"] += 1
+            raise
+        except Exception:
+            with self._lock:
+                self._stats["failed"] += 1
+            raise
+
+        with self._lock:
+            self._stats["completed"] += 1
+            self._ocr_seconds += time.perf_counter() - started
+        return result
+
+    def _reset_executor(self) -> None:
+        """A worker died (e.g. OOM-killed): start a fresh pool on the next job."""
+        with self._lock:
+            broken, self._executor = self._executor, None
+            self._stats["pool_restarts"] += 1
+        if broken is not None:
+            broken.shutdown(wait=False, cancel_futures=True)
+        logger.warning("⚠️ [OCR-POOL] Worker pool broken, restarting")
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            completed = self._stats["completed"]
+            return {
+                **self._stats,
+                "in_flight": self._in_flight,
+                "workers": self.max_workers,
+                "queue_depth": self.queue_depth,
+                "processes": self._use_processes,
+                "avg_seconds": round(self._ocr_seconds / completed, 3) if completed else 0.0,
+            }
+
+
+# ============================================
+# ASYNC ENTRY POINT
+# ============================================
+
+
+async def process_squad_image_async(
+    image_url: str,
+    channel_info: dict | None = None,
+    pool: OcrWorkerPool | None = None,
+    cache: OcrResultCache | None = None,
+    crop_to_text: bool = OCR_CROP_TO_TEXT,
+    raise_transient: bool = False,
+) -> str | None:
+    """
+    Non-blocking process_squad_image(): cached by image content hash, OCR in the worker pool.
+
+    Args:
+        image_url: Squad image (file://, http(s):// or local path)
+        channel_info: Channel metadata for the contextual trust bypass
+        pool: Worker pool (default: shared pool)
+        cache: Result cache (default: shared cache)
+        crop_to_text: Crop/downscale to the text region before OCR
+        raise_transient: Re-raise TRANSIENT_OCR_ERRORS instead of returning None,
+                         for callers that retry the image later
+
+    Returns:
+        Validated OCR text (uppercase), or None if failed/invalid/skipped
+    """
+    pool = pool or get_ocr_pool()
+    cache = cache or get_ocr_cache()
+    try:
+        logger.info(f"📸 Processing squad image: {image_url}")
+        source: str | bytes = image_url
+        if image_url.startswith(("http://", "https://")):
+            # Download once; the worker gets the bytes
+            source = await asyncio.to_thread(download_image, image_url)
+        fingerprint = await asyncio.to_thread(image_fingerprint, source)
+
+        text = cache.get(fingerprint)
+        if text is not None:
+            logger.info(f"♻️ [OCR-CACHE] Reusing OCR of a known image ({fingerprint})")
+        else:
+            text = await pool.run(ocr_image, source, crop_to_text, pool.timeout_seconds)
+            cache.put(fingerprint, text)
+        return validate_ocr_text(text, channel_info)
+
+    except OcrPoolFullError as e:
+        logger.warning(f"⚠️ [OCR-POOL] Skipping {image_url}: {e}")
+        if raise_transient:
+            raise
+        return None
+    except asyncio.TimeoutError:
+        logger.warning(f"⏱️ [OCR-POOL] OCR timed out after {pool.timeout_seconds}s: {image_url}")
+        if raise_transient:
+            raise
+        return None
+    except BrokenProcessPool as e:
+        logger.warning(f"⚠️ [OCR-POOL] Worker died while processing {image_url}: {e!r}")
+        if raise_transient:
+            raise
+        return None
+    except Exception as e:
+        return handle_ocr_error(e)
+
+
+# ============================================
+# SINGLETONS
+# ============================================
+
+_ocr_pool: OcrWorkerPool | None = None
+_ocr_cache: OcrResultCache | None = None
+_singleton_lock = threading.Lock()
+
+
+def get_ocr_pool() -> OcrWorkerPool:
+    """Get the shared OCR worker pool (thread-safe singleton)."""
+    global _ocr_pool
+    if _ocr_pool is None:
+        with _singleton_lock:
+            # Double-checked locking pattern for thread safety
+            if _ocr_pool is None:
+                _ocr_pool = OcrWorkerPool()
+                atexit.register(_ocr_pool.shutdown, False)
+    return _ocr_pool
+
+
+def get_ocr_cache() -> OcrResultCache:
+    """Get the shared OCR result cache (thread-safe singleton)."""
+    global _ocr_cache
+    if _ocr_cache is None:
+        with _singleton_lock:
+            if _ocr_cache is None:
+                _ocr_cache = OcrResultCache()
+    return _ocr_cache
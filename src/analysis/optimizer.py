@@ -31,6 +31,16 @@ from pathlib import Path
 logger = logging.getLogger(__name__)
 
 # Import safe access utilities
+from src.analysis.risk_metrics import RollingRiskMetrics
+from src.database.optimizer_state_model import (
+    SCOPE_DRIVER,
+    SCOPE_EXPANSION,
+    SCOPE_GLOBAL,
+    SCOPE_MARKET,
+    OptimizerStateStore,
+    get_optimizer_state_store,
+    optimizer_state_keys,
+)
 from src.utils.validators import safe_get
 
 # SILENT DROP FIX: Import ALERT_THRESHOLD_HIGH to detect score crushing below threshold
@@ -39,6 +49,12 @@ try:
 except ImportError:
     ALERT_THRESHOLD_HIGH = 8.0  # Fallback to default if import fails (V11.1: Relaxed from 8.5)
 
+try:
+    from config.settings import OPTIMIZER_RISK_DECAY_HALFLIFE, OPTIMIZER_STATE_BACKEND
+except ImportError:
+    OPTIMIZER_RISK_DECAY_HALFLIFE = 0  # Plain bounded window
+    OPTIMIZER_STATE_BACKEND = "json"
+
 # Default weights file path
 WEIGHTS_FILE = "data/optimizer_weights.json"
 
@@ -451,11 +467,29 @@ class StrategyOptimizer:
     }
     """
 
-    def __init__(self, weights_file: str = WEIGHTS_FILE):
+    def __init__(
+        self, weights_file: str = WEIGHTS_FILE, state_store: OptimizerStateStore | None = None
+    ):
+        """
+        Args:
+            weights_file: JSON state file (also the migration source for the SQLite store)
+            state_store: V15.1 SQLite state store; defaults to the shared store for the
+                production weights file when OPTIMIZER_STATE_BACKEND is "sqlite"
+        """
         self.weights_file = weights_file
         self._data_lock = (
             threading.RLock()
         )  # V5.3: Thread safety for data operations (RLock for nested acquisition)
+        # V15.0: Streaming risk metrics per stats entry (rebuilt lazily from the windows)
+        self._risk_metrics: dict[tuple[str, ...], RollingRiskMetrics] = {}
+
+        # V15.1: Row-per-strategy SQLite state; only entries touched since the last
+        # save are written
+        if state_store is None and weights_file == WEIGHTS_FILE:
+            if OPTIMIZER_STATE_BACKEND == "sqlite":
+                state_store = get_optimizer_state_store()
+        self._state_store = state_store
+        self._dirty_keys: set[tuple[str, str, str]] = set()
 
         # V7.3: Use weight cache for performance
         # CRITICAL: Only use cache for default weights file (production)
@@ -471,6 +505,34 @@ class StrategyOptimizer:
         logger.info(f"📊 Optimizer V3.0 initialized with {total_bets} historical bets")
 
     def _load_data(self) -> dict:
+        """
+        Load data from the state store or file, or return empty structure.
+
+        V15.1: With a state store, an empty store is seeded from the JSON file
+        (one-time migration); the file is left in place as a backup.
+        """
+        if self._state_store is None:
+            return self._load_json_data()
+
+        try:
+            data = self._state_store.load()
+            if data is not None:
+                logger.info("✅ Loaded optimizer data from SQLite state store")
+                return data
+
+            data = self._load_json_data()
+            if os.path.exists(self.weights_file):
+                rows = self._state_store.save(data, optimizer_state_keys(data))
+                logger.info(
+                    f"📦 Migrated optimizer data from {self.weights_file} to SQLite ({rows} rows)"
+                )
+            return data
+        except Exception as e:
+            logger.error(f"Optimizer state store unavailable, using {self.weights_file}: {e}")
+            self._state_store = None
+            return self._load_json_data()
+
+    def _load_json_data(self) -> dict:
         """Load data from file or return empty structure."""
         default = {
             "stats": {},
@@ -543,8 +605,12 @@ class StrategyOptimizer:
         V7.3 FIX: Update weight cache after successful save (only for production file).
         V8.1 FIX: Define temp_file before try block to prevent NameError in except cleanup.
         This prevents corruption if process crashes during write.
+        V15.1: With a state store, only the changed rows are upserted instead.
         """
         with self._data_lock:
+            if self._state_store is not None:
+                return self._save_state_rows()
+
             # V8.1 FIX: Define temp_file before try block for cleanup in except
             temp_file = self.weights_file + ".tmp"
 
@@ -554,8 +620,9 @@ class StrategyOptimizer:
 
                 # Atomic write: temp file + rename
 
+                # V15.0: Compact JSON (the per-strategy return windows dominate the size)
                 with open(temp_file, "w") as f:
-                    json.dump(self.data, f, indent=2)
+                    json.dump(self.data, f, separators=(",", ":"))
                     f.flush()
                     os.fsync(f.fileno())  # Force write to disk
 
@@ -579,6 +646,23 @@ class StrategyOptimizer:
                         logger.debug(f"Cleanup temp file fallito: {cleanup_err}")
                 return False
 
+    def _save_state_rows(self) -> bool:
+        """V15.1: Upsert the entries changed since the last save in one transaction."""
+        self.data["last_updated"] = datetime.now(timezone.utc).isoformat()
+        keys = self._dirty_keys | {(SCOPE_GLOBAL, "", SCOPE_GLOBAL)}
+        try:
+            rows = self._state_store.save(self.data, keys)
+        except Exception as e:
+            logger.error(f"Error saving optimizer state: {e}")
+            return False
+
+        self._dirty_keys.clear()
+        global _weight_cache
+        if self.weights_file == WEIGHTS_FILE:
+            _weight_cache.update_data(self.data)
+        logger.info(f"💾 Saved {rows} optimizer state rows")
+        return True
+
     def _normalize_key(self, key: str) -> str:
         """Normalize string to key format."""
         return key.lower().replace(" ", "_").replace("-", "_")
@@ -617,6 +701,40 @@ class StrategyOptimizer:
 
         return stats
 
+    def _update_risk_metrics(
+        self, key: tuple[str, ...], stats: dict, bet_return: float, track_pnl: bool = True
+    ) -> None:
+        """
+        V15.0: Append a bet return and refresh Sharpe/Sortino (and Max Drawdown).
+
+        Replaces recomputing calc_sharpe/calc_sortino/calc_max_drawdown over the
+        whole window on every bet. The RollingRiskMetrics for a stats entry is
+        rebuilt from its stored lists whenever they were replaced (cache reload,
+        tests assigning new data), so self.data stays the source of truth.
+        """
+        returns = stats["returns"]
+        pnl_history = stats["pnl_history"] if track_pnl else None
+        metrics = self._risk_metrics.get(key)
+        if metrics is None or not metrics.is_bound_to(returns, pnl_history):
+            metrics = RollingRiskMetrics(
+                returns,
+                pnl_history,
+                returns_window=MAX_RETURNS_HISTORY,
+                pnl_window=MAX_PNL_HISTORY,
+                decay_halflife=OPTIMIZER_RISK_DECAY_HALFLIFE,
+                decay_state=stats.get("risk_decay"),
+            )
+            self._risk_metrics[key] = metrics
+
+        metrics.add(bet_return)
+        stats["sharpe"] = round(metrics.sharpe(), 3)
+        stats["sortino"] = round(metrics.sortino(), 3)  # V4.2: Sortino Ratio
+        if track_pnl:
+            stats["max_drawdown"] = round(metrics.max_drawdown(), 3)
+        decay_state = metrics.decay_state()
+        if decay_state is not None:
+            stats["risk_decay"] = decay_state
+
     def _ensure_driver_structure(self, driver: str) -> dict:
         """Ensure driver structure exists and return it."""
         if driver not in self.data["drivers"]:
@@ -723,32 +841,19 @@ class StrategyOptimizer:
 
             # Update league/market stats
             stats["bets"] += 1
-            stats["returns"].append(bet_return)
-
-            # Keep returns list manageable (last MAX_RETURNS_HISTORY)
-            if len(stats["returns"]) > MAX_RETURNS_HISTORY:
-                stats["returns"] = stats["returns"][-MAX_RETURNS_HISTORY:]
 
             if outcome == "WIN":
                 stats["wins"] += 1
 
             stats["profit"] += bet_return
 
-            # Update PnL history (cumulative)
-            last_pnl = stats["pnl_history"][-1] if stats["pnl_history"] else 0
-            stats["pnl_history"].append(last_pnl + bet_return)
-
-            # Keep PnL history manageable
-            if len(stats["pnl_history"]) > MAX_PNL_HISTORY:
-                stats["pnl_history"] = stats["pnl_history"][-MAX_PNL_HISTORY:]
-
             # Recalculate metrics
             if stats["bets"] > 0:
                 stats["roi"] = round(stats["profit"] / stats["bets"], 4)
 
-            stats["sharpe"] = round(calc_sharpe(stats["returns"]), 3)
-            stats["sortino"] = round(calc_sortino(stats["returns"]), 3)  # V4.2: Sortino Ratio
-            stats["max_drawdown"] = round(calc_max_drawdown(stats["pnl_history"]), 3)
+            # V15.0: Returns/PnL windows and Sharpe/Sortino/Drawdown updated incrementally
+            self._update_risk_metrics(("stats", league_key, market_type), stats, bet_return)
+            self._dirty_keys.add((SCOPE_MARKET, league_key, market_type))
 
             # V5.0: Get previous weight for WARMING_UP state limiting
             previous_weight = stats.get("weight", NEUTRAL_WEIGHT)
@@ -776,9 +881,6 @@ class StrategyOptimizer:
 
             # Update driver stats
             driver_stats["bets"] += 1
-            driver_stats["returns"].append(bet_return)
-            if len(driver_stats["returns"]) > MAX_RETURNS_HISTORY:
-                driver_stats["returns"] = driver_stats["returns"][-MAX_RETURNS_HISTORY:]
 
             if outcome == "WIN":
                 driver_stats["wins"] += 1
@@ -788,10 +890,10 @@ class StrategyOptimizer:
             if driver_stats["bets"] > 0:
                 driver_stats["roi"] = round(driver_stats["profit"] / driver_stats["bets"], 4)
 
-            driver_stats["sharpe"] = round(calc_sharpe(driver_stats["returns"]), 3)
-            driver_stats["sortino"] = round(
-                calc_sortino(driver_stats["returns"]), 3
-            )  # V4.2: Sortino
+            self._update_risk_metrics(
+                ("drivers", driver), driver_stats, bet_return, track_pnl=False
+            )
+            self._dirty_keys.add((SCOPE_DRIVER, "", driver))
 
             # V8.1 FIX: Driver weights now use calculate_advanced_weight() for consistency
             # This applies the same risk metrics (ROI, Sharpe, Sortino) as league/market weights
@@ -1042,6 +1144,7 @@ class StrategyOptimizer:
                             # Not CLV-validated - reduce weight
                             new_weight = current_weight * 0.8
                             d_stats["weight"] = new_weight
+                            self._dirty_keys.add((SCOPE_DRIVER, "", driver))
                             logger.info(
                                 f"   📉 {driver}: NOT CLV-validated, weight reduced: "
                                 f"{current_weight:.2f} → {new_weight:.2f} "
@@ -1303,29 +1406,16 @@ class StrategyOptimizer:
 
             # Calculate return
             bet_return = odds - 1.0 if outcome == "WIN" else -1.0
-            stats["returns"].append(bet_return)
-
-            # Keep returns manageable
-            if len(stats["returns"]) > MAX_RETURNS_HISTORY:
-                stats["returns"] = stats["returns"][-MAX_RETURNS_HISTORY:]
 
             stats["profit"] += bet_return
 
-            # Update PnL history
-            last_pnl = stats["pnl_history"][-1] if stats["pnl_history"] else 0
-            stats["pnl_history"].append(last_pnl + bet_return)
-
-            if len(stats["pnl_history"]) > MAX_PNL_HISTORY:
-                stats["pnl_history"] = stats["pnl_history"][-MAX_PNL_HISTORY:]
-
             # Recalculate metrics
             if stats["bets"] > 0:
                 stats["roi"] = round(stats["profit"] / stats["bets"], 4)
                 stats["win_rate"] = round(stats["wins"] / stats["bets"], 3)
 
-            stats["sharpe"] = round(calc_sharpe(stats["returns"]), 3)
-            stats["sortino"] = round(calc_sortino(stats["returns"]), 3)
-            stats["max_drawdown"] = round(calc_max_drawdown(stats["pnl_history"]), 3)
+            self._update_risk_metrics(("expansion_stats", expansion_type), stats, bet_return)
+            self._dirty_keys.add((SCOPE_EXPANSION, "", expansion_type))
 
             # Log significant expansion performance
             if stats["bets"] % 10 == 0:  # Every 10 bets
@@ -3,10 +3,22 @@ Referee Statistics Cache
 
 Caches referee statistics to reduce dependency on external providers (Tavily/Perplexity).
 Referee statistics change slowly, so a 7-day TTL is appropriate.
+
+V15.0: The cache is resident in memory. The JSON file is loaded once at startup
+and reloaded only when its mtime/size/inode changes (checked at most every
+RELOAD_CHECK_SECONDS). Writes are write-behind: set() marks the cache dirty and
+a single debounced flush (FLUSH_DELAY_SECONDS) persists all pending changes via
+an atomic temp-file replace; if another process rewrote the file meanwhile, the
+flush re-reads it and overlays only the locally changed entries. Expiry uses
+timestamps parsed once per entry, so get() never touches the disk or re-parses
+dates on the hot path.
 """
 
+import atexit
 import json
 import logging
+import os
+import tempfile
 import threading
 import time
 from datetime import datetime, timedelta, timezone
@@ -22,22 +34,57 @@ CACHE_FILE = CACHE_DIR / "referee_stats.json"
 # TTL: 7 days (referee stats change slowly)
 CACHE_TTL_DAYS = 7
 
+# V15.0: Write-behind / reload tuning (0 = write-through / check file on every get)
+FLUSH_DELAY_SECONDS = 2.0
+RELOAD_CHECK_SECONDS = 5.0
+
+
+def _parse_expiry(entry: dict, ttl_days: int) -> Optional[datetime]:
+    """Parse an entry's cached_at into a timezone-aware expiry (None if invalid)."""
+    try:
+        cached_date = datetime.fromisoformat(entry["cached_at"])
+    except (ValueError, TypeError) as e:
+        logger.warning(f"⚠️ [REFEREE-CACHE] Invalid cache timestamp: {e}")
+        return None
+    if cached_date.tzinfo is None:
+        cached_date = cached_date.replace(tzinfo=timezone.utc)
+    return cached_date + timedelta(days=ttl_days)
 
-class RefereeCache:
-    """Cache for referee statistics."""
 
-    def __init__(self, cache_file: Path = CACHE_FILE, ttl_days: int = CACHE_TTL_DAYS):
-        self.cache_file = cache_file
+class RefereeCache:
+    """Cache for referee statistics (in-memory, write-behind JSON persistence)."""
+
+    def __init__(
+        self,
+        cache_file: Path = CACHE_FILE,
+        ttl_days: int = CACHE_TTL_DAYS,
+        flush_delay_seconds: float = FLUSH_DELAY_SECONDS,
+        reload_check_seconds: float = RELOAD_CHECK_SECONDS,
+    ):
+        self.cache_file = Path(cache_file)
         self.ttl_days = ttl_days
-        self._lock = threading.RLock()  # RLock allows reentrant locking (same thread can acquire multiple times)
+        self.flush_delay_seconds = flush_delay_seconds
+        self.reload_check_seconds = reload_check_seconds
+        # RLock allows reentrant locking (same thread can acquire multiple times)
+        self._lock = threading.RLock()
         self._cache = {}
 
+        # V15.0: Parsed expiries (None = invalid timestamp; missing key = no timestamp)
+        self._expires_at: dict[str, Optional[datetime]] = {}
+        self._dirty: set[str] = set()  # Entries changed since the last flush
+        self._flush_timer: Optional[threading.Timer] = None
+        self._file_signature: Optional[tuple[int, int, int]] = None
+        self._last_reload_check = 0.0
+        self._disk_reads = 0
+        self._disk_writes = 0
+
         # V12.1: Lock contention monitoring for production observability
         self._lock_wait_time = 0.0
         self._lock_wait_count = 0
         self._lock_timeout_count = 0
 
         self._ensure_cache_dir()
+        self._load_cache()
 
     def _acquire_lock_with_monitoring(self):
         """
@@ -77,81 +124,218 @@ class RefereeCache:
         """Ensure cache directory exists."""
         self.cache_file.parent.mkdir(parents=True, exist_ok=True)
 
+    def _read_signature(self) -> Optional[tuple[int, int, int]]:
+        """Return (mtime_ns, size, inode) of the cache file, or None if missing."""
+        try:
+            st = os.stat(self.cache_file)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def _replace_entries(self, cache_data: dict):
+        """Swap in a new entry dict and re-parse expiries (caller holds the lock)."""
+        self._cache = cache_data
+        self._expires_at = {
+            name: _parse_expiry(entry, self.ttl_days)
+            for name, entry in cache_data.items()
+            if isinstance(entry, dict) and entry.get("cached_at")
+        }
+
     def _load_cache(self) -> dict:
         """
         Load cache from file (thread-safe).
 
         V12.2: Added error logging and alert via orchestration_metrics on cache corruption.
         V12.3: Update in-memory cache to ensure consistency.
+        V15.0: Pending writes are flushed first so they are never lost; the
+        in-memory entries are replaced by the file contents.
         """
-        if not self.cache_file.exists():
-            return {}
+        with self._lock:
+            if self._dirty:
+                self.flush()
+
+            self._last_reload_check = time.monotonic()
+            signature = self._read_signature()
+            if signature is None:
+                self._file_signature = None
+                self._replace_entries({})
+                return {}
+
+            try:
+                with open(self.cache_file, "r", encoding="utf-8") as f:
+                    cache_data = json.load(f)
+                self._disk_reads += 1
+                self._file_signature = signature
+                # V12.3: Update in-memory cache for consistency
+                self._replace_entries(cache_data)
+                return cache_data
+            except Exception as e:
+                logger.error(
+                    f"❌ [REFEREE-CACHE] Failed to load referee cache: {e}. "
+                    f"Cache file may be corrupted. Starting with empty cache."
+                )
+                # Remember the corrupted file so it is not re-parsed on every check
+                self._file_signature = signature
+                self._replace_entries({})
+                # V12.2: Alert operators via orchestration metrics
+                try:
+                    from src.alerting.orchestration_metrics import get_metrics_collector
+
+                    metrics = get_metrics_collector()
+                    if metrics:
+                        metrics.record_cache_corruption("referee_cache", str(e))
+                except Exception:
+                    pass  # Don't fail if metrics not available
+                return {}
+
+    def _reload_if_changed(self):
+        """
+        V15.0: Reload the file if another writer changed it (caller holds the lock).
+
+        Only stats the file, at most every reload_check_seconds. Entries with
+        pending local writes win over the reloaded file contents.
+        """
+        now = time.monotonic()
+        if now - self._last_reload_check < self.reload_check_seconds:
+            return
+        self._last_reload_check = now
+
+        signature = self._read_signature()
+        if signature == self._file_signature or signature is None:
+            return
+
+        pending = {name: self._cache[name] for name in self._dirty if name in self._cache}
+        self._dirty.clear()
+        cache_data = self._load_cache()
+        if pending:
+            self._replace_entries({**cache_data, **pending})
+            self._dirty.update(pending)
+            self._schedule_flush()
+        logger.debug("Referee cache reloaded (file changed on disk)")
+
+    def _save_cache(self, cache: dict):
+        """
+        Save cache to file (thread-safe).
+
+        V15.0: Atomic write (temp file + os.replace) of compact JSON; the
+        in-memory entries are replaced by ``cache``.
+        """
+        with self._lock:
+            self._replace_entries(cache)
+            self._dirty.clear()
+            self._write_file(cache)
 
+    def _read_file(self) -> Optional[dict]:
+        """Read the cache file for a merge (caller holds the lock; None if unreadable)."""
         try:
             with open(self.cache_file, "r", encoding="utf-8") as f:
                 cache_data = json.load(f)
-                # V12.3: Update in-memory cache for consistency
-                self._cache = cache_data
-                return cache_data
+        except FileNotFoundError:
+            return {}
         except Exception as e:
-            logger.error(
-                f"❌ [REFEREE-CACHE] Failed to load referee cache: {e}. "
-                f"Cache file may be corrupted. Starting with empty cache."
+            logger.warning(f"⚠️ [REFEREE-CACHE] Could not re-read cache file before flush: {e}")
+            return None
+        self._disk_reads += 1
+        return cache_data if isinstance(cache_data, dict) else None
+
+    def _write_file(self, cache: dict) -> bool:
+        """Atomically write ``cache`` to the cache file (caller holds the lock)."""
+        temp_path = None
+        try:
+            self._ensure_cache_dir()
+            fd, temp_path = tempfile.mkstemp(
+                dir=self.cache_file.parent, prefix=f".{self.cache_file.name}.", suffix=".tmp"
             )
-            # V12.2: Alert operators via orchestration metrics
-            try:
-                from src.alerting.orchestration_metrics import get_metrics_collector
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(cache, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(temp_path, self.cache_file)
+            temp_path = None
+            self._file_signature = self._read_signature()
+            self._disk_writes += 1
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to save referee cache: {e}")
+            return False
+        finally:
+            if temp_path and os.path.exists(temp_path):
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
+
+    def _schedule_flush(self):
+        """Schedule one debounced flush for all pending writes (caller holds the lock)."""
+        if self.flush_delay_seconds <= 0:
+            self.flush()
+            return
+        if self._flush_timer is None:
+            self._flush_timer = threading.Timer(self.flush_delay_seconds, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def flush(self) -> bool:
+        """
+        V15.0: Persist pending writes now (thread-safe).
 
-                metrics = get_metrics_collector()
-                if metrics:
-                    metrics.record_cache_corruption("referee_cache", str(e))
-            except Exception:
-                pass  # Don't fail if metrics not available
-            return {}
+        Called by the debounce timer and at interpreter exit; safe to call
+        directly (e.g. before reading the file from another process).
 
-    def _save_cache(self, cache: dict):
-        """Save cache to file (thread-safe)."""
+        If the file changed since it was last loaded or written (another
+        process flushed in between), it is re-read and only the entries in
+        ``_dirty`` are overlaid on it, so the other writer's entries are kept.
+
+        Returns:
+            True if the file is up to date, False if the write failed
+        """
         with self._lock:
-            try:
-                with open(self.cache_file, "w", encoding="utf-8") as f:
-                    json.dump(cache, f, indent=2, ensure_ascii=False)
-            except Exception as e:
-                logger.warning(f"Failed to save referee cache: {e}")
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._dirty:
+                return True
+
+            merged = self._cache
+            if self._read_signature() != self._file_signature:
+                on_disk = self._read_file()
+                if on_disk is not None:
+                    pending = {name: self._cache[name] for name in self._dirty}
+                    merged = {**on_disk, **pending}
+
+            if self._write_file(merged):
+                if merged is not self._cache:
+                    self._replace_entries(merged)
+                self._dirty.clear()
+                return True
+            return False
 
     def get(self, referee_name: str) -> Optional[dict]:
         """
         Get referee stats from cache.
 
+        V15.0: Served from memory; the file is only stat'ed (rarely) to pick
+        up changes from other processes.
+
         Args:
             referee_name: Name of the referee
 
         Returns:
             Dict with referee stats or None if not found/expired
         """
-        # V12.3: Load cache from file outside lock to reduce contention
-        cache = self._load_cache()
-
         # V12.1: Acquire lock with contention monitoring
         self._acquire_lock_with_monitoring()
         try:
-            if referee_name not in self._cache:
-                return None
-
-            entry = self._cache[referee_name]
+            self._reload_if_changed()
 
-            # Check if entry is expired
-            cached_at = entry.get("cached_at")
-            if not cached_at:
+            entry = self._cache.get(referee_name)
+            if entry is None:
                 return None
 
-            # V12.3: Add error handling for datetime parsing
-            try:
-                cached_date = datetime.fromisoformat(cached_at)
-            except (ValueError, TypeError) as e:
-                logger.warning(f"⚠️ [REFEREE-CACHE] Invalid cache timestamp for {referee_name}: {e}")
+            # Entries without a (valid) timestamp are never served
+            if referee_name not in self._expires_at:
+                return None
+            expiry_date = self._expires_at[referee_name]
+            if expiry_date is None:
                 return None
-
-            expiry_date = cached_date + timedelta(days=self.ttl_days)
 
             # Use timezone-aware datetime for comparison
             if datetime.now(timezone.utc) > expiry_date:
@@ -167,6 +351,8 @@ class RefereeCache:
         """
         Set referee stats in cache (thread-safe).
 
+        V15.0: Updates memory immediately; persisted by a debounced flush.
+
         Args:
             referee_name: Name of the referee
             stats: Dict with referee stats (cards_per_game, strictness, etc.)
@@ -174,17 +360,17 @@ class RefereeCache:
         # V12.1: Acquire lock with contention monitoring
         self._acquire_lock_with_monitoring()
         try:
-            cache = self._load_cache()
-            cache[referee_name] = {
-                "cached_at": datetime.now(timezone.utc).isoformat(),
+            cached_at = datetime.now(timezone.utc)
+            self._cache[referee_name] = {
+                "cached_at": cached_at.isoformat(),
                 "stats": stats,
                 "referee_strictness": stats.get(
                     "strictness", "unknown"
                 ),  # Store strictness separately for consistency
             }
-            self._save_cache(cache)
-            # V12.3: Update in-memory cache to ensure consistency
-            self._cache = cache
+            self._expires_at[referee_name] = cached_at + timedelta(days=self.ttl_days)
+            self._dirty.add(referee_name)
+            self._schedule_flush()
             logger.info(f"Referee cache updated for {referee_name}")
         finally:
             self._lock.release()
@@ -198,10 +384,15 @@ class RefereeCache:
         # V12.3: Acquire lock with contention monitoring
         self._acquire_lock_with_monitoring()
         try:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            self._dirty.clear()
             if self.cache_file.exists():
                 self.cache_file.unlink()
             # V12.3: Clear in-memory cache
-            self._cache = {}
+            self._replace_entries({})
+            self._file_signature = None
             logger.info("Referee cache cleared")
         finally:
             self._lock.release()
@@ -213,34 +404,27 @@ class RefereeCache:
         Returns:
             Dict with cache stats (total_entries, expired_entries, etc.)
         """
-        # V12.3: Load cache from file outside lock to reduce contention
-        cache = self._load_cache()
-
         # V12.1: Acquire lock with contention monitoring
         self._acquire_lock_with_monitoring()
         try:
-            total_entries = len(cache)
-            expired_entries = 0
-
-            for entry in cache.values():
-                cached_at = entry.get("cached_at")
-                if cached_at:
-                    # V12.3: Add error handling for datetime parsing
-                    try:
-                        cached_date = datetime.fromisoformat(cached_at)
-                        expiry_date = cached_date + timedelta(days=self.ttl_days)
-                        # Use timezone-aware datetime for comparison
-                        if datetime.now(timezone.utc) > expiry_date:
-                            expired_entries += 1
-                    except (ValueError, TypeError):
-                        # Invalid timestamp, treat as expired
-                        expired_entries += 1
+            self._reload_if_changed()
+
+            now = datetime.now(timezone.utc)
+            total_entries = len(self._cache)
+            # Invalid timestamps count as expired; entries without one are not counted
+            expired_entries = sum(
+                1 for expiry in self._expires_at.values() if expiry is None or now > expiry
+            )
 
             return {
                 "total_entries": total_entries,
                 "expired_entries": expired_entries,
                 "valid_entries": total_entries - expired_entries,
                 "ttl_days": self.ttl_days,
+                # V15.0: Write-behind metrics
+                "pending_writes": len(self._dirty),
+                "disk_reads": self._disk_reads,
+                "disk_writes": self._disk_writes,
                 # V12.1: Lock contention metrics
                 "lock_wait_count": self._lock_wait_count,
                 "lock_wait_time_total": round(self._lock_wait_time, 3),
@@ -307,4 +491,6 @@ def get_referee_cache() -> RefereeCache:
             # Double-checked locking pattern for thread safety
             if _referee_cache is None:
                 _referee_cache = RefereeCache()
+                # V15.0: Persist pending write-behind changes on shutdown
+                atexit.register(_referee_cache.flush)
     return _referee_cache
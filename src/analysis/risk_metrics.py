@@ -0,0 +1,249 @@
+"""
+Streaming Risk Metrics for the Strategy Optimizer - V1.0
+
+Sharpe, Sortino and Max Drawdown maintained incrementally instead of being
+recomputed over the whole returns / PnL window on every settled bet.
+
+- Mean / variance: Welford accumulators with add + remove for the sliding window
+- Sortino: downside count and downside sum of squares (target 0)
+- Max drawdown: running window peak and worst drawdown; a rescan is needed
+  only when evicting a peak can actually change the worst drawdown
+- Optional exponential decay (half-life in bets) for Sharpe/Sortino
+
+Without decay the values are those of calc_sharpe() / calc_sortino() /
+calc_max_drawdown() on the same bounded window. Accumulators are resynced
+from the window every `window` evictions (and whenever the variance is
+near zero) so floating-point drift cannot build up or hide the
+zero-variance branches.
+
+The metrics object owns the window lists stored in the optimizer data
+(it appends / evicts in place), so the JSON layout is unchanged.
+"""
+
+import math
+
+# Returned for perfectly consistent winners / winners with no downside
+CONSISTENT_PROFIT_RATIO = 5.0
+MIN_RATIO_SAMPLES = 10
+
+# Variance (m2 / n) below this is recomputed exactly from the window
+_NEAR_ZERO_VARIANCE = 1e-9
+
+
+class RollingRiskMetrics:
+    """
+    Incremental risk metrics over a bounded window of bet returns.
+
+    Not thread-safe on its own; StrategyOptimizer calls it under _data_lock.
+    """
+
+    def __init__(
+        self,
+        returns: list[float],
+        pnl_history: list[float] | None = None,
+        returns_window: int = 100,
+        pnl_window: int = 100,
+        decay_halflife: float = 0,
+        decay_state: dict | None = None,
+    ):
+        """
+        Args:
+            returns: Returns window list (mutated in place by add())
+            pnl_history: Cumulative PnL window list, or None if not tracked
+            returns_window: Max returns kept
+            pnl_window: Max PnL points kept
+            decay_halflife: Half-life in bets for decayed Sharpe/Sortino (0 = off)
+            decay_state: Previously persisted decay accumulators
+        """
+        self.returns = returns
+        self.pnl_history = pnl_history
+        self.returns_window = returns_window
+        self.pnl_window = pnl_window
+        self.decay = 0.5 ** (1.0 / decay_halflife) if decay_halflife > 0 else None
+        self._evictions = 0
+        self.resyncs = 0
+        self.drawdown_rescans = 0
+        self._resync_returns()
+        self._rescan_drawdown()
+        self._ew = None
+        if self.decay is not None:
+            if decay_state and all(k in decay_state for k in ("w", "mean", "m2", "dw", "dsq")):
+                self._ew = {k: float(decay_state[k]) for k in ("w", "mean", "m2", "dw", "dsq")}
+            else:
+                self._ew = {"w": 0.0, "mean": 0.0, "m2": 0.0, "dw": 0.0, "dsq": 0.0}
+                for r in returns:
+                    self._add_decayed(r)
+
+    def is_bound_to(self, returns: list, pnl_history: list | None) -> bool:
+        """True if still tracking exactly these lists (not replaced or edited outside)."""
+        return (
+            self.returns is returns
+            and self.pnl_history is pnl_history
+            and len(returns) == self._n
+            and (pnl_history is None or len(pnl_history) == self._pnl_len)
+        )
+
+    # ============================================
+    # UPDATES
+    # ============================================
+
+    def add(self, bet_return: float) -> None:
+        """Append one bet return (and its cumulative PnL point), evicting the oldest."""
+        self.returns.append(bet_return)
+        self._add_moments(bet_return)
+        if len(self.returns) > self.returns_window:
+            self._remove_moments(self.returns.pop(0))
+            self._evictions += 1
+        if (
+            self._evictions >= self.returns_window
+            or self._m2 < 0
+            or 0 < self._m2 < _NEAR_ZERO_VARIANCE * self._n
+        ):
+            self._resync_returns()
+
+        if self._ew is not None:
+            self._add_decayed(bet_return)
+
+        if self.pnl_history is not None:
+            last_pnl = self.pnl_history[-1] if self.pnl_history else 0
+            self._add_pnl(last_pnl + bet_return)
+
+    def _add_moments(self, x: float) -> None:
+        self._n += 1
+        delta = x - self._mean
+        self._mean += delta / self._n
+        self._m2 += delta * (x - self._mean)
+        if x < 0:
+            self._down_n += 1
+            self._down_sq += x * x
+
+    def _remove_moments(self, x: float) -> None:
+        self._n -= 1
+        if self._n == 0:
+            self._mean = self._m2 = 0.0
+        else:
+            delta = x - self._mean
+            self._mean -= delta / self._n
+            self._m2 -= delta * (x - self._mean)
+        if x < 0:
+            self._down_n -= 1
+            self._down_sq = self._down_sq - x * x if self._down_n else 0.0
+
+    def _resync_returns(self) -> None:
+        """Recompute the accumulators from the window with the calc_* formulas."""
+        returns = self.returns
+        self._n = len(returns)
+        self._mean = sum(returns) / self._n if self._n else 0.0
+        self._m2 = sum((r - self._mean) ** 2 for r in returns)
+        downside = [r for r in returns if r < 0]
+        self._down_n = len(downside)
+        self._down_sq = sum(r**2 for r in downside)
+        self._evictions = 0
+        self.resyncs += 1
+
+    def _add_decayed(self, x: float) -> None:
+        ew = self._ew
+        ew["w"] = self.decay * ew["w"] + 1.0
+        delta = x - ew["mean"]
+        ew["mean"] += delta / ew["w"]
+        ew["m2"] = self.decay * ew["m2"] + delta * (x - ew["mean"])
+        ew["dw"] = self.decay * ew["dw"] + (1.0 if x < 0 else 0.0)
+        ew["dsq"] = self.decay * ew["dsq"] + (x * x if x < 0 else 0.0)
+
+    def _add_pnl(self, pnl: float) -> None:
+        self.pnl_history.append(pnl)
+        if pnl > self._peak:
+            self._peak = pnl
+        if self._peak > 0:
+            drawdown = (pnl - self._peak) / self._peak
+            if drawdown < self._max_dd:
+                self._max_dd = drawdown
+                self._max_dd_peak = self._peak
+
+        if len(self.pnl_history) > self.pnl_window:
+            evicted = self.pnl_history.pop(0)
+            # Prefix peaks (and so every drawdown) are unchanged unless the evicted
+            # point was a positive peak above its successor; a stale non-positive
+            # peak never produces a drawdown and is replaced by the next positive PnL
+            if evicted > 0 and evicted > self.pnl_history[0] and self._peak_change_matters(evicted):
+                self._rescan_drawdown()
+        self._pnl_len = len(self.pnl_history)
+
+    def _peak_change_matters(self, evicted: float) -> bool:
+        """
+        Whether evicting a positive prefix peak can change the max drawdown.
+
+        Points before the next PnL >= evicted lose that peak. Their drawdown only
+        gets milder when their PnL is positive, so the result holds unless the
+        worst drawdown was measured from this peak, one of those points is <= 0,
+        or the evicted point was the window maximum.
+        """
+        if self._max_dd_peak == evicted:
+            return True
+        for pnl in self.pnl_history:
+            if pnl >= evicted:
+                return False
+            if pnl <= 0:
+                return True
+        return True
+
+    def _rescan_drawdown(self) -> None:
+        """Same loop as calc_max_drawdown(), keeping the final peak."""
+        peak = float("-inf")
+        max_dd = 0.0
+        max_dd_peak = None
+        for pnl in self.pnl_history or ():
+            if pnl > peak:
+                peak = pnl
+            if peak > 0:
+                drawdown = (pnl - peak) / peak
+                if drawdown < max_dd:
+                    max_dd = drawdown
+                    max_dd_peak = peak
+        self._peak = peak
+        self._max_dd = max_dd
+        self._max_dd_peak = max_dd_peak
+        self._pnl_len = len(self.pnl_history) if self.pnl_history is not None else 0
+        self.drawdown_rescans += 1
+
+    # ============================================
+    # METRICS
+    # ============================================
+
+    def sharpe(self) -> float:
+        """Equivalent of calc_sharpe(returns) (decayed moments if decay is on)."""
+        if self._n < MIN_RATIO_SAMPLES:
+            return 0.0
+        if self._ew is not None:
+            mean, variance = self._ew["mean"], self._ew["m2"] / self._ew["w"]
+        else:
+            mean, variance = self._mean, self._m2 / self._n
+        stdev = math.sqrt(max(variance, 0.0))
+        if stdev == 0:
+            return CONSISTENT_PROFIT_RATIO if mean > 0 else 0.0
+        return mean / stdev
+
+    def sortino(self) -> float:
+        """Equivalent of calc_sortino(returns) with target 0."""
+        if self._n < MIN_RATIO_SAMPLES:
+            return 0.0
+        if self._ew is not None:
+            mean = self._ew["mean"]
+            down_variance = self._ew["dsq"] / self._ew["dw"] if self._ew["dw"] > 0 else 0.0
+        else:
+            mean = self._mean
+            down_variance = self._down_sq / self._down_n if self._down_n else 0.0
+        if not self._down_n:
+            return CONSISTENT_PROFIT_RATIO if mean > 0 else 0.0
+        downside_std = math.sqrt(down_variance)
+        if downside_std == 0:
+            return 0.0
+        return mean / downside_std
+
+    def max_drawdown(self) -> float:
+        """Equivalent of calc_max_drawdown(pnl_history)."""
+        return self._max_dd
+
+    def decay_state(self) -> dict | None:
+        """Decay accumulators to persist with the stats (None if decay is off)."""
+        return dict(self._ew) if self._ew is not None else None
@@ -0,0 +1,301 @@
+"""
+EarlyBird Settlement Results V1.0
+
+Result fetching and persistence shared by SettlementService and settler.py.
+
+Settlement used to resolve every bet serially (FotMob team search + team
+details + match stats, then a Tavily post-match search), and a failed commit
+meant the next run fetched all of it again. This module provides:
+
+- MatchResultStore: on-disk store of final results keyed by match ID
+  (PersistentCacheTier file). Finished results never change, so re-running
+  settlement reads them back instead of hitting FotMob/Tavily.
+- resolve_match_results(): store lookups first, then bounded-concurrency
+  fetches for the rest, results returned in input order.
+- apply_settlement_updates(): the DB write phase as one prefetch + one
+  executemany UPDATE per table.
+
+Only terminal results are stored: FINISHED (with its match stats) and
+CANCELLED. POSTPONED fixtures and results without stats are fetched again on
+the next run, exactly as before.
+
+Usage:
+    store = get_match_result_store()
+    resolved = resolve_match_results(matches, get_match_result, fetch_stats, store)
+
+V1.0: Initial implementation
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from sqlalchemy import update
+
+from config.settings import (
+    SETTLEMENT_FETCH_MAX_WORKERS,
+    SETTLEMENT_RESULT_STORE_ENABLED,
+    SETTLEMENT_RESULT_STORE_PATH,
+)
+from src.database.models import Match, NewsLog
+from src.utils.persistent_cache import PersistentCacheTier
+
+logger = logging.getLogger(__name__)
+
+# ============================================
+# CONFIGURATION
+# ============================================
+
+# Stored results older than this are pruned (settlement looks back 48h by default)
+RESULT_RETENTION_DAYS = 180
+RESULT_STORE_MAX_ENTRIES = 50000
+# Rows per IN (...) lookup in apply_settlement_updates()
+LOOKUP_BATCH_SIZE = 500
+
+STORABLE_STATUSES = frozenset({"FINISHED", "CANCELLED"})
+
+# Match columns filled from FotMob match stats
+MATCH_STAT_FIELDS = (
+    "home_corners",
+    "away_corners",
+    "home_yellow_cards",
+    "away_yellow_cards",
+    "home_red_cards",
+    "away_red_cards",
+    "home_xg",
+    "away_xg",
+    "home_possession",
+    "away_possession",
+    "home_shots_on_target",
+    "away_shots_on_target",
+    "home_big_chances",
+    "away_big_chances",
+    "home_fouls",
+    "away_fouls",
+)
+
+
+@dataclass
+class ResolvedResult:
+    """Final result of one match as used by the settlement evaluation."""
+
+    result: Optional[dict] = None
+    match_stats: Optional[dict] = None
+    insights: Optional[str] = None
+    from_store: bool = False
+
+
+class MatchResultStore:
+    """
+    Persistent finished-match result store keyed by match ID.
+
+    Thread-safe (PersistentCacheTier serializes access to its connection).
+    """
+
+    def __init__(self, db_path: str, retention_days: int = RESULT_RETENTION_DAYS):
+        self.retention_seconds = retention_days * 86400
+        self._tier = PersistentCacheTier(db_path, max_entries=RESULT_STORE_MAX_ENTRIES)
+
+    @property
+    def available(self) -> bool:
+        return self._tier.available
+
+    @staticmethod
+    def _key(match_id: str) -> str:
+        return f"result:{match_id}"
+
+    def _write(self, match_id: str, value: dict) -> bool:
+        expires = time.time() + self.retention_seconds
+        return self._tier.set(self._key(match_id), value, expires, expires)
+
+    def get(self, match_id: Optional[str]) -> Optional[ResolvedResult]:
+        if not match_id:
+            return None
+        record = self._tier.get(self._key(match_id))
+        if record is None or not isinstance(record.value, dict):
+            return None
+        value = record.value
+        return ResolvedResult(
+            result=value.get("result"),
+            match_stats=value.get("match_stats"),
+            insights=value.get("insights"),
+            from_store=True,
+        )
+
+    def put(
+        self,
+        match_id: Optional[str],
+        result: Optional[dict],
+        match_stats: Optional[dict] = None,
+        insights: Optional[str] = None,
+    ) -> bool:
+        """
+        Store a terminal result.
+
+        Returns:
+            True if stored (FINISHED with stats, or CANCELLED)
+        """
+        if not match_id or not result:
+            return False
+        status = result.get("status")
+        if status not in STORABLE_STATUSES or (status == "FINISHED" and not match_stats):
+            return False
+        return self._write(
+            match_id, {"result": result, "match_stats": match_stats, "insights": insights}
+        )
+
+    def set_insights(self, match_id: Optional[str], insights: str) -> bool:
+        """Attach post-match insights (e.g. Tavily) to an already stored result."""
+        stored = self.get(match_id)
+        if stored is None or not insights:
+            return False
+        return self._write(
+            match_id,
+            {"result": stored.result, "match_stats": stored.match_stats, "insights": insights},
+        )
+
+    def get_stats(self) -> dict[str, Any]:
+        stats = self._tier.get_stats()
+        stats["size"] = self._tier.size()
+        return stats
+
+    def close(self) -> None:
+        self._tier.close()
+
+
+def resolve_match_results(
+    matches: list[dict],
+    fetch_result: Callable[[str, str, Any], Optional[dict]],
+    fetch_stats: Callable[[Any], Optional[dict]],
+    store: Optional[MatchResultStore] = None,
+    max_workers: Optional[int] = None,
+) -> list[ResolvedResult]:
+    """
+    Resolve final results for matches, stored results first.
+
+    Args:
+        matches: Settlement match dicts (match_id, home_team, away_team, start_time)
+        fetch_result: (home_team, away_team, start_time) -> result dict or None
+        fetch_stats: FotMob match ID -> match stats dict or None
+        store: Optional persistent store (lookups + write-back of new terminal results)
+        max_workers: Concurrent fetches (defaults to SETTLEMENT_FETCH_MAX_WORKERS)
+
+    Returns:
+        One ResolvedResult per match, in input order (result None = not available)
+    """
+    resolved: list[Optional[ResolvedResult]] = [None] * len(matches)
+    to_fetch: list[int] = []
+    for i, match_data in enumerate(matches):
+        stored = store.get(match_data.get("match_id")) if store else None
+        if stored is not None:
+            resolved[i] = stored
+        else:
+            to_fetch.append(i)
+
+    def fetch(i: int) -> ResolvedResult:
+        match_data = matches[i]
+        result = fetch_result(
+            match_data["home_team"], match_data["away_team"], match_data["start_time"]
+        )
+        match_stats = None
+        fotmob_match_id = result.get("match_id") if result else None
+        if fotmob_match_id and result.get("status") == "FINISHED":
+            try:
+                match_stats = fetch_stats(fotmob_match_id)
+                if not match_stats:
+                    logger.warning(f"⚠️ Could not get match stats for {fotmob_match_id}")
+            except Exception as e:
+                logger.warning(f"⚠️ Could not fetch stats: {e}")
+        return ResolvedResult(result=result, match_stats=match_stats)
+
+    started = time.monotonic()
+    if to_fetch:
+        workers = max(1, min(max_workers or SETTLEMENT_FETCH_MAX_WORKERS, len(to_fetch)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="settle-fetch") as pool:
+            futures = {pool.submit(fetch, i): i for i in to_fetch}
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    item = future.result()
+                except Exception as e:
+                    logger.error(f"Error fetching match result: {e}")
+                    item = ResolvedResult()
+                resolved[i] = item
+                if store is not None and item.result:
+                    store.put(matches[i].get("match_id"), item.result, item.match_stats)
+
+    logger.info(
+        f"🌐 Results resolved: {len(matches) - len(to_fetch)} from store, "
+        f"{len(to_fetch)} fetched in {time.monotonic() - started:.1f}s"
+    )
+    return [item or ResolvedResult() for item in resolved]
+
+
+def match_stats_update(match_stats: dict) -> dict[str, Any]:
+    """Match column values for a FotMob match stats dict."""
+    return {field: match_stats.get(field) for field in MATCH_STAT_FIELDS}
+
+
+def _existing_ids(db, column, ids: list) -> set:
+    found = set()
+    for start in range(0, len(ids), LOOKUP_BATCH_SIZE):
+        batch = ids[start : start + LOOKUP_BATCH_SIZE]
+        found.update(row[0] for row in db.query(column).filter(column.in_(batch)))
+    return found
+
+
+def apply_settlement_updates(
+    db,
+    match_updates: dict[str, dict[str, Any]],
+    news_log_updates: dict[int, dict[str, Any]],
+) -> tuple[int, int]:
+    """
+    Write settlement results as bulk UPDATEs by primary key (caller commits).
+
+    Rows that no longer exist are skipped, matching the previous
+    query-then-update behaviour.
+
+    Args:
+        db: SQLAlchemy session
+        match_updates: {match_id: {column: value}}
+        news_log_updates: {news_log_id: {column: value}}
+
+    Returns:
+        (matches updated, news logs updated)
+    """
+    counts = []
+    for model, updates in ((Match, match_updates), (NewsLog, news_log_updates)):
+        updates = {pk: values for pk, values in updates.items() if pk is not None and values}
+        if not updates:
+            counts.append(0)
+            continue
+        existing = _existing_ids(db, model.id, list(updates))
+        rows = [{"id": pk, **values} for pk, values in updates.items() if pk in existing]
+        if rows:
+            db.execute(update(model), rows)
+        counts.append(len(rows))
+    return counts[0], counts[1]
+
+
+# ============================================
+# SHARED STORE
+# ============================================
+
+_result_store: Optional[MatchResultStore] = None
+_result_store_lock = threading.Lock()
+
+
+def get_match_result_store() -> Optional[MatchResultStore]:
+    """Shared store at SETTLEMENT_RESULT_STORE_PATH, or None when disabled/unavailable."""
+    global _result_store
+    if not SETTLEMENT_RESULT_STORE_ENABLED:
+        return None
+    if _result_store is None:
+        with _result_store_lock:
+            if _result_store is None:
+                _result_store = MatchResultStore(SETTLEMENT_RESULT_STORE_PATH)
+    return _result_store if _result_store.available else None
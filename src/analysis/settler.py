@@ -18,8 +18,14 @@ from sqlalchemy import and_
 from sqlalchemy.orm import joinedload
 
 from config.settings import DEFAULT_ODDS_GOALS, SETTLEMENT_MIN_SCORE
+from src.analysis.settlement_results import (
+    apply_settlement_updates,
+    get_match_result_store,
+    match_stats_update,
+    resolve_match_results,
+)
 from src.database.db import get_db_context
-from src.database.models import Match, NewsLog
+from src.database.models import Match
 from src.ingestion.data_provider import get_data_provider
 from src.utils.validators import safe_get
 
@@ -662,13 +668,18 @@ def settle_pending_bets(lookback_hours: int = 48) -> dict:
     logger.info(f"🌐 Fetching results for {len(matches_to_settle)} matches (no DB lock)...")
 
     results_cache: list[dict[str, Any]] = []
+    result_store = get_match_result_store()
+    resolved_results = resolve_match_results(
+        matches_to_settle,
+        get_match_result,
+        lambda fotmob_match_id: get_data_provider().get_match_stats(fotmob_match_id),
+        store=result_store,
+    )
 
-    for match_data in matches_to_settle:
+    for match_data, resolved in zip(matches_to_settle, resolved_results, strict=True):
         stats["total_checked"] += 1
 
-        result = get_match_result(
-            match_data["home_team"], match_data["away_team"], match_data["start_time"]
-        )
+        result = resolved.result
 
         if not result:
             stats["pending"] += 1
@@ -677,14 +688,7 @@ def settle_pending_bets(lookback_hours: int = 48) -> dict:
             )
             continue
 
-        match_stats = None
-        fotmob_match_id = result.get("match_id")
-        if fotmob_match_id and result.get("status") == "FINISHED":
-            try:
-                fotmob = get_data_provider()
-                match_stats = fotmob.get_match_stats(fotmob_match_id)
-            except Exception as e:
-                logger.warning(f"⚠️ Could not fetch stats: {e}")
+        match_stats = resolved.match_stats
 
         outcome, explanation = evaluate_bet(
             match_data["recommended_market"],
@@ -720,6 +724,7 @@ def settle_pending_bets(lookback_hours: int = 48) -> dict:
                 "combo_outcome": combo_outcome,
                 "combo_explanation": combo_explanation,
                 "expansion_type": expansion_type,
+                "tavily_insights": resolved.insights,
             }
         )
 
@@ -728,6 +733,8 @@ def settle_pending_bets(lookback_hours: int = 48) -> dict:
 
     total_stake = 0
     total_return = 0
+    match_updates: dict[str, dict] = {}
+    news_log_updates: dict[int, dict] = {}
 
     with get_db_context() as db:
         try:
@@ -742,33 +749,14 @@ def settle_pending_bets(lookback_hours: int = 48) -> dict:
                 expansion_type = item.get("expansion_type")
 
                 if match_stats:
-                    match = db.query(Match).filter(Match.id == match_data["match_id"]).first()
-                    if match:
-                        match.home_corners = match_stats.get("home_corners")
-                        match.away_corners = match_stats.get("away_corners")
-                        match.home_yellow_cards = match_stats.get("home_yellow_cards")
-                        match.away_yellow_cards = match_stats.get("away_yellow_cards")
-                        match.home_red_cards = match_stats.get("home_red_cards")
-                        match.away_red_cards = match_stats.get("away_red_cards")
-                        match.home_xg = match_stats.get("home_xg")
-                        match.away_xg = match_stats.get("away_xg")
-                        match.home_possession = match_stats.get("home_possession")
-                        match.away_possession = match_stats.get("away_possession")
-                        match.home_shots_on_target = match_stats.get("home_shots_on_target")
-                        match.away_shots_on_target = match_stats.get("away_shots_on_target")
-                        match.home_big_chances = match_stats.get("home_big_chances")
-                        match.away_big_chances = match_stats.get("away_big_chances")
-                        match.home_fouls = match_stats.get("home_fouls")
-                        match.away_fouls = match_stats.get("away_fouls")
+                    match_updates[match_data["match_id"]] = match_stats_update(match_stats)
 
                 if combo_outcome:
-                    news_log = (
-                        db.query(NewsLog).filter(NewsLog.id == match_data["news_log_id"]).first()
+                    news_log_updates.setdefault(match_data["news_log_id"], {}).update(
+                        combo_outcome=combo_outcome,
+                        combo_explanation=combo_explanation,
+                        expansion_type=expansion_type,
                     )
-                    if news_log:
-                        news_log.combo_outcome = combo_outcome
-                        news_log.combo_explanation = combo_explanation
-                        news_log.expansion_type = expansion_type
 
                 if outcome == RESULT_PENDING:
                     stats["pending"] += 1
@@ -901,9 +889,7 @@ def settle_pending_bets(lookback_hours: int = 48) -> dict:
                     if clv_value is not None:
                         news_log_id = match_data.get("news_log_id")
                         if news_log_id:
-                            news_log = db.query(NewsLog).filter(NewsLog.id == news_log_id).first()
-                            if news_log:
-                                news_log.clv_percent = clv_value
+                            news_log_updates.setdefault(news_log_id, {})["clv_percent"] = clv_value
 
                         clv_emoji = "📈" if clv_value > 0 else "📉"
                         logger.info(
@@ -929,12 +915,18 @@ def settle_pending_bets(lookback_hours: int = 48) -> dict:
                     }
                 )
 
-                tavily_insights = _tavily_post_match_search(
-                    match_data["home_team"], match_data["away_team"], match_data["start_time"]
-                )
+                # Insights are stored with the result, so re-runs skip the Tavily search
+                tavily_insights = item.get("tavily_insights")
+                if not tavily_insights:
+                    tavily_insights = _tavily_post_match_search(
+                        match_data["home_team"], match_data["away_team"], match_data["start_time"]
+                    )
+                    if tavily_insights and result_store is not None:
+                        result_store.set_insights(match_data["match_id"], tavily_insights)
                 if tavily_insights:
                     stats["details"][-1]["tavily_insights"] = tavily_insights
 
+            apply_settlement_updates(db, match_updates, news_log_updates)
             db.commit()
 
         except Exception as e:
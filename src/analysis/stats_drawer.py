@@ -31,6 +31,31 @@ COLORS = {
 }
 
 
+def _load_optimizer_data() -> dict | None:
+    """
+    Optimizer state from the SQLite state store (default backend) or the JSON weights file.
+
+    Returns:
+        Optimizer data dict, or None if nothing has been recorded yet
+    """
+    try:
+        from config.settings import OPTIMIZER_STATE_BACKEND
+
+        if OPTIMIZER_STATE_BACKEND == "sqlite":
+            from src.database.optimizer_state_model import get_optimizer_state_store
+
+            data = get_optimizer_state_store().load()
+            if data is not None:
+                return data
+    except Exception as e:
+        logger.warning(f"Could not read optimizer state store: {e}")
+
+    if os.path.exists(OPTIMIZER_WEIGHTS_FILE):
+        with open(OPTIMIZER_WEIGHTS_FILE) as f:
+            return json.load(f)
+    return None
+
+
 def get_stats_data() -> dict:
     """
     Extract performance statistics from optimizer data and database.
@@ -55,10 +80,8 @@ def get_stats_data() -> dict:
 
     try:
         # Load optimizer data (primary source of truth for settled bets)
-        if os.path.exists(OPTIMIZER_WEIGHTS_FILE):
-            with open(OPTIMIZER_WEIGHTS_FILE) as f:
-                optimizer_data = json.load(f)
-
+        optimizer_data = _load_optimizer_data()
+        if optimizer_data is not None:
             # Global stats
             global_stats = optimizer_data.get("global", {})
             stats["total_bets"] = global_stats.get("total_bets", 0)
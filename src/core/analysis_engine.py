@@ -78,6 +78,9 @@ from src.ingestion.weather_provider import get_match_weather
 # Processing
 from src.processing.news_hunter import run_hunter_for_match
 
+# V15.0: Per-provider concurrency limits (matches may be analyzed in parallel)
+from src.utils.provider_limiter import provider_slot
+
 # V12.0: Import ValidationResult validators for defense-in-depth validation
 try:
     from src.utils.validators import validate_news_log
@@ -1228,13 +1231,14 @@ class AnalysisEngine:
 
             def fetch_fotmob():
                 if _PARALLEL_ENRICHMENT_AVAILABLE and fotmob:
-                    return self.run_parallel_enrichment(
-                        fotmob=fotmob,
-                        home_team=home_team_valid,
-                        away_team=away_team_valid,
-                        match_start_time=start_time,
-                        weather_provider=get_match_weather,
-                    )
+                    with provider_slot("fotmob"):
+                        return self.run_parallel_enrichment(
+                            fotmob=fotmob,
+                            home_team=home_team_valid,
+                            away_team=away_team_valid,
+                            match_start_time=start_time,
+                            weather_provider=get_match_weather,
+                        )
                 return None
 
             def fetch_news():
@@ -1242,7 +1246,8 @@ class AnalysisEngine:
                 if forced_narrative:
                     return [{"title": "RADAR INTEL", "snippet": forced_narrative, "url": None}]
                 try:
-                    return run_hunter_for_match(match=match, include_insiders=True)
+                    with provider_slot("search"):
+                        return run_hunter_for_match(match=match, include_insiders=True)
                 except Exception as e:
                     self.logger.warning(f"⚠️ News hunting failed: {e}")
                     return []
@@ -1397,21 +1402,22 @@ class AnalysisEngine:
                 # Run triangulation analysis
                 # Note: twitter_intel parameter is omitted — twitter_data (dict) is not used by AI.
                 # All AI-formatted Twitter intel flows through twitter_intel_for_ai (str) below.
-                analysis_result = analyze_with_triangulation(
-                    match=match,
-                    home_context=home_context,
-                    away_context=away_context,
-                    home_stats=home_stats,
-                    away_stats=away_stats,
-                    news_articles=news_articles,
-                    twitter_intel_for_ai=twitter_intel_str,
-                    fatigue_differential=fatigue_differential,
-                    injury_impact_home=home_injury_impact,
-                    injury_impact_away=away_injury_impact,
-                    biscotto_result=biscotto_result,
-                    market_intel=market_intel,
-                    referee_info=referee_info,
-                )
+                with provider_slot("deepseek"):
+                    analysis_result = analyze_with_triangulation(
+                        match=match,
+                        home_context=home_context,
+                        away_context=away_context,
+                        home_stats=home_stats,
+                        away_stats=away_stats,
+                        news_articles=news_articles,
+                        twitter_intel_for_ai=twitter_intel_str,
+                        fatigue_differential=fatigue_differential,
+                        injury_impact_home=home_injury_impact,
+                        injury_impact_away=away_injury_impact,
+                        biscotto_result=biscotto_result,
+                        market_intel=market_intel,
+                        referee_info=referee_info,
+                    )
 
                 # COVE DEBUG: AI Response trace
                 if forced_narrative and analysis_result:
@@ -1808,7 +1814,8 @@ class AnalysisEngine:
                             )
 
                         # V14.0: Send alert using EnhancedMatchAlert object
-                        alert_delivered = send_alert_wrapper(alert=alert)
+                        with provider_slot("telegram"):
+                            alert_delivered = send_alert_wrapper(alert=alert)
 
                         # COVE FIX: Only update database if alert was actually delivered
                         if alert_delivered:
@@ -0,0 +1,288 @@
+"""
+EarlyBird Match Analysis Scheduler V1.0
+======================================
+
+Runs AnalysisEngine.analyze_match() for independent matches in parallel.
+
+Most of a match analysis is spent waiting on FotMob, Tavily/Brave, DeepSeek
+and Telegram, so running matches one at a time made a 13-league cycle take
+the sum of all those waits. The scheduler:
+
+- Orders matches by kickoff time (earliest first) so imminent matches are
+  always analyzed before the cycle budget runs out
+- Runs up to MATCH_ANALYSIS_MAX_WORKERS matches concurrently, each with its
+  own database session (SQLAlchemy sessions are not thread-safe)
+- Bounds concurrency per provider through src/utils/provider_limiter.py
+  (the FotMob global rate limiter and the budget managers stay in charge of
+  request spacing and quota)
+- Enforces a per-cycle deadline: matches not started before the deadline are
+  skipped and left for the next cycle (their cooldown is untouched)
+
+Usage:
+    scheduler = MatchAnalysisScheduler(analysis_engine, fotmob)
+    tier1 = scheduler.run(matches, now_utc, context_label="TIER1")
+    tier2 = scheduler.run(tier2_matches, now_utc, context_label="TIER2")
+
+Both runs share the same cycle deadline (started when the scheduler is created).
+
+V1.0: Initial implementation
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Optional
+
+from src.database.models import Match, SessionLocal
+from src.utils.provider_limiter import get_provider_limiter
+
+logger = logging.getLogger(__name__)
+
+try:
+    from config.settings import (
+        MATCH_ANALYSIS_CYCLE_DEADLINE_SECONDS,
+        MATCH_ANALYSIS_MAX_WORKERS,
+    )
+except ImportError:
+    MATCH_ANALYSIS_MAX_WORKERS = 4
+    MATCH_ANALYSIS_CYCLE_DEADLINE_SECONDS = 1500
+
+
+@dataclass(order=True)
+class MatchJob:
+    """
+    A single match scheduled for analysis.
+
+    Only plain attributes are copied from the Match ORM object so the job can
+    cross threads safely; each worker re-loads the Match in its own session.
+    Jobs sort by (kickoff, match_id).
+    """
+
+    start_time: datetime
+    match_id: str
+    home_team: str = field(default="Unknown", compare=False)
+    away_team: str = field(default="Unknown", compare=False)
+    league: str = field(default="Unknown", compare=False)
+
+    @classmethod
+    def from_match(cls, match: Match) -> "MatchJob":
+        return cls(
+            start_time=getattr(match, "start_time", None) or datetime.max,
+            match_id=str(match.id),
+            home_team=getattr(match, "home_team", "Unknown"),
+            away_team=getattr(match, "away_team", "Unknown"),
+            league=getattr(match, "league", "Unknown"),
+        )
+
+
+@dataclass
+class SchedulerStats:
+    """Statistics for a single scheduler run."""
+
+    context_label: str = ""
+    submitted: int = 0
+    completed: int = 0
+    skipped_deadline: int = 0
+    errors: int = 0
+    alerts_sent: int = 0
+    elapsed_seconds: float = 0.0
+    serial_seconds: float = 0.0  # Sum of per-match durations (what a serial loop would cost)
+
+    def get_summary(self) -> str:
+        speedup = self.serial_seconds / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+        return (
+            f"{self.context_label}: {self.completed}/{self.submitted} analyzed, "
+            f"{self.skipped_deadline} skipped (deadline), {self.errors} errors, "
+            f"{self.alerts_sent} alerts in {self.elapsed_seconds:.1f}s "
+            f"(serial estimate {self.serial_seconds:.1f}s, {speedup:.1f}x)"
+        )
+
+
+class MatchAnalysisScheduler:
+    """
+    Bounded, kickoff-prioritized parallel runner for analyze_match().
+
+    Thread Safety:
+        run() must be called from a single thread (the pipeline thread).
+        Worker threads only share the analysis engine and providers, which
+        already guard their shared state with locks.
+    """
+
+    def __init__(
+        self,
+        analysis_engine,
+        fotmob,
+        max_workers: int = MATCH_ANALYSIS_MAX_WORKERS,
+        cycle_deadline_seconds: float = MATCH_ANALYSIS_CYCLE_DEADLINE_SECONDS,
+        session_factory: Callable = SessionLocal,
+        intel_lookup: Optional[Callable[[str], Optional[dict]]] = None,
+    ):
+        """
+        Args:
+            analysis_engine: AnalysisEngine instance
+            fotmob: FotMob provider instance
+            max_workers: Max matches analyzed concurrently (1 = serial)
+            cycle_deadline_seconds: Budget for the whole cycle, across all run() calls
+            session_factory: Callable returning a new database session
+            intel_lookup: Optional callable(match_id) -> {"intel": str, "handle": str}
+                          (e.g. get_nitter_intel_for_match)
+        """
+        self.analysis_engine = analysis_engine
+        self.fotmob = fotmob
+        self.max_workers = max(1, int(max_workers))
+        self.session_factory = session_factory
+        self.intel_lookup = intel_lookup
+        self._deadline = time.monotonic() + cycle_deadline_seconds
+        self._stats_lock = threading.Lock()
+
+    def time_remaining(self) -> float:
+        """Seconds left before the cycle deadline (negative once exceeded)."""
+        return self._deadline - time.monotonic()
+
+    def run(
+        self, matches: list[Match], now_utc: datetime, context_label: str = "TIER1"
+    ) -> tuple[list[dict[str, Any]], SchedulerStats]:
+        """
+        Analyze matches in kickoff order with bounded concurrency.
+
+        Args:
+            matches: Match ORM objects (from the caller's session)
+            now_utc: Current UTC time passed through to analyze_match()
+            context_label: Label for logging (e.g., "TIER1", "TIER2")
+
+        Returns:
+            Tuple of (analysis results, SchedulerStats). Each result is the dict
+            returned by analyze_match() plus "match_id", "home_team",
+            "away_team" and "skipped" keys;
+            results are ordered by kickoff time.
+        """
+        jobs = sorted(MatchJob.from_match(m) for m in matches)
+        stats = SchedulerStats(context_label=context_label, submitted=len(jobs))
+        if not jobs:
+            return [], stats
+
+        start = time.monotonic()
+        workers = min(self.max_workers, len(jobs))
+        logger.info(
+            f"🗓️ [SCHEDULER] {context_label}: {len(jobs)} matches, {workers} workers, "
+            f"{max(0.0, self.time_remaining()):.0f}s left in cycle"
+        )
+
+        results: dict[str, dict[str, Any]] = {}
+        if workers == 1:
+            for job in jobs:
+                results[job.match_id] = self._run_job(job, now_utc, context_label, stats)
+        else:
+            # ThreadPoolExecutor hands out work in submission order,
+            # so earliest kickoffs start first
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix=f"analysis-{context_label.lower()}"
+            ) as executor:
+                futures = {
+                    executor.submit(self._run_job, job, now_utc, context_label, stats): job
+                    for job in jobs
+                }
+                for future in as_completed(futures):
+                    job = futures[future]
+                    try:
+                        results[job.match_id] = future.result()
+                    except Exception as e:
+                        # _run_job already catches everything; this is a last-resort guard
+                        logger.error(f"❌ [SCHEDULER] Worker crashed for {job.match_id}: {e}")
+                        results[job.match_id] = self._empty_result(job, error=str(e))
+
+        stats.elapsed_seconds = time.monotonic() - start
+        logger.info(f"🗓️ [SCHEDULER] {stats.get_summary()}")
+        provider_stats = get_provider_limiter().get_stats()
+        logger.debug(f"🗓️ [SCHEDULER] Provider slots: {provider_stats}")
+        return [results[job.match_id] for job in jobs], stats
+
+    @staticmethod
+    def _empty_result(
+        job: MatchJob, error: Optional[str] = None, skipped: bool = False
+    ) -> dict[str, Any]:
+        return {
+            "alert_sent": False,
+            "score": 0.0,
+            "market": None,
+            "error": error,
+            "news_count": 0,
+            "match_id": job.match_id,
+            "home_team": job.home_team,
+            "away_team": job.away_team,
+            "skipped": skipped,
+        }
+
+    def _run_job(
+        self, job: MatchJob, now_utc: datetime, context_label: str, stats: SchedulerStats
+    ) -> dict[str, Any]:
+        """Analyze one match in its own session. Never raises."""
+        if self.time_remaining() <= 0:
+            logger.info(
+                f"⏰ [SCHEDULER] Cycle deadline reached, deferring "
+                f"{job.home_team} vs {job.away_team} to next cycle"
+            )
+            with self._stats_lock:
+                stats.skipped_deadline += 1
+            return self._empty_result(job, skipped=True)
+
+        job_start = time.monotonic()
+        db = self.session_factory()
+        try:
+            match = db.get(Match, job.match_id)
+            if match is None:
+                logger.warning(f"⚠️ [SCHEDULER] Match {job.match_id} vanished before analysis")
+                result = self._empty_result(job, error="Match not found")
+            else:
+                nitter_intel = None
+                if self.intel_lookup:
+                    try:
+                        intel_data = self.intel_lookup(job.match_id)
+                        if intel_data:
+                            nitter_intel = intel_data.get("intel")
+                            logger.info(
+                                f"🐦 [NITTER-INTEL] Found intel for {job.home_team} vs "
+                                f"{job.away_team} via {intel_data.get('handle')}"
+                            )
+                    except Exception as e:
+                        logger.debug(f"Nitter intel check failed: {e}")
+
+                result = self.analysis_engine.analyze_match(
+                    match=match,
+                    fotmob=self.fotmob,
+                    now_utc=now_utc,
+                    db_session=db,
+                    context_label=context_label,
+                    nitter_intel=nitter_intel,
+                )
+                result = {
+                    **result,
+                    "match_id": job.match_id,
+                    "home_team": job.home_team,
+                    "away_team": job.away_team,
+                    "skipped": False,
+                }
+        except Exception as e:
+            logger.error(
+                f"❌ [SCHEDULER] Analysis crashed for {job.home_team} vs {job.away_team}: {e}"
+            )
+            try:
+                db.rollback()
+            except Exception:
+                pass
+            result = self._empty_result(job, error=str(e))
+        finally:
+            db.close()
+
+        with self._stats_lock:
+            stats.completed += 1
+            stats.serial_seconds += time.monotonic() - job_start
+            if result.get("error"):
+                stats.errors += 1
+            if result.get("alert_sent"):
+                stats.alerts_sent += 1
+        return result
@@ -33,8 +33,14 @@ from sqlalchemy import and_
 from sqlalchemy.orm import joinedload
 
 from config.settings import DEFAULT_ODDS_GOALS, SETTLEMENT_MIN_SCORE
+from src.analysis.settlement_results import (
+    apply_settlement_updates,
+    get_match_result_store,
+    match_stats_update,
+    resolve_match_results,
+)
 from src.database.db import get_db_context
-from src.database.models import Match, NewsLog
+from src.database.models import Match
 from src.ingestion.data_provider import get_data_provider
 from src.utils.validators import safe_get
 
@@ -254,13 +260,18 @@ class SettlementService:
         """
         results_cache: list[dict] = []
 
-        for match_data in matches_to_settle:
-            stats["total_checked"] += 1
+        # V1.1: Stored results first, then bounded-concurrency FotMob fetches
+        resolved = resolve_match_results(
+            matches_to_settle,
+            self._get_match_result,
+            lambda fotmob_match_id: get_data_provider().get_match_stats(fotmob_match_id),
+            store=get_match_result_store(),
+        )
 
-            result = self._get_match_result(
-                match_data["home_team"], match_data["away_team"], match_data["start_time"]
-            )
+        for match_data, resolved_result in zip(matches_to_settle, resolved, strict=True):
+            stats["total_checked"] += 1
 
+            result = resolved_result.result
             if not result:
                 stats["pending"] += 1
                 logger.debug(
@@ -268,16 +279,7 @@ class SettlementService:
                 )
                 continue
 
-            match_stats = None
-            fotmob_match_id = result.get("match_id")
-            if fotmob_match_id and result.get("status") == "FINISHED":
-                try:
-                    fotmob = get_data_provider()
-                    match_stats = fotmob.get_match_stats(fotmob_match_id)
-                    if not match_stats:
-                        logger.warning(f"⚠️ Could not get match stats for {fotmob_match_id}")
-                except Exception as e:
-                    logger.warning(f"⚠️ Could not fetch stats: {e}")
+            match_stats = resolved_result.match_stats
 
             outcome, explanation = self._evaluate_bet(
                 match_data["recommended_market"],
@@ -328,6 +330,9 @@ class SettlementService:
         """
         total_stake = 0
         total_return = 0
+        # V1.1: Column updates collected per row and written in one bulk UPDATE per table
+        match_updates: dict[str, dict] = {}
+        news_log_updates: dict[int, dict] = {}
 
         with get_db_context() as db:
             try:
@@ -341,50 +346,24 @@ class SettlementService:
                     combo_explanation = item.get("combo_explanation")
                     expansion_type = item.get("expansion_type")
 
+                    news_log_update = news_log_updates.setdefault(match_data["news_log_id"], {})
+
                     # Update match stats
                     if match_stats:
-                        match = db.query(Match).filter(Match.id == match_data["match_id"]).first()
-                        if match:
-                            match.home_corners = match_stats.get("home_corners")
-                            match.away_corners = match_stats.get("away_corners")
-                            match.home_yellow_cards = match_stats.get("home_yellow_cards")
-                            match.away_yellow_cards = match_stats.get("away_yellow_cards")
-                            match.home_red_cards = match_stats.get("home_red_cards")
-                            match.away_red_cards = match_stats.get("away_red_cards")
-                            match.home_xg = match_stats.get("home_xg")
-                            match.away_xg = match_stats.get("away_xg")
-                            match.home_possession = match_stats.get("home_possession")
-                            match.away_possession = match_stats.get("away_possession")
-                            match.home_shots_on_target = match_stats.get("home_shots_on_target")
-                            match.away_shots_on_target = match_stats.get("away_shots_on_target")
-                            match.home_big_chances = match_stats.get("home_big_chances")
-                            match.away_big_chances = match_stats.get("away_big_chances")
-                            match.home_fouls = match_stats.get("home_fouls")
-                            match.away_fouls = match_stats.get("away_fouls")
+                        match_updates[match_data["match_id"]] = match_stats_update(match_stats)
 
                     # Update combo outcome
                     if combo_outcome:
-                        news_log = (
-                            db.query(NewsLog)
-                            .filter(NewsLog.id == match_data["news_log_id"])
-                            .first()
+                        news_log_update.update(
+                            combo_outcome=combo_outcome,
+                            combo_explanation=combo_explanation,
+                            expansion_type=expansion_type,
                         )
-                        if news_log:
-                            news_log.combo_outcome = combo_outcome
-                            news_log.combo_explanation = combo_explanation
-                            news_log.expansion_type = expansion_type
 
                     # V13.0: Save primary bet outcome to database
                     # This is critical for CLV and ROI analysis
                     if outcome != RESULT_PENDING:
-                        news_log = (
-                            db.query(NewsLog)
-                            .filter(NewsLog.id == match_data["news_log_id"])
-                            .first()
-                        )
-                        if news_log:
-                            news_log.outcome = outcome
-                            news_log.outcome_explanation = explanation
+                        news_log_update.update(outcome=outcome, outcome_explanation=explanation)
 
                     # Skip pending outcomes
                     if outcome == RESULT_PENDING:
@@ -457,11 +436,7 @@ class SettlementService:
                                 line_movement = f"Odds moved from {odds_taken:.2f} to {closing_odds:.2f} (CLV: {clv_value:+.2f}%)"
 
                                 # Get match date from match_data
-                                match_date = (
-                                    match_data.get("start_time") or match.get("start_time")
-                                    if match
-                                    else None
-                                )
+                                match_date = match_data.get("start_time")
 
                                 # Call Tavily for explanation (V14.0: Pass clv_value for priority system)
                                 line_movement_explanation = _tavily_verify_line_movement(
@@ -506,17 +481,12 @@ class SettlementService:
 
                     # Save CLV to database
                     if clv_value is not None:
-                        news_log = (
-                            db.query(NewsLog)
-                            .filter(NewsLog.id == match_data["news_log_id"])
-                            .first()
-                        )
-                        if news_log:
-                            news_log.clv_percent = clv_value
-                            # V14.0: Save line movement explanation
-                            if line_movement_explanation:
-                                news_log.line_movement_explanation = line_movement_explanation
+                        news_log_update["clv_percent"] = clv_value
+                        # V14.0: Save line movement explanation
+                        if line_movement_explanation:
+                            news_log_update["line_movement_explanation"] = line_movement_explanation
 
+                apply_settlement_updates(db, match_updates, news_log_updates)
                 db.commit()
 
             except Exception as e:
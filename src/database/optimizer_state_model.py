@@ -0,0 +1,234 @@
+"""
+EarlyBird Optimizer State Model - V1.0
+
+SQLite storage for the StrategyOptimizer state, replacing whole-file rewrites
+of data/optimizer_weights.json.
+
+One row per (league, market) strategy, per driver and per expansion type,
+plus one row for the global totals. Each row keeps the stats dict exactly as
+the optimizer holds it (JSON payload) with bets/weight as real columns for
+queries. Saving upserts only the rows touched since the last save, in one
+transaction; reading rebuilds the usual nested dict once (the optimizer keeps
+it in OptimizerWeightCache as its read-through cache).
+"""
+
+import json
+import logging
+import threading
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import DateTime, Float, Index, Integer, String, Text, UniqueConstraint, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Mapped, mapped_column, sessionmaker
+
+from src.database.models import Base, engine
+
+logger = logging.getLogger(__name__)
+
+# Row scopes
+SCOPE_MARKET = "market"  # league = league key, name = market type
+SCOPE_DRIVER = "driver"  # name = driver
+SCOPE_EXPANSION = "expansion"  # name = combo expansion type
+SCOPE_GLOBAL = "global"  # single row: totals, version, last_updated
+
+_SCOPE_SECTIONS = {SCOPE_DRIVER: "drivers", SCOPE_EXPANSION: "expansion_stats"}
+
+StateKey = tuple[str, str, str]
+
+
+class OptimizerStat(Base):
+    """One StrategyOptimizer stats entry."""
+
+    __tablename__ = "optimizer_stats"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    scope: Mapped[str] = mapped_column(String, nullable=False)
+    league: Mapped[str] = mapped_column(String, nullable=False, default="")
+    name: Mapped[str] = mapped_column(String, nullable=False)
+
+    bets: Mapped[int] = mapped_column(Integer, default=0)
+    weight: Mapped[float | None] = mapped_column(Float, nullable=True)
+    payload: Mapped[str] = mapped_column(Text, nullable=False)  # JSON stats dict
+
+    updated_at: Mapped[datetime | None] = mapped_column(
+        DateTime, default=lambda: datetime.now(timezone.utc)
+    )
+
+    __table_args__ = (
+        UniqueConstraint("scope", "league", "name", name="uq_optimizer_stat_key"),
+        Index("idx_optimizer_stat_scope", "scope"),
+    )
+
+
+# ============================================
+# DATA TREE <-> ROWS
+# ============================================
+
+
+def optimizer_state_keys(data: dict) -> list[StateKey]:
+    """Every row key of an optimizer data tree (used for the JSON migration)."""
+    keys: list[StateKey] = [(SCOPE_GLOBAL, "", SCOPE_GLOBAL)]
+    for league, markets in data.get("stats", {}).items():
+        keys.extend((SCOPE_MARKET, league, market) for market in markets)
+    keys.extend((SCOPE_DRIVER, "", driver) for driver in data.get("drivers", {}))
+    keys.extend((SCOPE_EXPANSION, "", name) for name in data.get("expansion_stats", {}))
+    return keys
+
+
+def _entry(data: dict, key: StateKey) -> dict | None:
+    scope, league, name = key
+    if scope == SCOPE_GLOBAL:
+        return {
+            "global": data.get("global", {}),
+            "version": data.get("version"),
+            "last_updated": data.get("last_updated"),
+        }
+    if scope == SCOPE_MARKET:
+        return data.get("stats", {}).get(league, {}).get(name)
+    return data.get(_SCOPE_SECTIONS[scope], {}).get(name)
+
+
+def build_optimizer_data(rows: Iterable[tuple[str, str, str, dict]]) -> dict:
+    """Nested optimizer data dict from (scope, league, name, payload) rows."""
+    data: dict[str, Any] = {
+        "stats": {},
+        "drivers": {},
+        "global": {"total_bets": 0, "total_profit": 0.0, "overall_roi": 0.0},
+        "version": "3.0",
+        "last_updated": None,
+    }
+    for scope, league, name, payload in rows:
+        if scope == SCOPE_GLOBAL:
+            data["global"] = payload.get("global") or data["global"]
+            data["version"] = payload.get("version") or data["version"]
+            data["last_updated"] = payload.get("last_updated")
+        elif scope == SCOPE_MARKET:
+            data["stats"].setdefault(league, {})[name] = payload
+        elif scope in _SCOPE_SECTIONS:
+            data.setdefault(_SCOPE_SECTIONS[scope], {})[name] = payload
+    return data
+
+
+# ============================================
+# STORE
+# ============================================
+
+
+class OptimizerStateStore:
+    """
+    Optimizer state rows in the EarlyBird SQLite database.
+
+    Thread-safe: every call uses its own session; save() is one transaction.
+    """
+
+    def __init__(self, bind=None):
+        self._engine = bind if bind is not None else engine
+        self._session_factory = sessionmaker(autocommit=False, autoflush=False, bind=self._engine)
+        self._init_lock = threading.Lock()
+        self._initialized = False
+
+    def _ensure_table(self) -> None:
+        if self._initialized:
+            return
+        with self._init_lock:
+            if not self._initialized:
+                OptimizerStat.__table__.create(self._engine, checkfirst=True)
+                self._initialized = True
+
+    def load(self) -> dict | None:
+        """
+        Rebuild the optimizer data dict.
+
+        Returns:
+            Data dict, or None if the store is empty (nothing saved or migrated yet)
+        """
+        self._ensure_table()
+        with self._session_factory() as session:
+            rows = session.execute(
+                select(
+                    OptimizerStat.scope,
+                    OptimizerStat.league,
+                    OptimizerStat.name,
+                    OptimizerStat.payload,
+                )
+            ).all()
+        if not rows:
+            return None
+        return build_optimizer_data(
+            (scope, league, name, json.loads(payload)) for scope, league, name, payload in rows
+        )
+
+    def save(self, data: dict, keys: Iterable[StateKey]) -> int:
+        """
+        Upsert the given entries of data in one transaction.
+
+        Args:
+            data: Optimizer data dict
+            keys: (scope, league, name) of the entries to write
+
+        Returns:
+            Number of rows written
+        """
+        self._ensure_table()
+        now = datetime.now(timezone.utc)
+        rows = []
+        for key in dict.fromkeys(keys):
+            entry = _entry(data, key)
+            if entry is None:
+                continue
+            scope, league, name = key
+            rows.append(
+                {
+                    "scope": scope,
+                    "league": league,
+                    "name": name,
+                    "bets": entry.get("bets", entry.get("global", {}).get("total_bets", 0)),
+                    "weight": entry.get("weight"),
+                    "payload": json.dumps(entry, separators=(",", ":")),
+                    "updated_at": now,
+                }
+            )
+        if not rows:
+            return 0
+
+        stmt = sqlite_insert(OptimizerStat.__table__)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["scope", "league", "name"],
+            set_={
+                column: stmt.excluded[column]
+                for column in ("bets", "weight", "payload", "updated_at")
+            },
+        )
+        with self._session_factory() as session:
+            try:
+                session.execute(stmt, rows)
+                session.commit()
+            except Exception:
+                session.rollback()
+                raise
+        return len(rows)
+
+    def count(self) -> int:
+        self._ensure_table()
+        with self._session_factory() as session:
+            return session.query(OptimizerStat).count()
+
+
+# ============================================
+# SINGLETON INSTANCE
+# ============================================
+
+_state_store: OptimizerStateStore | None = None
+_state_store_lock = threading.Lock()
+
+
+def get_optimizer_state_store() -> OptimizerStateStore:
+    """Get or create the shared OptimizerStateStore (double-checked locking)."""
+    global _state_store
+    if _state_store is None:
+        with _state_store_lock:
+            if _state_store is None:
+                _state_store = OptimizerStateStore()
+    return _state_store
@@ -105,9 +105,15 @@ def _find_team_alias(db, team_name: str) -> Optional[TeamAlias]:
 
         # Try reverse: find records where normalized api_name matches input
         # This handles: DB has "Galatasaray SK", we search "Galatasaray"
-        all_aliases = db.query(TeamAlias).all()
-        for a in all_aliases:
-            if _normalize_team_name(a.api_name).lower() == normalized.lower():
+        # V15.0: Candidates come from the shared team-name index (suffix-stripped
+        # api_names are indexed as aliases) instead of loading and scanning every row
+        from src.utils.team_name_index import get_team_name_index
+
+        for api_name in get_team_name_index().lookup_all(normalized):
+            if _normalize_team_name(api_name).lower() != normalized.lower():
+                continue
+            a = db.query(TeamAlias).filter(TeamAlias.api_name == api_name).first()
+            if a:
                 logger.debug(f"✅ Found TeamAlias for '{team_name}' (reverse normalized match)")
                 return a
 
@@ -17,6 +17,8 @@ V4.0: Added API key rotation and budget management (duplicated from Tavily).
 V4.5: Fixed double URL encoding bug that caused HTTP 422 errors with non-ASCII characters.
        HTTPX automatically encodes query parameters; manual encoding was causing double encoding.
 V12.4: Added Half-Open auto-recovery for _rate_limited flag (12h cooldown).
+V4.7: Results cached in the shared provider response cache (src/utils/response_cache.py),
+      so repeated queries across components and restarts do not spend quota.
 """
 
 import html
@@ -28,6 +30,7 @@ from config.settings import BRAVE_API_KEY
 from src.ingestion.brave_budget import get_brave_budget_manager
 from src.ingestion.brave_key_rotator import get_brave_key_rotator
 from src.utils.http_client import get_http_client
+from src.utils.response_cache import get_response_cache
 from src.utils.validators import safe_get
 
 logger = logging.getLogger(__name__)
@@ -57,6 +60,7 @@ class BraveSearchProvider:
         self._api_key = BRAVE_API_KEY  # Fallback to single key
         self._rate_limited = False
         self._http_client = get_http_client()
+        self._response_cache = get_response_cache()
 
         # V12.4: Auto-recovery timestamp for _rate_limited flag
         self._rate_limited_activated_at: float | None = None
@@ -131,6 +135,13 @@ class BraveSearchProvider:
         if not self._api_key:
             raise ValueError("BRAVE_API_KEY not configured in environment")
 
+        # V4.7: Serve repeated (canonically equal) queries from the shared response cache
+        cache_key = self._response_cache.make_key("brave", query, limit=limit)
+        cached = self._response_cache.get("brave", cache_key)
+        if cached is not None:
+            logger.debug(f"📦 [BRAVE] Cache hit: {query[:60]}...")
+            return [dict(result) for result in cached]
+
         if self._rate_limited:
             logger.warning("⚠️ Brave Search temporarily rate limited")
             return []
@@ -223,6 +234,7 @@ class BraveSearchProvider:
                 )
 
             logger.info(f"🔍 [BRAVE] Found {len(results)} results")
+            self._response_cache.set("brave", cache_key, [dict(result) for result in results])
             return results
 
         except Exception as e:
@@ -30,6 +30,9 @@ import requests
 import requests.exceptions
 from dateutil import parser
 
+from src.utils.single_flight import SingleFlight
+from src.utils.team_name_index import score_team_candidate
+
 # Try to import thefuzz for better fuzzy matching
 try:
     from thefuzz import fuzz as thefuzz_fuzz
@@ -300,6 +303,11 @@ def normalize_unicode(text: str) -> str:
 def fuzzy_match_team(search_name: str, candidates: list[str], threshold: float = 0.6) -> str | None:
     """
     Find best fuzzy match for a team name.
+
+    V15.0: Per-candidate scoring lives in src/utils/team_name_index.py so the
+    shared TeamNameIndex ranks its (blocked) candidates exactly the same way.
+    Callers here only pass the handful of FotMob search results; for lookups
+    against all known teams use get_team_name_index().match().
     """
     if not candidates:
         return None
@@ -308,8 +316,6 @@ def fuzzy_match_team(search_name: str, candidates: list[str], threshold: float =
         return None
 
     search_lower = search_name.lower().strip()
-    search_tokens = set(search_lower.split())
-    search_first = search_lower.split()[0] if search_lower else ""
 
     best_match = None
     best_score = 0
@@ -318,35 +324,11 @@ def fuzzy_match_team(search_name: str, candidates: list[str], threshold: float =
         if not candidate:
             continue
 
-        cand_lower = candidate.lower().strip()
-        cand_tokens = set(cand_lower.split())
-
-        if search_lower == cand_lower:
-            return candidate
-
-        cand_first = cand_lower.split()[0] if cand_lower else ""
-        if search_first and cand_first and search_first == cand_first and len(search_first) >= 4:
+        score, definitive = score_team_candidate(search_lower, candidate.lower().strip())
+        if definitive:
             return candidate
-
-        overlap = len(search_tokens & cand_tokens)
-        if overlap >= 1 and overlap >= len(search_tokens) * 0.5:
-            token_score = overlap / max(len(search_tokens), len(cand_tokens))
-            if token_score > best_score:
-                best_score = token_score
-                best_match = candidate
-
-        if _THEFUZZ_AVAILABLE and thefuzz_fuzz is not None:
-            try:
-                fuzz_score = thefuzz_fuzz.token_set_ratio(search_lower, cand_lower) / 100.0
-                if fuzz_score > best_score:
-                    best_score = fuzz_score
-                    best_match = candidate
-            except Exception as e:
-                logger.debug(f"thefuzz matching failed, using difflib fallback: {e}")
-
-        seq_score = SequenceMatcher(None, search_lower, cand_lower).ratio()
-        if seq_score > best_score:
-            best_score = seq_score
+        if score > best_score:
+            best_score = score
             best_match = candidate
 
     if best_score >= threshold:
@@ -635,12 +617,49 @@ class FotMobProvider:
         self._team_cache: dict[str, tuple[int, str]] = {}
         self._last_request_time = 0.0
 
+        # V15.0: Concurrent requests for the same URL share one in-flight HTTP call
+        self._inflight = SingleFlight(name="fotmob")
+
         # V7.0: Initialize aggressive cache for FotMob data (24h TTL)
         # This reduces FotMob requests by 80-90%
         try:
             from src.utils.smart_cache import SmartCache
 
-            self._swr_cache = SmartCache(name="fotmob_swr", max_size=2000, swr_enabled=True)
+            try:
+                from config.settings import (
+                    FOTMOB_SWR_CACHE_MAX_BYTES,
+                    FOTMOB_SWR_CACHE_MAX_ENTRIES,
+                    FOTMOB_SWR_PERSISTENT_ENABLED,
+                    FOTMOB_SWR_PERSISTENT_MAX_ENTRIES,
+                    FOTMOB_SWR_PERSISTENT_PATH,
+                )
+            except ImportError:
+                FOTMOB_SWR_CACHE_MAX_ENTRIES, FOTMOB_SWR_CACHE_MAX_BYTES = 2000, None
+                FOTMOB_SWR_PERSISTENT_ENABLED = False
+                FOTMOB_SWR_PERSISTENT_PATH, FOTMOB_SWR_PERSISTENT_MAX_ENTRIES = "", 0
+
+            # V15.0: On-disk tier so restarts serve cached data instead of re-fetching.
+            # Error dicts stay memory-only so a transient failure is not replayed after restart.
+            persistent_tier = None
+            if FOTMOB_SWR_PERSISTENT_ENABLED:
+                from src.utils.persistent_cache import PersistentCacheTier
+
+                persistent_tier = PersistentCacheTier(
+                    FOTMOB_SWR_PERSISTENT_PATH,
+                    max_entries=FOTMOB_SWR_PERSISTENT_MAX_ENTRIES,
+                    should_persist=lambda value: (
+                        not (isinstance(value, dict) and value.get("error") is True)
+                    ),
+                )
+
+            # V15.0: Entry + byte bounds (LRU eviction) for predictable memory use
+            self._swr_cache = SmartCache(
+                name="fotmob_swr",
+                max_size=FOTMOB_SWR_CACHE_MAX_ENTRIES,
+                swr_enabled=True,
+                max_bytes=FOTMOB_SWR_CACHE_MAX_BYTES,
+                persistent_tier=persistent_tier,
+            )
             logger.info(
                 "✅ FotMob Provider initialized (UA rotation + Aggressive SWR caching enabled)"
             )
@@ -700,6 +719,16 @@ class FotMobProvider:
 
         return result, is_fresh
 
+    def get_request_coalescing_stats(self) -> dict[str, Any]:
+        """
+        V15.0: Single-flight counters for FotMob HTTP requests.
+
+        Returns:
+            Dict with executions (requests actually sent), coalesced (requests
+            saved by joining an in-flight call), saved_pct, max_waiters, in_flight
+        """
+        return self._inflight.get_stats()
+
     def log_cache_metrics(self):
         """
         V7.0: Log cache performance metrics for monitoring.
@@ -736,6 +765,14 @@ class FotMobProvider:
             else:
                 logger.info("📊 [FOTMOB] Cache Metrics - No requests yet")
 
+        coalescing = self.get_request_coalescing_stats()
+        if coalescing["coalesced"]:
+            logger.info(
+                f"📊 [FOTMOB] Request Coalescing - "
+                f"Sent: {coalescing['executions']}, "
+                f"Saved: {coalescing['coalesced']} ({coalescing['saved_pct']:.1f}%)"
+            )
+
     def cleanup(self):
         """
         V7.0: Cleanup resources when shutting down.
@@ -780,6 +817,14 @@ class FotMobProvider:
     def _make_request(
         self, url: str, retries: int = FOTMOB_MAX_RETRIES
     ) -> requests.Response | None:
+        """
+        V15.0: Coalesced entry point: concurrent callers for the same URL share one request.
+
+        See _request() for retry/rate-limit behaviour.
+        """
+        return self._inflight.do(("requests", url), lambda: self._request(url, retries))
+
+    def _request(self, url: str, retries: int = FOTMOB_MAX_RETRIES) -> requests.Response | None:
         """
         V6.3: Make HTTP request with retry logic and specific error handling.
 
@@ -1014,6 +1059,23 @@ class FotMobProvider:
 
     def _make_request_with_fallback(
         self, url: str, retries: int = FOTMOB_MAX_RETRIES
+    ) -> ResponseLike | None:
+        """
+        V15.0: Coalesced entry point for the hybrid fetch.
+
+        The same team is resolved and fetched by several callers in one cycle
+        (team context, turnover risk, team stats, referee, stadium) and by
+        concurrent threads (main loop, high-priority callback, radar triggers).
+        Concurrent calls for the same URL share one in-flight request, so a
+        burst of cache misses costs one rate-limited FotMob hit instead of N.
+        See get_request_coalescing_stats() for the number of requests saved.
+        """
+        return self._inflight.do(
+            ("fallback", url), lambda: self._request_with_fallback(url, retries)
+        )
+
+    def _request_with_fallback(
+        self, url: str, retries: int = FOTMOB_MAX_RETRIES
     ) -> ResponseLike | None:
         """
         V7.0: Hybrid approach - Try requests first, fallback to Playwright on 403.
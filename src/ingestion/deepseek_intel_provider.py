@@ -9,6 +9,8 @@ Flow:
 2. DDG Search (primary) or Brave Search (fallback) for real-time web results
 3. DeepSeek via OpenRouter for AI analysis
 
+V12.7: Responses cached in the shared provider response cache (src/utils/response_cache.py):
+       canonical keys, O(1) LRU, persisted across restarts.
 V10.0: Replaced broken search engine Twitter queries with TwitterIntelCache.
        Twitter/X blocks search engine indexing (site:twitter.com returns 0 results).
 V6.4: Fixed double URL encoding bug - HTTPX automatically encodes query parameters.
@@ -24,17 +26,12 @@ Requirements:
 - Brave Search API (via BraveSearchProvider) as fallback
 """
 
-import hashlib
-import json
 import logging
 import os
 import threading
 import time
-from dataclasses import dataclass
 from datetime import datetime, timezone
 
-from config.settings import DEEPSEEK_CACHE_TTL_SECONDS
-
 # Lazy import to prevent module-load failure if brave_provider is unavailable.
 # brave_provider depends on BRAVE_API_KEY and may raise ImportError if
 # dependencies are missing. Using a lazy pattern keeps this module loadable.
@@ -64,6 +61,7 @@ from src.utils.normalizers import (
     normalize_verification_result,
 )
 from src.utils.http_client import get_http_client
+from src.utils.response_cache import get_response_cache
 from src.utils.validators import safe_get, safe_list_get
 
 # V6.0: CooldownManager import removed - OpenRouter/DeepSeek has high rate limits
@@ -99,30 +97,6 @@ DEEPSEEK_MODEL = os.getenv("OPENROUTER_MODEL", MODEL_A_STANDARD)
 DEEPSEEK_MIN_INTERVAL = 2.0  # Minimum seconds between requests (Requirements 4.2)
 
 
-@dataclass
-class DeepSeekCacheEntry:
-    """Cache entry for DeepSeek responses with TTL and LRU tracking."""
-
-    response: str
-    cached_at: datetime
-    ttl_seconds: int = DEEPSEEK_CACHE_TTL_SECONDS
-    last_accessed: datetime = None
-
-    def __post_init__(self):
-        """Initialize last_accessed if not provided."""
-        if self.last_accessed is None:
-            self.last_accessed = datetime.now(timezone.utc)
-
-    def is_expired(self) -> bool:
-        """Check if cache entry has expired."""
-        elapsed = (datetime.now(timezone.utc) - self.cached_at).total_seconds()
-        return elapsed > self.ttl_seconds
-
-    def touch(self):
-        """Update last_accessed timestamp for LRU tracking."""
-        self.last_accessed = datetime.now(timezone.utc)
-
-
 class DeepSeekIntelProvider:
     """
     Provider AI che usa DeepSeek via OpenRouter + Brave Search.
@@ -160,10 +134,8 @@ class DeepSeekIntelProvider:
         self._model_b_calls = 0
 
         # V12.6: Response caching to reduce API costs
-        self._cache: dict[str, DeepSeekCacheEntry] = {}
-        self._cache_lock = threading.Lock()  # Thread-safe cache access
-        self._cache_hits = 0
-        self._cache_misses = 0
+        # V12.7: Shared persistent response cache (canonical keys, O(1) LRU)
+        self._response_cache = get_response_cache()
 
         if not self._api_key:
             logger.warning("⚠️ DeepSeek Intel Provider disabled: OPENROUTER_API_KEY not set")
@@ -217,21 +189,26 @@ class DeepSeekIntelProvider:
         """
         Generate a unique cache key for a request.
 
+        V12.7: Message contents are canonicalized (casing, whitespace, team
+        aliases) so equivalent prompts share a cached response.
+
         Args:
             model: Model ID being called
             messages: List of message dicts
 
         Returns:
-            SHA256 hash as cache key
+            Cache key ("deepseek:<sha256>")
         """
-        # Create a deterministic string representation
-        key_data = f"{model}:{json.dumps(messages, sort_keys=True)}"
-        return hashlib.sha256(key_data.encode()).hexdigest()
+        return self._response_cache.make_key(
+            "deepseek",
+            *(message.get("content", "") for message in messages),
+            model=model,
+            roles=[message.get("role") for message in messages],
+        )
 
     def _get_from_cache(self, cache_key: str) -> str | None:
         """
         Retrieve response from cache if available and not expired.
-        Updates last_accessed timestamp for LRU tracking.
 
         Args:
             cache_key: Cache key to look up
@@ -239,62 +216,20 @@ class DeepSeekIntelProvider:
         Returns:
             Cached response or None if not found/expired
         """
-        with self._cache_lock:
-            if cache_key in self._cache:
-                entry = self._cache[cache_key]
-                if not entry.is_expired():
-                    # Update last_accessed for LRU tracking
-                    entry.touch()
-                    self._cache_hits += 1
-                    logger.debug(f"💾 [DEEPSEEK] Cache hit for {cache_key[:16]}...")
-                    return entry.response
-                else:
-                    # Clean up expired entry
-                    del self._cache[cache_key]
-                    logger.debug(f"🗑️  [DEEPSEEK] Cache expired for {cache_key[:16]}...")
-        self._cache_misses += 1
-        return None
+        response = self._response_cache.get("deepseek", cache_key)
+        if response is not None:
+            logger.debug(f"💾 [DEEPSEEK] Cache hit for {cache_key[:25]}...")
+        return response
 
     def _store_in_cache(self, cache_key: str, response: str) -> None:
         """
-        Store response in cache.
+        Store response in cache (TTL: DEEPSEEK_CACHE_TTL_SECONDS).
 
         Args:
             cache_key: Cache key to store under
             response: Response to cache
         """
-        with self._cache_lock:
-            self._cache[cache_key] = DeepSeekCacheEntry(
-                response=response,
-                cached_at=datetime.now(timezone.utc),
-            )
-
-            # Cleanup old entries (keep cache size reasonable)
-            if len(self._cache) > 1000:
-                self._cleanup_cache()
-
-    def _cleanup_cache(self) -> None:
-        """
-        Remove expired and oldest cache entries to enforce size limit.
-        Uses hybrid approach: removes expired entries first, then LRU eviction.
-        """
-        with self._cache_lock:
-            # First, remove expired entries
-            expired_keys = [key for key, entry in self._cache.items() if entry.is_expired()]
-            for key in expired_keys:
-                del self._cache[key]
-
-            if expired_keys:
-                logger.debug(f"🧹 [DEEPSEEK] Cleaned up {len(expired_keys)} expired cache entries")
-
-            # If still over limit, remove oldest entries (by last_accessed) - LRU eviction
-            if len(self._cache) > 1000:
-                sorted_entries = sorted(self._cache.items(), key=lambda x: x[1].last_accessed)
-                num_to_remove = len(self._cache) - 1000
-                for i in range(num_to_remove):
-                    key, _ = sorted_entries[i]
-                    del self._cache[key]
-                logger.debug(f"🧹 [DEEPSEEK] LRU eviction: removed {num_to_remove} oldest entries")
+        self._response_cache.set("deepseek", cache_key, response)
 
     def get_cache_stats(self) -> dict:
         """
@@ -303,15 +238,14 @@ class DeepSeekIntelProvider:
         Returns:
             Dict with cache stats
         """
-        with self._cache_lock:
-            total_requests = self._cache_hits + self._cache_misses
-            hit_rate = (self._cache_hits / total_requests * 100) if total_requests > 0 else 0.0
-            return {
-                "cache_size": len(self._cache),
-                "cache_hits": self._cache_hits,
-                "cache_misses": self._cache_misses,
-                "hit_rate_percent": round(hit_rate, 2),
-            }
+        stats = self._response_cache.provider_stats("deepseek")
+        return {
+            "cache_size": self._response_cache.size(),
+            "cache_hits": stats.get("hits", 0),
+            "cache_misses": stats.get("misses", 0),
+            "hit_rate_percent": stats["hit_rate_percent"],
+            "quota_saved": stats.get("quota_saved", 0.0),
+        }
 
     # ============================================
     # INTERNAL METHODS
@@ -2,15 +2,22 @@ import logging
 import os
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException, Timeout
 from sqlalchemy import func
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import IntegrityError
 
-from config.settings import ODDS_API_KEY, ODDS_API_KEYS, ODDS_SMART_FREQUENCY_ENABLED
+from config.settings import (
+    ODDS_API_KEY,
+    ODDS_FETCH_MAX_WORKERS,
+    ODDS_SMART_FREQUENCY_ENABLED,
+)
 from src.database.models import Match as MatchModel
 from src.database.models import SessionLocal, TeamAlias
 from src.database.team_alias_enrichment import enrich_team_alias_data
@@ -19,12 +26,15 @@ from src.ingestion.league_manager import (
     get_active_niche_leagues,
     get_all_active_leagues,
 )
+from src.ingestion.odds_key_rotator import get_odds_key_rotator
+from src.utils.team_name_index import invalidate_team_name_index
+from src.utils.upcoming_match_index import invalidate_upcoming_match_index
 
 # ============================================
 # MARKET INTELLIGENCE (Odds Snapshot Tracking)
 # ============================================
 try:
-    from src.analysis.market_intelligence import init_market_intelligence_db, save_odds_snapshot
+    from src.analysis.market_intelligence import init_market_intelligence_db, save_odds_snapshots
 
     _MARKET_INTEL_AVAILABLE = True
 except ImportError:
@@ -33,6 +43,38 @@ except ImportError:
 
 BASE_URL = "https://api.the-odds-api.com/v4/sports"
 
+# ============================================
+# BULK UPSERT (one statement per batch instead of one query per event)
+# ============================================
+# Rows per INSERT ... ON CONFLICT batch (~30 columns x 500 rows, well under SQLite's limit)
+UPSERT_BATCH_SIZE = 500
+# Rows per IN (...) lookup
+LOOKUP_BATCH_SIZE = 500
+
+# Current odds are only overwritten when the feed returns a value for them
+_CURRENT_ODDS_COLUMNS = (
+    "current_home_odd",
+    "current_draw_odd",
+    "current_away_odd",
+    "current_over_2_5",
+    "current_under_2_5",
+    "current_btts_yes",
+    "current_btts_no",
+)
+# Refreshed on every upsert; opening_* and fixture columns are never overwritten
+_REFRESHED_COLUMNS = (
+    "sharp_bookie",
+    "sharp_home_odd",
+    "sharp_draw_odd",
+    "sharp_away_odd",
+    "avg_home_odd",
+    "avg_draw_odd",
+    "avg_away_odd",
+    "is_sharp_drop",
+    "sharp_signal",
+    "last_updated",
+)
+
 
 def _ensure_utc_aware(dt: datetime) -> datetime:
     """
@@ -53,9 +95,8 @@ def _ensure_utc_aware(dt: datetime) -> datetime:
 # ============================================
 # ODDS API KEY ROTATION SYSTEM
 # ============================================
-# Thread-safe key rotation for automatic failover
-_current_odds_key_index: int = 0
-_odds_key_lock: threading.Lock = threading.Lock()
+# V1.2: Shared thread-safe rotator (OddsKeyRotator) so concurrent league
+# fetches rotate once per exhausted key and track quota from response headers
 
 
 def _get_current_odds_key() -> str:
@@ -65,21 +106,7 @@ def _get_current_odds_key() -> str:
     Returns:
         Current API key string
     """
-    global _current_odds_key_index
-    with _odds_key_lock:
-        # Filter out empty keys
-        valid_keys = [key for key in ODDS_API_KEYS if key and key != ""]
-
-        if not valid_keys:
-            # Fallback to single key if no rotation keys available
-            return ODDS_API_KEY
-
-        # Ensure index is within bounds
-        if _current_odds_key_index >= len(valid_keys):
-            _current_odds_key_index = 0  # Loop back to first key
-
-        current_key = valid_keys[_current_odds_key_index]
-        return current_key
+    return get_odds_key_rotator().current_key() or ODDS_API_KEY
 
 
 def _rotate_odds_key() -> str:
@@ -89,30 +116,14 @@ def _rotate_odds_key() -> str:
     Returns:
         Next API key string
     """
-    global _current_odds_key_index
-    with _odds_key_lock:
-        valid_keys = [key for key in ODDS_API_KEYS if key and key != ""]
-
-        if not valid_keys:
-            return ODDS_API_KEY
-
-        # Move to next key
-        _current_odds_key_index = (_current_odds_key_index + 1) % len(valid_keys)
-
-        next_key = valid_keys[_current_odds_key_index]
-        logging.info(f"🔄 Rotated to Odds API Key {_current_odds_key_index + 1}/{len(valid_keys)}")
-
-        return next_key
+    return get_odds_key_rotator().rotate_to_next() or ODDS_API_KEY
 
 
 def _reset_odds_key_rotation():
     """
     Reset the Odds API key rotation to the first key.
     """
-    global _current_odds_key_index
-    with _odds_key_lock:
-        _current_odds_key_index = 0
-        logging.info("🔄 Reset Odds API key rotation to Key 1")
+    get_odds_key_rotator().reset()
 
 
 # Reusable session for connection pooling (faster API calls)
@@ -132,6 +143,9 @@ def _get_session() -> requests.Session:
             if _session is None:
                 _session = requests.Session()
                 _session.headers.update({"User-Agent": "EarlyBird/7.0"})
+                # V1.2: One pooled connection per concurrent league fetch
+                adapter = HTTPAdapter(pool_maxsize=max(10, ODDS_FETCH_MAX_WORKERS))
+                _session.mount("https://", adapter)
     return _session
 
 
@@ -612,49 +626,115 @@ def extract_sharp_odds_analysis(
     return result
 
 
+def _chunks(items: list, size: int):
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def _fetch_existing_match_ids(db, sport_keys: list[str]) -> set[str]:
+    """IDs of all stored matches for the given leagues, in one query."""
+    if not sport_keys:
+        return set()
+    rows = db.query(MatchModel.id).filter(MatchModel.league.in_(sport_keys)).all()
+    return {row[0] for row in rows}
+
+
+def _upsert_match_rows(db, rows: list[dict[str, Any]]) -> int:
+    """
+    Write match rows with SQLite INSERT ... ON CONFLICT(id) DO UPDATE batches.
+
+    New matches get every column (opening_* == current_*). On conflict only
+    current odds (when the new value is not NULL) and the sharp/avg analysis
+    are updated: opening_* odds, teams and kickoff are preserved.
+
+    Returns:
+        Number of rows written
+    """
+    if not rows:
+        return 0
+    table = MatchModel.__table__
+    stmt = sqlite_insert(table)
+    update_set = {
+        column: func.coalesce(stmt.excluded[column], table.c[column])
+        for column in _CURRENT_ODDS_COLUMNS
+    }
+    update_set.update({column: stmt.excluded[column] for column in _REFRESHED_COLUMNS})
+    stmt = stmt.on_conflict_do_update(index_elements=[table.c.id], set_=update_set)
+
+    for batch in _chunks(rows, UPSERT_BATCH_SIZE):
+        db.execute(stmt, batch)
+    return len(rows)
+
+
+def _insert_missing_team_aliases(db, team_names) -> int:
+    """
+    Create enriched TeamAlias rows for teams that don't have one yet.
+
+    Existing aliases are found with batched IN queries and the new rows are
+    written with one executemany INSERT (duplicates ignored). The caller commits.
+
+    Returns:
+        Number of aliases created
+    """
+    names = list(dict.fromkeys(name for name in team_names if name))
+    if not names:
+        return 0
+
+    existing = set()
+    for batch in _chunks(names, LOOKUP_BATCH_SIZE):
+        existing.update(
+            row[0] for row in db.query(TeamAlias.api_name).filter(TeamAlias.api_name.in_(batch))
+        )
+
+    rows = []
+    for team_name in names:
+        if team_name in existing:
+            continue
+        clean_name = clean_team_name(team_name)
+
+        # Get enriched data for this team
+        enriched_data = enrich_team_alias_data(team_name)
+        rows.append(
+            {
+                "api_name": team_name,
+                "search_name": clean_name,
+                "twitter_handle": enriched_data.get("twitter_handle"),
+                "telegram_channel": enriched_data.get("telegram_channel"),
+                "fotmob_id": str(enriched_data.get("fotmob_id"))
+                if enriched_data.get("fotmob_id")
+                else None,
+                "country": enriched_data.get("country"),
+                "league": enriched_data.get("league"),
+            }
+        )
+
+        # Log enrichment results
+        enriched_fields = [k for k, v in enriched_data.items() if v is not None]
+        if enriched_fields:
+            logging.info(
+                f"Creating Alias: {team_name} -> {clean_name} (enriched: {', '.join(enriched_fields)})"
+            )
+        else:
+            logging.info(f"Creating Alias: {team_name} -> {clean_name}")
+
+    if rows:
+        db.execute(sqlite_insert(TeamAlias.__table__).on_conflict_do_nothing(), rows)
+    return len(rows)
+
+
 def update_team_aliases(matches):
     """
     Ensures all teams in the fetched matches have an alias entry.
     """
     db = SessionLocal()
-    processed_teams = set()  # Track teams already added in this session
     try:
-        for m in matches:
-            for team_name in [m.home_team, m.away_team]:
-                if team_name in processed_teams:
-                    continue
-                existing = db.query(TeamAlias).filter(TeamAlias.api_name == team_name).first()
-                if not existing:
-                    clean_name = clean_team_name(team_name)
-
-                    # Get enriched data for this team
-                    enriched_data = enrich_team_alias_data(team_name)
-
-                    # Create TeamAlias with enriched data
-                    alias = TeamAlias(
-                        api_name=team_name,
-                        search_name=clean_name,
-                        twitter_handle=enriched_data.get("twitter_handle"),
-                        telegram_channel=enriched_data.get("telegram_channel"),
-                        fotmob_id=str(enriched_data.get("fotmob_id"))
-                        if enriched_data.get("fotmob_id")
-                        else None,
-                        country=enriched_data.get("country"),
-                        league=enriched_data.get("league"),
-                    )
-
-                    # Log enrichment results
-                    enriched_fields = [k for k, v in enriched_data.items() if v is not None]
-                    if enriched_fields:
-                        logging.info(
-                            f"Creating Alias: {team_name} -> {clean_name} (enriched: {', '.join(enriched_fields)})"
-                        )
-                    else:
-                        logging.info(f"Creating Alias: {team_name} -> {clean_name}")
-
-                    db.add(alias)
-                processed_teams.add(team_name)
+        aliases_created = _insert_missing_team_aliases(
+            db, (team for m in matches for team in (m.home_team, m.away_team))
+        )
         db.commit()
+        if aliases_created:
+            # Core INSERT skips the ORM events that patch the shared team index
+            invalidate_team_name_index()
     except Exception as e:
         logging.error(f"Error updating aliases: {e}")
         try:
@@ -675,8 +755,10 @@ def check_quota_status() -> dict[str, Any]:
     """
     try:
         url = BASE_URL
-        params = {"apiKey": _get_current_odds_key()}
+        api_key = _get_current_odds_key()
+        params = {"apiKey": api_key}
         response = _get_session().get(url, params=params, timeout=10)
+        get_odds_key_rotator().record_response(api_key, response.headers)
 
         remaining = response.headers.get("x-requests-remaining", "500")
         try:
@@ -702,6 +784,108 @@ def check_quota_status() -> dict[str, Any]:
         return {"remaining": 500, "used": "error", "emergency_mode": False}
 
 
+def _fetch_league_events(sport_key: str) -> list[dict] | None:
+    """
+    Fetch one league's events with odds, rotating keys on 429.
+
+    Runs inside the concurrent fetch stage: key rotation and quota tracking
+    go through the shared OddsKeyRotator.
+
+    Returns:
+        Parsed events, or None if the league could not be fetched
+    """
+    rotator = get_odds_key_rotator()
+    url = f"{BASE_URL}/{sport_key}/odds"
+
+    # REGION OPTIMIZATION: Use league-specific regions
+    regions = get_optimized_regions(sport_key)
+    logging.info(f"🌎 Fetching {sport_key} with regions={regions}")
+
+    # Try with current key, rotate on 429 (quota exceeded)
+    max_retries = max(rotator.key_count, 1)
+    for attempt in range(max_retries):
+        api_key = rotator.get_current_key()
+        if api_key is None:
+            logging.error(f"❌ All Odds API keys exhausted! Skipping {sport_key}")
+            return None
+
+        params = {
+            "apiKey": api_key,
+            "regions": regions,
+            "markets": "h2h,totals,btts",  # V12.7: Added BTTS market for full odds support
+            "dateFormat": "iso",
+            "oddsFormat": "decimal",
+        }
+        response = _get_session().get(url, params=params, timeout=30)
+        rotator.record_response(api_key, response.headers)
+
+        # Check for quota exceeded (429)
+        if response.status_code == 429:
+            logging.warning(
+                f"⚠️ Odds API quota exceeded (429) for {rotator.describe(api_key)} ({sport_key})"
+            )
+            rotator.mark_exhausted(api_key)
+            if attempt < max_retries - 1:
+                # BUG 4 FIX: Add exponential backoff (2^attempt seconds, max 8 seconds)
+                backoff_time = min(2**attempt, 8)
+                logging.info(f"⏳ Waiting {backoff_time}s before retry (exponential backoff)...")
+                time.sleep(backoff_time)
+                continue
+            logging.error("❌ All Odds API keys exhausted!")
+            return None
+
+        # Check for other errors
+        if response.status_code != 200:
+            logging.error(f"API Error {response.status_code} for {sport_key}: {response.text}")
+            return None
+
+        data = response.json()
+        # Verbose logging for raw API response
+        logging.debug(f"League {sport_key} returned {len(data)} raw matches from API.")
+        return data
+    return None
+
+
+def fetch_leagues_concurrently(
+    sport_keys: list[str], max_workers: int | None = None
+) -> dict[str, list[dict] | None]:
+    """
+    Fetch several leagues' odds in parallel over the pooled session.
+
+    Wall time is roughly that of the slowest league instead of the sum.
+
+    Args:
+        sport_keys: Leagues to fetch
+        max_workers: Concurrent requests (defaults to ODDS_FETCH_MAX_WORKERS)
+
+    Returns:
+        {sport_key: events or None if the fetch failed}
+    """
+    results: dict[str, list[dict] | None] = {}
+    if not sport_keys:
+        return results
+
+    workers = max(1, min(max_workers or ODDS_FETCH_MAX_WORKERS, len(sport_keys)))
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="odds-fetch") as pool:
+        futures = {pool.submit(_fetch_league_events, key): key for key in sport_keys}
+        for future in as_completed(futures):
+            sport_key = futures[future]
+            try:
+                results[sport_key] = future.result()
+            except Exception as e:
+                logging.error(f"Error fetching data for {sport_key}: {e}")
+                results[sport_key] = None
+
+    status = get_odds_key_rotator().get_status()
+    fetched = sum(1 for events in results.values() if events is not None)
+    logging.info(
+        f"⚡ Fetched {fetched}/{len(sport_keys)} leagues in {time.monotonic() - started:.1f}s "
+        f"({workers} workers) | quota remaining: {status['total_remaining']}"
+    )
+    return results
+
+
 def ingest_fixtures(
     target_leagues: list[str] | None = None,
     use_auto_discovery: bool = True,
@@ -819,11 +1003,22 @@ def ingest_fixtures(
     # FIX: Prevents UNIQUE constraint violation when same league is processed twice
     processed_leagues = set()
 
+    # Rows collected in memory and written in bulk after all leagues are fetched
+    match_rows: list[dict[str, Any]] = []
+    snapshot_rows: list[dict[str, Any]] = []
+    new_match_teams: list[str] = []
+    new_matches = 0
+
     try:
+        # One query for every stored match of these leagues (new vs update is only
+        # used for logging/aliases: the upsert itself resolves conflicts)
+        existing_match_ids = _fetch_existing_match_ids(db, leagues_to_process)
+
+        # ============================================
+        # STAGE 1: Select due leagues (SMART FREQUENCY)
+        # ============================================
+        due_leagues = []
         for sport_key in leagues_to_process:
-            # ============================================
-            # SMART FREQUENCY: Check if update needed
-            # ============================================
             if not force_all:
                 should_update, reason, hours_to_match = should_update_league(db, sport_key)
 
@@ -839,311 +1034,180 @@ def ingest_fixtures(
             if sport_key in processed_leagues:
                 logging.warning(f"⚠️ Skipping duplicate league in same transaction: {sport_key}")
                 continue
+            processed_leagues.add(sport_key)
+            due_leagues.append(sport_key)
+
+        # ============================================
+        # STAGE 2: Fetch all due leagues concurrently (V1.2)
+        # ============================================
+        fetched = fetch_leagues_concurrently(due_leagues)
+
+        # ============================================
+        # STAGE 3: Parse events in league order into bulk rows
+        # ============================================
+        for sport_key in due_leagues:
+            data = fetched.get(sport_key)
+            if data is None:
+                continue
 
             try:
-                url = f"{BASE_URL}/{sport_key}/odds"
-
-                # REGION OPTIMIZATION: Use league-specific regions
-                regions = get_optimized_regions(sport_key)
-                logging.info(f"🌎 Fetching {sport_key} with regions={regions}")
-
-                # Try with current key, rotate on 429 (quota exceeded)
-                valid_keys = [key for key in ODDS_API_KEYS if key and key != ""]
-                max_retries = len(valid_keys) if valid_keys else 1
-                for attempt in range(max_retries):
-                    params = {
-                        "apiKey": _get_current_odds_key(),
-                        "regions": regions,
-                        "markets": "h2h,totals,btts",  # V12.7: Added BTTS market for full odds support
-                        "dateFormat": "iso",
-                        "oddsFormat": "decimal",
-                    }
-
-                    response = _get_session().get(url, params=params, timeout=30)
-
-                    # Check for quota exceeded (429)
-                    if response.status_code == 429:
-                        # BUG 3 FIX: Use actual key index instead of attempt index
+                # Process events
+                for event in data:
+                    # SAFETY: Skip malformed events (missing required fields)
+                    if not all(
+                        k in event for k in ("id", "commence_time", "home_team", "away_team")
+                    ):
                         logging.warning(
-                            f"⚠️ Odds API quota exceeded (429) for Key {_current_odds_key_index + 1}/{len(ODDS_API_KEYS) if ODDS_API_KEYS else 1}"
+                            f"⚠️ Skipping malformed event in {sport_key}: missing required fields"
                         )
-                        if attempt < max_retries - 1:
-                            # Rotate to next key
-                            next_key = _rotate_odds_key()
-                            logging.info(f"🔄 Rotating to next key: {next_key[:10]}...")
-                            # BUG 4 FIX: Add exponential backoff (2^attempt seconds, max 8 seconds)
-                            backoff_time = min(2**attempt, 8)
-                            logging.info(
-                                f"⏳ Waiting {backoff_time}s before retry (exponential backoff)..."
-                            )
-                            time.sleep(backoff_time)
-                            continue
-                        else:
-                            logging.error("❌ All Odds API keys exhausted!")
-                            # BUG 1 & 2 FIX: Reset key index after exhaustion
-                            _reset_odds_key_rotation()
-                            continue  # Skip to next league
-
-                    # Check for other errors
-                    if response.status_code != 200:
-                        logging.error(f"API Error {response.status_code}: {response.text}")
-                        continue  # Skip to next league
-
-                    # Success - process data
-                    data = response.json()
-
-                    # Verbose logging for raw API response
-                    logging.debug(f"League {sport_key} returned {len(data)} raw matches from API.")
-
-                    # Process events
-                    for event in data:
-                        # SAFETY: Skip malformed events (missing required fields)
-                        if not all(
-                            k in event for k in ("id", "commence_time", "home_team", "away_team")
-                        ):
-                            logging.warning(
-                                f"⚠️ Skipping malformed event in {sport_key}: missing required fields"
-                            )
-                            continue
+                        continue
+
+                    # Parse commence_time and ensure it's timezone-aware (UTC)
+                    commence_time_str = event["commence_time"]
+                    if commence_time_str.endswith("Z"):
+                        commence_time_str = commence_time_str.replace("Z", "+00:00")
+                    commence_time = _ensure_utc_aware(datetime.fromisoformat(commence_time_str))
+
+                    # HARD-BLOCK: Skip historical matches (Ghost Match Prevention)
+                    if commence_time < now:
+                        logging.debug(
+                            f"Skipping past match: {event.get('home_team')} vs {event.get('away_team')} (started {commence_time})"
+                        )
+                        continue
 
-                        # Parse commence_time and ensure it's timezone-aware (UTC)
-                        commence_time_str = event["commence_time"]
-                        if commence_time_str.endswith("Z"):
-                            commence_time_str = commence_time_str.replace("Z", "+00:00")
-                        commence_time = _ensure_utc_aware(datetime.fromisoformat(commence_time_str))
+                    # Filter by time window (both are now timezone-aware)
+                    if not (min_time <= commence_time <= max_time):
+                        continue
 
-                        # HARD-BLOCK: Skip historical matches (Ghost Match Prevention)
-                        if commence_time < now:
-                            logging.debug(
-                                f"Skipping past match: {event.get('home_team')} vs {event.get('away_team')} (started {commence_time})"
-                            )
-                            continue
+                    match_id = event["id"]
+                    home_team = event["home_team"]
+                    away_team = event["away_team"]
 
-                        # Filter by time window (both are now timezone-aware)
-                        if not (min_time <= commence_time <= max_time):
-                            continue
+                    # FIX: Skip duplicate matches within the same transaction
+                    # Prevents UNIQUE constraint violation when same match is processed twice
+                    if match_id in processed_match_ids:
+                        logging.warning(
+                            f"⚠️ Skipping duplicate match in same transaction: {match_id} ({home_team} vs {away_team})"
+                        )
+                        continue
 
-                        match_id = event["id"]
-                        home_team = event["home_team"]
-                        away_team = event["away_team"]
-
-                        # FIX: Skip duplicate matches within the same transaction
-                        # Prevents UNIQUE constraint violation when same match is processed twice
-                        if match_id in processed_match_ids:
-                            logging.warning(
-                                f"⚠️ Skipping duplicate match in same transaction: {match_id} ({home_team} vs {away_team})"
-                            )
-                            continue
+                    # Convert to naive datetime for DB storage (remove timezone)
+                    commence_time_naive = commence_time.replace(tzinfo=None)
 
-                        # Convert to naive datetime for DB storage (remove timezone)
-                        commence_time_naive = commence_time.replace(tzinfo=None)
+                    # Extract odds (H2H + Totals + BTTS)
+                    bookmakers = event.get("bookmakers", [])
+                    home_odd, draw_odd, away_odd = extract_h2h_odds(
+                        bookmakers, home_team, away_team
+                    )
+                    over_2_5, under_2_5 = extract_totals_odds(bookmakers)
+                    btts_yes, btts_no = extract_btts_odds(bookmakers)  # V12.7: BTTS odds extraction
 
-                        # Extract odds (H2H + Totals + BTTS)
-                        bookmakers = event.get("bookmakers", [])
-                        home_odd, draw_odd, away_odd = extract_h2h_odds(
-                            bookmakers, home_team, away_team
-                        )
-                        over_2_5, under_2_5 = extract_totals_odds(bookmakers)
-                        btts_yes, btts_no = extract_btts_odds(
-                            bookmakers
-                        )  # V12.7: BTTS odds extraction
+                    # LAYER 3: Sharp odds analysis
+                    sharp_analysis = extract_sharp_odds_analysis(bookmakers, home_team, away_team)
 
-                        # LAYER 3: Sharp odds analysis
-                        sharp_analysis = extract_sharp_odds_analysis(
-                            bookmakers, home_team, away_team
+                    if sharp_analysis.get("is_sharp_drop"):
+                        logging.info(
+                            f"🎯 {sharp_analysis['analysis']} for {home_team} vs {away_team}"
                         )
 
-                        if sharp_analysis.get("is_sharp_drop"):
-                            logging.info(
-                                f"🎯 {sharp_analysis['analysis']} for {home_team} vs {away_team}"
-                            )
+                    last_updated = datetime.now(timezone.utc)
+                    match_rows.append(
+                        {
+                            "id": match_id,
+                            "league": sport_key,
+                            "home_team": home_team,
+                            "away_team": away_team,
+                            "start_time": commence_time_naive,
+                            # H2H Opening & Current (opening kept on conflict)
+                            "opening_home_odd": home_odd,
+                            "opening_away_odd": away_odd,
+                            "opening_draw_odd": draw_odd,
+                            "current_home_odd": home_odd,
+                            "current_away_odd": away_odd,
+                            "current_draw_odd": draw_odd,
+                            # Totals Opening & Current
+                            "opening_over_2_5": over_2_5,
+                            "opening_under_2_5": under_2_5,
+                            "current_over_2_5": over_2_5,
+                            "current_under_2_5": under_2_5,
+                            # V12.7: BTTS Opening & Current
+                            "opening_btts_yes": btts_yes,
+                            "opening_btts_no": btts_no,
+                            "current_btts_yes": btts_yes,
+                            "current_btts_no": btts_no,
+                            # LAYER 3: Sharp odds
+                            "sharp_bookie": sharp_analysis.get("sharp_bookie"),
+                            "sharp_home_odd": sharp_analysis.get("sharp_home"),
+                            "sharp_draw_odd": sharp_analysis.get("sharp_draw"),
+                            "sharp_away_odd": sharp_analysis.get("sharp_away"),
+                            "avg_home_odd": sharp_analysis.get("avg_home"),
+                            "avg_draw_odd": sharp_analysis.get("avg_draw"),
+                            "avg_away_odd": sharp_analysis.get("avg_away"),
+                            "is_sharp_drop": sharp_analysis.get("is_sharp_drop", False),
+                            "sharp_signal": sharp_analysis.get("analysis"),
+                            "last_updated": last_updated,
+                        }
+                    )
 
-                        # Check if match exists
-                        existing = db.query(MatchModel).filter(MatchModel.id == match_id).first()
+                    # MARKET INTELLIGENCE: Snapshot for time-based analysis
+                    # (new matches need their first snapshot too)
+                    snapshot_rows.append(
+                        {
+                            "match_id": match_id,
+                            "timestamp": last_updated,
+                            "home_odd": home_odd,
+                            "draw_odd": draw_odd,
+                            "away_odd": away_odd,
+                            "sharp_home_odd": sharp_analysis.get("sharp_home"),
+                            "sharp_draw_odd": sharp_analysis.get("sharp_draw"),
+                            "sharp_away_odd": sharp_analysis.get("sharp_away"),
+                            "sharp_bookie": sharp_analysis.get("sharp_bookie"),
+                        }
+                    )
 
-                        if existing:
-                            # FIX: Log that match already exists and will be updated
-                            logging.debug(
-                                f"🔄 Updating existing match: {match_id} ({home_team} vs {away_team})"
-                            )
-                            # UPDATE: Only update current odds, preserve opening
-                            if home_odd is not None:
-                                existing.current_home_odd = home_odd
-                            if draw_odd is not None:
-                                existing.current_draw_odd = draw_odd
-                            if away_odd is not None:
-                                existing.current_away_odd = away_odd
-
-                            # Update totals (current only)
-                            if over_2_5 is not None:
-                                existing.current_over_2_5 = over_2_5
-                            if under_2_5 is not None:
-                                existing.current_under_2_5 = under_2_5
-
-                            # V12.7: Update BTTS odds (current only)
-                            if btts_yes is not None:
-                                existing.current_btts_yes = btts_yes
-                            if btts_no is not None:
-                                existing.current_btts_no = btts_no
-
-                            # Update sharp odds analysis
-                            existing.sharp_bookie = sharp_analysis.get("sharp_bookie")
-                            existing.sharp_home_odd = sharp_analysis.get("sharp_home")
-                            existing.sharp_draw_odd = sharp_analysis.get("sharp_draw")
-                            existing.sharp_away_odd = sharp_analysis.get("sharp_away")
-                            existing.avg_home_odd = sharp_analysis.get("avg_home")
-                            existing.avg_draw_odd = sharp_analysis.get("avg_draw")
-                            existing.avg_away_odd = sharp_analysis.get("avg_away")
-                            existing.is_sharp_drop = sharp_analysis.get("is_sharp_drop", False)
-                            existing.sharp_signal = sharp_analysis.get("analysis")
-
-                            existing.last_updated = datetime.now(timezone.utc)
-
-                            # FIX: Mark match as processed to prevent duplicates in same transaction
-                            processed_match_ids.add(match_id)
-
-                            # MARKET INTELLIGENCE: Save odds snapshot for time-based analysis
-                            if _MARKET_INTEL_AVAILABLE:
-                                save_odds_snapshot(
-                                    match_id=match_id,
-                                    home_odd=home_odd,
-                                    draw_odd=draw_odd,
-                                    away_odd=away_odd,
-                                    sharp_home_odd=sharp_analysis.get("sharp_home"),
-                                    sharp_draw_odd=sharp_analysis.get("sharp_draw"),
-                                    sharp_away_odd=sharp_analysis.get("sharp_away"),
-                                    sharp_bookie=sharp_analysis.get("sharp_bookie"),
-                                )
-
-                            logging.debug(
-                                f"Updated: {home_team} vs {away_team} | O/U: {over_2_5}/{under_2_5}"
-                            )
-                        else:
-                            # NEW MATCH: Set BOTH opening and current odds
-                            new_match = MatchModel(
-                                id=match_id,
-                                league=sport_key,
-                                home_team=home_team,
-                                away_team=away_team,
-                                start_time=commence_time_naive,
-                                # H2H Opening
-                                opening_home_odd=home_odd,
-                                opening_away_odd=away_odd,
-                                opening_draw_odd=draw_odd,
-                                # H2H Current
-                                current_home_odd=home_odd,
-                                current_away_odd=away_odd,
-                                current_draw_odd=draw_odd,
-                                # Totals Opening
-                                opening_over_2_5=over_2_5,
-                                opening_under_2_5=under_2_5,
-                                # Totals Current
-                                current_over_2_5=over_2_5,
-                                current_under_2_5=under_2_5,
-                                # V12.7: BTTS Opening & Current
-                                opening_btts_yes=btts_yes,
-                                opening_btts_no=btts_no,
-                                current_btts_yes=btts_yes,
-                                current_btts_no=btts_no,
-                                # LAYER 3: Sharp odds
-                                sharp_bookie=sharp_analysis.get("sharp_bookie"),
-                                sharp_home_odd=sharp_analysis.get("sharp_home"),
-                                sharp_draw_odd=sharp_analysis.get("sharp_draw"),
-                                sharp_away_odd=sharp_analysis.get("sharp_away"),
-                                avg_home_odd=sharp_analysis.get("avg_home"),
-                                avg_draw_odd=sharp_analysis.get("avg_draw"),
-                                avg_away_odd=sharp_analysis.get("avg_away"),
-                                is_sharp_drop=sharp_analysis.get("is_sharp_drop", False),
-                                sharp_signal=sharp_analysis.get("analysis"),
-                                last_updated=datetime.now(timezone.utc),
-                            )
-                            db.add(new_match)
+                    # FIX: Mark match as processed to prevent duplicates in same transaction
+                    processed_match_ids.add(match_id)
 
-                            # MARKET INTELLIGENCE: Save first odds snapshot for new matches
-                            # CRITICAL FIX: New matches need their first snapshot for time-based analysis
-                            if _MARKET_INTEL_AVAILABLE:
-                                save_odds_snapshot(
-                                    match_id=match_id,
-                                    home_odd=home_odd,
-                                    draw_odd=draw_odd,
-                                    away_odd=away_odd,
-                                    sharp_home_odd=sharp_analysis.get("sharp_home"),
-                                    sharp_draw_odd=sharp_analysis.get("sharp_draw"),
-                                    sharp_away_odd=sharp_analysis.get("sharp_away"),
-                                    sharp_bookie=sharp_analysis.get("sharp_bookie"),
-                                )
-
-                            # FIX: Mark match as processed to prevent duplicates in same transaction
-                            processed_match_ids.add(match_id)
-
-                            logging.info(
-                                f"New: {home_team} vs {away_team} | H{home_odd}/X{draw_odd}/A{away_odd} | O{over_2_5}/U{under_2_5} | BTTS Y{btts_yes}/N{btts_no}"
-                            )
+                    if match_id in existing_match_ids:
+                        logging.debug(
+                            f"Updated: {home_team} vs {away_team} | O/U: {over_2_5}/{under_2_5}"
+                        )
+                    else:
+                        new_matches += 1
+                        logging.info(
+                            f"New: {home_team} vs {away_team} | H{home_odd}/X{draw_odd}/A{away_odd} | O{over_2_5}/U{under_2_5} | BTTS Y{btts_yes}/N{btts_no}"
+                        )
+                        # Aliases are created (enriched) for teams of new matches
+                        for team_name in (home_team, away_team):
+                            if team_name not in processed_teams:
+                                new_match_teams.append(team_name)
+                                processed_teams.add(team_name)
+
+                    matches_processed += 1
 
-                            # Create aliases with enrichment
-                            for team_name in [home_team, away_team]:
-                                if team_name not in processed_teams:
-                                    if (
-                                        not db.query(TeamAlias)
-                                        .filter(TeamAlias.api_name == team_name)
-                                        .first()
-                                    ):
-                                        clean_name = clean_team_name(team_name)
-
-                                        # Get enriched data for this team
-                                        from src.database.team_alias_enrichment import (
-                                            enrich_team_alias_data,
-                                        )
-
-                                        enriched_data = enrich_team_alias_data(team_name)
-
-                                        # Create TeamAlias with enriched data
-                                        alias = TeamAlias(
-                                            api_name=team_name,
-                                            search_name=clean_name,
-                                            twitter_handle=enriched_data.get("twitter_handle"),
-                                            telegram_channel=enriched_data.get("telegram_channel"),
-                                            fotmob_id=str(enriched_data.get("fotmob_id"))
-                                            if enriched_data.get("fotmob_id")
-                                            else None,
-                                            country=enriched_data.get("country"),
-                                            league=enriched_data.get("league"),
-                                        )
-                                        db.add(alias)
-
-                                        # Log enrichment results
-                                        enriched_fields = [
-                                            k for k, v in enriched_data.items() if v is not None
-                                        ]
-                                        if enriched_fields:
-                                            logging.debug(
-                                                f"Creating Alias: {team_name} -> {clean_name} (enriched: {', '.join(enriched_fields)})"
-                                            )
-                                        else:
-                                            logging.debug(
-                                                f"Creating Alias: {team_name} -> {clean_name}"
-                                            )
-                                    processed_teams.add(team_name)
-
-                        matches_processed += 1
-
-                    leagues_processed += 1
-                    logging.info(f"✅ {sport_key}: {matches_processed} matches")
-
-                    # FIX: Mark league as processed to prevent duplicates in same transaction
-                    # Prevents UNIQUE constraint violation when same league is processed twice
-                    processed_leagues.add(sport_key)
-
-                    # FIX: Exit retry loop on success to prevent duplicate league processing
-                    # Prevents UNIQUE constraint violation when same league is fetched twice
-                    break
+                leagues_processed += 1
+                logging.info(f"✅ {sport_key}: {matches_processed} matches")
 
             except Exception as e:
-                logging.error(f"Error fetching data for {sport_key}: {e}")
+                logging.error(f"Error processing data for {sport_key}: {e}")
 
         # FIX: Add error handling for ALL IntegrityError types
         try:
+            _upsert_match_rows(db, match_rows)
+            snapshots_saved = 0
+            if _MARKET_INTEL_AVAILABLE:
+                snapshots_saved = save_odds_snapshots(snapshot_rows, db=db)
+            aliases_created = _insert_missing_team_aliases(db, new_match_teams)
             db.commit()
+            # Fixtures changed: upcoming-match lookups reload on their next call
+            invalidate_upcoming_match_index()
+            if aliases_created:
+                # Core INSERT skips the ORM events that patch the shared team index
+                invalidate_team_name_index()
+            logging.info(
+                f"💾 Bulk upsert: {len(match_rows)} matches ({new_matches} new) | "
+                f"{snapshots_saved} snapshots | {aliases_created} aliases"
+            )
         except IntegrityError as e:
             # Rollback for ALL IntegrityError types to maintain data integrity
             logging.warning(f"⚠️ IntegrityError detected during commit: {e}")
@@ -1289,6 +1353,7 @@ def fetch_odds_for_team(
                                 existing_match.current_away_odd = away_odd
                             existing_match.last_updated = datetime.now(timezone.utc)
                             db.commit()
+                            invalidate_upcoming_match_index()
                             logger.info(f"✅ [ON-DEMAND] Updated match: {home_team} vs {away_team}")
                             return existing_match
                         else:
@@ -1326,6 +1391,7 @@ def fetch_odds_for_team(
                             )
                             db.add(new_match)
                             db.commit()
+                            invalidate_upcoming_match_index()
 
                             logger.info(
                                 f"✅ [ON-DEMAND] Created new match: {home_team} vs {away_team} "
@@ -0,0 +1,234 @@
+"""
+Odds API Key Rotator - V1.0
+
+Shared, thread-safe rotation and quota tracking for the Odds API keys.
+
+The concurrent league fetcher in ingest_fixtures runs several requests at
+once, so rotation can no longer be a bare module index: two threads hitting
+429 on the same key must rotate once, not skip a healthy key. Every response
+also reports the remaining quota of the key that made it
+(x-requests-remaining / x-requests-used); keys reaching 0 are retired before
+they ever return a 429.
+
+Requirements: Same shape as BraveKeyRotator/TavilyKeyRotator, plus a lock
+"""
+
+import logging
+import threading
+from collections.abc import Mapping
+
+from config.settings import ODDS_API_KEY, ODDS_API_KEYS
+
+logger = logging.getLogger(__name__)
+
+
+def _parse_quota_header(value) -> int | None:
+    """Parse an x-requests-* header ("500" or "20000.0")."""
+    if value is None:
+        return None
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+class OddsKeyRotator:
+    """
+    Rotates between Odds API keys and tracks each key's remaining quota.
+
+    Thread Safety:
+        All methods take an internal lock; rotation on exhaustion is
+        compare-and-set (only rotates if the exhausted key is still current).
+    """
+
+    def __init__(self, keys: list[str] | None = None, fallback_key: str | None = None):
+        """
+        Initialize key rotator with API keys.
+
+        Args:
+            keys: List of API keys (defaults to ODDS_API_KEYS from settings)
+            fallback_key: Single key used when no rotation keys are configured
+                (defaults to ODDS_API_KEY)
+        """
+        raw_keys = keys if keys is not None else ODDS_API_KEYS
+        self._keys: list[str] = list(dict.fromkeys(k for k in raw_keys if k and k.strip()))
+        if not self._keys:
+            fallback = fallback_key if fallback_key is not None else ODDS_API_KEY
+            if fallback:
+                self._keys = [fallback]
+
+        self._lock = threading.Lock()
+        self._current_index: int = 0
+        self._exhausted_keys: set[int] = set()
+        self._remaining: dict[int, int] = {}
+        self._used: dict[int, int] = {}
+        self._calls: dict[int, int] = {i: 0 for i in range(len(self._keys))}
+
+        if self._keys:
+            logger.info(f"🔑 OddsKeyRotator V1.0 initialized with {len(self._keys)} keys")
+        else:
+            logger.warning("⚠️ OddsKeyRotator: No valid API keys found!")
+
+    @property
+    def key_count(self) -> int:
+        return len(self._keys)
+
+    def _index_of(self, key: str) -> int | None:
+        try:
+            return self._keys.index(key)
+        except ValueError:
+            return None
+
+    def _advance_locked(self) -> bool:
+        """Move to the next non-exhausted key. Returns False if all are exhausted."""
+        original_index = self._current_index
+        for _ in range(len(self._keys)):
+            self._current_index = (self._current_index + 1) % len(self._keys)
+            if self._current_index not in self._exhausted_keys:
+                logger.info(
+                    f"🔄 Odds key rotation: Key {original_index + 1} → "
+                    f"Key {self._current_index + 1} "
+                    f"({len(self._keys) - len(self._exhausted_keys)} keys remaining)"
+                )
+                return True
+        return False
+
+    def current_key(self) -> str:
+        """Key at the current index, even if exhausted ("" if none configured)."""
+        with self._lock:
+            if not self._keys:
+                return ""
+            return self._keys[self._current_index]
+
+    def get_current_key(self) -> str | None:
+        """
+        Get current active API key, or None if all exhausted.
+
+        Returns:
+            Current API key or None if all keys exhausted
+        """
+        with self._lock:
+            if not self._keys or len(self._exhausted_keys) >= len(self._keys):
+                return None
+            if self._current_index in self._exhausted_keys and not self._advance_locked():
+                return None
+            return self._keys[self._current_index]
+
+    def rotate_to_next(self) -> str:
+        """
+        Unconditionally move to the next key (legacy _rotate_odds_key behaviour).
+
+        Returns:
+            The new current key ("" if none configured)
+        """
+        with self._lock:
+            if not self._keys:
+                return ""
+            self._current_index = (self._current_index + 1) % len(self._keys)
+            logger.info(f"🔄 Rotated to Odds API Key {self._current_index + 1}/{len(self._keys)}")
+            return self._keys[self._current_index]
+
+    def mark_exhausted(self, key: str) -> None:
+        """
+        Retire a key (429 or zero remaining quota).
+
+        Rotates only if the key is still the current one, so concurrent
+        callers reporting the same key rotate once.
+        """
+        with self._lock:
+            index = self._index_of(key)
+            if index is None or index in self._exhausted_keys:
+                return
+            self._exhausted_keys.add(index)
+            logger.warning(
+                f"⚠️ Odds Key {index + 1} marked as exhausted "
+                f"(remaining: {self._remaining.get(index, 'unknown')})"
+            )
+            if index == self._current_index:
+                self._advance_locked()
+
+    def record_response(self, key: str, headers: Mapping[str, str] | None) -> int | None:
+        """
+        Record a call made with key and the quota reported by the API.
+
+        Returns:
+            Remaining requests reported for the key (None if not reported)
+        """
+        remaining = _parse_quota_header((headers or {}).get("x-requests-remaining"))
+        used = _parse_quota_header((headers or {}).get("x-requests-used"))
+        with self._lock:
+            index = self._index_of(key)
+            if index is None:
+                return remaining
+            self._calls[index] = self._calls.get(index, 0) + 1
+            if remaining is not None:
+                self._remaining[index] = remaining
+            if used is not None:
+                self._used[index] = used
+        if remaining is not None and remaining <= 0:
+            self.mark_exhausted(key)
+        return remaining
+
+    def describe(self, key: str) -> str:
+        """Human-readable "Key i/n" label for logs (never the key itself)."""
+        index = self._index_of(key)
+        position = index + 1 if index is not None else "?"
+        return f"Key {position}/{len(self._keys) or 1}"
+
+    def reset(self) -> None:
+        """Back to the first key with every key available (start of an ingestion run)."""
+        with self._lock:
+            self._current_index = 0
+            self._exhausted_keys = set()
+        logger.info("🔄 Reset Odds API key rotation to Key 1")
+
+    def is_available(self) -> bool:
+        with self._lock:
+            return bool(self._keys) and len(self._exhausted_keys) < len(self._keys)
+
+    def get_status(self) -> dict:
+        """
+        Get rotation and quota status for monitoring.
+
+        Returns:
+            Dict with rotation status and per-key quota information
+        """
+        with self._lock:
+            known_remaining = [
+                self._remaining[i] for i in range(len(self._keys)) if i in self._remaining
+            ]
+            return {
+                "total_keys": len(self._keys),
+                "available_keys": len(self._keys) - len(self._exhausted_keys),
+                "current_key_index": self._current_index + 1 if self._keys else 0,
+                "exhausted_keys": sorted(i + 1 for i in self._exhausted_keys),
+                "remaining": {f"key_{i + 1}": r for i, r in sorted(self._remaining.items())},
+                "used": {f"key_{i + 1}": u for i, u in sorted(self._used.items())},
+                "calls": {f"key_{i + 1}": c for i, c in self._calls.items()},
+                "total_remaining": sum(known_remaining) if known_remaining else None,
+                "is_available": len(self._exhausted_keys) < len(self._keys),
+            }
+
+
+# ============================================
+# SINGLETON INSTANCE
+# ============================================
+
+_key_rotator_instance: OddsKeyRotator | None = None
+_key_rotator_instance_init_lock = threading.Lock()
+
+
+def get_odds_key_rotator() -> OddsKeyRotator:
+    """Get or create the shared OddsKeyRotator (double-checked locking)."""
+    global _key_rotator_instance
+    if _key_rotator_instance is None:
+        with _key_rotator_instance_init_lock:
+            if _key_rotator_instance is None:
+                _key_rotator_instance = OddsKeyRotator()
+    return _key_rotator_instance
+
+
+def reset_odds_key_rotator() -> None:
+    """Reset the singleton OddsKeyRotator instance for test isolation."""
+    global _key_rotator_instance
+    _key_rotator_instance = None
@@ -13,9 +13,12 @@ Requirements:
 
 Flow: Analyzer -> IntelligenceRouter -> Gemini (primary) / Perplexity (fallback)
 
+V5.1: Responses cached in the shared provider response cache (src/utils/response_cache.py).
+
 Phase 1 Critical Fix: Added URL encoding for non-ASCII characters in search queries
 """
 
+import copy
 import logging
 import os
 import threading
@@ -36,6 +39,7 @@ from src.schemas.perplexity_schemas import (
     DeepDiveResponse,
 )
 from src.utils.ai_parser import normalize_deep_dive_response, parse_ai_json
+from src.utils.response_cache import get_response_cache
 
 logger = logging.getLogger(__name__)
 
@@ -61,6 +65,7 @@ class PerplexityProvider:
 
     def __init__(self):
         self._enabled = False
+        self._response_cache = get_response_cache()
 
         if not PERPLEXITY_ENABLED:
             logger.info("ℹ️ Perplexity Provider disabled via config")
@@ -153,6 +158,13 @@ class PerplexityProvider:
             logger.warning(f"⚠️ [PERPLEXITY] Unknown task type: {task_type}")
             return None
 
+        # V5.1: Shared response cache (canonical prompt key)
+        cache_key = self._response_cache.make_key("perplexity", prompt, task_type=task_type)
+        cached = self._response_cache.get("perplexity", cache_key)
+        if cached is not None:
+            logger.debug(f"📦 [PERPLEXITY] Cache hit for {task_type}")
+            return copy.deepcopy(cached)
+
         headers = {
             "Authorization": f"Bearer {PERPLEXITY_API_KEY}",
             "Content-Type": "application/json",
@@ -213,17 +225,21 @@ class PerplexityProvider:
             try:
                 # Try direct Pydantic parsing first (for structured outputs)
                 validated_response = response_model.model_validate_json(content)
-                return validated_response.model_dump()
+                result = validated_response.model_dump()
             except Exception as pydantic_error:
                 logger.debug(f"🔍 [PERPLEXITY] Pydantic validation failed: {pydantic_error}")
 
                 # Fallback to legacy parsing
                 parsed = parse_ai_json(content)
                 if task_type == "deep_dive":
-                    return normalize_deep_dive_response(parsed)
+                    result = normalize_deep_dive_response(parsed)
                 else:
                     # For betting_stats, return raw parsed (will be normalized by caller)
-                    return parsed
+                    result = parsed
+
+            if result:
+                self._response_cache.set("perplexity", cache_key, copy.deepcopy(result))
+            return result
 
         except requests.exceptions.Timeout:
             logger.warning("⚠️ [PERPLEXITY] Request timeout")
@@ -247,6 +263,12 @@ class PerplexityProvider:
         Returns:
             Raw parsed JSON dict or None
         """
+        cache_key = self._response_cache.make_key("perplexity", prompt, task_type="raw")
+        cached = self._response_cache.get("perplexity", cache_key)
+        if cached is not None:
+            logger.debug("📦 [PERPLEXITY] Cache hit for raw query")
+            return copy.deepcopy(cached)
+
         headers = {
             "Authorization": f"Bearer {PERPLEXITY_API_KEY}",
             "Content-Type": "application/json",
@@ -291,7 +313,10 @@ class PerplexityProvider:
                 return None
 
             # Return raw parsed JSON without normalization
-            return parse_ai_json(content)
+            result = parse_ai_json(content)
+            if result:
+                self._response_cache.set("perplexity", cache_key, copy.deepcopy(result))
+            return result
 
         except requests.exceptions.Timeout:
             logger.warning("⚠️ [PERPLEXITY] Request timeout")
@@ -1,5 +1,5 @@
 """
-Tavily AI Search Provider - V7.4
+Tavily AI Search Provider - V7.6
 
 AI-optimized search API with key rotation and caching.
 Provides structured results with AI-generated answers.
@@ -10,6 +10,8 @@ Features:
 - Response caching (30 min TTL)
 - V7.3: Cross-component cache deduplication via SharedContentCache
 - V7.4: Uses unified BudgetStatus from budget_status.py
+- V7.6: Responses cached in the shared provider response cache (canonical query
+  keys, persisted across restarts; src/utils/response_cache.py)
 - Automatic fallback on exhaustion
 - Circuit breaker for consecutive failures
 - Brave/DDG fallback when Tavily unavailable
@@ -19,22 +21,21 @@ Requirements: 1.1, 1.2, 1.3, 1.4, 1.5, 1.6, 10.1, 10.2, 10.3, 10.4
 Phase 1 Critical Fix: Added URL encoding for non-ASCII characters in search queries
 """
 
-import hashlib
 import logging
 import threading
 import time
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from urllib.parse import quote
 
 from config.settings import (
     BRAVE_API_KEY,
-    TAVILY_CACHE_TTL_SECONDS,
     TAVILY_ENABLED,
     TAVILY_RATE_LIMIT_SECONDS,
 )
 from src.ingestion.tavily_key_rotator import TavilyKeyRotator, get_tavily_key_rotator
 from src.utils.http_client import get_http_client
+from src.utils.response_cache import ResponseCache, get_response_cache
 from src.utils.validators import safe_get
 
 from .budget_status import BudgetStatus
@@ -52,6 +53,9 @@ logger = logging.getLogger(__name__)
 # Tavily API endpoint
 TAVILY_API_URL = "https://api.tavily.com/search"
 
+# API credits per search (basic = 1); counted as quota saved on cache hits
+TAVILY_ADVANCED_SEARCH_CREDITS = 2
+
 
 def _normalize_score(score_raw: float | str | None) -> float:
     """
@@ -109,20 +113,6 @@ class TavilyResponse:
     response_time: float = 0.0
 
 
-@dataclass
-class CacheEntry:
-    """Cache entry with TTL."""
-
-    response: TavilyResponse
-    cached_at: datetime
-    ttl_seconds: int = TAVILY_CACHE_TTL_SECONDS
-
-    def is_expired(self) -> bool:
-        """Check if cache entry has expired."""
-        elapsed = (datetime.now(timezone.utc) - self.cached_at).total_seconds()
-        return elapsed > self.ttl_seconds
-
-
 class CircuitBreakerState:
     """Circuit breaker states."""
 
@@ -234,17 +224,23 @@ class TavilyProvider:
     Requirements: 1.1, 1.2, 1.3, 1.4, 1.5, 1.6
     """
 
-    def __init__(self, key_rotator: TavilyKeyRotator | None = None):
+    def __init__(
+        self,
+        key_rotator: TavilyKeyRotator | None = None,
+        response_cache: ResponseCache | None = None,
+    ):
         """
         Initialize TavilyProvider.
 
         Args:
             key_rotator: Optional key rotator (defaults to singleton)
+            response_cache: Optional response cache (defaults to the shared one)
 
         Requirements: 1.1
         """
         self._key_rotator = key_rotator or get_tavily_key_rotator()
-        self._cache: dict[str, CacheEntry] = {}
+        # V7.6: Shared persistent response cache (canonical keys, O(1) LRU)
+        self._response_cache = response_cache or get_response_cache()
         self._last_request_time: float = 0.0
         self._http_client = get_http_client()
         self._fallback_active = False
@@ -265,9 +261,6 @@ class TavilyProvider:
         self._daily_limit: int = 250  # ~7000 monthly / 28 days
         self._last_reset_date: str | None = None
 
-        # V7.5: Thread safety for cache operations
-        self._cache_lock = threading.Lock()
-
         if TAVILY_ENABLED and self._key_rotator.is_available():
             cache_status = "with shared cache" if self._shared_cache else "local cache only"
             logger.info(f"✅ Tavily AI Search initialized with circuit breaker ({cache_status})")
@@ -355,37 +348,43 @@ class TavilyProvider:
         topic: str | None = None,
         days: int | None = None,
     ) -> str:
-        """Generate cache key from query parameters."""
-        key_str = f"{query}|{search_depth}|{max_results}|{topic}|{days}"
-        return hashlib.md5(key_str.encode()).hexdigest()
+        """Generate cache key from the canonical query and the request parameters."""
+        return self._response_cache.make_key(
+            "tavily",
+            query,
+            search_depth=search_depth,
+            max_results=max_results,
+            topic=topic,
+            days=days,
+        )
 
-    def _check_cache(self, cache_key: str) -> TavilyResponse | None:
+    def _check_cache(self, cache_key: str, quota_cost: float = 1) -> TavilyResponse | None:
         """
         Check cache for existing response.
 
         Args:
             cache_key: Cache key to look up
+            quota_cost: Credits the search would cost (counted as saved on a hit)
 
         Returns:
             Cached response if valid, None otherwise
 
         Requirements: 1.3
         """
-        with self._cache_lock:
-            if cache_key in self._cache:
-                entry = self._cache[cache_key]
-                if not entry.is_expired():
-                    logger.debug(f"📦 [TAVILY] Cache hit for key {cache_key[:8]}...")
-                    return entry.response
-                else:
-                    # Clean up expired entry
-                    del self._cache[cache_key]
-
-        return None
+        cached = self._response_cache.get("tavily", cache_key, quota_cost=quota_cost)
+        if cached is None:
+            return None
+        logger.debug(f"📦 [TAVILY] Cache hit for key {cache_key[:15]}...")
+        return TavilyResponse(
+            query=cached["query"],
+            answer=cached.get("answer"),
+            results=[TavilyResult(**result) for result in cached.get("results", [])],
+            response_time=cached.get("response_time", 0.0),
+        )
 
     def _update_cache(self, cache_key: str, response: TavilyResponse) -> None:
         """
-        Update cache with new response.
+        Update cache with new response (TTL: TAVILY_CACHE_TTL_SECONDS).
 
         Args:
             cache_key: Cache key
@@ -393,25 +392,7 @@ class TavilyProvider:
 
         Requirements: 1.3
         """
-        with self._cache_lock:
-            self._cache[cache_key] = CacheEntry(
-                response=response, cached_at=datetime.now(timezone.utc)
-            )
-
-            # Cleanup old entries (keep cache size reasonable)
-            if len(self._cache) > 1000:
-                self._cleanup_cache()
-
-    def _cleanup_cache(self) -> None:
-        """
-        Remove expired cache entries.
-
-        Note: This method assumes the caller holds self._cache_lock.
-        It should only be called from within a 'with self._cache_lock:' block.
-        """
-        expired_keys = [key for key, entry in self._cache.items() if entry.is_expired()]
-        for key in expired_keys:
-            del self._cache[key]
+        self._response_cache.set("tavily", cache_key, asdict(response))
 
     def search(
         self,
@@ -444,19 +425,20 @@ class TavilyProvider:
         """
         # Generate cache key for this query
         cache_key = self._get_cache_key(query, search_depth, max_results, topic, days)
+        credits = TAVILY_ADVANCED_SEARCH_CREDITS if search_depth == "advanced" else 1
 
         # V7.3: Check shared cache first (cross-component deduplication)
         if self._shared_cache:
             # Use cache_key as content identifier for deduplication
             if self._shared_cache.is_duplicate_sync(content=cache_key, source="tavily"):
                 # Check local cache for actual response
-                cached = self._check_cache(cache_key)
+                cached = self._check_cache(cache_key, credits)
                 if cached:
                     logger.debug(f"📦 [TAVILY] Shared cache HIT: {query[:50]}...")
                     return cached
 
         # Check local cache (backward compatibility)
-        cached = self._check_cache(cache_key)
+        cached = self._check_cache(cache_key, credits)
         if cached:
             return cached
 
@@ -898,7 +880,7 @@ class TavilyProvider:
             "available": self.is_available(),
             "fallback_active": self._fallback_active,
             "fallback_calls": self._fallback_calls,
-            "cache_size": len(self._cache),
+            "cache_size": self._response_cache.size(),
             "keys": key_status,
             "budget": {
                 "monthly_used": budget.monthly_used,
@@ -155,6 +155,7 @@ from src.analysis.optimizer import get_optimizer
 # ANALYSIS ENGINE (V1.0 - Modular Refactor)
 # ============================================
 from src.core.analysis_engine import get_analysis_engine
+from src.core.match_scheduler import MatchAnalysisScheduler
 
 # ============================================
 # SETTLEMENT SERVICE (V1.0 - Modular Refactor)
@@ -1131,40 +1132,23 @@ def run_pipeline():
         tier1_alerts_sent = 0
         tier1_high_potential_count = 0
         tier1_news_count = 0
+        tier2_total_matches = 0  # Track total Tier 2 matches found
+        tier2_analyzed = 0  # V15.0: Tier 2 matches actually analyzed (not deadline-skipped)
+        tier2_deferred = 0
+        tier2_news_count = 0  # Track total Tier 2 news items analyzed
+
+        # V15.0: Bounded parallel scheduler (kickoff priority, per-provider limits, cycle deadline)
+        # Each worker re-loads its Match in a dedicated session; Tier 1 and Tier 2 share the deadline.
+        scheduler = MatchAnalysisScheduler(
+            analysis_engine=analysis_engine,
+            fotmob=fotmob,
+            intel_lookup=get_nitter_intel_for_match if _NITTER_INTEL_AVAILABLE else None,
+        )
 
         # 4. TRIANGULATION LOOP (INVESTIGATOR MODE) - DELEGATED TO ANALYSIS ENGINE
         # The Analysis Engine now handles all match-level analysis logic
-        for match in matches:
-            # VPS FIX: Extract team names safely to prevent session detachment
-            # This prevents "Trust validation error" when Match object becomes detached
-            # from session due to connection pool recycling under high load
-            home_team = getattr(match, "home_team", "Unknown")
-            away_team = getattr(match, "away_team", "Unknown")
-
-            # V10.5: Check for Nitter intel before analysis
-            nitter_intel = None
-            if _NITTER_INTEL_AVAILABLE:
-                try:
-                    intel_data = get_nitter_intel_for_match(match.id)
-                    if intel_data:
-                        nitter_intel = intel_data.get("intel")
-                        logging.info(
-                            f"🐦 [NITTER-INTEL] Found intel for {home_team} vs {away_team} "
-                            f"via {intel_data.get('handle')}"
-                        )
-                except Exception as e:
-                    logging.debug(f"Nitter intel check failed: {e}")
-
-            # Use Analysis Engine to analyze match
-            analysis_result = analysis_engine.analyze_match(
-                match=match,
-                fotmob=fotmob,
-                now_utc=now_utc,
-                db_session=db,
-                context_label="TIER1",
-                nitter_intel=nitter_intel,  # V10.5: Pass Nitter intel to analysis
-            )
-
+        tier1_results, tier1_stats = scheduler.run(matches, now_utc=now_utc, context_label="TIER1")
+        for analysis_result in tier1_results:
             # Track alerts sent
             if analysis_result["alert_sent"]:
                 tier1_alerts_sent += 1
@@ -1177,7 +1161,8 @@ def run_pipeline():
             # Log any errors
             if analysis_result["error"]:
                 logging.warning(
-                    f"⚠️ Analysis error for {home_team} vs {away_team}: {analysis_result['error']}"
+                    f"⚠️ Analysis error for {analysis_result['home_team']} vs "
+                    f"{analysis_result['away_team']}: {analysis_result['error']}"
                 )
 
         # 5. TIER 2 FALLBACK (V4.3)
@@ -1189,17 +1174,16 @@ def run_pipeline():
             logging.info("🔄 Activating Tier 2 Fallback...")
 
             tier2_batch = get_tier2_fallback_batch()
-            tier2_total_matches = 0  # Track total Tier 2 matches processed
-            tier2_news_count = 0  # Track total Tier 2 news items analyzed
 
             if tier2_batch:
                 logging.info(f"🎯 Tier 2 Fallback: Processing {len(tier2_batch)} leagues")
 
+                tier2_matches = []
                 for league_key in tier2_batch:
                     try:
                         # Get matches for this Tier 2 league
                         # V14.1 FIX: Require odds availability to prevent "No Odds Black Hole" silent drops
-                        tier2_matches = (
+                        league_matches = (
                             db.query(Match)
                             .filter(
                                 Match.start_time > now_naive,
@@ -1210,70 +1194,51 @@ def run_pipeline():
                             .all()
                         )
 
-                        logging.info(f"   Found {len(tier2_matches)} matches in {league_key}")
-                        tier2_total_matches += len(tier2_matches)  # Track total Tier 2 matches
-
-                        # Process Tier 2 matches (simplified analysis)
-                        for match in tier2_matches:
-                            # VPS FIX: Extract team names safely to prevent session detachment
-                            # This prevents "Trust validation error" when Match object becomes detached
-                            # from session due to connection pool recycling under high load
-                            home_team = getattr(match, "home_team", "Unknown")
-                            away_team = getattr(match, "away_team", "Unknown")
-
-                            # V10.5: Check for Nitter intel before analysis
-                            nitter_intel = None
-                            if _NITTER_INTEL_AVAILABLE:
-                                try:
-                                    intel_data = get_nitter_intel_for_match(match.id)
-                                    if intel_data:
-                                        nitter_intel = intel_data.get("intel")
-                                        logging.info(
-                                            f"🐦 [NITTER-INTEL] Found intel for {home_team} vs {away_team} "
-                                            f"via {intel_data.get('handle')}"
-                                        )
-                                except Exception as e:
-                                    logging.debug(f"Nitter intel check failed: {e}")
-
-                            # Use Analysis Engine for Tier 2 analysis
-                            analysis_result = analysis_engine.analyze_match(
-                                match=match,
-                                fotmob=fotmob,
-                                now_utc=now_utc,
-                                db_session=db,
-                                context_label="TIER2",
-                                nitter_intel=nitter_intel,  # V10.5: Pass Nitter intel to analysis
-                            )
-
-                            # Log results
-                            if analysis_result["alert_sent"]:
-                                tier1_alerts_sent += 1
-
-                            # Track news items analyzed for Tier2
-                            tier2_news_count += analysis_result.get("news_count", 0)
-
-                            if analysis_result["error"]:
-                                logging.warning(
-                                    f"⚠️ Tier 2 analysis error for {home_team} vs {away_team}: {analysis_result['error']}"
-                                )
-
+                        logging.info(f"   Found {len(league_matches)} matches in {league_key}")
+                        tier2_matches.extend(league_matches)
                     except Exception as e:
                         logging.warning(f"⚠️ Tier 2 processing failed for {league_key}: {e}")
 
+                tier2_total_matches = len(tier2_matches)  # Track total Tier 2 matches
+
+                # Process Tier 2 matches (simplified analysis) through the same scheduler
+                tier2_results, tier2_stats = scheduler.run(
+                    tier2_matches, now_utc=now_utc, context_label="TIER2"
+                )
+                tier2_analyzed = tier2_stats.completed
+                tier2_deferred = tier2_stats.skipped_deadline
+                for analysis_result in tier2_results:
+                    # Log results
+                    if analysis_result["alert_sent"]:
+                        tier1_alerts_sent += 1
+
+                    # Track news items analyzed for Tier2
+                    tier2_news_count += analysis_result.get("news_count", 0)
+
+                    if analysis_result["error"]:
+                        logging.warning(
+                            f"⚠️ Tier 2 analysis error for {analysis_result['home_team']} vs "
+                            f"{analysis_result['away_team']}: {analysis_result['error']}"
+                        )
+
                 record_tier2_activation()
             else:
                 logging.warning("⚠️ No Tier 2 leagues available for fallback")
 
         # 6. SUMMARY
         # Calculate total matches processed (Tier 1 + Tier 2)
-        total_matches_processed = len(matches) + tier2_total_matches
+        # V15.0: Only matches that ran; deadline-skipped ones are deferred to the next cycle
+        total_matches_processed = tier1_stats.completed + tier2_analyzed
         # Calculate total news items analyzed (Tier 1 + Tier 2)
         total_news_count = tier1_news_count + tier2_news_count
 
         logging.info("\n📊 PIPELINE SUMMARY:")
         logging.info(f"   Matches analyzed: {total_matches_processed}")
-        logging.info(f"   Tier 1 matches: {len(matches)}")
-        logging.info(f"   Tier 2 matches: {tier2_total_matches}")
+        logging.info(f"   Tier 1 matches: {tier1_stats.completed}/{len(matches)}")
+        logging.info(f"   Tier 2 matches: {tier2_analyzed}/{tier2_total_matches}")
+        logging.info(
+            f"   Deferred to next cycle (deadline): {tier1_stats.skipped_deadline + tier2_deferred}"
+        )
         logging.info(f"   Tier 1 alerts sent: {tier1_alerts_sent}")
         logging.info(f"   Tier 1 high potential: {tier1_high_potential_count}")
         logging.info(f"   News items analyzed: {total_news_count}")
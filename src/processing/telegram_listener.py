@@ -12,8 +12,24 @@ CRITICAL FILTERS:
 V2.0: Intelligent feature detection via startup_validator.is_feature_disabled()
      - Skips Tavily verification if 'tavily_enrichment' is disabled
      - Logs clear status messages for disabled features
+
+V12.5: Squad image OCR runs in the OCR worker pool (src/analysis/ocr_pool.py)
+     - A channel's photos are downloaded and OCR'd concurrently, off the event loop
+     - Reposted images reuse cached OCR text (image content hash)
+
+V12.6: Incremental polling with per-channel high-water marks
+     - Only messages newer than the last one seen are fetched (min_id)
+     - Last message id per channel persisted to data/telegram_channel_cursors.json
+     - A fresh photo whose OCR failed transiently (pool full, timeout, broken
+       pool) holds the cursor just below it; it and the newer messages of the
+       batch are evaluated on the next poll
+
+V12.7: has_upcoming_match() resolves teams on the shared upcoming-match index
+     (src/utils/upcoming_match_index.py) instead of one DB query per team name
 """
 
+import asyncio
+import json
 import logging
 import os
 import re
@@ -25,11 +41,12 @@ from telethon import TelegramClient
 from telethon.errors import ChannelInvalidError, ChannelPrivateError, UsernameNotOccupiedError
 
 from config.settings import DATA_DIR, is_stop_requested
-from src.analysis.image_ocr import process_squad_image
+from src.analysis.ocr_pool import TRANSIENT_OCR_ERRORS, process_squad_image_async
 from src.analysis.squad_analyzer import analyze_squad_list
-from src.database.models import Match, TeamAlias
+from src.database.models import TeamAlias
 from src.processing.sources_config import get_all_telegram_channels
 from src.utils.content_analysis import RelevanceAnalyzer
+from src.utils.upcoming_match_index import UpcomingMatch, get_upcoming_match_index
 from src.utils.validators import safe_dict_get
 
 # Initialize logger for this module
@@ -191,6 +208,9 @@ API_ID = _safe_int_env("TELEGRAM_API_ID", 0)
 API_HASH = os.getenv("TELEGRAM_API_HASH", "")
 # Use data/ directory for session file (consistent with setup_telegram_auth.py and run_telegram_monitor.py)
 SESSION_NAME = os.path.join(DATA_DIR, "earlybird_monitor")
+# V12.6: Last message id seen per channel (survives restarts)
+CHANNEL_CURSOR_FILE = os.path.join(DATA_DIR, "telegram_channel_cursors.json")
+MESSAGES_PER_CHANNEL = 10  # Max messages fetched per channel per cycle
 
 # ============================================
 # TIME-GATING CONFIGURATION
@@ -294,7 +314,7 @@ def extract_team_names_from_text(text: str) -> list[str]:
 
 def has_upcoming_match(
     team_name: str, lookahead_hours: int = MATCH_LOOKAHEAD_HOURS
-) -> tuple[bool, Match | None]:
+) -> tuple[bool, UpcomingMatch | None]:
     """
     TIME-GATE #2: Check if team has an upcoming match in ACTIVE LEAGUES.
 
@@ -304,6 +324,9 @@ def has_upcoming_match(
     This prevents processing news about teams from non-active leagues
     (e.g., Benfica from Portuguese Liga).
 
+    V12.7: Returns a detached UpcomingMatch (id, league, home_team, away_team,
+    start_time) from the shared index instead of a Match row.
+
     Args:
         team_name: Team name to check
         lookahead_hours: Hours to look ahead
@@ -314,60 +337,36 @@ def has_upcoming_match(
     try:
         # V12.4/V11.2: Use dynamic active scope from Supabase/Mirror
         # No more hardcoded ELITE_LEAGUES fallback
-        from src.database.models import get_db_session
-
         from src.ingestion.league_manager import is_in_active_scope
 
-        with get_db_session() as db:
-            now = datetime.now(timezone.utc)
-            min_time = now + timedelta(hours=MIN_MATCH_TIME_HOURS)
-            max_time = now + timedelta(hours=lookahead_hours)
-
-            # Search for team in home or away
-            team_lower = team_name.lower()
+        now = datetime.now(timezone.utc)
+        min_time = now + timedelta(hours=MIN_MATCH_TIME_HOURS)
+        max_time = now + timedelta(hours=lookahead_hours)
+
+        # V12.7: In-memory lookup; fuzzy match: team name contained in home/away
+        # or home/away contained in team name (same rule as the old per-name query)
+        for match in get_upcoming_match_index().find_team_substring(
+            team_name, start=min_time, end=max_time
+        ):
+            # V11.2: Use dynamic active scope from Supabase/Mirror
+            if match.league and not is_in_active_scope(match.league):
+                logger.debug(f"⏭️ [SCOPE] Skipping non-active league: {match.league}")
+                continue
 
-            matches = (
-                db.query(Match)
-                .filter(Match.start_time >= min_time, Match.start_time <= max_time)
-                .all()
+            logger.debug(
+                f"🏆 [TELEGRAM] Found upcoming match: {match.home_team} vs {match.away_team}"
             )
+            return True, match
 
-            for match in matches:
-                home_team = getattr(match, "home_team", None)
-                away_team = getattr(match, "away_team", None)
-                league = getattr(match, "league", None)
-
-                if not home_team or not away_team:
-                    continue
-
-                home_lower = home_team.lower()
-                away_lower = away_team.lower()
-
-                # Fuzzy match: team name contained in home/away
-                if (
-                    team_lower in home_lower
-                    or team_lower in away_lower
-                    or home_lower in team_lower
-                    or away_lower in team_lower
-                ):
-                    # V11.2: Use dynamic active scope from Supabase/Mirror
-                    if league:
-                        if not is_in_active_scope(league):
-                            logger.debug(f"⏭️ [SCOPE] Skipping non-active league: {league}")
-                            continue
-
-                    logger.debug(f"🏆 [TELEGRAM] Found upcoming match: {home_team} vs {away_team}")
-                    return True, match
-
-            logger.debug(f"🏆 [TELEGRAM] No upcoming matches for {team_name}")
-            return False, None
+        logger.debug(f"🏆 [TELEGRAM] No upcoming matches for {team_name}")
+        return False, None
 
     except Exception as e:
         logger.error(f"Error checking upcoming match for {team_name}: {e}")
         return False, None
 
 
-def should_process_message(msg_date: datetime, text: str) -> tuple[bool, Match | None, str]:
+def should_process_message(msg_date: datetime, text: str) -> tuple[bool, UpcomingMatch | None, str]:
     """
     MASTER TIME-GATE: Determine if a message should be processed.
 
@@ -451,6 +450,134 @@ async def get_channel_entity_safe(client: TelegramClient, channel: str):
         return None
 
 
+# ============================================
+# CHANNEL HIGH-WATER MARKS (V12.6)
+# ============================================
+class ChannelCursorStore:
+    """
+    Last message id evaluated per channel, persisted as JSON.
+
+    fetch_squad_images() used to fetch the last 10 messages of every channel on
+    every cycle and re-download, re-OCR and re-gate messages it had already
+    seen. With a cursor it asks Telegram only for messages above min_id; a
+    channel with nothing new costs one empty request.
+
+    A cursor only advances after a channel's batch has been evaluated, so a
+    batch that failed half-way is fetched again on the next cycle.
+    """
+
+    def __init__(self, path: str = CHANNEL_CURSOR_FILE):
+        self.path = path
+        self._cursors: dict[str, int] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            self._cursors = {str(k): int(v) for k, v in data.get("channels", {}).items()}
+            logger.info(f"📌 Loaded Telegram cursors for {len(self._cursors)} channels")
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            # Corrupt file: start over (one full fetch per channel)
+            logger.warning(f"⚠️ Could not load Telegram cursors from {self.path}: {e}")
+            self._cursors = {}
+
+    def get(self, channel: str) -> int:
+        """Last message id seen in the channel (0 = never polled)."""
+        return self._cursors.get(channel, 0)
+
+    def advance(self, channel: str, message_id: int) -> None:
+        """Move the channel's cursor forward (never backwards)."""
+        if message_id > self._cursors.get(channel, 0):
+            self._cursors[channel] = message_id
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the cursors if they changed (atomic: temp file + rename)."""
+        if not self._dirty:
+            return
+        temp_file = f"{self.path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump({"channels": self._cursors}, f, indent=2, sort_keys=True)
+            os.replace(temp_file, self.path)
+            self._dirty = False
+        except OSError as e:
+            logger.warning(f"⚠️ Could not save Telegram cursors to {self.path}: {e}")
+
+    def __len__(self) -> int:
+        return len(self._cursors)
+
+
+_channel_cursors: ChannelCursorStore | None = None
+
+
+def get_channel_cursors() -> ChannelCursorStore:
+    """Get the shared channel cursor store (loaded on first use)."""
+    global _channel_cursors
+    if _channel_cursors is None:
+        _channel_cursors = ChannelCursorStore()
+    return _channel_cursors
+
+
+async def _download_and_ocr(
+    client: TelegramClient, msg, channel: str, channel_info: dict
+) -> tuple[str, str | None, bool]:
+    """
+    V12.5: Download one message photo and OCR it in the worker pool.
+
+    Returns:
+        (image_path, ocr_text, retry); ocr_text is None if OCR failed or was
+        discarded; retry is True if it failed for a transient reason (pool
+        full, timeout, broken pool) and the photo should be OCR'd again later
+    """
+    timestamp = int(msg.date.timestamp())
+    image_path = f"./temp/{channel}_{timestamp}.jpg"
+    try:
+        await client.download_media(msg.photo, image_path)
+        logging.debug(f"📥 Downloaded image: {image_path}")
+
+        # Extract text via OCR (use local file path)
+        # V5.0: Pass channel_info for contextual trust bypass
+        ocr_text = await process_squad_image_async(
+            f"file://{os.path.abspath(image_path)}",
+            channel_info=channel_info,
+            raise_transient=True,
+        )
+    except TRANSIENT_OCR_ERRORS as ocr_err:
+        logging.warning(f"OCR deferred for {image_path}: {ocr_err!r}")
+        return image_path, None, True
+    except Exception as ocr_err:
+        logging.warning(f"OCR failed for {image_path}: {ocr_err}")
+        ocr_text = None
+    return image_path, ocr_text, False
+
+
+async def _ocr_channel_photos(
+    client: TelegramClient, messages: list, channel: str, channel_info: dict
+) -> dict[int, tuple[str, str | None, bool]]:
+    """
+    V12.5: OCR all photos of a channel batch concurrently.
+
+    Was one blocking process_squad_image() per message inside the loop; the
+    worker pool bounds how many images are processed at once.
+
+    Returns:
+        message id -> (image_path, ocr_text, retry)
+    """
+    photo_msgs = [msg for msg in messages if msg.photo]
+    if not photo_msgs:
+        return {}
+    results = await asyncio.gather(
+        *(_download_and_ocr(client, msg, channel, channel_info) for msg in photo_msgs)
+    )
+    return {msg.id: result for msg, result in zip(photo_msgs, results, strict=True)}
+
+
 async def fetch_squad_images(existing_client: TelegramClient = None) -> list[dict]:
     """
     Main function to fetch squad list images from Telegram channels.
@@ -555,12 +682,17 @@ async def fetch_squad_images(existing_client: TelegramClient = None) -> list[dic
         # Create temp directory for images
         os.makedirs("./temp", exist_ok=True)
 
+        # V12.6: Per-channel high-water marks
+        cursors = get_channel_cursors()
+
         # Stats for logging
         stats = {
             "channels_checked": 0,
             "channels_failed": 0,
             "channels_blacklisted": 0,
+            "channels_unchanged": 0,
             "messages_checked": 0,
+            "messages_deferred": 0,
             "messages_dropped_old": 0,
             "messages_dropped_no_match": 0,
             "messages_dropped_low_trust": 0,
@@ -588,8 +720,45 @@ async def fetch_squad_images(existing_client: TelegramClient = None) -> list[dic
             logging.info(f"📡 Checking channel: @{channel}")
 
             try:
-                # Fetch last 10 messages
-                messages = await client.get_messages(entity, limit=10)
+                # V12.6: Fetch only messages newer than the last one seen
+                # (first poll of a channel: its last MESSAGES_PER_CHANNEL messages)
+                last_seen_id = cursors.get(channel)
+                messages = await client.get_messages(
+                    entity, limit=MESSAGES_PER_CHANNEL, min_id=last_seen_id
+                )
+                if not messages:
+                    stats["channels_unchanged"] += 1
+                    logging.debug(f"   ⏭️ No new messages since #{last_seen_id}")
+                    continue
+
+                # V12.5: Download + OCR the batch's photos concurrently in the worker pool
+                photo_ocr = await _ocr_channel_photos(client, messages, channel, channel_info)
+
+                # V12.6: A fresh photo whose OCR failed transiently is retried on the next
+                # poll. The cursor stays just below it and the newer messages wait for that
+                # poll too, so no message is evaluated twice.
+                high_water_id = max(msg.id for msg in messages)
+                retry_ids = [
+                    msg.id
+                    for msg in messages
+                    if msg.photo and photo_ocr[msg.id][2] and is_message_fresh(msg.date)
+                ]
+                if retry_ids:
+                    high_water_id = min(retry_ids) - 1
+                    deferred = [msg for msg in messages if msg.id > high_water_id]
+                    messages = [msg for msg in messages if msg.id <= high_water_id]
+                    stats["messages_deferred"] += len(deferred)
+                    logging.info(
+                        f"   🔁 OCR retry pending: {len(deferred)} messages from "
+                        f"#{high_water_id + 1} deferred to the next poll"
+                    )
+                    for msg in deferred:
+                        image_path = photo_ocr[msg.id][0] if msg.photo else None
+                        if image_path and os.path.exists(image_path):
+                            try:
+                                os.remove(image_path)
+                            except OSError:
+                                pass
 
                 for msg in messages:
                     stats["messages_checked"] += 1
@@ -603,28 +772,14 @@ async def fetch_squad_images(existing_client: TelegramClient = None) -> list[dic
                     ocr_text = None
                     image_path = None
 
-                    # Step 2: If has image, download and OCR FIRST
+                    # Step 2: If has image, use its OCR text (prefetched above)
                     # This allows us to use OCR text for time-gating
                     if msg.photo:
-                        timestamp = int(msg.date.timestamp())
-                        image_path = f"./temp/{channel}_{timestamp}.jpg"
-
-                        try:
-                            await client.download_media(msg.photo, image_path)
-                            logging.debug(f"📥 Downloaded image: {image_path}")
-
-                            # Extract text via OCR (use local file path)
-                            # V5.0: Pass channel_info for contextual trust bypass
-                            ocr_text = process_squad_image(
-                                f"file://{os.path.abspath(image_path)}", channel_info=channel_info
-                            )
-
-                            if ocr_text:
-                                # APPEND OCR text to full_text for analysis
-                                full_text += f"\n[OCR]: {ocr_text}"
-                                logging.debug(f"📸 OCR extracted {len(ocr_text)} chars")
-                        except Exception as ocr_err:
-                            logging.warning(f"OCR failed for {image_path}: {ocr_err}")
+                        image_path, ocr_text, _ = photo_ocr[msg.id]
+                        if ocr_text:
+                            # APPEND OCR text to full_text for analysis
+                            full_text += f"\n[OCR]: {ocr_text}"
+                            logging.debug(f"📸 OCR extracted {len(ocr_text)} chars")
 
                     # Step 3: TIME-GATING with COMBINED text (caption + OCR)
                     should_process, match, reason = should_process_message(msg.date, full_text)
@@ -897,10 +1052,15 @@ async def fetch_squad_images(existing_client: TelegramClient = None) -> list[dic
                         }
                     )
 
+                # V12.6: Batch evaluated (up to a pending OCR retry), don't fetch it again
+                cursors.advance(channel, high_water_id)
+
             except Exception as e:
                 logging.error(f"Error processing channel @{channel}: {e}")
                 continue
 
+        cursors.save()
+
         # Only disconnect if we created the client
         if should_disconnect:
             await client.disconnect()
@@ -910,9 +1070,13 @@ async def fetch_squad_images(existing_client: TelegramClient = None) -> list[dic
         logging.info(
             f"   Channels: {stats['channels_checked']} checked, "
             f"{stats['channels_failed']} failed, "
-            f"{stats['channels_blacklisted']} blacklisted"
+            f"{stats['channels_blacklisted']} blacklisted, "
+            f"{stats['channels_unchanged']} without new messages"
+        )
+        logging.info(
+            f"   Messages: {stats['messages_checked']} checked, "
+            f"{stats['messages_deferred']} deferred (OCR retry)"
         )
-        logging.info(f"   Messages: {stats['messages_checked']} checked")
         logging.info(
             f"   Dropped: {stats['messages_dropped_old']} old, "
             f"{stats['messages_dropped_no_match']} no match, "
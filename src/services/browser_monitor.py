@@ -89,17 +89,27 @@ from src.utils.content_analysis import (
     get_relevance_analyzer,
 )
 
+# V15.1: Per-URL conditional fetches (ETag / Last-Modified / raw-body fingerprint)
+from src.utils.fetch_state import (
+    FetchProbe,
+    FetchStateStore,
+    fetch_if_changed,
+    get_fetch_state_store,
+)
+from src.utils.http_client import get_http_client
+
 # V11.2: Import unknown team detection for safe team handling
 from src.version import is_unknown_team
 
 # V14.0: Import shared cache for cross-component deduplication
 try:
-    from src.utils.shared_cache import get_shared_cache
+    from src.utils.shared_cache import compute_simhashes, get_shared_cache
 
     SHARED_CACHE_AVAILABLE = True
 except ImportError:
     SHARED_CACHE_AVAILABLE = False
     get_shared_cache = None
+    compute_simhashes = None
 
 # V7.3: Import psutil with fallback for memory monitoring
 try:
@@ -842,6 +852,9 @@ class BrowserMonitor:
         # Content cache for deduplication
         self._content_cache: ContentCache | None = None
 
+        # V15.1: Conditional fetch state (set in start(); None = always fetch in full)
+        self._fetch_state: FetchStateStore | None = None
+
         # Playwright resources
         self._playwright = None
         self._browser = None
@@ -887,6 +900,7 @@ class BrowserMonitor:
         self._browser_extractions = 0
         self._circuit_breaker_skips = 0
         self._waf_bypasses = 0  # V13.1: Track WAF bypass successes via Scrapling
+        self._unchanged_skips = 0  # V15.1: 304 / identical bytes, extraction skipped
 
         # V7.2: Behavior simulation stats
         self._behavior_simulations = 0
@@ -953,6 +967,7 @@ class BrowserMonitor:
                 max_entries=self._config.global_settings.cache_max_entries,
                 ttl_hours=self._config.global_settings.cache_ttl_hours,
             )
+            self._fetch_state = get_fetch_state_store("browser_monitor")
 
             # V7.6: Initialize Tavily for short content expansion
             try:
@@ -1861,6 +1876,37 @@ class BrowserMonitor:
             logger.debug(f"⚠️ [BROWSER-MONITOR] HTTP extraction failed: {e}")
             return None
 
+    async def _probe_if_changed(self, url: str) -> FetchProbe | None:
+        """
+        V15.1: Conditional GET of a single-page source with its stored validators.
+
+        Returns:
+            FetchProbe, or None when fetch state is disabled or the URL is not probed
+            (it kept failing the plain HTTP probe, e.g. behind a WAF)
+        """
+        store = self._fetch_state
+        if store is None or not store.should_probe(url):
+            return None
+        return await asyncio.to_thread(
+            fetch_if_changed,
+            get_http_client(),
+            url,
+            store,
+            rate_limit_key="conditional_fetch",
+            timeout=HTTP_TIMEOUT,
+            use_fingerprint=True,
+        )
+
+    def _extract_from_probe(self, probe: FetchProbe | None) -> str | None:
+        """V15.1: Trafilatura text of a changed probe body, if long enough."""
+        if probe is None or not probe.changed or not probe.text:
+            return None
+        text = self._extract_with_trafilatura(probe.text)
+        if text and len(text) > HTTP_MIN_CONTENT_LENGTH:
+            self._http_extractions += 1
+            return text
+        return None
+
     async def extract_content_hybrid(self, url: str) -> str | None:
         """
         V7.1: Hybrid extraction - HTTP first, browser fallback.
@@ -2424,6 +2470,8 @@ class BrowserMonitor:
         V7.4: Supports paginated navigation for Elite 7 and Tier 2 sources.
         V12.1: Returns tuple (news, scan_successful) to distinguish between
         "no news found" and "scan failed". This allows proper last_scanned updates.
+        V15.1: Single pages are probed with a conditional GET first; a 304 or
+        identical bytes is a successful scan without extraction or analysis.
 
         Args:
             source: Source to scan
@@ -2446,9 +2494,22 @@ class BrowserMonitor:
             if source.navigation_mode == "paginated" and source.link_selector:
                 return await self._scan_source_paginated(source)
 
+            # V15.1: Skip pages that haven't changed since the last extraction
+            probe = await self._probe_if_changed(source.url)
+            if probe is not None and probe.skip:
+                self._unchanged_skips += 1
+                self._record_source_success(source.url)
+                logger.debug(
+                    f"⏭️ [BROWSER-MONITOR] Unchanged ({probe.status}): {source.url[:40]}..."
+                )
+                return None, True
+
             # V7.1: Extract content with retry and hybrid mode (single page)
             # V7.3: Now returns tuple (content, is_network_error)
-            content, is_network_error = await self._extract_with_retry(source.url)
+            content = self._extract_from_probe(probe)
+            is_network_error = False
+            if not content:
+                content, is_network_error = await self._extract_with_retry(source.url)
 
             if not content:
                 # V7.3: Only record failure for circuit breaker if it was a network error
@@ -2457,6 +2518,8 @@ class BrowserMonitor:
 
             # V7.1: Record success for circuit breaker
             self._record_source_success(source.url)
+            if probe is not None and self._fetch_state is not None:
+                self._fetch_state.commit(probe)
 
             # Analyze and create news from single page content
             news = await self._analyze_and_create_news(source, source.url, content)
@@ -2511,15 +2574,27 @@ class BrowserMonitor:
         # V7.1: Record success for circuit breaker (we got some content)
         self._record_source_success(source.url)
 
+        # V15.0: Simhash all pages in one pass (shared token hashes) for the dedup check
+        simhashes: list[int | None] = [None] * len(results)
+        if SHARED_CACHE_AVAILABLE:
+            try:
+                simhashes = await asyncio.to_thread(
+                    compute_simhashes, [content for _, content in results]
+                )
+            except Exception as e:
+                logger.debug(f"[BROWSER-MONITOR] Batch simhash failed, using per-page: {e}")
+
         # Analyze each extracted page
         first_news = None
-        for article_url, content in results:
+        for (article_url, content), simhash in zip(results, simhashes, strict=True):
             # Check if we should stop
             if not self._running or self._stop_event.is_set():
                 break
 
             # Analyze and create news
-            news = await self._analyze_and_create_news(source, article_url, content)
+            news = await self._analyze_and_create_news(
+                source, article_url, content, simhash=simhash
+            )
             if news and first_news is None:
                 first_news = news
                 # Continue analyzing other pages but don't return yet
@@ -2528,7 +2603,11 @@ class BrowserMonitor:
         return first_news, True
 
     async def _analyze_and_create_news(
-        self, source: MonitoredSource, article_url: str, content: str
+        self,
+        source: MonitoredSource,
+        article_url: str,
+        content: str,
+        simhash: int | None = None,
     ) -> DiscoveredNews | None:
         """
         V7.5: Analyze content and create DiscoveredNews if relevant.
@@ -2546,6 +2625,7 @@ class BrowserMonitor:
             source: Source configuration
             article_url: URL of the article (may differ from source.url for paginated)
             content: Extracted text content
+            simhash: Precomputed simhash of content (V15.0, optional)
 
         Returns:
             DiscoveredNews if relevant, None otherwise
@@ -2558,7 +2638,7 @@ class BrowserMonitor:
                 shared_cache = get_shared_cache()
                 # Atomic check-and-mark operation to prevent race conditions
                 if await shared_cache.check_and_mark_async(
-                    content=content, url=article_url, source="browser_monitor"
+                    content=content, url=article_url, source="browser_monitor", simhash=simhash
                 ):
                     logger.debug(
                         f"🔄 [BROWSER-MONITOR] Skipping cross-component duplicate: {article_url[:50]}..."
@@ -3337,6 +3417,14 @@ RULES:
                 # V13.1: Scrapling WAF bypass stats
                 "waf_bypasses": self._waf_bypasses,
                 "scrapling_enabled": self._article_reader is not None,
+                # V15.1: Conditional fetches and how often each source changes
+                # (suggested intervals are reported only, not applied)
+                "unchanged_skips": self._unchanged_skips,
+                "source_change_rates": self._fetch_state.get_source_change_rates(
+                    {s.url: s.scan_interval_minutes for s in self._config.sources}
+                )
+                if self._fetch_state
+                else {},
                 # V7.2: Behavior simulation stats
                 "behavior_simulations": self._behavior_simulations,
                 "behavior_simulation_failures": self._behavior_simulation_failures,  # V7.6
@@ -33,6 +33,8 @@ import subprocess
 import time
 import traceback
 from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -45,10 +47,12 @@ from src.utils.content_analysis import (
     AnalysisResult,
     get_exclusion_filter,
     get_positive_news_filter,
+    scan_content,
 )
 
 # V2.0: Import high-value signal detection
 from src.utils.high_value_detector import (
+    SignalResult,
     SignalType,
     StructuredAnalysis,
     get_garbage_filter,
@@ -114,6 +118,13 @@ except ImportError:
 # V11.0: Import DiscoveryQueue for GlobalRadarMonitor intelligence queue
 from src.utils.discovery_queue import DiscoveryQueue, get_discovery_queue
 
+# V16.1: Per-URL conditional fetches (ETag / Last-Modified / raw-body fingerprint)
+from src.utils.fetch_state import FetchStateStore, fetch_if_changed, get_fetch_state_store
+from src.utils.team_name_index import TeamIndexEntry, TeamNameIndex, token_set_score
+
+# V16.2: Shared in-memory index of upcoming matches (team lookups, handoff league)
+from src.utils.upcoming_match_index import get_upcoming_match_index
+
 # V11.2: Import centralized unknown team detection
 try:
     from src.version import UNKNOWN_TEAM, get_team_display_name, is_unknown_team
@@ -170,6 +181,40 @@ CIRCUIT_BREAKER_FAILURE_THRESHOLD = 3
 CIRCUIT_BREAKER_RECOVERY_TIMEOUT = 300  # 5 minutes
 CIRCUIT_BREAKER_MAX_RETRIES = 20  # Give up after 20 total attempts (approx 100 min)
 
+# V15.0: Refresh interval for the upcoming-match team-name index (_fuzzy_match_team)
+UPCOMING_TEAM_INDEX_TTL_SECONDS = 300
+
+# V16.0: Max DeepSeek analyses in flight during a scan cycle (content pipeline)
+# and size / page recycling of the browser fallback pool (BrowserPagePool)
+try:
+    from config.settings import (
+        NEWS_RADAR_ANALYSIS_CONCURRENCY,
+        NEWS_RADAR_BROWSER_PAGE_MAX_NAVIGATIONS,
+        NEWS_RADAR_BROWSER_POOL_SIZE,
+    )
+except ImportError:
+    NEWS_RADAR_ANALYSIS_CONCURRENCY = 4
+    NEWS_RADAR_BROWSER_POOL_SIZE = 3
+    NEWS_RADAR_BROWSER_PAGE_MAX_NAVIGATIONS = 20
+
+# V16.0: Memory check shared with BrowserMonitor (browser pool back-off)
+try:
+    from src.services.browser_monitor import (
+        MEMORY_HIGH_THRESHOLD,
+        MEMORY_LOW_THRESHOLD,
+        get_memory_usage_percent,
+    )
+except ImportError:
+    MEMORY_HIGH_THRESHOLD = 80
+    MEMORY_LOW_THRESHOLD = 70
+
+    def get_memory_usage_percent() -> float:
+        return 50.0
+
+
+# How often a pool waiter re-checks memory while the pool is backing off
+BROWSER_POOL_MEMORY_POLL_SECONDS = 5.0
+
 # HTTP configuration
 HTTP_TIMEOUT = 15
 HTTP_MIN_CONTENT_LENGTH = 200
@@ -177,6 +222,13 @@ HTTP_MIN_CONTENT_LENGTH = 200
 # V13.1: WAF detection status codes
 WAF_BLOCK_CODES = {403, 429}
 
+# Request headers for the plain HTTP paths (legacy fallback and V16.1 conditional probe)
+HTTP_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+}
+
 # OpenRouter API
 OPENROUTER_API_URL = "https://openrouter.ai/api/v1/chat/completions"
 
@@ -1192,6 +1244,200 @@ def load_config_from_supabase() -> RadarConfig:
         return RadarConfig()
 
 
+# ============================================
+# BROWSER PAGE POOL (V16.0)
+# ============================================
+
+
+@dataclass
+class _PooledPage:
+    """A pooled Playwright page with its own browser context."""
+
+    browser: Any
+    context: Any
+    page: Any
+    navigations: int = 0
+
+
+class BrowserPagePool:
+    """
+    Small pool of reusable Playwright pages for the browser fallback.
+
+    - At most `size` pages are handed out at once; callers wait for a free one
+    - Each page lives in its own browser context and is closed (context and
+      all) after `max_navigations` uses, on any error, or when the browser it
+      belongs to has been recreated, so Chromium memory cannot build up
+    - Memory back-off: above memory_high percent idle pages are closed and new
+      checkouts wait until a page in use is returned or memory drops below
+      memory_low, so under pressure the pool runs one page at a time
+
+    Usage:
+        async with pool.page() as page:
+            if page is not None:
+                await page.goto(url)
+    """
+
+    def __init__(
+        self,
+        get_browser: Callable[[], Awaitable[Any | None]],
+        size: int = NEWS_RADAR_BROWSER_POOL_SIZE,
+        navigation_timeout: float = DEFAULT_PAGE_TIMEOUT_SECONDS,
+        max_navigations: int = NEWS_RADAR_BROWSER_PAGE_MAX_NAVIGATIONS,
+        setup_page: Callable[[Any], Awaitable[None]] | None = None,
+        memory_high: float = MEMORY_HIGH_THRESHOLD,
+        memory_low: float = MEMORY_LOW_THRESHOLD,
+        memory_check: Callable[[], float] = get_memory_usage_percent,
+        memory_poll_seconds: float = BROWSER_POOL_MEMORY_POLL_SECONDS,
+    ):
+        """
+        Args:
+            get_browser: Coroutine returning the connected browser (None if unavailable)
+            size: Max pages in use at once
+            navigation_timeout: Default navigation / action timeout per page (seconds)
+            max_navigations: Uses before a page and its context are replaced
+            setup_page: Optional coroutine run once on each new page (e.g. stealth)
+            memory_high: Memory percent above which the pool backs off
+            memory_low: Memory percent below which it runs at full size again
+            memory_check: Returns current memory usage percent
+            memory_poll_seconds: Re-check interval while backing off
+        """
+        self.size = max(1, size)
+        self._get_browser = get_browser
+        self._navigation_timeout_ms = navigation_timeout * 1000
+        self._max_navigations = max(1, max_navigations)
+        self._setup_page = setup_page
+        self._memory_high = memory_high
+        self._memory_low = memory_low
+        self._memory_check = memory_check
+        self._memory_poll_seconds = memory_poll_seconds
+
+        self._slots = asyncio.Semaphore(self.size)
+        self._memory_lock = asyncio.Lock()
+        self._idle: list[_PooledPage] = []
+        self._in_use = 0
+        self._closed = False
+
+        # Stats
+        self._pages_created = 0
+        self._pages_recycled = 0
+        self._pages_discarded = 0
+        self._navigations = 0
+        self._memory_backoffs = 0
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator[Any | None]:
+        """Check out a page (None if no browser is available) and return it on exit."""
+        async with self._slots:
+            pooled = await self._checkout()
+            if pooled is None:
+                yield None
+                return
+            healthy = False
+            try:
+                yield pooled.page
+                healthy = True
+            finally:
+                self._in_use -= 1
+                await self._checkin(pooled, healthy)
+
+    async def _checkout(self) -> _PooledPage | None:
+        async with self._memory_lock:
+            await self._wait_for_memory()
+            self._in_use += 1
+        try:
+            browser = await self._get_browser()
+            if browser is None or self._closed:
+                self._in_use -= 1
+                return None
+            while self._idle:
+                pooled = self._idle.pop()
+                if pooled.browser is browser and not pooled.page.is_closed():
+                    return pooled
+                await self._close_pooled(pooled)
+            return await self._create_page(browser)
+        except BaseException:
+            self._in_use -= 1
+            raise
+
+    async def _create_page(self, browser: Any) -> _PooledPage:
+        context = await browser.new_context(viewport={"width": 1280, "height": 720})
+        try:
+            page = await context.new_page()
+            page.set_default_navigation_timeout(self._navigation_timeout_ms)
+            page.set_default_timeout(self._navigation_timeout_ms)
+            if self._setup_page is not None:
+                await self._setup_page(page)
+        except BaseException:
+            await context.close()
+            raise
+        self._pages_created += 1
+        return _PooledPage(browser=browser, context=context, page=page)
+
+    async def _checkin(self, pooled: _PooledPage, healthy: bool) -> None:
+        pooled.navigations += 1
+        self._navigations += 1
+        if pooled.navigations >= self._max_navigations:
+            self._pages_recycled += 1
+            await self._close_pooled(pooled)
+            return
+        if not healthy or self._closed or self._memory_check() > self._memory_high:
+            self._pages_discarded += 1
+            await self._close_pooled(pooled)
+            return
+        try:
+            # Drop the last site's DOM and scripts while the page sits idle
+            await pooled.page.goto("about:blank")
+        except Exception:
+            self._pages_discarded += 1
+            await self._close_pooled(pooled)
+            return
+        self._idle.append(pooled)
+
+    async def _wait_for_memory(self) -> None:
+        """Back off while memory is high (caller holds _memory_lock)."""
+        memory_percent = self._memory_check()
+        if memory_percent <= self._memory_high:
+            return
+
+        self._memory_backoffs += 1
+        logger.warning(
+            f"⏸️ [NEWS-RADAR] High memory ({memory_percent:.1f}%), browser pool backing off"
+        )
+        await self._close_idle()
+        while self._in_use > 0 and not self._closed:
+            await asyncio.sleep(self._memory_poll_seconds)
+            if self._memory_check() < self._memory_low:
+                break
+
+    async def _close_pooled(self, pooled: _PooledPage) -> None:
+        try:
+            await pooled.context.close()
+        except Exception as e:
+            logger.debug(f"⚠️ [NEWS-RADAR] Error closing pooled browser context: {e}")
+
+    async def _close_idle(self) -> None:
+        idle, self._idle = self._idle, []
+        for pooled in idle:
+            await self._close_pooled(pooled)
+
+    async def close(self) -> None:
+        """Close idle pages; pages still in use are closed when returned."""
+        self._closed = True
+        await self._close_idle()
+
+    def get_stats(self) -> dict[str, int]:
+        return {
+            "size": self.size,
+            "in_use": self._in_use,
+            "idle": len(self._idle),
+            "pages_created": self._pages_created,
+            "pages_recycled": self._pages_recycled,
+            "pages_discarded": self._pages_discarded,
+            "navigations": self._navigations,
+            "memory_backoffs": self._memory_backoffs,
+        }
+
+
 # ============================================
 # CONTENT EXTRACTOR
 # ============================================
@@ -1206,15 +1452,26 @@ class ContentExtractor:
     2. Playwright fallback with stealth mode (slower, ~95% success)
 
     V1.3: Added browser lock for race condition protection
+    V16.0: Browser fallback pages come from a BrowserPagePool and run in parallel
+    V16.1: Optional FetchStateStore: extract_batch_if_changed() sends conditional
+           requests and skips pages that answer 304 or return identical bytes
 
     Requirements: 2.1, 2.2, 2.3, 2.4
     """
 
-    def __init__(self, page_timeout: int = DEFAULT_PAGE_TIMEOUT_SECONDS):
+    def __init__(
+        self,
+        page_timeout: int = DEFAULT_PAGE_TIMEOUT_SECONDS,
+        browser_pool_size: int = NEWS_RADAR_BROWSER_POOL_SIZE,
+        fetch_state: FetchStateStore | None = None,
+    ):
         self._page_timeout = page_timeout
+        self._fetch_state = fetch_state  # V16.1: None = always fetch in full
         self._playwright: Any | None = None
         self._browser: Any | None = None
         self._browser_lock: asyncio.Lock | None = None  # V1.3: Lock for browser recreation
+        self._browser_pool_size = browser_pool_size
+        self._page_pool: BrowserPagePool | None = None  # V16.0: created on first fallback
 
         # V13.1: Scrapling-based stealth extractor (WAF bypass)
         self._article_reader = None
@@ -1231,6 +1488,7 @@ class ContentExtractor:
         self._browser_extractions = 0
         self._failed_extractions = 0
         self._waf_bypasses = 0  # V13.1: Track WAF bypass successes
+        self._unchanged_skips = 0  # V16.1: 304 / identical bytes
 
     def _diagnose_playwright_installation(self) -> dict:
         """
@@ -1381,6 +1639,11 @@ class ContentExtractor:
 
     async def shutdown(self) -> None:
         """Shutdown Playwright and release resources."""
+        # V16.0: Close pooled pages before the browser goes away
+        if self._page_pool:
+            await self._page_pool.close()
+            self._page_pool = None
+
         # V13.1: Close ArticleReader
         if self._article_reader:
             try:
@@ -1595,12 +1858,6 @@ class ContentExtractor:
 
         # V13.1: Legacy fallback - standard httpx (no WAF bypass)
         try:
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                "Accept-Language": "en-US,en;q=0.5",
-            }
-
             http_client = get_http_client()
             response = await asyncio.to_thread(
                 http_client.get_sync,
@@ -1608,7 +1865,7 @@ class ContentExtractor:
                 rate_limit_key="news_radar",
                 use_fingerprint=False,
                 timeout=HTTP_TIMEOUT,
-                headers=headers,
+                headers=HTTP_HEADERS,
             )
 
             if response.status_code in WAF_BLOCK_CODES:
@@ -1635,11 +1892,90 @@ class ContentExtractor:
             logger.debug(f"⚠️ [NEWS-RADAR] HTTP extraction failed: {e}")
             return None
 
+    @property
+    def fetch_state(self) -> FetchStateStore | None:
+        return self._fetch_state
+
+    async def _extract_if_changed(self, url: str) -> tuple[str | None, bool]:
+        """
+        V16.1: Extract a page unless the conditional probe shows it hasn't changed.
+
+        The probe is a plain conditional GET with the stored validators. A 200 body
+        is extracted directly with Trafilatura; WAF blocks, failed probes and
+        bodies Trafilatura can't read go through _extract_with_http() as before.
+        Validators are committed only once extraction succeeded.
+
+        Returns:
+            (content, unchanged): unchanged is True on 304 or identical bytes
+        """
+        store = self._fetch_state
+        if store is None or not store.should_probe(url):
+            return await self._extract_with_http(url), False
+
+        probe = await asyncio.to_thread(
+            fetch_if_changed,
+            get_http_client(),
+            url,
+            store,
+            rate_limit_key="conditional_fetch",
+            headers=HTTP_HEADERS,
+            timeout=HTTP_TIMEOUT,
+        )
+        if probe.skip:
+            self._unchanged_skips += 1
+            logger.debug(f"⏭️ [NEWS-RADAR] Unchanged ({probe.status}): {url[:40]}...")
+            return None, True
+
+        content = None
+        if probe.changed and probe.text:
+            text = self._extract_with_trafilatura(probe.text)
+            if text and len(text) > HTTP_MIN_CONTENT_LENGTH:
+                self._http_extractions += 1
+                content = text
+        if content is None:
+            content = await self._extract_with_http(url)
+        if content:
+            store.commit(probe)
+        return content, False
+
+    def _get_page_pool(self) -> BrowserPagePool:
+        """V16.0: Lazily created pool of stealth pages for the browser fallback."""
+        if self._page_pool is None:
+            self._page_pool = BrowserPagePool(
+                self._get_connected_browser,
+                size=self._browser_pool_size,
+                navigation_timeout=self._page_timeout,
+                setup_page=self._apply_stealth,
+            )
+        return self._page_pool
+
+    async def _get_connected_browser(self) -> Any | None:
+        if not await self._ensure_browser_connected():
+            return None
+        return self._browser
+
+    async def _apply_stealth(self, page: Any) -> None:
+        """Apply playwright-stealth to a new page if available."""
+        # V12.1: Apply stealth if available (COVE FIX)
+        if STEALTH_AVAILABLE and Stealth is not None:
+            try:
+                stealth = Stealth()
+                await stealth.apply_stealth_async(page)
+                logger.debug("🥷 [NEWS-RADAR] Stealth mode applied")
+            except Exception as e:
+                logger.warning(f"⚠️ [NEWS-RADAR] Stealth failed: {e}")
+        else:
+            logger.debug(
+                "⚠️ [NEWS-RADAR] playwright-stealth not available, continuing without stealth"
+            )
+
     async def _extract_with_browser(self, url: str) -> str | None:
         """
         Extract content using Playwright browser.
 
         V1.2: Now uses _ensure_browser_connected() for auto-recovery.
+        V16.0: Uses a page from the BrowserPagePool (stealth applied once per
+        page); concurrent calls run in parallel up to the pool size.
 
         Requirements: 2.2
         """
@@ -1648,35 +1984,23 @@ class ContentExtractor:
             logger.error("❌ [NEWS-RADAR] Browser not available and could not be recreated")
             return None
 
-        page = None
         try:
-            page = await self._browser.new_page()  # type: ignore[union-attr]
-            await page.set_viewport_size({"width": 1280, "height": 720})
-
-            # V12.1: Apply stealth if available (COVE FIX)
-            if STEALTH_AVAILABLE and Stealth is not None:
-                try:
-                    stealth = Stealth()
-                    await stealth.apply_stealth_async(page)
-                    logger.debug("🥷 [NEWS-RADAR] Stealth mode applied")
-                except Exception as e:
-                    logger.warning(f"⚠️ [NEWS-RADAR] Stealth failed: {e}")
-            else:
-                logger.debug(
-                    "⚠️ [NEWS-RADAR] playwright-stealth not available, continuing without stealth"
-                )
+            async with self._get_page_pool().page() as page:
+                if page is None:
+                    logger.error("❌ [NEWS-RADAR] Browser not available for pooled page")
+                    return None
 
-            # Navigate
-            timeout_ms = self._page_timeout * 1000
-            await page.goto(url, timeout=timeout_ms, wait_until="domcontentloaded")
+                # Navigate
+                timeout_ms = self._page_timeout * 1000
+                await page.goto(url, timeout=timeout_ms, wait_until="domcontentloaded")
 
-            # Get HTML for Trafilatura
-            html = await page.content()
-            text = self._extract_with_trafilatura(html)
+                # Get HTML for Trafilatura
+                html = await page.content()
+                text = self._extract_with_trafilatura(html)
 
-            # Fallback to raw text
-            if not text:
-                text = await page.inner_text("body")
+                # Fallback to raw text
+                if not text:
+                    text = await page.inner_text("body")
 
             if text and len(text) > MAX_TEXT_LENGTH:
                 text = text[:MAX_TEXT_LENGTH]
@@ -1695,12 +2019,6 @@ class ContentExtractor:
             logger.error(f"   URL: {url}")
             logger.debug(f"   Traceback:\n{traceback.format_exc()}")
             return None
-        finally:
-            if page:
-                try:
-                    await page.close()
-                except Exception:
-                    pass
 
     async def extract(self, url: str) -> str | None:
         """
@@ -1873,24 +2191,48 @@ class ContentExtractor:
         Returns:
             Dict mapping URL -> extracted content (or None if failed)
         """
+        results, _ = await self._extract_batch(urls, max_concurrent, conditional=False)
+        return results
+
+    async def extract_batch_if_changed(
+        self, urls: list[str], max_concurrent: int = 5
+    ) -> tuple[dict[str, str | None], set[str]]:
+        """
+        V16.1: Like extract_batch_http(), but skips pages that haven't changed.
+
+        Pages answering 304 or returning the same bytes as the last successful
+        extraction are neither extracted nor sent to the browser fallback.
+
+        Returns:
+            (URL -> content or None if failed, set of unchanged URLs)
+        """
+        return await self._extract_batch(urls, max_concurrent, conditional=True)
+
+    async def _extract_batch(
+        self, urls: list[str], max_concurrent: int, conditional: bool
+    ) -> tuple[dict[str, str | None], set[str]]:
         if not urls:
-            return {}
+            return {}, set()
 
         results: dict[str, str | None] = {}
+        unchanged: set[str] = set()
 
         # Use semaphore to limit concurrency
         semaphore = asyncio.Semaphore(max_concurrent)
 
-        async def extract_single(url: str) -> tuple[str, str | None]:
+        async def extract_single(url: str) -> tuple[str, str | None, bool]:
             """Extract single URL with semaphore."""
             async with semaphore:
                 try:
                     # Try HTTP first (fast)
+                    if conditional:
+                        content, is_unchanged = await self._extract_if_changed(url)
+                        return (url, content, is_unchanged)
                     content = await self._extract_with_http(url)
-                    return (url, content)
+                    return (url, content, False)
                 except Exception as e:
                     logger.debug(f"⚠️ [NEWS-RADAR] Batch HTTP failed for {url[:40]}: {e}")
-                    return (url, None)
+                    return (url, None, False)
 
         # Run all extractions in parallel
         tasks = [extract_single(url) for url in urls]
@@ -1906,21 +2248,24 @@ class ContentExtractor:
                 browser_fallback_urls.append(url)
                 continue
 
-            _, content = result
-            if content:
+            _, content, is_unchanged = result
+            if is_unchanged:
+                unchanged.add(url)
+            elif content:
                 results[url] = content
             else:
                 # Mark for browser fallback
                 browser_fallback_urls.append(url)
 
-        # Browser fallback for failed URLs (sequential to avoid overload)
+        # V16.0: Browser fallback for failed URLs in parallel, bounded by the page pool
         if browser_fallback_urls:
             logger.debug(f"🌐 [NEWS-RADAR] Browser fallback for {len(browser_fallback_urls)} URLs")
-            for url in browser_fallback_urls:
-                content = await self._extract_with_browser(url)
-                results[url] = content
+            contents = await asyncio.gather(
+                *(self._extract_with_browser(url) for url in browser_fallback_urls)
+            )
+            results.update(zip(browser_fallback_urls, contents, strict=True))
 
-        return results
+        return results, unchanged
 
     def get_stats(self) -> dict[str, int]:
         """Get extraction statistics."""
@@ -1929,6 +2274,12 @@ class ContentExtractor:
             "browser_extractions": self._browser_extractions,
             "failed_extractions": self._failed_extractions,
             "waf_bypasses": self._waf_bypasses,
+            "unchanged_skips": self._unchanged_skips,  # V16.1
+            # V16.0: Browser fallback pool
+            **{
+                f"browser_pool_{key}": value
+                for key, value in (self._page_pool.get_stats() if self._page_pool else {}).items()
+            },
         }
 
 
@@ -1953,17 +2304,25 @@ class DeepSeekFallback:
         self._min_interval = min_interval
         self._last_call_time: float = 0.0
         self._call_count = 0
+        # V16.0: Analyses run concurrently in the scan-cycle pipeline
+        self._rate_lock = asyncio.Lock()
 
     async def _wait_for_rate_limit(self) -> None:
         """
         Wait if needed to respect rate limit.
 
+        V16.0: The call slot is reserved under a lock, so concurrent analyses
+        start at least min_interval apart instead of all passing the check
+        before any of them has recorded its call.
+
         Requirements: 5.4
         """
-        elapsed = time.time() - self._last_call_time
-        if elapsed < self._min_interval:
-            wait_time = self._min_interval - elapsed
-            await asyncio.sleep(wait_time)
+        async with self._rate_lock:
+            elapsed = time.time() - self._last_call_time
+            if elapsed < self._min_interval:
+                wait_time = self._min_interval - elapsed
+                await asyncio.sleep(wait_time)
+            self._last_call_time = time.time()
 
     def _parse_response_v2(self, response_text: str) -> dict[str, Any] | None:
         """
@@ -2099,7 +2458,6 @@ class DeepSeekFallback:
                     timeout=timeout,
                 )
 
-                self._last_call_time = time.time()
                 self._call_count += 1
 
                 if response.status_code != 200:
@@ -2464,11 +2822,15 @@ class TelegramAlerter:
         self._chat_id = chat_id or os.getenv("TELEGRAM_CHAT_ID")
         self._alerts_sent = 0
         self._alerts_failed = 0
+        # V16.0: One send at a time (keeps alert order and Telegram rate limits)
+        self._send_lock = asyncio.Lock()
 
     async def send_alert(self, alert: RadarAlert, max_retries: int = 3) -> bool:
         """
         Send formatted alert to Telegram.
 
+        V16.0: Sends are serialized; concurrent callers wait their turn.
+
         Returns True if sent successfully.
 
         Requirements: 6.1, 6.2, 6.3, 6.4
@@ -2477,6 +2839,11 @@ class TelegramAlerter:
             logger.error("❌ [NEWS-RADAR] Telegram credentials not configured")
             return False
 
+        async with self._send_lock:
+            return await self._send_with_retry(alert, max_retries)
+
+    async def _send_with_retry(self, alert: RadarAlert, max_retries: int) -> bool:
+        """POST the alert with retry and exponential backoff (caller holds _send_lock)."""
         message = alert.to_telegram_message()
         url = f"https://api.telegram.org/bot{self._token}/sendMessage"
 
@@ -2534,6 +2901,68 @@ class TelegramAlerter:
         }
 
 
+# ============================================
+# CONTENT PIPELINE (V16.0)
+# ============================================
+
+
+@dataclass
+class PrefilteredContent:
+    """Extracted page that passed dedup and the cheap filters, ready for DeepSeek."""
+
+    source: RadarSource
+    url: str
+    content: str
+    cleaned_content: str
+    signal: SignalResult
+
+
+@dataclass
+class PipelineStageStats:
+    """
+    Throughput of one content pipeline stage during a scan cycle.
+
+    busy_seconds is the summed time of the individual items; wall_seconds runs
+    from the first item entering the stage to the last one leaving it, so
+    busy / wall is the average number of items in flight.
+    """
+
+    items_in: int = 0
+    items_out: int = 0
+    errors: int = 0
+    busy_seconds: float = 0.0
+    first_start: float | None = None
+    last_end: float | None = None
+
+    def record(self, started: float, ended: float, passed: bool) -> None:
+        self.items_in += 1
+        if passed:
+            self.items_out += 1
+        self.busy_seconds += ended - started
+        if self.first_start is None or started < self.first_start:
+            self.first_start = started
+        if self.last_end is None or ended > self.last_end:
+            self.last_end = ended
+
+    @property
+    def wall_seconds(self) -> float:
+        if self.first_start is None or self.last_end is None:
+            return 0.0
+        return self.last_end - self.first_start
+
+    def to_dict(self) -> dict[str, Any]:
+        wall = self.wall_seconds
+        return {
+            "items_in": self.items_in,
+            "items_out": self.items_out,
+            "errors": self.errors,
+            "busy_seconds": round(self.busy_seconds, 3),
+            "wall_seconds": round(wall, 3),
+            "items_per_second": round(self.items_in / wall, 2) if wall > 0 else None,
+            "avg_in_flight": round(self.busy_seconds / wall, 2) if wall > 0 else None,
+        }
+
+
 # ============================================
 # NEWS RADAR MONITOR (Main Class)
 # ============================================
@@ -2607,6 +3036,8 @@ class NewsRadarMonitor:
         self._alerts_sent = 0
         self._excluded_count = 0  # VPS FIX: Track excluded content statistics
         self._last_cycle_time: datetime | None = None
+        # V16.0: Per-stage throughput of the last scan cycle's content pipeline
+        self._pipeline_stats: dict[str, dict[str, Any]] = {}
 
         logger.info("🔔 [NEWS-RADAR] V2.0 Monitor created")
 
@@ -2648,7 +3079,8 @@ class NewsRadarMonitor:
             )
 
             self._extractor = ContentExtractor(
-                page_timeout=self._config.global_settings.page_timeout_seconds
+                page_timeout=self._config.global_settings.page_timeout_seconds,
+                fetch_state=get_fetch_state_store("news_radar"),
             )
 
             if not await self._extractor.initialize():
@@ -2972,6 +3404,11 @@ class NewsRadarMonitor:
         Execute one scan cycle over all due sources.
 
         V7.3: Uses batch HTTP extraction for single-page sources.
+        V16.0: Extracted pages go through _run_content_pipeline() (prefilter →
+        concurrent DeepSeek analysis → serialized delivery) instead of being
+        processed one source after another.
+        V16.1: Conditional fetches; unchanged pages (304 / identical bytes) count
+        as a successful scan but skip extraction and the content pipeline.
 
         Returns number of alerts sent.
 
@@ -3007,9 +3444,15 @@ class NewsRadarMonitor:
                 urls = [s.url for s in eligible_sources]
                 logger.info(f"⚡ [NEWS-RADAR] Batch extracting {len(urls)} single-page sources")
 
-                contents = await self._extractor.extract_batch_http(urls, max_concurrent=5)  # type: ignore[union-attr]
+                contents, unchanged = await self._extractor.extract_batch_if_changed(  # type: ignore[union-attr]
+                    urls, max_concurrent=5
+                )
 
-                # Process each result
+                # V15.0: Simhash the whole batch at once (shared token hashes) for the dedup check
+                simhashes = await self._compute_batch_simhashes(contents)
+
+                # Record each result and collect the pages for the content pipeline
+                extracted: list[tuple[RadarSource, str, int | None]] = []
                 for source in eligible_sources:
                     if not self._running or self._stop_event.is_set():
                         break
@@ -3021,19 +3464,13 @@ class NewsRadarMonitor:
                     # Update counter immediately to avoid loss on interruption
                     self._urls_scanned = urls_scanned
 
-                    if content:
+                    if source.url in unchanged:
+                        # V16.1: Page reachable but unchanged since the last extraction
                         breaker.record_success()
-                        alert = await self._process_content(content, source, source.url)
-
-                        if alert:
-                            # CROSS-PROCESS HANDOFF: High-confidence alerts to Main Pipeline
-                            if alert.confidence >= ALERT_CONFIDENCE_THRESHOLD:
-                                await self._handoff_to_main_pipeline(alert, content)
-
-                            # Send Telegram alert
-                            if self._alerter and await self._alerter.send_alert(alert):
-                                alerts_sent += 1
-                                self._alerts_sent += 1
+                        source.last_scanned = datetime.now(timezone.utc)
+                    elif content:
+                        breaker.record_success()
+                        extracted.append((source, content, simhashes.get(source.url)))
 
                         # Update last scanned time ONLY on success
                         # This ensures circuit breaker effectiveness and proper retry timing
@@ -3043,6 +3480,9 @@ class NewsRadarMonitor:
                         # DO NOT update last_scanned on failure
                         # This allows circuit breaker to work correctly and retry sooner
 
+                if extracted:
+                    alerts_sent += await self._run_content_pipeline(extracted)
+
         # V8.0: Process paginated sources concurrently using 3 browser contexts (tabs)
         if paginated_sources:
             alerts_sent, urls_scanned = await self._scan_paginated_sources_concurrent(
@@ -3053,6 +3493,118 @@ class NewsRadarMonitor:
         self._urls_scanned = urls_scanned
         return alerts_sent
 
+    async def _run_content_pipeline(
+        self, extracted: list[tuple[RadarSource, str, int | None]]
+    ) -> int:
+        """
+        V16.0: Process extracted single-page sources as a bounded async pipeline.
+
+        Stages:
+        1. prefilter: dedup + garbage/positive/signal filters, run on every page
+           in order (cheap, no network)
+        2. analysis: DeepSeek extraction, enrichment and validation; a task is
+           started as soon as a page passes the prefilter, with at most
+           NEWS_RADAR_ANALYSIS_CONCURRENCY analyses in flight
+        3. delivery: main-pipeline handoff + Telegram send (the alerter
+           serializes sends)
+
+        A cycle therefore takes roughly the sum of LLM latencies divided by the
+        concurrency limit instead of their sum. Per-stage throughput is kept in
+        self._pipeline_stats (see get_stats()).
+
+        Args:
+            extracted: (source, content, simhash) for each successfully extracted page
+
+        Returns:
+            Number of alerts sent
+        """
+        stats = {
+            "prefilter": PipelineStageStats(),
+            "analysis": PipelineStageStats(),
+            "delivery": PipelineStageStats(),
+        }
+        semaphore = asyncio.Semaphore(max(1, NEWS_RADAR_ANALYSIS_CONCURRENCY))
+
+        async def analyze_and_deliver(item: PrefilteredContent) -> bool:
+            async with semaphore:
+                if not self._running or self._stop_event.is_set():
+                    return False
+                started = time.perf_counter()
+                try:
+                    alert = await self._analyze_content(item)
+                except Exception as e:
+                    stats["analysis"].errors += 1
+                    logger.error(f"❌ [NEWS-RADAR] Analysis failed for {item.url[:50]}: {e}")
+                    alert = None
+                stats["analysis"].record(started, time.perf_counter(), alert is not None)
+
+            if alert is None:
+                return False
+
+            started = time.perf_counter()
+            try:
+                sent = await self._deliver_alert(alert, item.content)
+            except Exception as e:
+                stats["delivery"].errors += 1
+                logger.error(f"❌ [NEWS-RADAR] Alert delivery failed for {item.url[:50]}: {e}")
+                sent = False
+            stats["delivery"].record(started, time.perf_counter(), sent)
+            return sent
+
+        tasks: list[asyncio.Task] = []
+        try:
+            for source, content, simhash in extracted:
+                if not self._running or self._stop_event.is_set():
+                    break
+                started = time.perf_counter()
+                try:
+                    item = await self._prefilter_content(content, source, source.url, simhash)
+                except Exception as e:
+                    stats["prefilter"].errors += 1
+                    logger.error(f"❌ [NEWS-RADAR] Prefilter failed for {source.name}: {e}")
+                    item = None
+                stats["prefilter"].record(started, time.perf_counter(), item is not None)
+                if item is not None:
+                    tasks.append(asyncio.create_task(analyze_and_deliver(item)))
+                # Let started analyses run while the remaining pages are filtered
+                await asyncio.sleep(0)
+
+            results = await asyncio.gather(*tasks)
+        except asyncio.CancelledError:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        finally:
+            self._pipeline_stats = {name: stage.to_dict() for name, stage in stats.items()}
+
+        alerts_sent = sum(1 for sent in results if sent)
+        logger.info(
+            "📊 [NEWS-RADAR] Pipeline: "
+            + ", ".join(
+                f"{name} {s['items_in']}→{s['items_out']} ({s['wall_seconds']:.1f}s)"
+                for name, s in self._pipeline_stats.items()
+            )
+        )
+        return alerts_sent
+
+    async def _deliver_alert(self, alert: RadarAlert, content: str) -> bool:
+        """
+        V16.0: Hand off high-confidence alerts to the main pipeline and send the
+        Telegram alert.
+
+        Returns True if the Telegram alert was sent.
+        """
+        # CROSS-PROCESS HANDOFF: High-confidence alerts to Main Pipeline
+        if alert.confidence >= ALERT_CONFIDENCE_THRESHOLD:
+            await self._handoff_to_main_pipeline(alert, content)
+
+        # Send Telegram alert
+        if self._alerter and await self._alerter.send_alert(alert):
+            self._alerts_sent += 1
+            return True
+        return False
+
     async def _scan_paginated_sources_concurrent(
         self, paginated_sources: list[RadarSource], alerts_sent: int, urls_scanned: int
     ) -> tuple[int, int]:
@@ -3244,8 +3796,27 @@ class NewsRadarMonitor:
             logger.error(f"❌ [NEWS-RADAR] Error scanning {source.name}: {e}")
             return None
 
+    async def _compute_batch_simhashes(self, contents: dict[str, str | None]) -> dict[str, int]:
+        """
+        V15.0: Bulk simhash for a batch of extracted contents, keyed by URL.
+
+        Runs compute_simhashes() in a worker thread so the event loop stays free.
+        Returns an empty dict on failure (the shared cache then hashes per item).
+        """
+        batch = {url: content for url, content in contents.items() if content}
+        if not batch:
+            return {}
+        try:
+            from src.utils.shared_cache import compute_simhashes
+
+            hashes = await asyncio.to_thread(compute_simhashes, list(batch.values()))
+            return dict(zip(batch.keys(), hashes, strict=True))
+        except Exception as e:
+            logger.debug(f"[NEWS-RADAR] Batch simhash failed, falling back to per-item: {e}")
+            return {}
+
     async def _process_content(
-        self, content: str, source: RadarSource, url: str
+        self, content: str, source: RadarSource, url: str, simhash: int | None = None
     ) -> RadarAlert | None:
         """
         V2.0: Process extracted content through the new high-value pipeline.
@@ -3257,8 +3828,26 @@ class NewsRadarMonitor:
         4. Quality gate (team must be identified, impact must be HIGH/MEDIUM)
         5. Create alert only if passes all gates
 
+        V16.0: Runs _prefilter_content() then _analyze_content(); scan_cycle()
+        uses the two halves as separate pipeline stages.
+
         Requirements: 3.5, 4.5, 5.1, 5.2
         """
+        prepared = await self._prefilter_content(content, source, url, simhash=simhash)
+        if prepared is None:
+            return None
+        return await self._analyze_content(prepared)
+
+    async def _prefilter_content(
+        self, content: str, source: RadarSource, url: str, simhash: int | None = None
+    ) -> PrefilteredContent | None:
+        """
+        V16.0: Cheap first half of _process_content(): dedup, garbage filter,
+        positive news filter and signal detection / pre-filter score.
+
+        Returns the cleaned content with its signal if it is worth a DeepSeek
+        call, None otherwise.
+        """
         # V1.1: Safety check - ensure components are initialized
         if not self._content_cache:
             logger.error("❌ [NEWS-RADAR] Components not initialized - call start() first")
@@ -3272,7 +3861,7 @@ class NewsRadarMonitor:
             shared_cache = get_shared_cache()
             # Atomic check-and-mark operation to prevent race conditions
             if await shared_cache.check_and_mark_async(
-                content=content, url=url, source="news_radar"
+                content=content, url=url, source="news_radar", simhash=simhash
             ):
                 logger.debug(f"🔄 [NEWS-RADAR] Skipping cross-component duplicate: {url[:50]}...")
                 return None
@@ -3365,6 +3954,22 @@ class NewsRadarMonitor:
                 f"🎯 [NEWS-RADAR] High-value signal: {signal.signal_type} ({signal.matched_pattern})"
             )
 
+        return PrefilteredContent(
+            source=source,
+            url=url,
+            content=content,
+            cleaned_content=cleaned_content,
+            signal=signal,
+        )
+
+    async def _analyze_content(self, prepared: PrefilteredContent) -> RadarAlert | None:
+        """
+        V16.0: Second half of _process_content(): pre-enrichment, DeepSeek
+        structured extraction, validation and alert creation (steps 4-18).
+        """
+        source, url = prepared.source, prepared.url
+        cleaned_content, signal = prepared.cleaned_content, prepared.signal
+
         # Step 4: V4.0 INTELLIGENCE PRE-ENRICHMENT
         # ROOT CAUSE FIX: Before calling DeepSeek, gather intelligence from:
         # A) Source context (WHERE is this content from? → narrows team candidates)
@@ -3843,41 +4448,49 @@ class NewsRadarMonitor:
             return []
 
         try:
-            from src.database.models import Match, SessionLocal
-
-            db = SessionLocal()
-            try:
-                from datetime import timedelta
-
-                now = datetime.now(timezone.utc)
-                max_time = now + timedelta(hours=96)
+            # V16.2: Upcoming matches from the shared in-memory index (no DB query per call)
+            now = datetime.now(timezone.utc)
+            matches = get_upcoming_match_index().upcoming(start=now, end=now + timedelta(hours=96))
 
-                matches = (
-                    db.query(Match)
-                    .filter(Match.start_time >= now.replace(tzinfo=None))
-                    .filter(Match.start_time <= max_time.replace(tzinfo=None))
-                    .all()
-                )
+            teams: list[str] = []
+            for m in matches:
+                league = getattr(m, "league", "") or ""
+                # Check if this match's league matches any of the country patterns
+                if any(p in league.lower() for p in patterns):
+                    home = getattr(m, "home_team", None)
+                    away = getattr(m, "away_team", None)
+                    if home:
+                        teams.append(home)
+                    if away:
+                        teams.append(away)
 
-                teams: list[str] = []
-                for m in matches:
-                    league = getattr(m, "league", "") or ""
-                    # Check if this match's league matches any of the country patterns
-                    if any(p in league.lower() for p in patterns):
-                        home = getattr(m, "home_team", None)
-                        away = getattr(m, "away_team", None)
-                        if home:
-                            teams.append(home)
-                        if away:
-                            teams.append(away)
-
-                return sorted(set(teams))[:20]
-            finally:
-                db.close()
+            return sorted(set(teams))[:20]
         except Exception as e:
             logger.debug(f"[SOURCE-CONTEXT] DB lookup failed for {country_code}: {e}")
             return []
 
+    def _get_upcoming_team_index(self) -> tuple[TeamNameIndex, int]:
+        """
+        V15.0: Team-name index over upcoming-match teams, refreshed every
+        UPCOMING_TEAM_INDEX_TTL_SECONDS with an incremental diff sync.
+
+        Returns:
+            (index, number of upcoming teams)
+        """
+        index = getattr(self, "_upcoming_team_index", None)
+        if index is None:
+            index = self._upcoming_team_index = TeamNameIndex()
+            self._upcoming_team_index_at = 0.0
+
+        if time.monotonic() - self._upcoming_team_index_at >= UPCOMING_TEAM_INDEX_TTL_SECONDS:
+            # V16.2: Teams from the shared upcoming-match index instead of a DB query
+            now = datetime.now(timezone.utc)
+            teams = get_upcoming_match_index().team_names(now, now + timedelta(hours=96))
+            index.sync(TeamIndexEntry(name=team) for team in sorted(teams))
+            self._upcoming_team_index_at = time.monotonic()
+
+        return index, len(index)
+
     def _fuzzy_match_team(self, extracted_team: str) -> str | None:
         """
         V4.0: Normalize extracted team name against DB using fuzzy matching.
@@ -3893,10 +4506,10 @@ class NewsRadarMonitor:
         3. Returns the canonical DB team name if match found (threshold >= 80)
         4. Returns the original name if no better match found
 
-        Uses the same thefuzz library already used in:
-        - data_provider.py:338 (team search)
-        - verification_layer.py:1881 (player matching)
-        - text_normalizer.py:88 (general fuzzy matching)
+        V15.0: Upcoming teams are kept in a TeamNameIndex (src/utils/team_name_index.py)
+        refreshed every few minutes instead of querying the DB and scoring every
+        team on each article. Exact matches after accent folding are O(1); fuzzy
+        matches score only the token/n-gram blocked candidates.
 
         Args:
             extracted_team: Team name extracted by DeepSeek
@@ -3907,89 +4520,27 @@ class NewsRadarMonitor:
         if not extracted_team:
             return extracted_team
 
-        # Try thefuzz import (already in requirements.txt, used elsewhere in the bot)
-        try:
-            from thefuzz import fuzz  # type: ignore[import-untyped]
-        except ImportError:
-            return extracted_team
-
-        # Get accent folding utility (already used in text_normalizer.py)
-        fold_accents_fn = None
         try:
-            from src.utils.text_normalizer import fold_accents as fa
-
-            fold_accents_fn = fa
-        except ImportError:
-            pass
-
-        # Get all team names from upcoming matches in DB
-        try:
-            from src.database.models import Match, SessionLocal
-
-            db = SessionLocal()
-            try:
-                now = datetime.now(timezone.utc)
-                max_time = now + timedelta(hours=96)
-
-                matches = (
-                    db.query(Match)
-                    .filter(Match.start_time >= now.replace(tzinfo=None))
-                    .filter(Match.start_time <= max_time.replace(tzinfo=None))
-                    .all()
-                )
-
-                # Build candidate list from DB
-                db_teams: list[str] = []
-                for m in matches:
-                    home = getattr(m, "home_team", None)
-                    away = getattr(m, "away_team", None)
-                    if home:
-                        db_teams.append(home)
-                    if away:
-                        db_teams.append(away)
-
-                if not db_teams:
-                    return extracted_team
-
-                # Deduplicate
-                db_teams = list(set(db_teams))
-
-                # Helper: normalize a string for comparison
-                def _normalize(text: str) -> str:
-                    t = text.lower().strip()
-                    if fold_accents_fn:
-                        t = fold_accents_fn(t)
-                    return t
-
-                extracted_norm = _normalize(extracted_team)
-
-                # Strategy 1: Exact match after accent folding (most common case)
-                for db_team in db_teams:
-                    if _normalize(db_team) == extracted_norm:
-                        return db_team
-
-                # Strategy 2: thefuzz token_set_ratio (handles partial names, word reordering)
-                best_match = None
-                best_score = 0
-                FUZZY_THRESHOLD = 80  # Same threshold used in verification_layer.py
-
-                for db_team in db_teams:
-                    score = fuzz.token_set_ratio(extracted_team, db_team)
-                    if score > best_score:
-                        best_score = score
-                        best_match = db_team
-
-                if best_score >= FUZZY_THRESHOLD and best_match:
-                    logger.debug(
-                        f"[FUZZY-MATCH] '{extracted_team}' → '{best_match}' (score={best_score})"
-                    )
-                    return best_match
+            index, team_count = self._get_upcoming_team_index()
+            if not team_count:
+                return extracted_team
 
+            # Strategy 1: exact match after accent folding (index lookup)
+            # Strategy 2: token_set_ratio on blocked candidates
+            FUZZY_THRESHOLD = 80  # Same threshold used in verification_layer.py
+            result = index.match(
+                extracted_team, threshold=FUZZY_THRESHOLD / 100, scorer=token_set_score
+            )
+            if result is None:
                 # No good match found — return original
                 return extracted_team
 
-            finally:
-                db.close()
+            best_match, score = result
+            if score < 1.0:
+                logger.debug(
+                    f"[FUZZY-MATCH] '{extracted_team}' → '{best_match}' (score={score * 100:.0f})"
+                )
+            return best_match
 
         except Exception as e:
             logger.debug(f"[FUZZY-MATCH] Team normalization failed: {e}")
@@ -4001,33 +4552,11 @@ class NewsRadarMonitor:
 
         Used to decide if DeepSeek analysis is worth trying
         when no high-value pattern was detected.
+
+        V16.3: Reads FOOTBALL_KEYWORDS hits from the shared keyword scan
+        (src/utils/content_analysis.py), matched at the start of a word.
         """
-        football_keywords = [
-            "football",
-            "soccer",
-            "match",
-            "game",
-            "team",
-            "player",
-            "goal",
-            "league",
-            "cup",
-            "coach",
-            "manager",
-            "squad",
-            "calcio",
-            "fútbol",
-            "futebol",
-            "fußball",
-            "voetbal",
-            "partita",
-            "partido",
-            "jogo",
-            "spiel",
-            "wedstrijd",
-        ]
-        content_lower = content.lower()
-        return any(kw in content_lower for kw in football_keywords)
+        return scan_content(content).has("FOOTBALL")
 
     def _compute_prefilter_score(self, content: str) -> float:
         """
@@ -4197,12 +4726,11 @@ class NewsRadarMonitor:
 
                         optimizer = get_optimizer()
 
-                        # Query match to get league information
-                        match = (
-                            db.query(Match)
-                            .filter(Match.id == alert.enrichment_context.match_id)
-                            .first()
-                        )
+                        # Match league: V16.2 upcoming-match index first, DB as fallback
+                        match_id = alert.enrichment_context.match_id
+                        match = get_upcoming_match_index().get(match_id)
+                        if match is None:
+                            match = db.query(Match).filter(Match.id == match_id).first()
                         league = match.league if match else None
 
                         # Radar handoff doesn't have a specific market, use None
@@ -4392,8 +4920,20 @@ class NewsRadarMonitor:
             "last_cycle_time": self._last_cycle_time.isoformat() if self._last_cycle_time else None,
             "extractor_stats": self._extractor.get_stats() if self._extractor else {},
             "alerter_stats": self._alerter.get_stats() if self._alerter else {},
+            "pipeline_stats": self._pipeline_stats,
+            # V16.1: How often each source actually changes, with the scan interval
+            # that change rate suggests (reported only, not applied)
+            "source_change_rates": self._get_source_change_rates(),
         }
 
+    def _get_source_change_rates(self) -> dict[str, dict[str, Any]]:
+        store = getattr(self._extractor, "fetch_state", None)
+        if store is None:
+            return {}
+        return store.get_source_change_rates(
+            {s.url: s.scan_interval_minutes for s in self._config.sources}
+        )
+
 
 # ============================================
 # V11.0: GLOBAL PARALLEL RADAR (4-TAB ARCHITECTURE)
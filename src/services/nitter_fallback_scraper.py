@@ -56,6 +56,9 @@ except ImportError:
     STEALTH_AVAILABLE = False
     Stealth = None
 
+# V14.1: Parallel per-instance scheduler for scrape_accounts()
+from src.services.nitter_scheduler import NitterScrapeScheduler
+
 # Import shared content analysis utilities
 from src.utils.content_analysis import (
     get_exclusion_filter,
@@ -169,6 +172,13 @@ MAX_RETRIES_PER_ACCOUNT = int(os.getenv("NITTER_MAX_RETRIES", str(_NUM_FALLBACK_
 # This prevents excessive latency when many accounts lack data after Tavily
 MAX_NITTER_RECOVERY_ACCOUNTS = int(os.getenv("MAX_NITTER_RECOVERY_ACCOUNTS", "10"))
 
+# V14.1: Parallel scheduler (src/services/nitter_scheduler.py): attempts per handle across
+# all instances before it is given up. Default = the old worst case of the serial loop
+# (MAX_RETRIES_PER_ACCOUNT instances x RETRIES_PER_INSTANCE tries each).
+NITTER_HANDLE_RETRY_BUDGET = int(
+    os.getenv("NITTER_HANDLE_RETRY_BUDGET", str(MAX_RETRIES_PER_ACCOUNT * RETRIES_PER_INSTANCE))
+)
+
 # Cache configuration
 CACHE_FILE = "data/nitter_cache.json"
 CACHE_TTL_HOURS = 6  # Cache tweets for 6 hours
@@ -493,6 +503,8 @@ class NitterFallbackScraper:
     - Persistent cache (avoid re-scraping)
     - Health check (test instances at startup)
     - Retry with fallback (if one instance fails, try another)
+    - V14.1: scrape_accounts() runs handles in parallel, one rate-limited
+      worker per healthy instance (NitterScrapeScheduler)
     """
 
     def __init__(self):
@@ -530,6 +542,18 @@ class NitterFallbackScraper:
         self._cache_hits = 0
         self._instance_switches = 0
 
+        # V14.1: Per-instance token buckets persist across cycles in the scheduler
+        self._scheduler = NitterScrapeScheduler(
+            attempt=self._scheduled_attempt,
+            get_instances=self._get_healthy_instances,
+            is_available=self._is_instance_available,
+            retry_budget=NITTER_HANDLE_RETRY_BUDGET,
+            min_interval_seconds=SCRAPE_DELAY_MIN,
+            jitter_seconds=SCRAPE_DELAY_MAX - SCRAPE_DELAY_MIN,
+            on_exhausted=self._soft_reset_unhealthy_instances,
+            should_stop=is_stop_requested,
+        )
+
         logger.info("🐦 [NITTER-FALLBACK] Initialized")
 
     async def _ensure_browser(self) -> bool:
@@ -711,6 +735,27 @@ class NitterFallbackScraper:
         logger.debug("⚠️ [NITTER-FALLBACK] All instances unhealthy, no more retries")
         return None
 
+    def _get_healthy_instances(self) -> list[str]:
+        """V14.1: All instances whose circuit is closed, in tier order (after recovery)."""
+        self._recover_stale_instances()
+        with self._health_lock:
+            return [
+                url
+                for url in self._instances + self._fallback_instances + self._tertiary_instances
+                if self._instance_health[url].is_healthy
+            ]
+
+    def _is_instance_available(self, url: str) -> bool:
+        """V14.1: Circuit breaker check for a single instance."""
+        with self._health_lock:
+            health = self._instance_health.get(url)
+            return health is not None and health.is_healthy
+
+    async def _scheduled_attempt(self, handle_clean: str, instance_url: str) -> list | None:
+        """V14.1: NitterScrapeScheduler attempt: one page load, None on failure."""
+        tweets, _, _ = await self._scrape_once(handle_clean, instance_url, "scheduled")
+        return tweets
+
     def _is_transient_error(self, error_type: str) -> bool:
         """
         Check if an error type is considered transient (network-related).
@@ -1100,6 +1145,172 @@ class NitterFallbackScraper:
 
         return tweets
 
+    def _get_cached_tweets(self, handle_clean: str) -> list[ScrapedTweet] | None:
+        """Cached tweets of a handle (without @), or None on a cache miss."""
+        cached = self._cache.get(handle_clean)
+        if not cached:
+            return None
+        self._cache_hits += 1
+        logger.debug(f"🐦 [NITTER-FALLBACK] Cache hit for @{handle_clean}")
+        return [
+            ScrapedTweet(
+                handle=f"@{handle_clean}",
+                date=t.get("date", ""),
+                content=t.get("content", ""),
+                topics=t.get("topics", []),
+                relevance_score=t.get("relevance_score", 0.5),
+            )
+            for t in cached
+        ]
+
+    async def _scrape_once(
+        self, handle_clean: str, instance_url: str, attempt_info: str = ""
+    ) -> tuple[list[ScrapedTweet] | None, Exception | None, bool]:
+        """
+        V14.1: One page load of a handle on one instance.
+
+        Marks the instance healthy/failed and caches successful results.
+
+        Args:
+            handle_clean: Handle without @
+            instance_url: Nitter instance (or redirector) base URL
+            attempt_info: Retry position for log messages
+
+        Returns:
+            Tuple of (tweets, error, retry_same_instance):
+            - tweets: Scraped tweets (possibly empty), or None if the attempt failed
+            - error: The failure, if any
+            - retry_same_instance: True for transient errors (timeouts etc.) where
+              retrying the same instance makes sense
+        """
+        profile_url = f"{instance_url}/{handle_clean}"
+        page = None  # Track page for guaranteed cleanup
+        try:
+            page = await self._browser.new_page()
+
+            # V12.1: Apply stealth mode (COVE FIX)
+            await self._apply_stealth(page)
+
+            # Set stealth headers
+            await page.set_extra_http_headers(
+                {
+                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+                    "Accept-Language": "en-US,en;q=0.5",
+                    "Accept-Encoding": "gzip, deflate, br",
+                    "DNT": "1",
+                    "Connection": "keep-alive",
+                    "Upgrade-Insecure-Requests": "1",
+                }
+            )
+
+            # Navigate to profile
+            response = await page.goto(
+                profile_url,
+                timeout=PAGE_TIMEOUT_SECONDS * 1000,
+                wait_until="domcontentloaded",
+            )
+
+            if not response or response.status != 200:
+                status_code = response.status if response else "unknown"
+                await page.close()
+                self._mark_instance_failure(instance_url, f"HTTP{status_code}")
+                # V13.1: Don't retry on HTTP errors - switch instance immediately
+                return None, Exception(f"HTTP{status_code}"), False
+
+            # Wait for content to load (Nitter uses JS)
+            await page.wait_for_timeout(2000)
+
+            # Get HTML
+            html = await page.content()
+            await page.close()
+
+            # Pre-filter check
+            if not self._pre_filter_html(html):
+                logger.debug(f"🐦 [NITTER-FALLBACK] No relevant content for @{handle_clean}")
+                self._mark_instance_success(instance_url)
+                # Cache empty result to avoid re-scraping
+                self._cache.set(handle_clean, [])
+                return [], None, False
+
+            # Extract tweets (includes V10.0 Layer 1 gate)
+            tweets = self._extract_tweets_from_html(html, f"@{handle_clean}")
+            self._mark_instance_success(instance_url)
+
+            if not tweets:
+                # No tweets found but page loaded OK
+                self._cache.set(handle_clean, [])
+                return [], None, False
+
+            self._total_scraped += len(tweets)
+
+            # Cache results (simplified - only essential fields)
+            self._cache.set(
+                handle_clean,
+                [
+                    {
+                        "date": t.date,
+                        "content": t.content,
+                        "topics": t.topics,
+                        "relevance_score": t.relevance_score,
+                    }
+                    for t in tweets
+                ],
+            )
+
+            logger.debug(f"✅ [NITTER-FALLBACK] Scraped {len(tweets)} tweets from @{handle_clean}")
+            return tweets, None, False
+
+        except Exception as e:
+            # FIX: Close leaked page on any exception (TimeoutError, network error, etc.)
+            if page is not None:
+                try:
+                    await page.close()
+                except Exception:
+                    pass  # Page cleanup must never mask the original error
+
+            error_type = type(e).__name__
+            error_message = str(e)
+
+            # V13.1 COVE FIX: Enhanced error classification with per-instance retry awareness
+            if error_type == "ConnectionRefusedError":
+                logger.warning(
+                    f"⚠️ [NITTER-FALLBACK] Connection REFUSED for @{handle_clean} from {instance_url} "
+                    f"({attempt_info}) - "
+                    f"Possible causes: VPS firewall, IP blocked by Nitter, or instance down"
+                )
+                self._mark_instance_failure(instance_url, error_type)
+                # Connection refused is usually permanent - don't retry same instance
+                return None, e, False
+            if error_type in ("TimeoutError", "asyncio.TimeoutError"):
+                logger.warning(
+                    f"⚠️ [NITTER-FALLBACK] TIMEOUT for @{handle_clean} from {instance_url} "
+                    f"({attempt_info}) - Network issue or slow response"
+                )
+                self._mark_instance_failure(instance_url, error_type)
+                # V13.1: Timeout is transient - the same instance may be retried
+                return None, e, True
+            if (
+                "403" in error_message
+                or "429" in error_message
+                or "blocked" in error_message.lower()
+            ):
+                logger.warning(
+                    f"⚠️ [NITTER-FALLBACK] BLOCKED/RATE LIMITED for @{handle_clean} from {instance_url} "
+                    f"({attempt_info}) - Instance may be blocking requests"
+                )
+                self._mark_instance_failure(instance_url, "RateLimited")
+                # Rate limit is permanent - don't retry same instance
+                return None, e, False
+
+            logger.info(
+                f"⚠️ [NITTER-FALLBACK] Attempt failed for @{handle_clean} ({attempt_info}): "
+                f"{error_type}: {error_message}"
+            )
+            self._mark_instance_failure(instance_url, error_type)
+            # V13.1: Generic error - the same instance may be retried
+            return None, e, True
+
     async def _scrape_account(self, handle: str) -> list[ScrapedTweet]:
         """
         Scrape tweets from a single account.
@@ -1129,26 +1340,14 @@ class NitterFallbackScraper:
             return []
 
         # Check cache first
-        cached = self._cache.get(handle_clean)
+        cached = self._get_cached_tweets(handle_clean)
         if cached:
-            self._cache_hits += 1
-            logger.debug(f"🐦 [NITTER-FALLBACK] Cache hit for @{handle_clean}")
-            return [
-                ScrapedTweet(
-                    handle=f"@{handle_clean}",
-                    date=t.get("date", ""),
-                    content=t.get("content", ""),
-                    topics=t.get("topics", []),
-                    relevance_score=t.get("relevance_score", 0.5),
-                )
-                for t in cached
-            ]
+            return cached
 
         # Ensure browser is ready
         if not await self._ensure_browser():
             return []
 
-        tweets: list[ScrapedTweet] = []
         last_error = None
         soft_reset_done = False  # V13.1: Track if soft reset was already attempted
 
@@ -1178,153 +1377,22 @@ class NitterFallbackScraper:
                     last_error = Exception("No healthy Nitter instances available")
                     break
 
-            profile_url = f"{instance_url}/{handle_clean}"
-
             # V13.1 COVE FIX: Inner loop - retry same instance before switching
-            instance_succeeded = False
             for instance_retry in range(RETRIES_PER_INSTANCE):
-                page = None  # Track page for guaranteed cleanup
-                try:
-                    page = await self._browser.new_page()
-
-                    # V12.1: Apply stealth mode (COVE FIX)
-                    await self._apply_stealth(page)
-
-                    # Set stealth headers
-                    await page.set_extra_http_headers(
-                        {
-                            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-                            "Accept-Language": "en-US,en;q=0.5",
-                            "Accept-Encoding": "gzip, deflate, br",
-                            "DNT": "1",
-                            "Connection": "keep-alive",
-                            "Upgrade-Insecure-Requests": "1",
-                        }
-                    )
-
-                    # Navigate to profile
-                    response = await page.goto(
-                        profile_url,
-                        timeout=PAGE_TIMEOUT_SECONDS * 1000,
-                        wait_until="domcontentloaded",
-                    )
-
-                    if not response or response.status != 200:
-                        status_code = response.status if response else "unknown"
-                        await page.close()
-                        last_error = Exception(f"HTTP{status_code}")
-                        self._mark_instance_failure(instance_url, f"HTTP{status_code}")
-                        # V13.1: Don't retry on HTTP errors - switch instance immediately
-                        break
-
-                    # Wait for content to load (Nitter uses JS)
-                    await page.wait_for_timeout(2000)
-
-                    # Get HTML
-                    html = await page.content()
-                    await page.close()
-
-                    # Pre-filter check
-                    if not self._pre_filter_html(html):
-                        logger.debug(
-                            f"🐦 [NITTER-FALLBACK] No relevant content for @{handle_clean}"
-                        )
-                        self._mark_instance_success(instance_url)
-                        # Cache empty result to avoid re-scraping
-                        self._cache.set(handle_clean, [])
-                        return []
-
-                    # Extract tweets (includes V10.0 Layer 1 gate)
-                    tweets = self._extract_tweets_from_html(html, f"@{handle_clean}")
-
-                    if tweets:
-                        self._mark_instance_success(instance_url)
-                        self._total_scraped += len(tweets)
-
-                        # Cache results (simplified - only essential fields)
-                        self._cache.set(
-                            handle_clean,
-                            [
-                                {
-                                    "date": t.date,
-                                    "content": t.content,
-                                    "topics": t.topics,
-                                    "relevance_score": t.relevance_score,
-                                }
-                                for t in tweets
-                            ],
-                        )
-
-                        logger.debug(
-                            f"✅ [NITTER-FALLBACK] Scraped {len(tweets)} tweets from @{handle_clean}"
-                        )
-                        return tweets
-                    else:
-                        # No tweets found but page loaded OK
-                        self._mark_instance_success(instance_url)
-                        self._cache.set(handle_clean, [])
-                        return []
-
-                except Exception as e:
-                    # FIX: Close leaked page on any exception (TimeoutError, network error, etc.)
-                    if page is not None:
-                        try:
-                            await page.close()
-                        except Exception:
-                            pass  # Page cleanup must never mask the original error
-
-                    last_error = e
-                    error_type = type(e).__name__
-                    error_message = str(e)
-
-                    # V13.1 COVE FIX: Enhanced error classification with per-instance retry awareness
-                    if error_type == "ConnectionRefusedError":
-                        logger.warning(
-                            f"⚠️ [NITTER-FALLBACK] Connection REFUSED for @{handle_clean} from {instance_url} "
-                            f"(instance retry {instance_retry + 1}/{RETRIES_PER_INSTANCE}, "
-                            f"attempt {attempt + 1}/{MAX_RETRIES_PER_ACCOUNT}) - "
-                            f"Possible causes: VPS firewall, IP blocked by Nitter, or instance down"
-                        )
-                        self._mark_instance_failure(instance_url, error_type)
-                        # Connection refused is usually permanent - don't retry same instance
-                        break
-                    elif error_type in ("TimeoutError", "asyncio.TimeoutError"):
-                        logger.warning(
-                            f"⚠️ [NITTER-FALLBACK] TIMEOUT for @{handle_clean} from {instance_url} "
-                            f"(instance retry {instance_retry + 1}/{RETRIES_PER_INSTANCE}, "
-                            f"attempt {attempt + 1}/{MAX_RETRIES_PER_ACCOUNT}) - "
-                            f"Network issue or slow response"
-                        )
-                        self._mark_instance_failure(instance_url, error_type)
-                        # V13.1: Timeout is transient - retry same instance with short delay
-                        if instance_retry < RETRIES_PER_INSTANCE - 1:
-                            await asyncio.sleep(random.uniform(1.0, 2.0))
-                            continue
-                    elif (
-                        "403" in error_message
-                        or "429" in error_message
-                        or "blocked" in error_message.lower()
-                    ):
-                        logger.warning(
-                            f"⚠️ [NITTER-FALLBACK] BLOCKED/RATE LIMITED for @{handle_clean} from {instance_url} "
-                            f"(instance retry {instance_retry + 1}/{RETRIES_PER_INSTANCE}, "
-                            f"attempt {attempt + 1}/{MAX_RETRIES_PER_ACCOUNT}) - "
-                            f"Instance may be blocking requests"
-                        )
-                        self._mark_instance_failure(instance_url, "RateLimited")
-                        # Rate limit is permanent - don't retry same instance
-                        break
-                    else:
-                        logger.info(
-                            f"⚠️ [NITTER-FALLBACK] Attempt {attempt + 1}/{MAX_RETRIES_PER_ACCOUNT} failed "
-                            f"for @{handle_clean}: {error_type}: {error_message}"
-                        )
-                        self._mark_instance_failure(instance_url, error_type)
-                        # V13.1: Generic error - retry same instance with short delay
-                        if instance_retry < RETRIES_PER_INSTANCE - 1:
-                            await asyncio.sleep(random.uniform(1.0, 2.0))
-                            continue
+                tweets, error, retry_same = await self._scrape_once(
+                    handle_clean,
+                    instance_url,
+                    f"instance retry {instance_retry + 1}/{RETRIES_PER_INSTANCE}, "
+                    f"attempt {attempt + 1}/{MAX_RETRIES_PER_ACCOUNT}",
+                )
+                if tweets is not None:
+                    return tweets
+                last_error = error
+                if not retry_same:
+                    break
+                # V13.1: Transient error - retry same instance with short delay
+                if instance_retry < RETRIES_PER_INSTANCE - 1:
+                    await asyncio.sleep(random.uniform(1.0, 2.0))
 
             # Move to next instance
             attempt += 1
@@ -1370,6 +1438,10 @@ class NitterFallbackScraper:
 
         Main entry point - returns data in same format as DeepSeek.
 
+        V14.1: Cached handles are served first; the rest are spread over all
+        healthy instances in parallel by NitterScrapeScheduler (per-instance
+        token bucket, per-handle retry budget) instead of one handle at a time.
+
         Args:
             handles: List of Twitter handles (with @)
             max_posts_per_account: Max tweets per account
@@ -1396,34 +1468,37 @@ class NitterFallbackScraper:
 
         logger.info(f"🐦 [NITTER-FALLBACK] Scraping {len(valid_handles)} accounts...")
 
-        accounts_data: list[dict[str, Any]] = []
-
-        for handle in valid_handles:
-            # P2: Check for full stop before each handle
-            if is_stop_requested():
-                logger.info("🛑 [NITTER-FALLBACK] Stop requested during scraping, aborting")
-                break
+        handles_clean = [h.replace("@", "").strip() for h in valid_handles]
+        tweets_by_handle: dict[str, list[ScrapedTweet]] = {}
+        to_scrape: list[str] = []
+        for handle_clean in dict.fromkeys(handles_clean):
+            cached = self._get_cached_tweets(handle_clean)
+            if cached:
+                tweets_by_handle[handle_clean] = cached
+            else:
+                to_scrape.append(handle_clean)
 
-            # Scrape account
-            tweets = await self._scrape_account(handle)
+        # P2: Check for full stop before scraping
+        if to_scrape and is_stop_requested():
+            logger.info("🛑 [NITTER-FALLBACK] Stop requested during scraping, aborting")
+        elif to_scrape and await self._ensure_browser():
+            tweets_by_handle.update(await self._scheduler.run(to_scrape))
 
+        accounts_data: list[dict[str, Any]] = []
+        for handle_clean in dict.fromkeys(handles_clean):
+            if handle_clean not in tweets_by_handle:
+                continue
             # Format for output
-            handle_clean = handle.replace("@", "").strip()
             posts = [
                 {
                     "date": t.date,
                     "content": t.content,
                     "topics": t.topics,
                 }
-                for t in tweets[:max_posts_per_account]
+                for t in tweets_by_handle[handle_clean][:max_posts_per_account]
             ]
-
             accounts_data.append({"handle": f"@{handle_clean}", "posts": posts})
 
-            # Delay between accounts
-            if handle != valid_handles[-1]:  # Not last
-                await asyncio.sleep(random.uniform(SCRAPE_DELAY_MIN, SCRAPE_DELAY_MAX))
-
         # Count accounts with data
         accounts_with_posts = sum(1 for a in accounts_data if a.get("posts"))
         total_posts = sum(len(a.get("posts", [])) for a in accounts_data)
@@ -1441,6 +1516,7 @@ class NitterFallbackScraper:
                 "total_scraped": self._total_scraped,
                 "cache_hits": self._cache_hits,
                 "instance_switches": self._instance_switches,
+                "cycle": self._scheduler.get_stats()["last_cycle"],  # V14.1
             },
         }
 
@@ -1450,6 +1526,7 @@ class NitterFallbackScraper:
             "total_scraped": self._total_scraped,
             "cache_hits": self._cache_hits,
             "instance_switches": self._instance_switches,
+            "scheduler": self._scheduler.get_stats(),  # V14.1: cycle-time metrics
             "instance_health": {
                 url: {
                     "healthy": h.is_healthy,
@@ -1690,8 +1767,7 @@ class NitterFallbackScraper:
         """
         try:
             # Import inside method to avoid circular imports
-            from src.database.db_manager import get_db_session
-            from src.database.models import Match
+            from src.utils.upcoming_match_index import get_upcoming_match_index
 
             now_utc = datetime.now(timezone.utc)
             next_72h = now_utc + timedelta(hours=72)
@@ -1705,44 +1781,34 @@ class NitterFallbackScraper:
                 if not league_id:
                     continue
 
-                # Query DB for upcoming matches in this league
+                # V14.1: Upcoming matches of this league from the shared in-memory index
                 try:
-                    with get_db_session() as db_session:
-                        upcoming_matches = (
-                            db_session.query(Match)
-                            .filter(
-                                Match.league == league_id,
-                                Match.start_time >= now_utc,
-                                Match.start_time <= next_72h,
-                            )
-                            .order_by(Match.start_time)
-                            .all()
+                    upcoming_matches = get_upcoming_match_index().upcoming(
+                        start=now_utc, end=next_72h, league=league_id
+                    )
+
+                    if not upcoming_matches:
+                        logger.debug(
+                            f"🔍 [NITTER-CYCLE] No upcoming matches for league {league_id}"
                         )
+                        continue
 
-                        if not upcoming_matches:
-                            logger.debug(
-                                f"🔍 [NITTER-CYCLE] No upcoming matches for league {league_id}"
-                            )
+                    # Check for fuzzy match with team names
+                    for match in upcoming_matches:
+                        # VPS FIX: Extract Match attributes safely to prevent session detachment
+                        # This prevents "Trust validation error" when Match object becomes detached
+                        # from session due to connection pool recycling under high load
+                        home_team = getattr(match, "home_team", None)
+                        away_team = getattr(match, "away_team", None)
+
+                        if not home_team or not away_team:
                             continue
 
-                        # Check for fuzzy match with team names
-                        for match in upcoming_matches:
-                            # VPS FIX: Extract Match attributes safely to prevent session detachment
-                            # This prevents "Trust validation error" when Match object becomes detached
-                            # from session due to connection pool recycling under high load
-                            home_team = getattr(match, "home_team", None)
-                            away_team = getattr(match, "away_team", None)
-
-                            if not home_team or not away_team:
-                                continue
-
-                            if await self._check_team_match(
-                                content, description, home_team, away_team
-                            ):
-                                # 90% confident - trigger analysis
-                                await self._trigger_analysis(match, handle, content)
-                                result["matches_triggered"] += 1
-                                break  # Only trigger once per tweet
+                        if await self._check_team_match(content, description, home_team, away_team):
+                            # 90% confident - trigger analysis
+                            await self._trigger_analysis(match, handle, content)
+                            result["matches_triggered"] += 1
+                            break  # Only trigger once per tweet
 
                 except Exception as e:
                     logger.warning(f"⚠️ [NITTER-CYCLE] Error querying matches: {e}")
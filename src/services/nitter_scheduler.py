@@ -0,0 +1,339 @@
+"""
+EarlyBird Nitter Scrape Scheduler V1.0
+
+Parallel handle scheduler for NitterFallbackScraper.
+
+scrape_accounts() used to walk the handles one at a time with a random
+1.5-3s pause between them, so a cycle took ~N * (page load + delay) no
+matter how many Nitter instances were healthy. The scheduler runs one
+worker per healthy instance over a shared handle queue:
+
+- Each instance has its own TokenBucket, so the per-instance request rate
+  (and the random pause before each request) matches what a single instance
+  saw from the sequential loop, while instances work in parallel
+- Workers check the instance circuit breaker before every request and stop
+  as soon as their instance is marked unhealthy; its queued handles are
+  picked up by the remaining workers
+- Every handle has its own retry budget; a failed handle goes back to the
+  end of the queue, usually landing on a different instance
+- When no instance is healthy, an optional callback (soft reset of transient
+  failures) gets one chance to bring instances back before the remaining
+  handles are given up
+
+Cycle time therefore scales with handles / healthy instances. Per-cycle
+metrics (duration, attempts, retries, per-instance load) are kept in
+get_stats().
+
+Usage:
+    scheduler = NitterScrapeScheduler(
+        attempt=scrape_once,                 # async (handle, instance) -> list | None
+        get_instances=healthy_instances,     # () -> list[str]
+        is_available=instance_is_healthy,    # (instance) -> bool
+    )
+    results = await scheduler.run(handles)   # handle -> tweets ([] when given up)
+
+V1.0: Initial implementation
+"""
+
+import asyncio
+import logging
+import random
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# ============================================
+# CONFIGURATION
+# ============================================
+
+# Same pause the sequential loop made between accounts, now applied per instance
+DEFAULT_MIN_INTERVAL_SECONDS = 1.5
+DEFAULT_JITTER_SECONDS = 1.5
+DEFAULT_RETRY_BUDGET = 4
+
+
+class TokenBucket:
+    """
+    Token bucket limiting requests to one instance.
+
+    Tokens refill at `rate` per second up to `capacity`; acquire() waits for a
+    token. Used from a single event loop (no lock: check-and-take never awaits).
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+    ):
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = capacity
+        self._updated = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self) -> bool:
+        self._refill()
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            return True
+        return False
+
+    async def acquire(self) -> float:
+        """Take a token, waiting for the refill if needed. Returns seconds waited."""
+        waited = 0.0
+        while not self.try_acquire():
+            delay = (1.0 - self._tokens) / self.rate
+            await self._sleep(delay)
+            waited += delay
+        return waited
+
+
+@dataclass
+class _HandleJob:
+    handle: str
+    attempts: int = 0
+    instances: list[str] = field(default_factory=list)
+
+
+@dataclass
+class _Cycle:
+    """Work shared by the workers of one run()."""
+
+    queue: deque
+    results: dict[str, list] = field(default_factory=dict)
+    given_up: list[str] = field(default_factory=list)
+    in_flight: int = 0
+    changed: asyncio.Event = field(default_factory=asyncio.Event)
+
+    def notify(self) -> None:
+        """Wake idle workers: a job was re-queued or a worker finished one."""
+        self.changed.set()
+        self.changed = asyncio.Event()
+
+
+@dataclass
+class InstanceCycleStats:
+    """Per-instance load during one scheduler cycle."""
+
+    attempts: int = 0
+    successes: int = 0
+    failures: int = 0
+    busy_seconds: float = 0.0
+    throttled_seconds: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "attempts": self.attempts,
+            "successes": self.successes,
+            "failures": self.failures,
+            "busy_seconds": round(self.busy_seconds, 3),
+            "throttled_seconds": round(self.throttled_seconds, 3),
+        }
+
+
+class NitterScrapeScheduler:
+    """Spreads handles over healthy Nitter instances, one rate-limited worker each."""
+
+    def __init__(
+        self,
+        attempt: Callable[[str, str], Awaitable[list | None]],
+        get_instances: Callable[[], list[str]],
+        is_available: Callable[[str], bool],
+        retry_budget: int = DEFAULT_RETRY_BUDGET,
+        min_interval_seconds: float = DEFAULT_MIN_INTERVAL_SECONDS,
+        jitter_seconds: float = DEFAULT_JITTER_SECONDS,
+        on_exhausted: Callable[[], int] | None = None,
+        should_stop: Callable[[], bool] = lambda: False,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+    ):
+        """
+        Args:
+            attempt: One scrape of a handle on an instance; returns the tweets
+                     (possibly empty) or None if the attempt failed
+            get_instances: Instances whose circuit breaker currently allows calls
+            is_available: Circuit breaker check for a single instance
+            retry_budget: Attempts per handle before it is given up
+            min_interval_seconds: Minimum seconds between requests to one instance
+            jitter_seconds: Random extra pause (0..jitter) before each request
+            on_exhausted: Called once per run when no instance is healthy; returns
+                          the number of instances it brought back
+            should_stop: Checked before every request (global stop)
+            clock: Monotonic time source (injectable for tests)
+            sleep: Async sleep (injectable for tests)
+        """
+        self._attempt = attempt
+        self._get_instances = get_instances
+        self._is_available = is_available
+        self.retry_budget = max(1, retry_budget)
+        self.min_interval_seconds = min_interval_seconds
+        self.jitter_seconds = jitter_seconds
+        self._on_exhausted = on_exhausted
+        self._should_stop = should_stop
+        self._clock = clock
+        self._sleep = sleep
+        # Buckets outlive a cycle so back-to-back cycles can't burst an instance
+        self._buckets: dict[str, TokenBucket] = {}
+        self._last_cycle: dict[str, Any] = {}
+        self._cycles = 0
+
+    def _bucket(self, instance: str) -> TokenBucket:
+        bucket = self._buckets.get(instance)
+        if bucket is None:
+            rate = 1.0 / self.min_interval_seconds if self.min_interval_seconds > 0 else 1e9
+            bucket = TokenBucket(rate, clock=self._clock, sleep=self._sleep)
+            self._buckets[instance] = bucket
+        return bucket
+
+    async def run(self, handles: list[str]) -> dict[str, list]:
+        """
+        Scrape all handles.
+
+        Returns:
+            Dict handle -> tweets; handles that ran out of retries or instances
+            (or were not reached before a stop) map to []
+        """
+        start = self._clock()
+        jobs = [_HandleJob(handle) for handle in dict.fromkeys(handles)]
+        cycle = _Cycle(queue=deque(jobs))
+        queue, results, given_up = cycle.queue, cycle.results, cycle.given_up
+        instance_stats: dict[str, InstanceCycleStats] = {}
+        exhausted_called = False
+        peak_instances = 0
+
+        while queue and not self._should_stop():
+            instances = [i for i in self._get_instances() if self._is_available(i)]
+            if not instances:
+                if self._on_exhausted is not None and not exhausted_called:
+                    exhausted_called = True
+                    if self._on_exhausted() > 0:
+                        continue
+                logger.warning(
+                    f"⚠️ [NITTER-SCHEDULER] No healthy instances, giving up {len(queue)} handles"
+                )
+                break
+
+            peak_instances = max(peak_instances, len(instances))
+            attempts_before = sum(s.attempts for s in instance_stats.values())
+            await asyncio.gather(
+                *(
+                    self._worker(
+                        instance, cycle, instance_stats.setdefault(instance, InstanceCycleStats())
+                    )
+                    for instance in instances
+                )
+            )
+            if sum(s.attempts for s in instance_stats.values()) == attempts_before:
+                break  # every worker stopped before its first request
+
+        for job in queue:
+            results.setdefault(job.handle, [])
+            if job.handle not in given_up:
+                given_up.append(job.handle)
+
+        elapsed = self._clock() - start
+        attempts = sum(s.attempts for s in instance_stats.values())
+        self._cycles += 1
+        self._last_cycle = {
+            "handles": len(results),
+            "succeeded": len(results) - len(given_up),
+            "given_up": len(given_up),
+            "attempts": attempts,
+            "retries": sum(max(0, job.attempts - 1) for job in jobs),
+            "instances_used": len(instance_stats),
+            "peak_parallel_instances": peak_instances,
+            "cycle_seconds": round(elapsed, 3),
+            "handles_per_second": round(len(results) / elapsed, 3) if elapsed > 0 else 0.0,
+            "instances": {url: s.to_dict() for url, s in instance_stats.items()},
+        }
+        logger.info(
+            f"🐦 [NITTER-SCHEDULER] Cycle: {len(results)} handles on "
+            f"{peak_instances} instances in {elapsed:.1f}s "
+            f"({attempts} attempts, {len(given_up)} given up)"
+        )
+        return results
+
+    async def _worker(self, instance: str, cycle: _Cycle, stats: InstanceCycleStats) -> None:
+        bucket = self._bucket(instance)
+        queue = cycle.queue
+        while (queue or cycle.in_flight) and not self._should_stop():
+            if not self._is_available(instance):
+                return
+            if not queue:
+                # Another worker may still put its job back for a retry here
+                await cycle.changed.wait()
+                continue
+
+            job: _HandleJob = queue.popleft()
+            cycle.in_flight += 1
+            try:
+                await self._run_job(instance, job, bucket, cycle, stats)
+            finally:
+                cycle.in_flight -= 1
+                cycle.notify()
+            if job in queue:
+                # Let idle workers pick the retry first so it lands on another instance
+                await asyncio.sleep(0)
+
+    async def _run_job(
+        self,
+        instance: str,
+        job: _HandleJob,
+        bucket: TokenBucket,
+        cycle: _Cycle,
+        stats: InstanceCycleStats,
+    ) -> None:
+        waited = await bucket.acquire()
+        if self.jitter_seconds > 0:
+            jitter = random.uniform(0, self.jitter_seconds)
+            await self._sleep(jitter)
+            waited += jitter
+        stats.throttled_seconds += waited
+
+        # The breaker may have opened (or a stop been requested) while waiting
+        if not self._is_available(instance) or self._should_stop():
+            cycle.queue.appendleft(job)
+            return
+
+        started = self._clock()
+        try:
+            tweets = await self._attempt(job.handle, instance)
+        except Exception as e:
+            logger.warning(
+                f"⚠️ [NITTER-SCHEDULER] Attempt for {job.handle} on {instance} raised: {e}"
+            )
+            tweets = None
+        stats.busy_seconds += self._clock() - started
+        stats.attempts += 1
+        job.attempts += 1
+        job.instances.append(instance)
+
+        if tweets is not None:
+            stats.successes += 1
+            cycle.results[job.handle] = tweets
+        elif job.attempts >= self.retry_budget:
+            stats.failures += 1
+            cycle.results[job.handle] = []
+            cycle.given_up.append(job.handle)
+            logger.warning(
+                f"⚠️ [NITTER-SCHEDULER] Giving up {job.handle} after "
+                f"{job.attempts} attempts ({', '.join(job.instances)})"
+            )
+        else:
+            stats.failures += 1
+            cycle.queue.append(job)  # back of the queue: usually another instance
+
+    def get_stats(self) -> dict[str, Any]:
+        return {"cycles": self._cycles, "last_cycle": dict(self._last_cycle)}
@@ -10,11 +10,13 @@ Key differences from RelevanceAnalyzer:
 - Simplified scoring for short text: 0.0 (excluded), 0.1 (low relevance), 0.8 (high relevance)
 
 Requirements: V10.5 - Precision Gating & Persistence
+
+V10.6: Injury/suspension checks read the shared keyword scan (scan_content())
+that the exclusion and positive news filters already computed for the tweet
 """
 
 import logging
 import os
-import re
 import sys
 import threading
 from dataclasses import dataclass
@@ -25,9 +27,9 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
 # Import from content_analysis module
 from src.utils.content_analysis import (
-    RelevanceAnalyzer,
     get_exclusion_filter,
     get_positive_news_filter,
+    scan_content,
 )
 
 # Import from text_normalizer for team matching utilities
@@ -97,26 +99,12 @@ class TweetRelevanceFilter:
     """
 
     def __init__(self):
-        """Initialize with compiled regex patterns for efficiency."""
+        """Initialize the shared content filters."""
         # Initialize filters for keyword access
         # VPS FIX: Use singleton instead of creating new instance
         self._exclusion_filter = get_exclusion_filter()
         self._positive_filter = get_positive_news_filter()
 
-        # Compile injury/suspension patterns for short text matching
-        # Access keywords from RelevanceAnalyzer class
-        injury_pattern = (
-            r"\b(" + "|".join(re.escape(kw) for kw in RelevanceAnalyzer.INJURY_KEYWORDS) + r")\b"
-        )
-        self._injury_pattern = re.compile(injury_pattern, re.IGNORECASE)
-
-        suspension_pattern = (
-            r"\b("
-            + "|".join(re.escape(kw) for kw in RelevanceAnalyzer.SUSPENSION_KEYWORDS)
-            + r")\b"
-        )
-        self._suspension_pattern = re.compile(suspension_pattern, re.IGNORECASE)
-
     def analyze(self, text: str) -> dict[str, Any]:
         """
         Analyze tweet text for relevance (short text mode).
@@ -162,7 +150,8 @@ class TweetRelevanceFilter:
         # Priority 3: Check for injury keywords (HIGH relevance)
         # VPS FIX: Add error handling
         try:
-            if self._injury_pattern.search(text):
+            # V10.6: RelevanceAnalyzer INJURY keywords from the shared scan
+            if scan_content(text).has("INJURY"):
                 topics.append("injury")
                 logger.debug(f"[TWEET-FILTER] Injury detected in short text: {text[:50]}...")
                 return {"is_relevant": True, "score": 0.8, "topics": topics}
@@ -173,7 +162,7 @@ class TweetRelevanceFilter:
         # Priority 4: Check for suspension keywords (HIGH relevance)
         # VPS FIX: Add error handling
         try:
-            if self._suspension_pattern.search(text):
+            if scan_content(text).has("SUSPENSION"):
                 topics.append("suspension")
                 logger.debug(f"[TWEET-FILTER] Suspension detected in short text: {text[:50]}...")
                 return {"is_relevant": True, "score": 0.8, "topics": topics}
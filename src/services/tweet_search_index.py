@@ -0,0 +1,261 @@
+"""
+EarlyBird Tweet Search Index V1.0
+
+Inverted index over the tweets held by TwitterIntelCache.
+
+search_intel() used to lower-case and substring-scan every cached tweet for
+every query, and a single match analysis runs several queries. The index
+keeps, per cached account:
+
+- token -> tweet id postings over normalize_for_matching() tokens (accents
+  folded, so "Fenerbahçe" and "Fenerbahce" meet)
+- a topic bitmap per tweet, so a topic filter is a single AND
+- the account's tweet ids, so an account is re-indexed in one step when its
+  cache entry is replaced
+
+A lookup intersects the postings of the query tokens (rarest first) and
+checks that they appear as a contiguous phrase, so its cost grows with the
+number of candidate tweets instead of the cache size. A single-token query
+(most team names) matches every token it is a prefix of, found by bisecting
+a sorted token list, so suffixed forms ("Galatasaraylı", "Beşiktaş'ın") are
+found as they were by the old substring scan. Queries written in
+scripts without word spacing (Chinese, Japanese) fall back to a scan of the
+normalized text, which keeps the old substring behaviour for them.
+
+Usage:
+    index = TweetSearchIndex()
+    index.sync(cache_entries)            # account -> entry with .tweets
+    tweets = index.search(["Galatasaray", "Cimbom"], topics=["injury"])
+
+V1.0: Initial implementation
+"""
+
+import re
+from bisect import bisect_left
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+from src.utils.text_normalizer import get_team_aliases, normalize_for_matching
+
+_TOKEN_RE = re.compile(r"\w+")
+
+# CJK Radicals Supplement and later blocks: words are not separated by spaces
+_NO_SPACE_SCRIPT_START = 0x2E80
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into normalized (NFKC, accent-folded, lower-case) word tokens."""
+    if not text:
+        return []
+    return _TOKEN_RE.findall(normalize_for_matching(text))
+
+
+@lru_cache(maxsize=1024)
+def expand_aliases(query: str) -> tuple[str, ...]:
+    """Return the query plus its known team aliases (text_normalizer.TEAM_ALIASES)."""
+    queries = [query]
+    for alias in get_team_aliases(query):
+        if alias not in queries:
+            queries.append(alias)
+    return tuple(queries)
+
+
+@dataclass
+class _IndexedTweet:
+    tweet: Any
+    account: str
+    position: int
+    phrase: str  # " tok1 tok2 ... ", for phrase checks
+    topic_mask: int
+
+
+class TweetSearchIndex:
+    """
+    Token and topic index over cached tweets, grouped by account key.
+
+    Not thread-safe on its own: TwitterIntelCache calls it under _cache_lock.
+    """
+
+    def __init__(self):
+        self._tweets: dict[int, _IndexedTweet] = {}
+        self._postings: dict[str, set[int]] = {}
+        self._sorted_tokens: list[str] | None = None  # rebuilt lazily after token changes
+        self._topic_bits: dict[str, int] = {}
+        # account -> (entry, tweets list, tweet count, tweet ids) as last indexed
+        self._accounts: dict[str, tuple[Any, list, int, list[int]]] = {}
+        self._next_id = 0
+
+    # ============================================
+    # UPDATES
+    # ============================================
+
+    def put(self, account: str, entry: Any) -> None:
+        """(Re-)index the tweets of one account's cache entry."""
+        self.remove(account)
+        tweets = entry.tweets
+        ids: list[int] = []
+        for position, tweet in enumerate(tweets):
+            tweet_id = self._next_id
+            self._next_id += 1
+            tokens = tokenize(tweet.content)
+            self._tweets[tweet_id] = _IndexedTweet(
+                tweet=tweet,
+                account=account,
+                position=position,
+                phrase=f" {' '.join(tokens)} ",
+                topic_mask=self._topic_mask(tweet.topics, create=True),
+            )
+            for token in set(tokens):
+                postings = self._postings.get(token)
+                if postings is None:
+                    postings = self._postings[token] = set()
+                    self._sorted_tokens = None
+                postings.add(tweet_id)
+            ids.append(tweet_id)
+        self._accounts[account] = (entry, tweets, len(tweets), ids)
+
+    def remove(self, account: str) -> None:
+        indexed = self._accounts.pop(account, None)
+        if indexed is None:
+            return
+        for tweet_id in indexed[3]:
+            item = self._tweets.pop(tweet_id)
+            for token in set(item.phrase.split()):
+                postings = self._postings.get(token)
+                if postings is not None:
+                    postings.discard(tweet_id)
+                    if not postings:
+                        del self._postings[token]
+                        self._sorted_tokens = None
+
+    def sync(self, entries: Mapping[str, Any]) -> int:
+        """
+        Bring the index in line with the cache dict.
+
+        Catches entries written without put() (direct _cache assignments,
+        tweets appended in place). O(accounts): entries are compared by identity.
+
+        Returns:
+            Number of accounts re-indexed or removed
+        """
+        changed = 0
+        for account, entry in entries.items():
+            indexed = self._accounts.get(account)
+            if (
+                indexed is None
+                or indexed[0] is not entry
+                or indexed[1] is not entry.tweets
+                or indexed[2] != len(entry.tweets)
+            ):
+                self.put(account, entry)
+                changed += 1
+        for account in [a for a in self._accounts if a not in entries]:
+            self.remove(account)
+            changed += 1
+        return changed
+
+    def clear(self) -> None:
+        self._tweets.clear()
+        self._postings.clear()
+        self._sorted_tokens = None
+        self._accounts.clear()
+
+    # ============================================
+    # LOOKUPS
+    # ============================================
+
+    def search(
+        self,
+        queries: Iterable[str],
+        account_order: Mapping[str, int] | None = None,
+        topics: list[str] | None = None,
+    ) -> list[Any]:
+        """
+        Tweets matching any of the queries.
+
+        A multi-word query matches as a whole-word phrase; a single-word
+        query matches the start of a word ("Galatasaray" finds "Galatasaraylı").
+
+        Args:
+            queries: Phrases to look up (e.g. a team name and its aliases)
+            account_order: Accounts to search, mapped to their rank in the
+                           result order; None searches every account
+            topics: Keep only tweets having at least one of these topics
+
+        Returns:
+            Tweets ordered by account rank, then by position in the account
+        """
+        matched: set[int] = set()
+        for query in queries:
+            tokens = tokenize(query)
+            if tokens:
+                matched |= self._match_phrase(tokens)
+        if not matched:
+            return []
+
+        if topics:
+            mask = self._topic_mask(topics, create=False)
+            matched = {i for i in matched if self._tweets[i].topic_mask & mask}
+
+        items = [self._tweets[i] for i in matched]
+        if account_order is None:
+            ranks = {account: rank for rank, account in enumerate(self._accounts)}
+        else:
+            ranks = account_order
+            items = [item for item in items if item.account in ranks]
+        items.sort(key=lambda item: (ranks.get(item.account, len(ranks)), item.position))
+        return [item.tweet for item in items]
+
+    def _match_phrase(self, tokens: list[str]) -> set[int]:
+        if any(ord(char) >= _NO_SPACE_SCRIPT_START for token in tokens for char in token):
+            needle = " ".join(tokens)
+            return {i for i, item in self._tweets.items() if needle in item.phrase}
+
+        if len(tokens) == 1:
+            return self._match_prefix(tokens[0])
+
+        postings = sorted((self._postings.get(token, set()) for token in set(tokens)), key=len)
+        candidates = set(postings[0])
+        for other in postings[1:]:
+            if not candidates:
+                break
+            candidates &= other
+        if candidates:
+            needle = f" {' '.join(tokens)} "
+            candidates = {i for i in candidates if needle in self._tweets[i].phrase}
+        return candidates
+
+    def _match_prefix(self, prefix: str) -> set[int]:
+        """Ids of tweets having a token that starts with prefix."""
+        if self._sorted_tokens is None:
+            self._sorted_tokens = sorted(self._postings)
+        tokens = self._sorted_tokens
+        matched: set[int] = set()
+        for position in range(bisect_left(tokens, prefix), len(tokens)):
+            token = tokens[position]
+            if not token.startswith(prefix):
+                break
+            matched |= self._postings[token]
+        return matched
+
+    def _topic_mask(self, topics: Iterable[str] | None, create: bool) -> int:
+        mask = 0
+        for topic in topics or ():
+            bit = self._topic_bits.get(topic)
+            if bit is None:
+                if not create:
+                    continue
+                bit = 1 << len(self._topic_bits)
+                self._topic_bits[topic] = bit
+            mask |= bit
+        return mask
+
+    def get_stats(self) -> dict[str, int]:
+        return {
+            "accounts": len(self._accounts),
+            "tweets": len(self._tweets),
+            "tokens": len(self._postings),
+            "topics": len(self._topic_bits),
+        }
@@ -9,6 +9,11 @@ V7.0: Tavily AI Search integration for Twitter intel recovery when
 Gemini/Nitter fails. Uses Tavily to search for recent tweets from
 configured accounts as fallback.
 
+V15.1: search_intel() answers from an inverted token index (TweetSearchIndex)
+instead of scanning every cached tweet, with optional team alias expansion.
+The disk cache is append-only: changed accounts are appended to the pickle
+file and the snapshot is only rewritten when the log outgrows it.
+
 FLUSSO:
 1. All'inizio del ciclo: refresh_twitter_intel()
 2. Durante il ciclo: get_cached_intel() per consultare i dati
@@ -41,8 +46,18 @@ from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
 
+from src.services.tweet_search_index import TweetSearchIndex
+from src.services.tweet_search_index import expand_aliases as _expand_aliases
+
 # V13.0: Pickle format version for backward compatibility
-PICKLE_FORMAT_VERSION = 1
+# V15.1: Version 2 = snapshot followed by appended records; a version 1 file is a
+# snapshot without records and still loads
+PICKLE_FORMAT_VERSION = 2
+_COMPATIBLE_FORMAT_VERSIONS = (1, 2)
+
+# V15.1: Rewrite the snapshot once the appended records outnumber the live
+# accounts (and there are at least this many of them)
+_COMPACT_MIN_RECORDS = 64
 
 # V11.1 FIX: Import nest_asyncio at module level for better performance
 # Call once at module level (idempotent) instead of before every asyncio.run()
@@ -298,6 +313,11 @@ class TwitterIntelCache:
             self._cycle_id: str | None = None
             self._cache_lock: threading.Lock = threading.Lock()  # Lock for cache operations
 
+            # V15.1: Search index and append-only persistence state (guarded by _cache_lock)
+            self._index = TweetSearchIndex()
+            self._persisted: dict[str, tuple] = {}  # handle -> entry signature on disk
+            self._log_records = 0  # records appended after the snapshot
+
             # V7.0: Tavily integration for Twitter recovery
             self._tavily: Any | None = None
             self._unavailable_accounts: dict[
@@ -336,42 +356,78 @@ class TwitterIntelCache:
 
         V13.0: Added version control to prevent crashes when Python version changes
         or pickle format becomes incompatible.
+
+        V15.1: The snapshot is followed by ("put", handle, entry) / ("del", handle)
+        records appended by _save_to_disk(), replayed in order. A record cut short
+        by a crash ends the replay and is truncated away so later appends stay
+        readable.
         """
         try:
             if not os.path.exists(self._cache_file_path):
                 logging.debug("🐦 [PERSISTENCE] No cache file found, starting fresh")
                 return
 
+            records = 0
             with open(self._cache_file_path, "rb") as f:
                 loaded_data = pickle.load(f)
 
-            # V13.0: Check pickle format version
-            if isinstance(loaded_data, dict) and "__version__" in loaded_data:
-                version = loaded_data.get("__version__")
-                loaded_cache = loaded_data.get("__cache__")
+                # V13.0: Check pickle format version
+                if isinstance(loaded_data, dict) and "__version__" in loaded_data:
+                    version = loaded_data.get("__version__")
+                    loaded_cache = loaded_data.get("__cache__")
 
-                if version != PICKLE_FORMAT_VERSION:
+                    if version not in _COMPATIBLE_FORMAT_VERSIONS:
+                        logging.warning(
+                            f"🐦 [PERSISTENCE] Cache format version mismatch: "
+                            f"expected {PICKLE_FORMAT_VERSION}, got {version}. "
+                            f"Starting with empty cache"
+                        )
+                        return
+
+                    if not isinstance(loaded_cache, dict):
+                        logging.warning("🐦 [PERSISTENCE] Invalid cache structure, starting fresh")
+                        return
+                else:
+                    # Legacy format without version (pre-V13.0)
                     logging.warning(
-                        f"🐦 [PERSISTENCE] Cache format version mismatch: "
-                        f"expected {PICKLE_FORMAT_VERSION}, got {version}. "
-                        f"Starting with empty cache"
+                        "🐦 [PERSISTENCE] Legacy cache format detected. "
+                        "Starting with empty cache for compatibility"
                     )
                     return
 
-                if not isinstance(loaded_cache, dict):
-                    logging.warning("🐦 [PERSISTENCE] Invalid cache structure, starting fresh")
-                    return
-            else:
-                # Legacy format without version (pre-V13.0)
+                # V15.1: Replay appended records
+                good_offset = f.tell()
+                while True:
+                    try:
+                        record = pickle.load(f)
+                    except EOFError:
+                        break
+                    except Exception as e:
+                        logging.warning(f"🐦 [PERSISTENCE] Ignoring damaged cache record: {e}")
+                        break
+                    if record[0] == "put":
+                        loaded_cache[record[1]] = record[2]
+                    elif record[0] == "del":
+                        loaded_cache.pop(record[1], None)
+                    records += 1
+                    good_offset = f.tell()
+                file_end = f.seek(0, os.SEEK_END)
+
+            if good_offset < file_end:
+                with open(self._cache_file_path, "r+b") as f:
+                    f.truncate(good_offset)
                 logging.warning(
-                    "🐦 [PERSISTENCE] Legacy cache format detected. "
-                    "Starting with empty cache for compatibility"
+                    f"🐦 [PERSISTENCE] Truncated {file_end - good_offset} bytes of "
+                    f"incomplete records"
                 )
-                return
 
             # Restore cache entries
             with self._cache_lock:
                 self._cache = loaded_cache
+                self._persisted = {
+                    key: self._entry_signature(entry) for key, entry in loaded_cache.items()
+                }
+                self._log_records = records
 
             # Update last refresh time from file modification time
             file_mtime = os.path.getmtime(self._cache_file_path)
@@ -381,8 +437,8 @@ class TwitterIntelCache:
             file_size_kb = os.path.getsize(self._cache_file_path) / 1024
             logging.info(
                 f"🐦 [PERSISTENCE] Loaded {len(self._cache)} accounts, "
-                f"{total_tweets} tweets from disk ({file_size_kb:.1f} KB) "
-                f"[v{PICKLE_FORMAT_VERSION}]"
+                f"{total_tweets} tweets from disk ({file_size_kb:.1f} KB, "
+                f"{records} appended records) [v{PICKLE_FORMAT_VERSION}]"
             )
 
         except pickle.PickleError as e:
@@ -404,30 +460,56 @@ class TwitterIntelCache:
 
         V13.0: Added atomic write to prevent corruption on crash and version control
         for backward compatibility.
+
+        V15.1: Append-only. Accounts whose entry changed since the last save are
+        appended as records instead of re-pickling the whole cache; the snapshot
+        is rewritten (atomically, as before) only when the file is missing or the
+        appended records outnumber the live accounts.
         """
+        # V13.0: Use atomic write pattern
+        temp_path = self._cache_file_path + ".tmp"
         try:
             # Ensure data directory exists
             os.makedirs(os.path.dirname(self._cache_file_path), exist_ok=True)
 
-            # V13.0: Use atomic write pattern
-            temp_path = self._cache_file_path + ".tmp"
-
-            # Prepare data with version control
-            data_to_save = {"__version__": PICKLE_FORMAT_VERSION, "__cache__": self._cache}
-
-            # Write to temporary file first
             with self._cache_lock:
-                with open(temp_path, "wb") as f:
-                    pickle.dump(data_to_save, f)
+                records = self._pending_records()
+                compact = not os.path.exists(self._cache_file_path) or (
+                    self._log_records + len(records) > max(_COMPACT_MIN_RECORDS, len(self._cache))
+                )
+                if compact:
+                    # Prepare data with version control
+                    data_to_save = {"__version__": PICKLE_FORMAT_VERSION, "__cache__": self._cache}
+
+                    # Write to temporary file first
+                    with open(temp_path, "wb") as f:
+                        pickle.dump(data_to_save, f)
+
+                    # Atomic rename (guaranteed to be atomic on POSIX systems)
+                    os.rename(temp_path, self._cache_file_path)
+                    self._persisted = {
+                        key: self._entry_signature(entry) for key, entry in self._cache.items()
+                    }
+                    self._log_records = 0
+                elif records:
+                    with open(self._cache_file_path, "ab") as f:
+                        for record in records:
+                            pickle.dump(record, f)
+                    for record in records:
+                        if record[0] == "put":
+                            self._persisted[record[1]] = self._entry_signature(record[2])
+                        else:
+                            self._persisted.pop(record[1], None)
+                    self._log_records += len(records)
 
-                # Atomic rename (guaranteed to be atomic on POSIX systems)
-                os.rename(temp_path, self._cache_file_path)
+                total_tweets = sum(len(e.tweets) for e in self._cache.values())
+                accounts = len(self._cache)
 
-            total_tweets = sum(len(e.tweets) for e in self._cache.values())
             file_size_kb = os.path.getsize(self._cache_file_path) / 1024
+            action = "Saved snapshot of" if compact else f"Appended {len(records)} records,"
             logging.info(
-                f"🐦 [PERSISTENCE] Saved {len(self._cache)} accounts, "
-                f"{total_tweets} tweets to disk ({file_size_kb:.1f} KB) "
+                f"🐦 [PERSISTENCE] {action} {accounts} accounts, "
+                f"{total_tweets} tweets on disk ({file_size_kb:.1f} KB) "
                 f"[v{PICKLE_FORMAT_VERSION}]"
             )
 
@@ -456,6 +538,35 @@ class TwitterIntelCache:
                 except Exception:
                     pass
 
+    @staticmethod
+    def _entry_signature(entry: TwitterIntelCacheEntry) -> tuple:
+        """V15.1: Identity of an entry and its tweet list, to spot changed accounts."""
+        return (entry, entry.tweets, len(entry.tweets))
+
+    def _pending_records(self) -> list[tuple]:
+        """V15.1: Records for accounts changed since the last save. Caller holds _cache_lock."""
+        records: list[tuple] = []
+        for key, entry in self._cache.items():
+            persisted = self._persisted.get(key)
+            if (
+                persisted is None
+                or persisted[0] is not entry
+                or persisted[1] is not entry.tweets
+                or persisted[2] != len(entry.tweets)
+            ):
+                records.append(("put", key, entry))
+        records.extend(("del", key) for key in self._persisted if key not in self._cache)
+        return records
+
+    def _store_entry(self, handle_key: str, entry: TwitterIntelCacheEntry) -> None:
+        """
+        V15.1: Put an account's entry in the cache and the search index.
+
+        Caller holds _cache_lock. The entry is persisted on the next _save_to_disk().
+        """
+        self._cache[handle_key] = entry
+        self._index.put(handle_key, entry)
+
     @property
     def is_fresh(self) -> bool:
         """Verifica se la cache è stata refreshata in questo ciclo"""
@@ -609,7 +720,7 @@ class TwitterIntelCache:
                         )
 
                         # Use normalized handle for cache key
-                        self._cache[self._normalize_handle(handle)] = entry
+                        self._store_entry(self._normalize_handle(handle), entry)
 
         except Exception as e:
             logging.error(f"🐦 Error refreshing Twitter intel: {e}", exc_info=True)
@@ -737,53 +848,54 @@ class TwitterIntelCache:
         return tweets
 
     def search_intel(
-        self, query: str, league_key: str | None = None, topics: list[str] | None = None
+        self,
+        query: str,
+        league_key: str | None = None,
+        topics: list[str] | None = None,
+        expand_aliases: bool = False,
     ) -> list[CachedTweet]:
         """
         Cerca nella cache tweet che matchano la query.
 
+        V15.1: Lookup via the inverted token index (accents folded). A single-word
+        query matches as a word prefix ("gala" finds "Galatasaray"); a multi-word
+        query matches as a whole-word phrase.
+
         Args:
             query: Testo da cercare (team name, player, etc.)
             league_key: Opzionale, filtra per lega
             topics: Opzionale, filtra per topic (injury, lineup, etc.)
+            expand_aliases: V15.1: also match known team aliases ("Cimbom" for Galatasaray)
 
         Returns:
             Lista di tweet rilevanti
         """
         if not query or not isinstance(query, str):
             return []
+        return self._search([query], league_key, topics, expand_aliases)
+
+    def _search(
+        self,
+        queries: list[str],
+        league_key: str | None,
+        topics: list[str] | None,
+        expand_aliases: bool,
+    ) -> list[CachedTweet]:
+        """V15.1: Index lookup for any of the queries, in the old scan order."""
+        if expand_aliases:
+            queries = [alias for query in queries for alias in _expand_aliases(query)]
 
-        results: list[dict[str, Any]] = []
-        query_lower = query.lower()
-
-        # Determina quali entry cercare
+        # Determina quali account cercare (ordine dei risultati come lo scan V7.0)
+        account_order: dict[str, int] = {}
         if league_key:
-            accounts = get_twitter_intel_accounts(league_key)
-            with self._cache_lock:
-                entries = [
-                    self._cache.get(self._normalize_handle(a.handle))
-                    for a in accounts
-                    if self._normalize_handle(a.handle) in self._cache
-                ]
-        else:
-            with self._cache_lock:
-                entries = list(self._cache.values())
+            for account in get_twitter_intel_accounts(league_key):
+                account_order.setdefault(self._normalize_handle(account.handle), len(account_order))
 
-        for entry in entries:
-            if not entry:
-                continue
-
-            for tweet in entry.tweets:
-                # Match query nel contenuto
-                if query_lower in tweet.content.lower():
-                    # Filtra per topic se specificato
-                    if topics:
-                        if any(t in tweet.topics for t in topics):
-                            results.append(tweet)
-                    else:
-                        results.append(tweet)
-
-        return results
+        with self._cache_lock:
+            if not league_key:
+                account_order = {key: rank for rank, key in enumerate(self._cache)}
+            self._index.sync(self._cache)
+            return self._index.search(queries, account_order=account_order, topics=topics)
 
     def get_cached_tweets_for_match(
         self, home_team: str, away_team: str, league_key: str
@@ -803,17 +915,16 @@ class TwitterIntelCache:
             List of tweet dictionaries with keys: handle, content, date, topics
         """
         try:
-            # Search for tweets mentioning home team
-            home_tweets = self.search_intel(home_team, league_key=league_key)
-
-            # Search for tweets mentioning away team
-            away_tweets = self.search_intel(away_team, league_key=league_key)
+            # V15.1: One index lookup for both teams and their aliases
+            # (filter_tweets_for_match matches aliases too)
+            queries = [team for team in (home_team, away_team) if team and isinstance(team, str)]
+            match_tweets = self._search(queries, league_key, None, expand_aliases=True)
 
             # Combine and deduplicate tweets
             seen_tweets = set()
             unique_tweets: list[dict[str, Any]] = []
 
-            for tweet in home_tweets + away_tweets:
+            for tweet in match_tweets:
                 # Create unique identifier (handle + content + date)
                 tweet_id = (tweet.handle, tweet.content, tweet.date)
 
@@ -1263,7 +1374,7 @@ class TwitterIntelCache:
                 )
 
                 with self._cache_lock:
-                    self._cache[handle_key] = entry
+                    self._store_entry(handle_key, entry)
                 stats["recovered"] += 1
                 stats["tweets_recovered"] += len(tweets)
             else:
@@ -1443,7 +1554,7 @@ class TwitterIntelCache:
 
                     with self._cache_lock:
                         handle_key = self._normalize_handle(handle)
-                        self._cache[handle_key] = entry
+                        self._store_entry(handle_key, entry)
 
                     stats["recovered"] += 1
                     stats["tweets_recovered"] += len(cached_tweets)
@@ -1500,6 +1611,7 @@ class TwitterIntelCache:
                 "tavily_recovered_tweets": tavily_tweets,
                 "tavily_recovery_count": self._tavily_recovery_count,
                 "unavailable_accounts": len(self._unavailable_accounts),
+                "search_index": self._index.get_stats(),
                 "last_refresh": self._last_full_refresh.isoformat()
                 if self._last_full_refresh
                 else None,
@@ -1509,6 +1621,7 @@ class TwitterIntelCache:
         """Svuota la cache (chiamare a fine ciclo se necessario)"""
         with self._cache_lock:
             self._cache.clear()
+            self._index.clear()
         self._last_full_refresh = None
         self._cycle_id = None
         logging.info("🐦 Twitter Intel cache cleared")
@@ -12,8 +12,13 @@ Used by:
 
 V1.0: Extracted from news_radar.py for DRY compliance and shared usage.
 V1.1: Fixed Python version compatibility - using Optional[str] instead of str | None (COVE FIX 2026-03-07)
+V1.2: All filters share one keyword scan per text (scan_content(), see
+      src/utils/keyword_matcher.py) instead of one regex pass per keyword list
+V1.3: PositiveNewsFilter's sentence split compiles again: it raised re.error
+      on every text with a positive keyword, so callers skipped the filter
 """
 
+import functools
 import logging
 import re
 from dataclasses import dataclass
@@ -24,9 +29,50 @@ from src.config.exclusion_lists import (
     EXCLUDED_OTHER_SPORTS,
     EXCLUDED_SPORTS,
 )
+from src.utils.keyword_matcher import (
+    BOUNDARY_AUTO,
+    BOUNDARY_PREFIX,
+    BOUNDARY_WORD,
+    KeywordMatcher,
+    KeywordScan,
+)
 
 logger = logging.getLogger(__name__)
 
+# Basic football vocabulary: cheap "worth an LLM call?" check for News Radar
+# (matched at the start of a word: "match" also covers "matches")
+FOOTBALL_KEYWORDS = [
+    "football",
+    "soccer",
+    "match",
+    "game",
+    "team",
+    "player",
+    "goal",
+    "league",
+    "cup",
+    "coach",
+    "manager",
+    "squad",
+    "calcio",
+    "fútbol",
+    "futebol",
+    "fußball",
+    "voetbal",
+    "partita",
+    "partido",
+    "jogo",
+    "spiel",
+    "wedstrijd",
+]
+
+# Abbreviations that should NOT end a sentence ("vs. Arsenal", "Dr. Smith")
+_SENTENCE_ABBREVIATIONS = ["Mr", "Dr", "Mrs", "Ms", "vs", "etc", "St", "Ave", "Blvd", "Rd"]
+# Sentence delimiter or newline; one fixed-width lookbehind per abbreviation
+_SENTENCE_BREAK = re.compile(
+    "".join(rf"(?<!\b{abbr})" for abbr in _SENTENCE_ABBREVIATIONS) + r"[.!?]+\s+|\n+"
+)
+
 
 @dataclass
 class AnalysisResult:
@@ -177,7 +223,13 @@ class PositiveNewsFilter:
     ]
 
     def __init__(self):
-        """Initialize with compiled regex patterns for efficiency."""
+        """
+        Initialize with compiled regex patterns for efficiency.
+
+        V1.6: is_positive_news() and get_positive_reason() look keywords up
+        in the shared keyword scan; sentences are still checked with these
+        patterns.
+        """
         positive_pattern = (
             r"\b(" + "|".join(re.escape(kw) for kw in self.POSITIVE_KEYWORDS) + r")\b"
         )
@@ -199,13 +251,10 @@ class PositiveNewsFilter:
         if not content:
             return []
 
-        # Common abbreviations that should NOT split sentences
-        # Sports context: "vs. Arsenal" should NOT split at "vs."
-        abbreviations = r"(?:Mr|Dr|Mrs|Ms|vs|etc|St|Ave|Blvd|Rd)\."
-
         # Split by sentence delimiters, but not after abbreviations
-        # Pattern: (not abbreviation + punctuation) OR newline
-        sentences = re.split(rf"(?<!{abbreviations})[.!?]+\s+|\n+", content)
+        # Sports context: "vs. Arsenal" should NOT split at "vs."
+        # V1.7: Was one variable-width lookbehind, which re rejects (re.error)
+        sentences = _SENTENCE_BREAK.split(content)
 
         # Filter out very short segments (likely not real sentences)
         return [s.strip() for s in sentences if s and len(s.strip()) > 10]
@@ -229,7 +278,8 @@ class PositiveNewsFilter:
             return False
 
         # Quick check: if no positive keywords at all, not positive news
-        if not self._positive_pattern.search(content):
+        # V1.6: Answered by the shared single-pass scan
+        if not scan_content(content).has("POSITIVE"):
             return False
 
         # V1.5: Sentence-level analysis
@@ -274,10 +324,8 @@ class PositiveNewsFilter:
         if not self.is_positive_news(content):
             return None
 
-        match = self._positive_pattern.search(content)
-        if match:
-            return match.group(1).lower()
-        return None
+        keyword = scan_content(content).first("POSITIVE")
+        return keyword.lower() if keyword else None
 
 
 class ExclusionFilter:
@@ -299,15 +347,7 @@ class ExclusionFilter:
     # ============================================
     # VPS FIX: Now imported from centralized config to eliminate duplication
     # See src/config/exclusion_lists.py for the complete lists
-    # These are imported at module level and used directly in __init__
-
-    def __init__(self):
-        """Initialize with compiled regex pattern for efficiency."""
-        # Build exclusion pattern from all excluded keywords (imported from centralized config)
-        all_excluded = EXCLUDED_SPORTS + EXCLUDED_CATEGORIES + EXCLUDED_OTHER_SPORTS
-        # Create case-insensitive pattern with word boundaries
-        pattern = r"\b(" + "|".join(re.escape(kw) for kw in all_excluded) + r")\b"
-        self._exclusion_pattern = re.compile(pattern, re.IGNORECASE)
+    # V1.2: Matched as the EXCLUDED category of the shared keyword scan
 
     def is_excluded(self, content: str) -> bool:
         """
@@ -322,7 +362,8 @@ class ExclusionFilter:
         if not content:
             return True
 
-        return bool(self._exclusion_pattern.search(content))
+        # V1.2: Shared single-pass keyword scan
+        return scan_content(content).has("EXCLUDED")
 
     def get_exclusion_reason(self, content: str) -> str | None:
         """
@@ -337,10 +378,8 @@ class ExclusionFilter:
         if not content:
             return "empty_content"
 
-        match = self._exclusion_pattern.search(content)
-        if match:
-            return match.group(1).lower()
-        return None
+        keyword = scan_content(content).first("EXCLUDED")
+        return keyword.lower() if keyword else None
 
 
 class RelevanceAnalyzer:
@@ -1072,62 +1111,687 @@ class RelevanceAnalyzer:
         "équipe bloquée",
     ]
 
+    # Words that are never team names (articles, prepositions, verbs, common player names)
+    TEAM_EXCLUDED_WORDS = {
+        "the",
+        "at",
+        "for",
+        "from",
+        "with",
+        "and",
+        "but",
+        "or",
+        "in",
+        "on",
+        "to",
+        "of",
+        "by",
+        "as",
+        "is",
+        "it",
+        "be",
+        "are",
+        "was",
+        "were",
+        "has",
+        "have",
+        "had",
+        "do",
+        "does",
+        "did",
+        "will",
+        "would",
+        "could",
+        "should",
+        "may",
+        "might",
+        "must",
+        "shall",
+        "can",
+        "need",
+        "dare",
+        "face",
+        "play",
+        "beat",
+        "lose",
+        "win",
+        "draw",
+        "meet",
+        "host",
+        "visit",
+        "martin",
+        "oxford",
+        "hugo",
+        "saka",
+        "kerkez",  # Common player names
+        "glance",
+        "clear",
+        "points",
+        "match",
+        "game",
+        "news",
+        "sport",
+        "football",
+        "soccer",
+        "live",
+        "update",
+        "breaking",
+        "report",
+        # Portuguese/Spanish common words
+        "para",
+        "com",
+        "por",
+        "sem",
+        "mais",
+        "como",
+        "sobre",
+        "entre",
+        "jogo",
+        "partida",
+        "resultado",
+        "gol",
+        "time",
+        "clube",
+        "sucesso",
+        "vitória",
+        "derrota",
+        "empate",
+        "campeonato",
+    }
+
+    # V15.0: Known club names, checked in list order by _extract_team_name() (moved out of
+    # the method so they are not rebuilt and recompiled for every article)
+    KNOWN_CLUBS = [
+        # ========== ENGLAND - Premier League ==========
+        "Arsenal",
+        "Chelsea",
+        "Liverpool",
+        "Manchester United",
+        "Manchester City",
+        "Tottenham",
+        "West Ham",
+        "Newcastle",
+        "Aston Villa",
+        "Brighton",
+        "Bournemouth",
+        "Brentford",
+        "Crystal Palace",
+        "Everton",
+        "Fulham",
+        "Nottingham Forest",
+        "Southampton",
+        "Wolves",
+        "Leicester",
+        "Leeds",
+        "Ipswich",
+        "Luton",
+        "Sheffield United",
+        "Burnley",
+        # National League
+        "Chesterfield",
+        # Championship
+        "Wigan Athletic",
+        # ========== ITALY - Serie A ==========
+        "AC Milan",
+        "Inter Milan",
+        "Juventus",
+        "Roma",
+        "Napoli",
+        "Lazio",
+        "Atalanta",
+        "Fiorentina",
+        # ========== SPAIN - La Liga ==========
+        "Real Madrid",
+        "Barcelona",
+        "Atletico Madrid",
+        "Sevilla",
+        "Valencia",
+        "Villarreal",
+        # ========== GERMANY - Bundesliga ==========
+        "Bayern Munich",
+        "Borussia Dortmund",
+        "RB Leipzig",
+        "Bayer Leverkusen",
+        # ========== FRANCE - Ligue 1 ==========
+        "PSG",
+        "Paris Saint-Germain",
+        "Lyon",
+        "Marseille",
+        "Monaco",
+        "Lille",
+        # ========== NETHERLANDS - Eredivisie (V1.7 Tier 2) ==========
+        "Ajax",
+        "PSV",
+        "PSV Eindhoven",
+        "Feyenoord",
+        "AZ Alkmaar",
+        "AZ",
+        "FC Twente",
+        "Twente",
+        "FC Utrecht",
+        "Utrecht",
+        "Vitesse",
+        "SC Heerenveen",
+        "Heerenveen",
+        "Sparta Rotterdam",
+        "Sparta",
+        "Go Ahead Eagles",
+        "Fortuna Sittard",
+        "RKC Waalwijk",
+        "NEC Nijmegen",
+        "PEC Zwolle",
+        "Excelsior",
+        "Heracles Almelo",
+        "FC Volendam",
+        # ========== TURKEY - Süper Lig (V1.7 Elite 7) ==========
+        "Galatasaray",
+        "Fenerbahce",
+        "Fenerbahçe",
+        "Besiktas",
+        "Beşiktaş",
+        "Trabzonspor",
+        "Basaksehir",
+        "Başakşehir",
+        "Istanbul Basaksehir",
+        "Antalyaspor",
+        "Konyaspor",
+        "Kasimpasa",
+        "Kasımpaşa",
+        "Sivasspor",
+        "Alanyaspor",
+        "Kayserispor",
+        "Adana Demirspor",
+        "Gaziantep FK",
+        "Rizespor",
+        "Çaykur Rizespor",
+        "Hatayspor",
+        "Samsunspor",
+        "Pendikspor",
+        "Istanbulspor",
+        "Fatih Karagümrük",
+        "Ankaragücü",
+        # ========== GREECE - Super League (V1.7 Elite 7) ==========
+        "Olympiacos",
+        "Olympiakos",
+        "Ολυμπιακός",
+        "Panathinaikos",
+        "Παναθηναϊκός",
+        "AEK Athens",
+        "AEK",
+        "ΑΕΚ",
+        "PAOK",
+        "PAOK Thessaloniki",
+        "ΠΑΟΚ",
+        "Aris Thessaloniki",
+        "Aris",
+        "Άρης",
+        "Panetolikos",
+        "Παναιτωλικός",
+        "Asteras Tripolis",
+        "Αστέρας Τρίπολης",
+        "Atromitos",
+        "Ατρόμητος",
+        "OFI Crete",
+        "ΟΦΗ",
+        "Volos",
+        "Volos NFC",
+        "Βόλος",
+        "Lamia",
+        "Λαμία",
+        "Ionikos",
+        "Ιωνικός",
+        "Giannina",
+        "PAS Giannina",
+        "ΠΑΣ Γιάννινα",
+        "Levadiakos",
+        "Λεβαδειακός",
+        # ========== SCOTLAND - Premiership (V1.7 Elite 7) ==========
+        "Celtic",
+        "Rangers",
+        "Aberdeen",
+        "Hearts",
+        "Heart of Midlothian",
+        "Hibernian",
+        "Hibs",
+        "Dundee",
+        "Dundee United",
+        "Kilmarnock",
+        "Motherwell",
+        "Ross County",
+        "Livingston",
+        "St Mirren",
+        "St Johnstone",
+        "Partick Thistle",
+        "Dundee FC",
+        # ========== BELGIUM - First Division (V1.7 Tier 2) ==========
+        "Anderlecht",
+        "Club Brugge",
+        "Club Bruges",
+        "Genk",
+        "KRC Genk",
+        "Standard Liege",
+        "Standard Liège",
+        "Antwerp",
+        "Royal Antwerp",
+        "Gent",
+        "KAA Gent",
+        "Union Saint-Gilloise",
+        "Union SG",
+        "Cercle Brugge",
+        "Mechelen",
+        "KV Mechelen",
+        "Charleroi",
+        "Kortrijk",
+        "Sint-Truiden",
+        "Westerlo",
+        "OH Leuven",
+        "Eupen",
+        "RWD Molenbeek",
+        # ========== BRAZIL - Brasileirão (V1.6) ==========
+        # Série A - Top 20
+        "Flamengo",
+        "Palmeiras",
+        "Corinthians",
+        "São Paulo",
+        "Sao Paulo",
+        "Santos",
+        "Fluminense",
+        "Botafogo",
+        "Vasco",
+        "Vasco da Gama",
+        "Athletico Paranaense",
+        "Athletico-PR",
+        "Grêmio",
+        "Gremio",
+        "Internacional",
+        "Inter de Porto Alegre",
+        "Cruzeiro",
+        "Atlético Mineiro",
+        "Atletico Mineiro",
+        "Atlético-MG",
+        "Bahia",
+        "Fortaleza",
+        "Ceará",
+        "Ceara",
+        "Sport Recife",
+        "Vitória",
+        "Vitoria",
+        "Juventude",
+        "América Mineiro",
+        "America Mineiro",
+        "Cuiabá",
+        "Cuiaba",
+        "Red Bull Bragantino",
+        "Bragantino",
+        "Coritiba",
+        "Goiás",
+        "Goias",
+        "Avaí",
+        "Avai",
+        "Chapecoense",
+        # Série B (V1.7 Tier 2)
+        "Guarani",
+        "Ponte Preta",
+        "Novorizontino",
+        "Mirassol",
+        "Vila Nova",
+        "CRB",
+        "CSA",
+        "Sport",
+        "Náutico",
+        "Santa Cruz",
+        "ABC",
+        "Londrina",
+        "Operário",
+        "Brusque",
+        "Ituano",
+        "Sampaio Corrêa",
+        # Common shortened names (used in media)
+        "Mengão",
+        "Mengao",
+        "Timão",
+        "Timao",
+        "Tricolor",
+        "Colorado",
+        "Verdão",
+        "Verdao",
+        "Peixe",
+        "Fogão",
+        "Fogao",
+        "Galo",
+        # ========== ARGENTINA - Primera División (V1.6 Elite 7) ==========
+        "River Plate",
+        "Boca Juniors",
+        "Racing Club",
+        "Independiente",
+        "San Lorenzo",
+        "Estudiantes",
+        "Vélez Sarsfield",
+        "Velez Sarsfield",
+        "Lanús",
+        "Lanus",
+        "Rosario Central",
+        "Newell's Old Boys",
+        "Newells",
+        "Talleres",
+        "Argentinos Juniors",
+        "Defensa y Justicia",
+        "Banfield",
+        "Godoy Cruz",
+        "Huracán",
+        "Huracan",
+        "Tigre",
+        "Colón",
+        "Colon",
+        "Unión",
+        "Union",
+        "Central Córdoba",
+        "Platense",
+        "Sarmiento",
+        # ========== MEXICO - Liga MX (V1.6 Elite 7) ==========
+        "Club América",
+        "Club America",
+        "Chivas",
+        "Guadalajara",
+        "Cruz Azul",
+        "Pumas",
+        "UNAM",
+        "Tigres",
+        "Monterrey",
+        "Rayados",
+        "Santos Laguna",
+        "León",
+        "Leon",
+        "Toluca",
+        "Pachuca",
+        "Atlas",
+        "Tijuana",
+        "Xolos",
+        "Necaxa",
+        "Puebla",
+        "Querétaro",
+        "Queretaro",
+        "Mazatlán",
+        "Mazatlan",
+        "Juárez",
+        "FC Juarez",
+        "San Luis",
+        "Atlético San Luis",
+        # ========== POLAND - Ekstraklasa (V1.7 Elite 7) ==========
+        "Legia Warsaw",
+        "Legia Warszawa",
+        "Lech Poznan",
+        "Lech Poznań",
+        "Raków Częstochowa",
+        "Rakow",
+        "Jagiellonia Białystok",
+        "Jagiellonia",
+        "Pogoń Szczecin",
+        "Pogon",
+        "Górnik Zabrze",
+        "Gornik Zabrze",
+        "Śląsk Wrocław",
+        "Slask Wroclaw",
+        "Cracovia",
+        "Wisła Kraków",
+        "Wisla Krakow",
+        "Piast Gliwice",
+        "Warta Poznań",
+        "Korona Kielce",
+        "Zagłębie Lubin",
+        "Radomiak",
+        "Stal Mielec",
+        "Widzew Łódź",
+        "Widzew Lodz",
+        "Puszcza Niepołomice",
+        # ========== AUSTRALIA - A-League (V1.7 Elite 7) ==========
+        "Melbourne Victory",
+        "Sydney FC",
+        "Western Sydney Wanderers",
+        "WSW",
+        "Melbourne City",
+        "Brisbane Roar",
+        "Adelaide United",
+        "Perth Glory",
+        "Central Coast Mariners",
+        "Mariners",
+        "Wellington Phoenix",
+        "Macarthur FC",
+        "Western United",
+        "Newcastle Jets",
+        "Auckland FC",
+        # ========== NORWAY - Eliteserien (V1.7 Tier 2) ==========
+        "Bodø/Glimt",
+        "Bodo Glimt",
+        "Molde",
+        "Rosenborg",
+        "Viking",
+        "Brann",
+        "Strømsgodset",
+        "Stromsgodset",
+        "Lillestrøm",
+        "Lillestrom",
+        "Sarpsborg",
+        "Tromsø",
+        "Tromso",
+        "Odd",
+        "Vålerenga",
+        "Valerenga",
+        "Haugesund",
+        "HamKam",
+        "Sandefjord",
+        "Kristiansund",
+        "Aalesund",
+        # ========== FRANCE - Ligue 1 (V1.7 Tier 2) ==========
+        "PSG",
+        "Paris Saint-Germain",
+        "Lyon",
+        "Olympique Lyon",
+        "OL",
+        "Marseille",
+        "Olympique Marseille",
+        "OM",
+        "Monaco",
+        "AS Monaco",
+        "Lille",
+        "LOSC",
+        "Nice",
+        "OGC Nice",
+        "Lens",
+        "RC Lens",
+        "Rennes",
+        "Stade Rennais",
+        "Nantes",
+        "FC Nantes",
+        "Montpellier",
+        "Strasbourg",
+        "RC Strasbourg",
+        "Brest",
+        "Stade Brestois",
+        "Toulouse",
+        "Reims",
+        "Stade de Reims",
+        "Lorient",
+        "Le Havre",
+        "Clermont",
+        "Metz",
+        "Auxerre",
+        # ========== AUSTRIA - Bundesliga (V1.7 Tier 2) ==========
+        "Red Bull Salzburg",
+        "Salzburg",
+        "Sturm Graz",
+        "SK Sturm",
+        "Rapid Wien",
+        "Rapid Vienna",
+        "Austria Wien",
+        "Austria Vienna",
+        "LASK",
+        "LASK Linz",
+        "Wolfsberg",
+        "WAC",
+        "Hartberg",
+        "TSV Hartberg",
+        "Altach",
+        "SCR Altach",
+        "Rheindorf Altach",
+        "Austria Klagenfurt",
+        "WSG Tirol",
+        "Blau-Weiß Linz",
+        "Austria Lustenau",
+        # ========== CHINA - Super League (V1.7 Tier 2) ==========
+        "Shanghai Port",
+        "Shanghai SIPG",
+        "上海海港",
+        "Shanghai Shenhua",
+        "上海申花",
+        "Shandong Taishan",
+        "山东泰山",
+        "Beijing Guoan",
+        "北京国安",
+        "Guangzhou FC",
+        "Guangzhou Evergrande",
+        "广州队",
+        "Henan Songshan",
+        "河南嵩山龙门",
+        "Wuhan Three Towns",
+        "武汉三镇",
+        "Chengdu Rongcheng",
+        "成都蓉城",
+        "Qingdao Hainiu",
+        "青岛海牛",
+        "Tianjin Jinmen Tiger",
+        "天津津门虎",
+        "Zhejiang FC",
+        "浙江队",
+        "Changchun Yatai",
+        "长春亚泰",
+        "Cangzhou Mighty Lions",
+        "沧州雄狮",
+        "Dalian Pro",
+        "大连人",
+        "Nantong Zhiyun",
+        "南通支云",
+        "Shenzhen FC",
+        "深圳队",
+        # ========== JAPAN - J-League (V1.7 Tier 2) ==========
+        "Vissel Kobe",
+        "ヴィッセル神戸",
+        "Yokohama F Marinos",
+        "Marinos",
+        "横浜F・マリノス",
+        "Kawasaki Frontale",
+        "川崎フロンターレ",
+        "Urawa Reds",
+        "Urawa Red Diamonds",
+        "浦和レッズ",
+        "FC Tokyo",
+        "FC東京",
+        "Kashima Antlers",
+        "鹿島アントラーズ",
+        "Nagoya Grampus",
+        "名古屋グランパス",
+        "Cerezo Osaka",
+        "セレッソ大阪",
+        "Gamba Osaka",
+        "ガンバ大阪",
+        "Sanfrecce Hiroshima",
+        "サンフレッチェ広島",
+        "Kashiwa Reysol",
+        "柏レイソル",
+        "Consadole Sapporo",
+        "北海道コンサドーレ札幌",
+        "Sagan Tosu",
+        "サガン鳥栖",
+        "Avispa Fukuoka",
+        "アビスパ福岡",
+        "Albirex Niigata",
+        "アルビレックス新潟",
+        "Shonan Bellmare",
+        "湘南ベルマーレ",
+        "Kyoto Sanga",
+        "京都サンガ",
+        "Jubilo Iwata",
+        "ジュビロ磐田",
+        "Tokyo Verdy",
+        "東京ヴェルディ",
+        "Machida Zelvia",
+        "町田ゼルビア",
+        # ========== HONDURAS - Liga Nacional (V1.6) ==========
+        "Olimpia Honduras",
+        "Motagua",
+        "Real España",
+        "Real Espana",
+        "Marathón",
+        "Marathon",
+        "Victoria Honduras",
+        "UPNFM",
+        "Honduras Progreso",
+        "Vida",
+        "Real Sociedad Honduras",
+        "Platense Honduras",
+        "Lobos UPNFM",
+        "Olancho FC",
+        "Génesis",
+        "Genesis",
+        # ========== COLOMBIA/CHILE/PERU (V1.6) ==========
+        # Colombia
+        "Atlético Nacional",
+        "Atletico Nacional",
+        "Millonarios",
+        "América de Cali",
+        "America de Cali",
+        "Independiente Medellín",
+        "Junior Barranquilla",
+        "Deportivo Cali",
+        "Santa Fe",
+        "Once Caldas",
+        # Chile
+        "Colo-Colo",
+        "Colo Colo",
+        "Universidad de Chile",
+        "Universidad Católica",
+        "Cobreloa",
+        "O'Higgins",
+        "Huachipato",
+        # Peru
+        "Alianza Lima",
+        "Universitario",
+        "Sporting Cristal",
+        "Cienciano",
+        "Melgar",
+        "Deportivo Municipal",
+        # ========== INDONESIA (V1.6) ==========
+        "Persija Jakarta",
+        "Persebaya",
+        "Arema FC",
+        "Persib Bandung",
+        "Bali United",
+        "PSM Makassar",
+        "Persik Kediri",
+        "PSIS Semarang",
+        "Madura United",
+        "Borneo FC",
+        "Persita Tangerang",
+        "Dewa United",
+    ]
+
     def __init__(self):
-        """Initialize with compiled regex patterns for efficiency."""
-        self._injury_pattern = self._compile_pattern(self.INJURY_KEYWORDS)
-        self._suspension_pattern = self._compile_pattern(self.SUSPENSION_KEYWORDS)
-        self._national_pattern = self._compile_pattern(self.NATIONAL_TEAM_KEYWORDS)
-        self._cup_pattern = self._compile_pattern(self.CUP_ABSENCE_KEYWORDS)
-        self._youth_pattern = self._compile_pattern(self.YOUTH_CALLUP_KEYWORDS)
-        self._general_sports_pattern = self._compile_pattern(self.GENERAL_SPORTS_KEYWORDS)
-        self._squad_pattern = self._compile_pattern(self.SQUAD_KEYWORDS)
-        self._logistical_crisis_pattern = self._compile_pattern(self.LOGISTICAL_CRISIS_KEYWORDS)
-
-    def _compile_pattern(self, keywords: list[str]) -> re.Pattern:
         """
-        Compile keywords into case-insensitive regex pattern.
-
-        V1.7: Smart handling for CJK (Chinese/Japanese) which don't use word boundaries (\\b).
-        Separates keywords into boundary-enforced and boundary-free groups.
+        Initialize the known-club lookups.
 
-        V1.8: Extended to include Greek characters which also don't use word boundaries.
+        V1.11: Keyword categories and known clubs are matched by the shared
+        single-pass scan (scan_content()); CJK/Greek/Cyrillic keywords keep
+        matching without word boundaries.
         """
-        boundary_kw = []
-        no_boundary_kw = []
-
-        # Helper to detect non-Latin characters (CJK, Greek, Cyrillic)
-        # These scripts don't use word boundaries the same way as Latin
-        # Using Unicode ranges for common non-Latin blocks
-        def is_non_latin(s):
-            return any(
-                "\u4e00" <= c <= "\u9fff"  # CJK Unified Ideographs (Chinese, Japanese Kanji)
-                or "\u3040" <= c <= "\u30ff"  # Hiragana and Katakana (Japanese)
-                or "\u0370" <= c <= "\u03ff"  # Greek and Coptic
-                or "\u0400" <= c <= "\u04ff"  # Cyrillic (for future expansion)
-                for c in s
-            )
-
-        for kw in keywords:
-            if is_non_latin(kw):
-                no_boundary_kw.append(re.escape(kw))
-            else:
-                boundary_kw.append(re.escape(kw))
-
-        parts = []
-        if boundary_kw:
-            # Traditional word boundary logic for Latin/Cyrillic/Greek
-            parts.append(r"\b(?:" + "|".join(boundary_kw) + r")\b")
-        if no_boundary_kw:
-            # No boundaries for non-Latin scripts (CJK, Greek, Cyrillic)
-            parts.append(r"(?:" + "|".join(no_boundary_kw) + r")")
-
-        if not parts:
-            # Fallback pattern that matches nothing
-            # Changed to a pattern that never matches instead of '(?!x)x' which is broken
-            return re.compile(r"(?!a)a")
-
-        pattern = "|".join(parts)
-        return re.compile(pattern, re.IGNORECASE)
+        self._known_club_names = {c.lower() for c in self.KNOWN_CLUBS}
+        self._cjk_clubs = {
+            c
+            for c in self.KNOWN_CLUBS
+            if any("\u4e00" <= ch <= "\u9fff" or "\u3040" <= ch <= "\u30ff" for ch in c)
+        }
+        self._greek_clubs = {
+            c for c in self.KNOWN_CLUBS if any("\u0370" <= ch <= "\u03ff" for ch in c)
+        }
 
     def analyze(self, content: str) -> AnalysisResult:
         """
@@ -1153,17 +1817,19 @@ class RelevanceAnalyzer:
             )
 
         # Count keyword matches for each category
-        injury_matches = len(self._injury_pattern.findall(content))
-        suspension_matches = len(self._suspension_pattern.findall(content))
-        national_matches = len(self._national_pattern.findall(content))
-        cup_matches = len(self._cup_pattern.findall(content))
-        youth_matches = len(self._youth_pattern.findall(content))
-        general_sports_matches = len(self._general_sports_pattern.findall(content))
-        logistical_crisis_matches = len(self._logistical_crisis_pattern.findall(content))
+        # V1.11: One scan for every category and the known clubs
+        scan = scan_content(content)
+        injury_matches = scan.count("INJURY")
+        suspension_matches = scan.count("SUSPENSION")
+        national_matches = scan.count("NATIONAL_TEAM")
+        cup_matches = scan.count("CUP_ABSENCE")
+        youth_matches = scan.count("YOUTH_CALLUP")
+        general_sports_matches = scan.count("GENERAL_SPORTS")
+        logistical_crisis_matches = scan.count("LOGISTICAL_CRISIS")
 
         # V1.9: Try to extract team name BEFORE checking relevance
         # This allows us to use team extraction as a relevance factor
-        affected_team = self._extract_team_name(content)
+        affected_team = self._extract_team_name(content, scan)
 
         # V12.8: LOGISTICAL_CRISIS has high priority - check early
         # Travel disruptions, strikes, unpaid wages severely affect match outcomes
@@ -1260,7 +1926,7 @@ class RelevanceAnalyzer:
             summary=summary,
         )
 
-    def _extract_team_name(self, content: str) -> str | None:
+    def _extract_team_name(self, content: str, scan: KeywordScan | None = None) -> str | None:
         """
         Try to extract team name from content using heuristics.
 
@@ -1268,683 +1934,26 @@ class RelevanceAnalyzer:
         V1.6: Added Brazilian, Argentine, Honduran and other South American clubs
               for multi-language support (Portuguese/Spanish articles).
         V1.10: Added validation to ensure extracted team is in known clubs list
+        V1.11: Known clubs come from the shared keyword scan (pass it if already done)
         """
         # DEBUG: Log content for debugging
         logger.debug(f"[TEAM-EXTRACTION] Analyzing content: {content[:100]}...")
 
-        # Common words to exclude (articles, prepositions, etc.)
-        excluded_words = {
-            "the",
-            "at",
-            "for",
-            "from",
-            "with",
-            "and",
-            "but",
-            "or",
-            "in",
-            "on",
-            "to",
-            "of",
-            "by",
-            "as",
-            "is",
-            "it",
-            "be",
-            "are",
-            "was",
-            "were",
-            "has",
-            "have",
-            "had",
-            "do",
-            "does",
-            "did",
-            "will",
-            "would",
-            "could",
-            "should",
-            "may",
-            "might",
-            "must",
-            "shall",
-            "can",
-            "need",
-            "dare",
-            "face",
-            "play",
-            "beat",
-            "lose",
-            "win",
-            "draw",
-            "meet",
-            "host",
-            "visit",
-            "martin",
-            "oxford",
-            "hugo",
-            "saka",
-            "kerkez",  # Common player names
-            "glance",
-            "clear",
-            "points",
-            "match",
-            "game",
-            "news",
-            "sport",
-            "football",
-            "soccer",
-            "live",
-            "update",
-            "breaking",
-            "report",
-            # Portuguese/Spanish common words
-            "para",
-            "com",
-            "por",
-            "sem",
-            "mais",
-            "como",
-            "sobre",
-            "entre",
-            "jogo",
-            "partida",
-            "resultado",
-            "gol",
-            "time",
-            "clube",
-            "sucesso",
-            "vitória",
-            "derrota",
-            "empate",
-            "campeonato",
-        }
+        excluded_words = self.TEAM_EXCLUDED_WORDS
 
         # Pattern 1 (PRIORITY): Known club names directly - most reliable
-        known_clubs = [
-            # ========== ENGLAND - Premier League ==========
-            "Arsenal",
-            "Chelsea",
-            "Liverpool",
-            "Manchester United",
-            "Manchester City",
-            "Tottenham",
-            "West Ham",
-            "Newcastle",
-            "Aston Villa",
-            "Brighton",
-            "Bournemouth",
-            "Brentford",
-            "Crystal Palace",
-            "Everton",
-            "Fulham",
-            "Nottingham Forest",
-            "Southampton",
-            "Wolves",
-            "Leicester",
-            "Leeds",
-            "Ipswich",
-            "Luton",
-            "Sheffield United",
-            "Burnley",
-            # National League
-            "Chesterfield",
-            # Championship
-            "Wigan Athletic",
-            # ========== ITALY - Serie A ==========
-            "AC Milan",
-            "Inter Milan",
-            "Juventus",
-            "Roma",
-            "Napoli",
-            "Lazio",
-            "Atalanta",
-            "Fiorentina",
-            # ========== SPAIN - La Liga ==========
-            "Real Madrid",
-            "Barcelona",
-            "Atletico Madrid",
-            "Sevilla",
-            "Valencia",
-            "Villarreal",
-            # ========== GERMANY - Bundesliga ==========
-            "Bayern Munich",
-            "Borussia Dortmund",
-            "RB Leipzig",
-            "Bayer Leverkusen",
-            # ========== FRANCE - Ligue 1 ==========
-            "PSG",
-            "Paris Saint-Germain",
-            "Lyon",
-            "Marseille",
-            "Monaco",
-            "Lille",
-            # ========== NETHERLANDS - Eredivisie (V1.7 Tier 2) ==========
-            "Ajax",
-            "PSV",
-            "PSV Eindhoven",
-            "Feyenoord",
-            "AZ Alkmaar",
-            "AZ",
-            "FC Twente",
-            "Twente",
-            "FC Utrecht",
-            "Utrecht",
-            "Vitesse",
-            "SC Heerenveen",
-            "Heerenveen",
-            "Sparta Rotterdam",
-            "Sparta",
-            "Go Ahead Eagles",
-            "Fortuna Sittard",
-            "RKC Waalwijk",
-            "NEC Nijmegen",
-            "PEC Zwolle",
-            "Excelsior",
-            "Heracles Almelo",
-            "FC Volendam",
-            # ========== TURKEY - Süper Lig (V1.7 Elite 7) ==========
-            "Galatasaray",
-            "Fenerbahce",
-            "Fenerbahçe",
-            "Besiktas",
-            "Beşiktaş",
-            "Trabzonspor",
-            "Basaksehir",
-            "Başakşehir",
-            "Istanbul Basaksehir",
-            "Antalyaspor",
-            "Konyaspor",
-            "Kasimpasa",
-            "Kasımpaşa",
-            "Sivasspor",
-            "Alanyaspor",
-            "Kayserispor",
-            "Adana Demirspor",
-            "Gaziantep FK",
-            "Rizespor",
-            "Çaykur Rizespor",
-            "Hatayspor",
-            "Samsunspor",
-            "Pendikspor",
-            "Istanbulspor",
-            "Fatih Karagümrük",
-            "Ankaragücü",
-            # ========== GREECE - Super League (V1.7 Elite 7) ==========
-            "Olympiacos",
-            "Olympiakos",
-            "Ολυμπιακός",
-            "Panathinaikos",
-            "Παναθηναϊκός",
-            "AEK Athens",
-            "AEK",
-            "ΑΕΚ",
-            "PAOK",
-            "PAOK Thessaloniki",
-            "ΠΑΟΚ",
-            "Aris Thessaloniki",
-            "Aris",
-            "Άρης",
-            "Panetolikos",
-            "Παναιτωλικός",
-            "Asteras Tripolis",
-            "Αστέρας Τρίπολης",
-            "Atromitos",
-            "Ατρόμητος",
-            "OFI Crete",
-            "ΟΦΗ",
-            "Volos",
-            "Volos NFC",
-            "Βόλος",
-            "Lamia",
-            "Λαμία",
-            "Ionikos",
-            "Ιωνικός",
-            "Giannina",
-            "PAS Giannina",
-            "ΠΑΣ Γιάννινα",
-            "Levadiakos",
-            "Λεβαδειακός",
-            # ========== SCOTLAND - Premiership (V1.7 Elite 7) ==========
-            "Celtic",
-            "Rangers",
-            "Aberdeen",
-            "Hearts",
-            "Heart of Midlothian",
-            "Hibernian",
-            "Hibs",
-            "Dundee",
-            "Dundee United",
-            "Kilmarnock",
-            "Motherwell",
-            "Ross County",
-            "Livingston",
-            "St Mirren",
-            "St Johnstone",
-            "Partick Thistle",
-            "Dundee FC",
-            # ========== BELGIUM - First Division (V1.7 Tier 2) ==========
-            "Anderlecht",
-            "Club Brugge",
-            "Club Bruges",
-            "Genk",
-            "KRC Genk",
-            "Standard Liege",
-            "Standard Liège",
-            "Antwerp",
-            "Royal Antwerp",
-            "Gent",
-            "KAA Gent",
-            "Union Saint-Gilloise",
-            "Union SG",
-            "Cercle Brugge",
-            "Mechelen",
-            "KV Mechelen",
-            "Charleroi",
-            "Kortrijk",
-            "Sint-Truiden",
-            "Westerlo",
-            "OH Leuven",
-            "Eupen",
-            "RWD Molenbeek",
-            # ========== BRAZIL - Brasileirão (V1.6) ==========
-            # Série A - Top 20
-            "Flamengo",
-            "Palmeiras",
-            "Corinthians",
-            "São Paulo",
-            "Sao Paulo",
-            "Santos",
-            "Fluminense",
-            "Botafogo",
-            "Vasco",
-            "Vasco da Gama",
-            "Athletico Paranaense",
-            "Athletico-PR",
-            "Grêmio",
-            "Gremio",
-            "Internacional",
-            "Inter de Porto Alegre",
-            "Cruzeiro",
-            "Atlético Mineiro",
-            "Atletico Mineiro",
-            "Atlético-MG",
-            "Bahia",
-            "Fortaleza",
-            "Ceará",
-            "Ceara",
-            "Sport Recife",
-            "Vitória",
-            "Vitoria",
-            "Juventude",
-            "América Mineiro",
-            "America Mineiro",
-            "Cuiabá",
-            "Cuiaba",
-            "Red Bull Bragantino",
-            "Bragantino",
-            "Coritiba",
-            "Goiás",
-            "Goias",
-            "Avaí",
-            "Avai",
-            "Chapecoense",
-            # Série B (V1.7 Tier 2)
-            "Guarani",
-            "Ponte Preta",
-            "Novorizontino",
-            "Mirassol",
-            "Vila Nova",
-            "CRB",
-            "CSA",
-            "Sport",
-            "Náutico",
-            "Santa Cruz",
-            "ABC",
-            "Londrina",
-            "Operário",
-            "Brusque",
-            "Ituano",
-            "Sampaio Corrêa",
-            # Common shortened names (used in media)
-            "Mengão",
-            "Mengao",
-            "Timão",
-            "Timao",
-            "Tricolor",
-            "Colorado",
-            "Verdão",
-            "Verdao",
-            "Peixe",
-            "Fogão",
-            "Fogao",
-            "Galo",
-            # ========== ARGENTINA - Primera División (V1.6 Elite 7) ==========
-            "River Plate",
-            "Boca Juniors",
-            "Racing Club",
-            "Independiente",
-            "San Lorenzo",
-            "Estudiantes",
-            "Vélez Sarsfield",
-            "Velez Sarsfield",
-            "Lanús",
-            "Lanus",
-            "Rosario Central",
-            "Newell's Old Boys",
-            "Newells",
-            "Talleres",
-            "Argentinos Juniors",
-            "Defensa y Justicia",
-            "Banfield",
-            "Godoy Cruz",
-            "Huracán",
-            "Huracan",
-            "Tigre",
-            "Colón",
-            "Colon",
-            "Unión",
-            "Union",
-            "Central Córdoba",
-            "Platense",
-            "Sarmiento",
-            # ========== MEXICO - Liga MX (V1.6 Elite 7) ==========
-            "Club América",
-            "Club America",
-            "Chivas",
-            "Guadalajara",
-            "Cruz Azul",
-            "Pumas",
-            "UNAM",
-            "Tigres",
-            "Monterrey",
-            "Rayados",
-            "Santos Laguna",
-            "León",
-            "Leon",
-            "Toluca",
-            "Pachuca",
-            "Atlas",
-            "Tijuana",
-            "Xolos",
-            "Necaxa",
-            "Puebla",
-            "Querétaro",
-            "Queretaro",
-            "Mazatlán",
-            "Mazatlan",
-            "Juárez",
-            "FC Juarez",
-            "San Luis",
-            "Atlético San Luis",
-            # ========== POLAND - Ekstraklasa (V1.7 Elite 7) ==========
-            "Legia Warsaw",
-            "Legia Warszawa",
-            "Lech Poznan",
-            "Lech Poznań",
-            "Raków Częstochowa",
-            "Rakow",
-            "Jagiellonia Białystok",
-            "Jagiellonia",
-            "Pogoń Szczecin",
-            "Pogon",
-            "Górnik Zabrze",
-            "Gornik Zabrze",
-            "Śląsk Wrocław",
-            "Slask Wroclaw",
-            "Cracovia",
-            "Wisła Kraków",
-            "Wisla Krakow",
-            "Piast Gliwice",
-            "Warta Poznań",
-            "Korona Kielce",
-            "Zagłębie Lubin",
-            "Radomiak",
-            "Stal Mielec",
-            "Widzew Łódź",
-            "Widzew Lodz",
-            "Puszcza Niepołomice",
-            # ========== AUSTRALIA - A-League (V1.7 Elite 7) ==========
-            "Melbourne Victory",
-            "Sydney FC",
-            "Western Sydney Wanderers",
-            "WSW",
-            "Melbourne City",
-            "Brisbane Roar",
-            "Adelaide United",
-            "Perth Glory",
-            "Central Coast Mariners",
-            "Mariners",
-            "Wellington Phoenix",
-            "Macarthur FC",
-            "Western United",
-            "Newcastle Jets",
-            "Auckland FC",
-            # ========== NORWAY - Eliteserien (V1.7 Tier 2) ==========
-            "Bodø/Glimt",
-            "Bodo Glimt",
-            "Molde",
-            "Rosenborg",
-            "Viking",
-            "Brann",
-            "Strømsgodset",
-            "Stromsgodset",
-            "Lillestrøm",
-            "Lillestrom",
-            "Sarpsborg",
-            "Tromsø",
-            "Tromso",
-            "Odd",
-            "Vålerenga",
-            "Valerenga",
-            "Haugesund",
-            "HamKam",
-            "Sandefjord",
-            "Kristiansund",
-            "Aalesund",
-            # ========== FRANCE - Ligue 1 (V1.7 Tier 2) ==========
-            "PSG",
-            "Paris Saint-Germain",
-            "Lyon",
-            "Olympique Lyon",
-            "OL",
-            "Marseille",
-            "Olympique Marseille",
-            "OM",
-            "Monaco",
-            "AS Monaco",
-            "Lille",
-            "LOSC",
-            "Nice",
-            "OGC Nice",
-            "Lens",
-            "RC Lens",
-            "Rennes",
-            "Stade Rennais",
-            "Nantes",
-            "FC Nantes",
-            "Montpellier",
-            "Strasbourg",
-            "RC Strasbourg",
-            "Brest",
-            "Stade Brestois",
-            "Toulouse",
-            "Reims",
-            "Stade de Reims",
-            "Lorient",
-            "Le Havre",
-            "Clermont",
-            "Metz",
-            "Auxerre",
-            # ========== AUSTRIA - Bundesliga (V1.7 Tier 2) ==========
-            "Red Bull Salzburg",
-            "Salzburg",
-            "Sturm Graz",
-            "SK Sturm",
-            "Rapid Wien",
-            "Rapid Vienna",
-            "Austria Wien",
-            "Austria Vienna",
-            "LASK",
-            "LASK Linz",
-            "Wolfsberg",
-            "WAC",
-            "Hartberg",
-            "TSV Hartberg",
-            "Altach",
-            "SCR Altach",
-            "Rheindorf Altach",
-            "Austria Klagenfurt",
-            "WSG Tirol",
-            "Blau-Weiß Linz",
-            "Austria Lustenau",
-            # ========== CHINA - Super League (V1.7 Tier 2) ==========
-            "Shanghai Port",
-            "Shanghai SIPG",
-            "上海海港",
-            "Shanghai Shenhua",
-            "上海申花",
-            "Shandong Taishan",
-            "山东泰山",
-            "Beijing Guoan",
-            "北京国安",
-            "Guangzhou FC",
-            "Guangzhou Evergrande",
-            "广州队",
-            "Henan Songshan",
-            "河南嵩山龙门",
-            "Wuhan Three Towns",
-            "武汉三镇",
-            "Chengdu Rongcheng",
-            "成都蓉城",
-            "Qingdao Hainiu",
-            "青岛海牛",
-            "Tianjin Jinmen Tiger",
-            "天津津门虎",
-            "Zhejiang FC",
-            "浙江队",
-            "Changchun Yatai",
-            "长春亚泰",
-            "Cangzhou Mighty Lions",
-            "沧州雄狮",
-            "Dalian Pro",
-            "大连人",
-            "Nantong Zhiyun",
-            "南通支云",
-            "Shenzhen FC",
-            "深圳队",
-            # ========== JAPAN - J-League (V1.7 Tier 2) ==========
-            "Vissel Kobe",
-            "ヴィッセル神戸",
-            "Yokohama F Marinos",
-            "Marinos",
-            "横浜F・マリノス",
-            "Kawasaki Frontale",
-            "川崎フロンターレ",
-            "Urawa Reds",
-            "Urawa Red Diamonds",
-            "浦和レッズ",
-            "FC Tokyo",
-            "FC東京",
-            "Kashima Antlers",
-            "鹿島アントラーズ",
-            "Nagoya Grampus",
-            "名古屋グランパス",
-            "Cerezo Osaka",
-            "セレッソ大阪",
-            "Gamba Osaka",
-            "ガンバ大阪",
-            "Sanfrecce Hiroshima",
-            "サンフレッチェ広島",
-            "Kashiwa Reysol",
-            "柏レイソル",
-            "Consadole Sapporo",
-            "北海道コンサドーレ札幌",
-            "Sagan Tosu",
-            "サガン鳥栖",
-            "Avispa Fukuoka",
-            "アビスパ福岡",
-            "Albirex Niigata",
-            "アルビレックス新潟",
-            "Shonan Bellmare",
-            "湘南ベルマーレ",
-            "Kyoto Sanga",
-            "京都サンガ",
-            "Jubilo Iwata",
-            "ジュビロ磐田",
-            "Tokyo Verdy",
-            "東京ヴェルディ",
-            "Machida Zelvia",
-            "町田ゼルビア",
-            # ========== HONDURAS - Liga Nacional (V1.6) ==========
-            "Olimpia Honduras",
-            "Motagua",
-            "Real España",
-            "Real Espana",
-            "Marathón",
-            "Marathon",
-            "Victoria Honduras",
-            "UPNFM",
-            "Honduras Progreso",
-            "Vida",
-            "Real Sociedad Honduras",
-            "Platense Honduras",
-            "Lobos UPNFM",
-            "Olancho FC",
-            "Génesis",
-            "Genesis",
-            # ========== COLOMBIA/CHILE/PERU (V1.6) ==========
-            # Colombia
-            "Atlético Nacional",
-            "Atletico Nacional",
-            "Millonarios",
-            "América de Cali",
-            "America de Cali",
-            "Independiente Medellín",
-            "Junior Barranquilla",
-            "Deportivo Cali",
-            "Santa Fe",
-            "Once Caldas",
-            # Chile
-            "Colo-Colo",
-            "Colo Colo",
-            "Universidad de Chile",
-            "Universidad Católica",
-            "Cobreloa",
-            "O'Higgins",
-            "Huachipato",
-            # Peru
-            "Alianza Lima",
-            "Universitario",
-            "Sporting Cristal",
-            "Cienciano",
-            "Melgar",
-            "Deportivo Municipal",
-            # ========== INDONESIA (V1.6) ==========
-            "Persija Jakarta",
-            "Persebaya",
-            "Arema FC",
-            "Persib Bandung",
-            "Bali United",
-            "PSM Makassar",
-            "Persik Kediri",
-            "PSIS Semarang",
-            "Madura United",
-            "Borneo FC",
-            "Persita Tangerang",
-            "Dewa United",
-        ]
-
-        # DEBUG: Check if we have CJK clubs in list and if content matches
+        known_clubs = self._known_club_names
+
         # Check known clubs first (case-insensitive) with word boundaries
-        content_lower = content.lower()
-        for club in known_clubs:
-            # V1.10: Use word boundary matching to prevent partial matches
-            # e.g., prevent "OL" from matching "Olimpia"
-            pattern = r"\b" + re.escape(club.lower()) + r"\b"
-            if re.search(pattern, content_lower):
-                logger.debug(f"[TEAM-EXTRACTION] Known club matched: {club}")
-                return club
+        # V1.10: Use word boundary matching to prevent partial matches
+        # e.g., prevent "OL" from matching "Olimpia"
+        # V1.11: First listed club found by the single-pass scan (same result)
+        if scan is None:
+            scan = scan_content(content)
+        club = scan.best("KNOWN_CLUB")
+        if club:
+            logger.debug(f"[TEAM-EXTRACTION] Known club matched: {club}")
+            return club
 
         logger.debug("[TEAM-EXTRACTION] No known club match, trying patterns...")
 
@@ -1957,7 +1966,7 @@ class RelevanceAnalyzer:
             first_word = team.split()[0].lower()
             if first_word not in excluded_words:
                 # V1.10: Validate team is in known clubs list
-                if team in known_clubs or any(team.lower() == kc.lower() for kc in known_clubs):
+                if team.lower() in known_clubs:
                     return team
 
         # Pattern 3: "X's player/star/striker" - possessive form (English)
@@ -1967,7 +1976,7 @@ class RelevanceAnalyzer:
             team = match.group(1).strip()
             if team.lower() not in excluded_words and len(team) > 2:
                 # V1.10: Validate team is in known clubs list
-                if team in known_clubs or any(team.lower() == kc.lower() for kc in known_clubs):
+                if team.lower() in known_clubs:
                     return team
 
         # Pattern 4 (V1.8): Portuguese/Spanish possessive - "jogador do [Team]" / "jugador del [Team]"
@@ -1978,7 +1987,7 @@ class RelevanceAnalyzer:
             team = match.group(1).strip()
             if team.lower() not in excluded_words and len(team) > 2:
                 # V1.10: Validate team is in known clubs list
-                if team in known_clubs or any(team.lower() == kc.lower() for kc in known_clubs):
+                if team.lower() in known_clubs:
                     return team
 
         # Pattern 5 (V1.8): Common Brazilian news patterns - "[Team] vence/perde/enfrenta"
@@ -1990,7 +1999,7 @@ class RelevanceAnalyzer:
             team = match.group(1).strip()
             if team.lower() not in excluded_words and len(team) > 3:
                 # V1.10: Validate team is in known clubs list
-                if team in known_clubs or any(team.lower() == kc.lower() for kc in known_clubs):
+                if team.lower() in known_clubs:
                     return team
 
         # Pattern 6 (V1.8): CJK team names (Chinese/Japanese)
@@ -2001,12 +2010,7 @@ class RelevanceAnalyzer:
         if match:
             team = match.group(1).strip()
             # Verify it's a known CJK team to avoid false positives
-            cjk_teams = [
-                c
-                for c in known_clubs
-                if any("\u4e00" <= ch <= "\u9fff" or "\u3040" <= ch <= "\u30ff" for ch in c)
-            ]
-            if team in cjk_teams:
+            if team in self._cjk_clubs:
                 return team
 
         # Pattern 7 (V1.8): Greek team names
@@ -2017,8 +2021,7 @@ class RelevanceAnalyzer:
         if match:
             team = match.group(1).strip()
             # Verify it's a known Greek team to avoid false positives
-            greek_teams = [c for c in known_clubs if any("\u0370" <= ch <= "\u03ff" for ch in c)]
-            if team in greek_teams:
+            if team in self._greek_clubs:
                 return team
 
         return None
@@ -2160,9 +2163,55 @@ import threading
 _exclusion_filter: ExclusionFilter | None = None
 _relevance_analyzer: RelevanceAnalyzer | None = None
 _positive_news_filter: PositiveNewsFilter | None = None
+_content_matcher: KeywordMatcher | None = None
 _singleton_lock = threading.Lock()
 
 
+def _build_content_matcher() -> KeywordMatcher:
+    """Every keyword list of the content filters in one matcher (one category each)."""
+    matcher = KeywordMatcher()
+    # RelevanceAnalyzer categories: same boundary rules as the old _compile_pattern()
+    matcher.add("INJURY", RelevanceAnalyzer.INJURY_KEYWORDS, BOUNDARY_AUTO)
+    matcher.add("SUSPENSION", RelevanceAnalyzer.SUSPENSION_KEYWORDS, BOUNDARY_AUTO)
+    matcher.add("NATIONAL_TEAM", RelevanceAnalyzer.NATIONAL_TEAM_KEYWORDS, BOUNDARY_AUTO)
+    matcher.add("CUP_ABSENCE", RelevanceAnalyzer.CUP_ABSENCE_KEYWORDS, BOUNDARY_AUTO)
+    matcher.add("YOUTH_CALLUP", RelevanceAnalyzer.YOUTH_CALLUP_KEYWORDS, BOUNDARY_AUTO)
+    matcher.add("GENERAL_SPORTS", RelevanceAnalyzer.GENERAL_SPORTS_KEYWORDS, BOUNDARY_AUTO)
+    matcher.add("LOGISTICAL_CRISIS", RelevanceAnalyzer.LOGISTICAL_CRISIS_KEYWORDS, BOUNDARY_AUTO)
+    matcher.add("KNOWN_CLUB", RelevanceAnalyzer.KNOWN_CLUBS, BOUNDARY_WORD)
+    matcher.add("POSITIVE", PositiveNewsFilter.POSITIVE_KEYWORDS, BOUNDARY_WORD)
+    matcher.add(
+        "EXCLUDED",
+        EXCLUDED_SPORTS + EXCLUDED_CATEGORIES + EXCLUDED_OTHER_SPORTS,
+        BOUNDARY_WORD,
+    )
+    matcher.add("FOOTBALL", FOOTBALL_KEYWORDS, BOUNDARY_PREFIX)
+    return matcher
+
+
+def get_content_matcher() -> KeywordMatcher:
+    """Get singleton KeywordMatcher over all content filter keywords (thread-safe). V1.2"""
+    global _content_matcher
+    if _content_matcher is None:
+        with _singleton_lock:
+            # Double-check locking pattern
+            if _content_matcher is None:
+                _content_matcher = _build_content_matcher()
+    return _content_matcher
+
+
+@functools.lru_cache(maxsize=64)
+def scan_content(content: str) -> KeywordScan:
+    """
+    V1.2: Keyword scan of content for every filter category.
+
+    The same article goes through several filters (exclusion, positive news,
+    relevance, football keywords); the last scans are cached so each text is
+    scanned once.
+    """
+    return get_content_matcher().scan(content)
+
+
 def get_exclusion_filter() -> ExclusionFilter:
     """Get singleton ExclusionFilter instance (thread-safe)."""
     global _exclusion_filter
@@ -20,11 +20,17 @@ Architecture:
                                      └── Memory limit enforcement
 
 V1.0: Initial implementation replacing _browser_monitor_discoveries dict.
+V1.1: Indexed lookups. pop_for_match() only visits candidate items found via
+      an index of normalized team names (exact substrings of the queried name)
+      and team trigrams (teams containing the queried name), instead of
+      scanning the whole queue. Expiry uses a time-ordered heap, so cleanup
+      pops expired items in O(log n) each.
 """
 
+import heapq
 import logging
 import uuid
-from collections import deque
+from collections import Counter
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
@@ -37,6 +43,20 @@ logger = logging.getLogger(__name__)
 DEFAULT_MAX_ENTRIES = 1000
 DEFAULT_TTL_HOURS = 24
 
+# V1.1: Team index n-gram size (names shorter than this fall back to a league scan)
+TEAM_NGRAM_SIZE = 3
+
+
+def normalize_team_name(name: str | None) -> str:
+    """Normalize a team name the same way DiscoveryItem.matches_team() compares it."""
+    return name.lower().strip() if name else ""
+
+
+def _team_ngrams(normalized: str) -> set[str]:
+    return {
+        normalized[i : i + TEAM_NGRAM_SIZE] for i in range(len(normalized) - TEAM_NGRAM_SIZE + 1)
+    }
+
 
 @dataclass
 class DiscoveryItem:
@@ -139,11 +159,21 @@ class DiscoveryQueue:
         self._max_entries = max_entries
         self._ttl_hours = ttl_hours
 
-        # Main storage: deque for O(1) append/popleft
-        self._queue: deque[DiscoveryItem] = deque(maxlen=max_entries)
+        # Main storage: uuid -> item in insertion (FIFO) order, O(1) removal
+        self._items: dict[str, DiscoveryItem] = {}
+        self._seq: dict[str, int] = {}  # uuid -> insertion sequence (result ordering)
+        self._next_seq = 0
+
+        # Index by league for fast filtering (league_key -> ordered uuid set)
+        self._by_league: dict[str, dict[str, None]] = {}
+
+        # V1.1: Team indexes for pop_for_match()
+        self._by_team: dict[str, set[str]] = {}  # normalized team -> uuids
+        self._team_lengths: Counter = Counter()  # normalized team length -> item count
+        self._by_ngram: dict[str, set[str]] = {}  # team trigram -> uuids
 
-        # Index by league for fast filtering
-        self._by_league: dict[str, list[str]] = {}  # league_key -> [uuids]
+        # V1.1: Expiry heap of (discovered_at, seq, uuid); removed items are skipped lazily
+        self._expiry_heap: list[tuple[datetime, int, str]] = []
 
         # Lock for thread safety (RLock allows reentrant calls)
         self._lock = RLock()
@@ -210,6 +240,7 @@ class DiscoveryQueue:
         source_name: str | None = None,
         category: str = "OTHER",
         confidence: float = 0.0,
+        discovered_at: datetime | None = None,
     ) -> str:
         """
         Push a new discovery to the queue.
@@ -224,12 +255,13 @@ class DiscoveryQueue:
             source_name: Source name
             category: News category
             confidence: AI confidence score
+            discovered_at: Discovery time (default: now)
 
         Returns:
             UUID of the pushed item
         """
         item_uuid = str(uuid.uuid4())
-        now = datetime.now(timezone.utc)
+        now = discovered_at or datetime.now(timezone.utc)
 
         # Extract fields from data if not provided explicitly
         team = team or data.get("team") or data.get("affected_team") or ""
@@ -274,24 +306,12 @@ class DiscoveryQueue:
         )
 
         with self._lock:
-            # Check if we need to evict (deque handles this, but we track stats)
-            if len(self._queue) >= self._max_entries:
+            # Evict oldest items at capacity
+            while len(self._items) >= self._max_entries:
                 self._total_evicted += 1
-                # Remove oldest from league index
-                oldest = self._queue[0]
-                if oldest.league_key in self._by_league:
-                    try:
-                        self._by_league[oldest.league_key].remove(oldest.uuid)
-                    except ValueError:
-                        pass
-
-            # Add to queue
-            self._queue.append(item)
-
-            # Update league index
-            if league_key not in self._by_league:
-                self._by_league[league_key]: list[str] = []
-            self._by_league[league_key].append(item_uuid)
+                self._remove_locked(next(iter(self._items)))
+
+            self._add_locked(item)
 
             self._total_pushed += 1
 
@@ -350,28 +370,30 @@ class DiscoveryQueue:
         results: list[dict] = []
         now = datetime.now(timezone.utc)
         matching_items: list[DiscoveryItem] = []
+        names = {normalize_team_name(name) for name in team_names} - {""}
+        if not names:
+            return []
 
         with self._lock:
-            # Get UUIDs for this league
-            league_uuids = set(self._by_league.get(league_key, []))
+            # V1.1: Expired items are popped from the heap instead of checked one by one
+            self._expire_locked(now)
 
             # V11.0: Also include GLOBAL items (from GlobalRadarMonitor)
-            global_uuids = set(self._by_league.get("GLOBAL", []))
-            all_uuids = league_uuids.union(global_uuids)
-
-            if not all_uuids:
+            leagues = {league_key, "GLOBAL"}
+            if not any(self._by_league.get(league) for league in leagues):
                 return []
 
-            # Find matching items (minimal work inside lock)
-            for item in self._queue:
-                if item.uuid not in all_uuids:
-                    continue
+            # V1.1: Only visit candidates from the team index (minimal work inside lock)
+            candidates: set[str] = set()
+            for name in names:
+                candidates |= self._candidates_for_name(name, leagues)
 
-                # Skip expired
-                if item.is_expired(self._ttl_hours):
+            for item_uuid in sorted(candidates, key=self._seq.__getitem__):
+                item = self._items[item_uuid]
+                if item.league_key not in leagues:
                     continue
 
-                # Check team match
+                # Verify with the original bidirectional substring match
                 if not item.matches_team(team_names):
                     continue
 
@@ -435,29 +457,16 @@ class DiscoveryQueue:
         Returns:
             Number of items removed
         """
-        removed = 0
-
         with self._lock:
-            # Build list of non-expired items
-            valid_items: list[DiscoveryItem] = []
-            valid_uuids_by_league: dict[str, list[str]] = {}
-
-            for item in self._queue:
-                if item.is_expired(self._ttl_hours):
-                    removed += 1
-                    self._total_expired += 1
-                else:
-                    valid_items.append(item)
-                    if item.league_key not in valid_uuids_by_league:
-                        valid_uuids_by_league[item.league_key]: list[str] = []
-                    valid_uuids_by_league[item.league_key].append(item.uuid)
-
-            # Replace queue contents
-            self._queue.clear()
-            self._queue.extend(valid_items)
+            removed = self._expire_locked(datetime.now(timezone.utc))
 
-            # Update league index
-            self._by_league = valid_uuids_by_league
+            # Drop heap entries left behind by evicted/cleared items
+            if len(self._expiry_heap) > 2 * len(self._items) + 64:
+                self._expiry_heap = [
+                    (item.discovered_at, self._seq[item_uuid], item_uuid)
+                    for item_uuid, item in self._items.items()
+                ]
+                heapq.heapify(self._expiry_heap)
 
         if removed > 0:
             logger.info(f"🧹 [QUEUE] Cleaned up {removed} expired discoveries")
@@ -477,28 +486,21 @@ class DiscoveryQueue:
         """
         with self._lock:
             if league_key is None:
-                count = len(self._queue)
-                self._queue.clear()
+                count = len(self._items)
+                self._items.clear()
+                self._seq.clear()
                 self._by_league.clear()
+                self._by_team.clear()
+                self._team_lengths.clear()
+                self._by_ngram.clear()
+                self._expiry_heap.clear()
                 return count
 
             # Clear only specific league
-            uuids_to_remove = set(self._by_league.get(league_key, []))
-            if not uuids_to_remove:
-                return 0
-
-            # Filter queue
-            remaining = [item for item in self._queue if item.uuid not in uuids_to_remove]
-            count = len(self._queue) - len(remaining)
-
-            self._queue.clear()
-            self._queue.extend(remaining)
-
-            # Update league index
-            if league_key in self._by_league:
-                del self._by_league[league_key]
-
-            return count
+            uuids_to_remove = list(self._by_league.get(league_key, {}))
+            for item_uuid in uuids_to_remove:
+                self._remove_locked(item_uuid)
+            return len(uuids_to_remove)
 
     def size(self, league_key: str | None = None) -> int:
         """
@@ -512,8 +514,8 @@ class DiscoveryQueue:
         """
         with self._lock:
             if league_key is None:
-                return len(self._queue)
-            return len(self._by_league.get(league_key, []))
+                return len(self._items)
+            return len(self._by_league.get(league_key, {}))
 
     @property
     def ttl_hours(self) -> int:
@@ -548,7 +550,7 @@ class DiscoveryQueue:
             List of all DiscoveryItem objects (copies, not references)
         """
         with self._lock:
-            return list(self._queue)
+            return list(self._items.values())
 
     def get_stats(self) -> dict[str, Any]:
         """
@@ -562,12 +564,12 @@ class DiscoveryQueue:
             oldest_age_hours = 0.0
             now = datetime.now(timezone.utc)
 
-            if self._queue:
-                oldest = self._queue[0]
+            if self._items:
+                oldest = next(iter(self._items.values()))
                 oldest_age_hours = (now - oldest.discovered_at).total_seconds() / 3600
 
             return {
-                "current_size": len(self._queue),
+                "current_size": len(self._items),
                 "max_entries": self._max_entries,
                 "ttl_hours": self._ttl_hours,
                 "leagues_count": len(self._by_league),
@@ -577,8 +579,98 @@ class DiscoveryQueue:
                 "total_popped": self._total_popped,
                 "total_expired": self._total_expired,
                 "total_evicted": self._total_evicted,
+                "indexed_teams": len(self._by_team),
             }
 
+    # ============================================
+    # V1.1: INDEX MAINTENANCE (caller holds the lock)
+    # ============================================
+
+    def _add_locked(self, item: DiscoveryItem) -> None:
+        """Insert an item into storage, league/team indexes and the expiry heap."""
+        seq = self._next_seq
+        self._next_seq += 1
+        self._items[item.uuid] = item
+        self._seq[item.uuid] = seq
+        self._by_league.setdefault(item.league_key, {})[item.uuid] = None
+        heapq.heappush(self._expiry_heap, (item.discovered_at, seq, item.uuid))
+
+        team = normalize_team_name(item.team)
+        if team:
+            self._by_team.setdefault(team, set()).add(item.uuid)
+            self._team_lengths[len(team)] += 1
+            for gram in _team_ngrams(team):
+                self._by_ngram.setdefault(gram, set()).add(item.uuid)
+
+    def _remove_locked(self, item_uuid: str) -> DiscoveryItem | None:
+        """Remove an item from storage and indexes (its heap entry is skipped later)."""
+        item = self._items.pop(item_uuid, None)
+        if item is None:
+            return None
+        self._seq.pop(item_uuid, None)
+
+        league_uuids = self._by_league.get(item.league_key)
+        if league_uuids is not None:
+            league_uuids.pop(item_uuid, None)
+            if not league_uuids:
+                del self._by_league[item.league_key]
+
+        team = normalize_team_name(item.team)
+        if team:
+            _discard_from_index(self._by_team, team, item_uuid)
+            self._team_lengths[len(team)] -= 1
+            if self._team_lengths[len(team)] <= 0:
+                del self._team_lengths[len(team)]
+            for gram in _team_ngrams(team):
+                _discard_from_index(self._by_ngram, gram, item_uuid)
+        return item
+
+    def _expire_locked(self, now: datetime) -> int:
+        """Pop expired items off the expiry heap. Returns the number removed."""
+        cutoff = now - timedelta(hours=self._ttl_hours)
+        removed = 0
+        while self._expiry_heap and self._expiry_heap[0][0] < cutoff:
+            _, seq, item_uuid = heapq.heappop(self._expiry_heap)
+            if self._seq.get(item_uuid) != seq:
+                continue  # Already evicted/cleared
+            self._remove_locked(item_uuid)
+            removed += 1
+            self._total_expired += 1
+        return removed
+
+    def _candidates_for_name(self, name: str, leagues: set[str]) -> set[str]:
+        """
+        Superset of items whose team matches ``name`` by bidirectional substring.
+
+        - team in name: look up every substring of name with an indexed team length
+        - name in team: every trigram of name occurs in team, so take the
+          smallest trigram posting list (names under 3 chars scan the leagues)
+        """
+        candidates: set[str] = set()
+        name_len = len(name)
+        for length in self._team_lengths:
+            for start in range(name_len - length + 1):
+                uuids = self._by_team.get(name[start : start + length])
+                if uuids:
+                    candidates |= uuids
+
+        if name_len >= TEAM_NGRAM_SIZE:
+            postings = [self._by_ngram.get(gram) for gram in _team_ngrams(name)]
+            if all(postings):
+                candidates |= min(postings, key=len)
+        else:
+            for league in leagues:
+                candidates.update(self._by_league.get(league, {}))
+        return candidates
+
+
+def _discard_from_index(index: dict[str, set[str]], key: str, item_uuid: str) -> None:
+    uuids = index.get(key)
+    if uuids is not None:
+        uuids.discard(item_uuid)
+        if not uuids:
+            del index[key]
+
 
 # ============================================
 # SINGLETON INSTANCE
@@ -0,0 +1,405 @@
+"""
+EarlyBird Fetch State Store V1.0
+
+Per-URL conditional fetch state for the scanners that poll news pages
+(NewsRadarMonitor, BrowserMonitor).
+
+Both scanners re-fetched every due source in full on every interval, ran
+Trafilatura and only then found out (via ContentCache / SharedContentCache)
+that the page had not changed. This store remembers, per URL:
+
+- ETag / Last-Modified validators, sent back as If-None-Match /
+  If-Modified-Since so servers that support it answer 304 Not Modified
+- A fingerprint of the raw response bytes, so pages without validators are
+  skipped when the server returns identical bytes
+- Check/change counters and an exponentially weighted change rate, used to
+  report how often each source actually changes and to suggest scan intervals
+
+Flow (fetch_if_changed is synchronous, run it with asyncio.to_thread):
+    probe = fetch_if_changed(get_http_client(), url, store, rate_limit_key="conditional_fetch")
+    if probe.skip:
+        ...  # 304 or identical bytes: no extraction, no analysis
+    elif probe.changed:
+        text = extract(probe.text)
+        if text:
+            store.commit(probe)  # validators only count once extraction worked
+
+Validators and the fingerprint are committed only after a successful
+extraction, so a page whose extraction failed is fetched in full again on the
+next scan instead of being skipped as "unchanged".
+
+State lives in memory and, optionally, in a PersistentCacheTier (SQLite) so
+validators survive restarts.
+
+V1.0: Initial implementation
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, fields
+from typing import Any, Optional
+
+from src.utils.persistent_cache import PersistentCacheTier
+
+logger = logging.getLogger(__name__)
+
+try:
+    from config.settings import FETCH_STATE_PERSISTENT_ENABLED, FETCH_STATE_PERSISTENT_PATH
+except ImportError:
+    FETCH_STATE_PERSISTENT_ENABLED = False
+    FETCH_STATE_PERSISTENT_PATH = "data/cache/fetch_state.db"
+
+# ============================================
+# CONFIGURATION
+# ============================================
+
+# Smoothing factor of the per-URL change rate (weight of the latest check)
+CHANGE_RATE_ALPHA = 0.2
+# Sources changing on at least this share of checks keep their base interval
+CHANGE_RATE_FULL_SPEED = 0.5
+# Suggested intervals never exceed base interval * this factor
+MAX_INTERVAL_FACTOR = 4
+# Consecutive failed probes (403, 5xx, timeouts) after which a URL is only
+# re-probed every PROBE_RETRY_EVERY checks; WAF-protected pages never answer
+# the plain HTTP probe, so probing them on every scan is a wasted request
+MAX_PROBE_FAILURES = 3
+PROBE_RETRY_EVERY = 10
+# On-disk retention of a URL's state after its last check
+FETCH_STATE_RETENTION_DAYS = 30
+FETCH_STATE_MAX_ENTRIES = 5000
+
+# Probe outcomes
+STATUS_CHANGED = "changed"
+STATUS_NOT_MODIFIED = "not_modified"  # 304
+STATUS_UNCHANGED = "unchanged"  # 200 with identical bytes
+STATUS_FAILED = "failed"
+
+
+@dataclass
+class FetchState:
+    """Conditional fetch state and change statistics of one URL."""
+
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fingerprint: Optional[str] = None
+    checks: int = 0
+    changes: int = 0
+    not_modified: int = 0
+    unchanged: int = 0
+    probe_failures: int = 0  # consecutive
+    probes_skipped: int = 0  # since the last retry of a failing URL
+    change_rate: Optional[float] = None  # EWMA of changed (1) / unchanged (0) checks
+    last_checked: Optional[float] = None  # Unix timestamps
+    last_changed: Optional[float] = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "FetchState":
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in known})
+
+
+@dataclass
+class FetchProbe:
+    """Result of one conditional GET."""
+
+    url: str
+    status: str
+    status_code: Optional[int] = None
+    text: Optional[str] = None  # decoded body, only when changed
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fingerprint: Optional[str] = None
+
+    @property
+    def skip(self) -> bool:
+        """True if the page is known not to have changed (304 or identical bytes)."""
+        return self.status in (STATUS_NOT_MODIFIED, STATUS_UNCHANGED)
+
+    @property
+    def changed(self) -> bool:
+        return self.status == STATUS_CHANGED
+
+
+def fingerprint_bytes(body: bytes) -> str:
+    """Fingerprint of a raw response body."""
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+class FetchStateStore:
+    """
+    Per-URL ETag / Last-Modified / fingerprint store with change statistics.
+
+    Thread-safe: probes run in worker threads (asyncio.to_thread).
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        db_path: Optional[str] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Args:
+            namespace: Key prefix in the persistent tier (one per scanner)
+            db_path: SQLite path of the persistent tier, or None for memory only
+            clock: Time source (injectable for tests)
+        """
+        self.namespace = namespace
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._states: dict[str, FetchState] = {}
+        self._tier: Optional[PersistentCacheTier] = None
+        if db_path:
+            tier = PersistentCacheTier(db_path, max_entries=FETCH_STATE_MAX_ENTRIES)
+            self._tier = tier if tier.available else None
+
+    @property
+    def persistent(self) -> bool:
+        return self._tier is not None
+
+    def _key(self, url: str) -> str:
+        return f"{self.namespace}:{url}"
+
+    def _load(self, url: str) -> FetchState:
+        """Get the state of url, loading it from disk on first use. Caller holds the lock."""
+        state = self._states.get(url)
+        if state is None:
+            state = FetchState()
+            if self._tier is not None:
+                record = self._tier.get(self._key(url))
+                if record is not None and isinstance(record.value, dict):
+                    state = FetchState.from_dict(record.value)
+            self._states[url] = state
+        return state
+
+    def _save(self, url: str, state: FetchState) -> None:
+        if self._tier is not None:
+            expires = self._clock() + FETCH_STATE_RETENTION_DAYS * 86400
+            self._tier.set(self._key(url), asdict(state), expires, expires)
+
+    def get(self, url: str) -> FetchState:
+        with self._lock:
+            return FetchState(**asdict(self._load(url)))
+
+    def conditional_headers(self, url: str) -> dict[str, str]:
+        """If-None-Match / If-Modified-Since headers for the stored validators."""
+        with self._lock:
+            state = self._load(url)
+            headers = {}
+            if state.etag:
+                headers["If-None-Match"] = state.etag
+            if state.last_modified:
+                headers["If-Modified-Since"] = state.last_modified
+            return headers
+
+    def should_probe(self, url: str) -> bool:
+        """False while a URL keeps failing the plain HTTP probe (retried periodically)."""
+        with self._lock:
+            state = self._load(url)
+            if state.probe_failures < MAX_PROBE_FAILURES:
+                return True
+            state.probes_skipped += 1
+            if state.probes_skipped >= PROBE_RETRY_EVERY:
+                state.probes_skipped = 0
+                return True
+            return False
+
+    def classify(self, url: str, status_code: int, fingerprint: Optional[str]) -> str:
+        """Outcome of a response: 304 and identical bytes are skips, other 200s changes."""
+        with self._lock:
+            state = self._load(url)
+            if status_code == 304 and (state.etag or state.last_modified):
+                return STATUS_NOT_MODIFIED
+            if status_code == 200:
+                if fingerprint is not None and fingerprint == state.fingerprint:
+                    return STATUS_UNCHANGED
+                return STATUS_CHANGED
+            return STATUS_FAILED
+
+    def record(self, probe: FetchProbe) -> None:
+        """Update counters and the change rate after a probe."""
+        with self._lock:
+            state = self._load(probe.url)
+            now = self._clock()
+            if probe.status == STATUS_FAILED:
+                state.probe_failures += 1
+            else:
+                state.probe_failures = 0
+                state.checks += 1
+                state.last_checked = now
+                changed = 1.0 if probe.changed else 0.0
+                if probe.changed:
+                    state.changes += 1
+                    state.last_changed = now
+                elif probe.status == STATUS_NOT_MODIFIED:
+                    state.not_modified += 1
+                else:
+                    state.unchanged += 1
+                if state.change_rate is None:
+                    state.change_rate = changed
+                else:
+                    state.change_rate += CHANGE_RATE_ALPHA * (changed - state.change_rate)
+            self._save(probe.url, state)
+
+    def commit(self, probe: FetchProbe) -> None:
+        """Store the validators and fingerprint of a changed page once it was extracted."""
+        if not probe.changed:
+            return
+        with self._lock:
+            state = self._load(probe.url)
+            state.etag = probe.etag
+            state.last_modified = probe.last_modified
+            state.fingerprint = probe.fingerprint
+            self._save(probe.url, state)
+
+    def change_rate(self, url: str) -> Optional[float]:
+        with self._lock:
+            return self._load(url).change_rate
+
+    def suggested_interval_minutes(self, url: str, base_minutes: int) -> int:
+        """
+        Scan interval matching how often url changes.
+
+        Sources that change on at least half of the checks keep base_minutes;
+        slower ones get proportionally longer intervals, up to
+        MAX_INTERVAL_FACTOR * base_minutes. Unknown sources keep base_minutes.
+        """
+        rate = self.change_rate(url)
+        if rate is None or rate >= CHANGE_RATE_FULL_SPEED:
+            return base_minutes
+        factor = min(MAX_INTERVAL_FACTOR, CHANGE_RATE_FULL_SPEED / max(rate, 1e-9))
+        return int(round(base_minutes * factor))
+
+    def get_source_change_rates(
+        self, base_intervals: Optional[dict[str, int]] = None
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Per-URL change statistics of the URLs checked by this process.
+
+        Args:
+            base_intervals: Optional URL -> configured scan interval (minutes); adds
+                            suggested_interval_minutes for those URLs
+        """
+        with self._lock:
+            snapshot = {url: FetchState(**asdict(s)) for url, s in self._states.items()}
+        rates: dict[str, dict[str, Any]] = {}
+        for url, state in snapshot.items():
+            if not state.checks:
+                continue
+            entry: dict[str, Any] = {
+                "checks": state.checks,
+                "changes": state.changes,
+                "not_modified": state.not_modified,
+                "unchanged": state.unchanged,
+                "change_rate": round(state.change_rate or 0.0, 3),
+            }
+            if base_intervals and url in base_intervals:
+                entry["suggested_interval_minutes"] = self.suggested_interval_minutes(
+                    url, base_intervals[url]
+                )
+            rates[url] = entry
+        return rates
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            states = list(self._states.values())
+        checks = sum(s.checks for s in states)
+        skipped = sum(s.not_modified + s.unchanged for s in states)
+        return {
+            "urls": len(states),
+            "checks": checks,
+            "changes": sum(s.changes for s in states),
+            "not_modified": sum(s.not_modified for s in states),
+            "unchanged": sum(s.unchanged for s in states),
+            "skip_rate_percent": round(skipped / checks * 100, 2) if checks else 0.0,
+            "persistent": self.persistent,
+        }
+
+    def close(self) -> None:
+        if self._tier is not None:
+            self._tier.close()
+
+
+def fetch_if_changed(
+    http_client: Any,
+    url: str,
+    store: FetchStateStore,
+    *,
+    rate_limit_key: str,
+    headers: Optional[dict[str, str]] = None,
+    timeout: float = 15,
+    use_fingerprint: bool = False,
+) -> FetchProbe:
+    """
+    Conditional GET of url through EarlyBirdHTTPClient (or FallbackHTTPClient).
+
+    Sends the stored validators, fingerprints a 200 body and records the probe
+    in store. Never raises: network errors come back as a failed probe.
+    Blocking; call it with asyncio.to_thread from async code.
+    """
+    request_headers = dict(headers or {})
+    request_headers.update(store.conditional_headers(url))
+    try:
+        response = http_client.get_sync(
+            url,
+            rate_limit_key=rate_limit_key,
+            use_fingerprint=use_fingerprint,
+            timeout=timeout,
+            max_retries=0,
+            headers=request_headers,
+        )
+    except Exception as e:
+        logger.debug(f"⚠️ [FETCH-STATE] Probe failed for {url[:50]}: {e}")
+        probe = FetchProbe(url=url, status=STATUS_FAILED)
+        store.record(probe)
+        return probe
+
+    fingerprint = fingerprint_bytes(response.content) if response.status_code == 200 else None
+    probe = FetchProbe(
+        url=url,
+        status=store.classify(url, response.status_code, fingerprint),
+        status_code=response.status_code,
+        etag=response.headers.get("ETag"),
+        last_modified=response.headers.get("Last-Modified"),
+        fingerprint=fingerprint,
+    )
+    if probe.changed:
+        probe.text = response.text
+    store.record(probe)
+    return probe
+
+
+# ============================================
+# SINGLETONS
+# ============================================
+
+_stores: dict[str, FetchStateStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_fetch_state_store(namespace: str) -> FetchStateStore:
+    """Get or create the shared store of a scanner (double-checked locking)."""
+    store = _stores.get(namespace)
+    if store is None:
+        with _stores_lock:
+            store = _stores.get(namespace)
+            if store is None:
+                db_path = FETCH_STATE_PERSISTENT_PATH if FETCH_STATE_PERSISTENT_ENABLED else None
+                store = FetchStateStore(namespace, db_path=db_path)
+                _stores[namespace] = store
+                logger.info(
+                    f"🔁 [FETCH-STATE] Initialized {namespace} "
+                    f"({'persistent: ' + db_path if store.persistent else 'memory only'})"
+                )
+    return store
+
+
+def reset_fetch_state_stores() -> None:
+    """Close and drop all shared stores (tests)."""
+    with _stores_lock:
+        for store in _stores.values():
+            store.close()
+        _stores.clear()
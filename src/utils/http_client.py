@@ -178,6 +178,9 @@ RATE_LIMIT_CONFIGS: dict[str, dict] = {
     "fotmob": {"min_interval": 2.0, "jitter_min": 0.0, "jitter_max": 0.5},
     # V8.1: Added rate limiting for news_radar (24/7 component that extracts content from web sources)
     "news_radar": {"min_interval": 2.0, "jitter_min": 0.5, "jitter_max": 1.0},
+    # Conditional probes of News Radar / Browser Monitor sources (src/utils/fetch_state.py):
+    # mostly 304s spread over many hosts, so a short global interval is enough
+    "conditional_fetch": {"min_interval": 0.2, "jitter_min": 0.0, "jitter_max": 0.2},
     "default": {"min_interval": 1.0, "jitter_min": 0.0, "jitter_max": 0.0},
 }
 
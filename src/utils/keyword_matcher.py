@@ -0,0 +1,247 @@
+"""
+EarlyBird Keyword Matcher V1.0
+
+Single-pass multi-pattern keyword matching for the content filters.
+
+Content filtering used to rescan the same article once per keyword list:
+RelevanceAnalyzer.analyze() ran seven large alternation regexes with findall()
+plus a known-club scan, and ExclusionFilter, PositiveNewsFilter,
+TweetRelevanceFilter and NewsRadarMonitor._has_football_keywords() each ran
+their own pattern over the text again.
+
+KeywordMatcher puts every keyword of every category into one character trie
+(Aho-Corasick style goto table over lowercased keywords). A scan lowercases
+the text once (with the case equivalences of re.IGNORECASE), visits only the
+positions where a keyword can start (word starts, plus the first characters
+of boundary-free keywords) and walks the trie from there, so the cost depends
+on the text length and not on the number of keywords or categories.
+
+Boundaries follow the regexes the matcher replaces:
+- "word":   \\b<keyword>\\b
+- "auto":   like RelevanceAnalyzer._compile_pattern(): CJK/Greek/Cyrillic
+            keywords without \\b, all others with \\b (boundary ones first)
+- "prefix": \\b<keyword> (keyword at the start of a word)
+
+Per category, count() and spans() equal len(pattern.findall(text)) and the
+finditer() spans of the replaced alternation regex (leftmost match, first
+listed keyword wins at a position). best() returns the match of the keyword
+listed first, like trying one regex per keyword in list order.
+
+Usage:
+    matcher = KeywordMatcher()
+    matcher.add("INJURY", ["injury", "ruled out", "infortunio"], boundary="auto")
+    matcher.add("TEAM", ["AEK Athens", "PSV"], boundary="word")
+    scan = matcher.scan("AEK Athens striker ruled out")
+    scan.count("INJURY"), scan.best("TEAM")   # (1, "AEK Athens")
+
+V1.0: Initial implementation
+"""
+
+import re
+from collections.abc import Iterable
+from typing import Optional
+
+# Boundary modes
+BOUNDARY_WORD = "word"
+BOUNDARY_AUTO = "auto"
+BOUNDARY_PREFIX = "prefix"
+
+_END = ""  # trie key holding the keywords ending at a node (never a text character)
+
+
+def is_non_latin(text: str) -> bool:
+    """True if text has CJK, Hiragana/Katakana, Greek or Cyrillic characters."""
+    return any(
+        "\u4e00" <= c <= "\u9fff"  # CJK Unified Ideographs (Chinese, Japanese Kanji)
+        or "\u3040" <= c <= "\u30ff"  # Hiragana and Katakana (Japanese)
+        or "\u0370" <= c <= "\u03ff"  # Greek and Coptic
+        or "\u0400" <= c <= "\u04ff"  # Cyrillic
+        for c in text
+    )
+
+
+def _is_word_char(c: str) -> bool:
+    # Same character class as \w in a str regex
+    return c.isalnum() or c == "_"
+
+
+# Characters re.IGNORECASE treats as equal to a different lowercase letter
+# (dotless i, long s, final sigma, Greek symbol variants)
+_CASE_EQUIVALENTS = str.maketrans(
+    {
+        "\u0131": "i",  # ı
+        "\u017f": "s",  # ſ
+        "\u00b5": "\u03bc",  # µ -> μ
+        "\u0345": "\u03b9",  # ypogegrammeni -> ι
+        "\u1fbe": "\u03b9",  # prosgegrammeni -> ι
+        "\u03c2": "\u03c3",  # ς -> σ
+        "\u03d0": "\u03b2",  # ϐ -> β
+        "\u03f5": "\u03b5",  # ϵ -> ε
+        "\u03d1": "\u03b8",  # ϑ -> θ
+        "\u03f0": "\u03ba",  # ϰ -> κ
+        "\u03d6": "\u03c0",  # ϖ -> π
+        "\u03f1": "\u03c1",  # ϱ -> ρ
+        "\u03d5": "\u03c6",  # ϕ -> φ
+        "\u1e9b": "\u1e61",  # ẛ -> ṡ
+    }
+)
+
+
+def _fold(text: str) -> str:
+    """Lowercase as re.IGNORECASE compares, keeping offsets aligned with text."""
+    lowered = text.lower()
+    if len(lowered) != len(text):
+        # e.g. "İ".lower() is "i" + combining dot: use the simple lowercase "i"
+        lowered = "".join(c.lower()[0] for c in text)
+    return lowered.translate(_CASE_EQUIVALENTS)
+
+
+class KeywordScan:
+    """
+    Keyword hits of one text, per category.
+
+    Hits are (start, end, keyword position) tuples in text order: at each
+    start, the hit of the first listed keyword of the category.
+    """
+
+    __slots__ = ("_hits", "_keywords", "_spans")
+
+    def __init__(self, hits: dict[str, list[tuple[int, int, int]]], keywords: dict[str, list[str]]):
+        self._hits = hits
+        self._keywords = keywords
+        self._spans: dict[str, list[tuple[int, int]]] = {}
+
+    def has(self, category: str) -> bool:
+        return bool(self._hits.get(category))
+
+    def spans(self, category: str) -> list[tuple[int, int]]:
+        """Non-overlapping match spans, left to right (regex finditer() order)."""
+        spans = self._spans.get(category)
+        if spans is None:
+            spans = []
+            last_end = 0
+            for start, end, _ in self._hits.get(category, ()):
+                if start >= last_end:
+                    spans.append((start, end))
+                    last_end = end
+            self._spans[category] = spans
+        return spans
+
+    def count(self, category: str) -> int:
+        """Number of non-overlapping matches (len(regex.findall(text)))."""
+        return len(self.spans(category))
+
+    def first(self, category: str) -> Optional[str]:
+        """Keyword of the leftmost match (regex search())."""
+        hits = self._hits.get(category)
+        return self._keywords[category][hits[0][2]] if hits else None
+
+    def best(self, category: str) -> Optional[str]:
+        """Matched keyword listed first in the category (first hit of a per-keyword loop)."""
+        hits = self._hits.get(category)
+        if not hits:
+            return None
+        return self._keywords[category][min(position for _, _, position in hits)]
+
+    def best_span(self, category: str) -> Optional[tuple[int, int]]:
+        """Leftmost span of best()."""
+        hits = self._hits.get(category)
+        if not hits:
+            return None
+        top = min(position for _, _, position in hits)
+        return next((start, end) for start, end, position in hits if position == top)
+
+
+class KeywordMatcher:
+    """
+    Case-insensitive multi-category keyword matcher, one pass per text.
+
+    Categories are added once (add()); scan() is read-only and thread-safe.
+    """
+
+    def __init__(self):
+        self._root: dict = {}
+        self._keywords: dict[str, list[str]] = {}
+        self._free_starts: set[str] = set()  # first chars of keywords without left \b
+        self._starts: Optional[re.Pattern] = None
+
+    @property
+    def categories(self) -> list[str]:
+        return list(self._keywords)
+
+    def add(self, category: str, keywords: Iterable[str], boundary: str = BOUNDARY_WORD) -> None:
+        """Add a keyword category. Keyword order sets precedence, as in a regex alternation."""
+        if category in self._keywords:
+            raise ValueError(f"Category already added: {category}")
+        if boundary not in (BOUNDARY_WORD, BOUNDARY_AUTO, BOUNDARY_PREFIX):
+            raise ValueError(f"Unknown boundary mode: {boundary}")
+
+        keywords = [kw for kw in keywords if kw]
+        self._keywords[category] = keywords
+        if boundary == BOUNDARY_AUTO:
+            # _compile_pattern() puts the boundary group before the boundary-free one
+            order = [i for i, kw in enumerate(keywords) if not is_non_latin(kw)]
+            order += [i for i, kw in enumerate(keywords) if is_non_latin(kw)]
+        else:
+            order = list(range(len(keywords)))
+
+        for priority, position in enumerate(order):
+            keyword = _fold(keywords[position])
+            if boundary == BOUNDARY_AUTO and is_non_latin(keyword):
+                left = right = False
+            else:
+                left, right = True, boundary != BOUNDARY_PREFIX
+            if not left:
+                self._free_starts.add(keyword[0])
+            node = self._root
+            for c in keyword:
+                node = node.setdefault(c, {})
+            node.setdefault(_END, []).append((category, priority, position, left, right))
+        self._starts = None
+
+    def _start_pattern(self) -> re.Pattern:
+        if self._starts is None:
+            pattern = r"\b\w"
+            if self._free_starts:
+                chars = "".join(re.escape(c) for c in sorted(self._free_starts))
+                pattern += f"|[{chars}]"
+            self._starts = re.compile(pattern)
+        return self._starts
+
+    def scan(self, text: str) -> KeywordScan:
+        """Find the keyword hits of every category in one pass over text."""
+        hits: dict[str, list[tuple[int, int, int]]] = {}
+        if not text:
+            return KeywordScan(hits, self._keywords)
+
+        lowered = _fold(text)
+        length = len(lowered)
+        root = self._root
+        for start_match in self._start_pattern().finditer(lowered):
+            start = start_match.start()
+            node = root.get(lowered[start])
+            if node is None:
+                continue
+            word_start = start == 0 or not _is_word_char(lowered[start - 1])
+            # category -> (priority, end, position) of the preferred keyword at this start
+            found: dict[str, tuple[int, int, int]] = {}
+            end = start + 1
+            while True:
+                entries = node.get(_END)
+                if entries:
+                    word_end = end == length or not _is_word_char(lowered[end])
+                    for category, priority, position, left, right in entries:
+                        if (left and not word_start) or (right and not word_end):
+                            continue
+                        current = found.get(category)
+                        if current is None or priority < current[0]:
+                            found[category] = (priority, end, position)
+                if end == length:
+                    break
+                node = node.get(lowered[end])
+                if node is None:
+                    break
+                end += 1
+            for category, (_, match_end, position) in found.items():
+                hits.setdefault(category, []).append((start, match_end, position))
+        return KeywordScan(hits, self._keywords)
@@ -0,0 +1,289 @@
+"""
+EarlyBird Persistent Cache Tier V1.0
+
+On-disk second tier for SmartCache (src/utils/smart_cache.py).
+
+The in-process SWR cache is lost on every restart (run_forever.sh and the
+launcher restart the bot regularly), so each restart re-fetched team details,
+league tables and match details from FotMob at 2s+ per request. This tier
+keeps the same fresh/stale windows in a small SQLite key/value file so a warm
+restart serves stale-while-revalidate entries immediately.
+
+Storage:
+- One row per SWR key: zlib-compressed JSON payload + fresh_until/stale_until
+  (Unix timestamps)
+- SQLite in WAL mode, one connection shared by all threads behind a lock
+- Rows past stale_until are pruned periodically; the oldest rows beyond
+  max_entries are pruned as well
+
+Any SQLite/serialization error disables only the affected operation: the
+cache degrades to memory-only and callers never see an exception.
+
+Usage:
+    tier = PersistentCacheTier("data/cache/fotmob_swr.db")
+    cache = SmartCache(name="fotmob_swr", persistent_tier=tier)
+
+V1.0: Initial implementation
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# ============================================
+# CONFIGURATION
+# ============================================
+
+DEFAULT_MAX_ENTRIES = 20000
+# zlib level: FotMob JSON compresses ~8-10x at level 6 for a fraction of a millisecond
+COMPRESSION_LEVEL = 6
+# Minimum seconds between prune passes (expired rows + max_entries)
+PRUNE_INTERVAL_SECONDS = 600
+
+
+@dataclass
+class PersistentRecord:
+    """A value loaded from disk with its SWR windows."""
+
+    value: Any
+    fresh_until: float  # Unix timestamp
+    stale_until: float  # Unix timestamp
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        return (now if now is not None else time.time()) < self.fresh_until
+
+    def is_usable(self, now: Optional[float] = None) -> bool:
+        return (now if now is not None else time.time()) < self.stale_until
+
+
+class PersistentCacheTier:
+    """
+    SQLite-backed key/value store with TTL and compression.
+
+    Thread-safe: a single connection is shared behind a lock (SQLite
+    serializes writers anyway; reads are sub-millisecond primary-key lookups).
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        should_persist: Optional[Callable[[Any], bool]] = None,
+        compression_level: int = COMPRESSION_LEVEL,
+        prune_interval_seconds: float = PRUNE_INTERVAL_SECONDS,
+    ):
+        """
+        Args:
+            db_path: SQLite file path (parent directory is created if missing)
+            max_entries: Rows kept on disk (oldest updates are pruned first)
+            should_persist: Optional predicate; values it rejects stay memory-only
+                            (e.g. FotMob error dicts)
+            compression_level: zlib level for payloads
+            prune_interval_seconds: Minimum seconds between prune passes
+        """
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.should_persist = should_persist
+        self.compression_level = compression_level
+        self.prune_interval_seconds = prune_interval_seconds
+        self._lock = threading.Lock()
+        self._last_prune = 0.0
+        self._stats = {"reads": 0, "hits": 0, "writes": 0, "skipped": 0, "errors": 0}
+        self._conn: Optional[sqlite3.Connection] = None
+
+        try:
+            directory = os.path.dirname(db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(
+                db_path, timeout=30, check_same_thread=False, isolation_level=None
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS cache_entries (
+                    key TEXT PRIMARY KEY,
+                    payload BLOB NOT NULL,
+                    fresh_until REAL NOT NULL,
+                    stale_until REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_cache_entries_stale_until "
+                "ON cache_entries(stale_until)"
+            )
+            self._conn = conn
+            self.prune()
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"⚠️ [PERSISTENT-CACHE] Disabled, cannot open {db_path}: {e}")
+            self._conn = None
+
+    @property
+    def available(self) -> bool:
+        return self._conn is not None
+
+    def _encode(self, value: Any) -> Optional[bytes]:
+        try:
+            raw = json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+        except (TypeError, ValueError):
+            return None
+        return zlib.compress(raw.encode("utf-8"), self.compression_level)
+
+    @staticmethod
+    def _decode(payload: bytes) -> Any:
+        return json.loads(zlib.decompress(payload).decode("utf-8"))
+
+    def get(self, key: str) -> Optional[PersistentRecord]:
+        """
+        Load a record that is still within its stale window.
+
+        Returns:
+            PersistentRecord, or None if missing, past stale_until or unreadable
+        """
+        if self._conn is None:
+            return None
+        now = time.time()
+        try:
+            with self._lock:
+                self._stats["reads"] += 1
+                row = self._conn.execute(
+                    "SELECT payload, fresh_until, stale_until FROM cache_entries "
+                    "WHERE key = ? AND stale_until > ?",
+                    (key, now),
+                ).fetchone()
+            if row is None:
+                return None
+            record = PersistentRecord(
+                value=self._decode(row[0]), fresh_until=row[1], stale_until=row[2]
+            )
+        except (sqlite3.Error, zlib.error, ValueError) as e:
+            with self._lock:
+                self._stats["errors"] += 1
+            logger.warning(f"⚠️ [PERSISTENT-CACHE] Read failed for {key[:50]}...: {e}")
+            return None
+
+        with self._lock:
+            self._stats["hits"] += 1
+        return record
+
+    def set(self, key: str, value: Any, fresh_until: float, stale_until: float) -> bool:
+        """
+        Store (or replace) a value with its fresh/stale windows.
+
+        Returns:
+            True if written, False if skipped (filtered, not JSON-serializable) or failed
+        """
+        if self._conn is None or value is None:
+            return False
+        if self.should_persist is not None and not self.should_persist(value):
+            with self._lock:
+                self._stats["skipped"] += 1
+            return False
+
+        payload = self._encode(value)
+        if payload is None:
+            with self._lock:
+                self._stats["skipped"] += 1
+            logger.debug(f"📦 [PERSISTENT-CACHE] SKIP (not JSON-serializable): {key[:50]}...")
+            return False
+
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO cache_entries "
+                    "(key, payload, fresh_until, stale_until, updated_at) VALUES (?, ?, ?, ?, ?)",
+                    (key, payload, fresh_until, stale_until, time.time()),
+                )
+                self._stats["writes"] += 1
+        except sqlite3.Error as e:
+            with self._lock:
+                self._stats["errors"] += 1
+            logger.warning(f"⚠️ [PERSISTENT-CACHE] Write failed for {key[:50]}...: {e}")
+            return False
+
+        if time.monotonic() - self._last_prune >= self.prune_interval_seconds:
+            self.prune()
+        return True
+
+    def _execute_write(self, sql: str, params: tuple = ()) -> int:
+        if self._conn is None:
+            return 0
+        try:
+            with self._lock:
+                return self._conn.execute(sql, params).rowcount
+        except sqlite3.Error as e:
+            with self._lock:
+                self._stats["errors"] += 1
+            logger.warning(f"⚠️ [PERSISTENT-CACHE] Write failed: {e}")
+            return 0
+
+    def delete(self, key: str) -> bool:
+        return self._execute_write("DELETE FROM cache_entries WHERE key = ?", (key,)) > 0
+
+    def delete_matching(self, pattern: str) -> int:
+        """Delete rows whose key contains pattern (same semantics as invalidate_pattern)."""
+        escaped = pattern.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        return self._execute_write(
+            "DELETE FROM cache_entries WHERE key LIKE ? ESCAPE '\\'", (f"%{escaped}%",)
+        )
+
+    def clear(self) -> int:
+        return self._execute_write("DELETE FROM cache_entries")
+
+    def prune(self) -> int:
+        """
+        Drop rows past their stale window, then the oldest rows beyond max_entries.
+
+        Returns:
+            Number of rows removed
+        """
+        self._last_prune = time.monotonic()
+        removed = self._execute_write(
+            "DELETE FROM cache_entries WHERE stale_until <= ?", (time.time(),)
+        )
+        removed += self._execute_write(
+            "DELETE FROM cache_entries WHERE key IN ("
+            "SELECT key FROM cache_entries ORDER BY updated_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
+        if removed:
+            logger.debug(f"🧹 [PERSISTENT-CACHE] Pruned {removed} rows from {self.db_path}")
+        return removed
+
+    def size(self) -> int:
+        if self._conn is None:
+            return 0
+        try:
+            with self._lock:
+                return self._conn.execute("SELECT COUNT(*) FROM cache_entries").fetchone()[0]
+        except sqlite3.Error:
+            return 0
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+        stats["available"] = self.available
+        stats["size"] = self.size()
+        stats["path"] = self.db_path
+        return stats
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    self._conn.close()
+                except sqlite3.Error:
+                    pass
+                self._conn = None
@@ -0,0 +1,123 @@
+"""
+EarlyBird Provider Limiter - Per-Provider Concurrency Limits V1.0
+
+Bounds how many threads may be inside a given external provider at once
+when several matches are analyzed in parallel (see src/core/match_scheduler.py).
+
+Providers:
+- fotmob: enrichment calls (the global FotMob rate limiter still spaces requests)
+- search: news hunting (Tavily / Brave / DDG via news_hunter)
+- deepseek: AI triangulation calls
+- telegram: alert delivery (serialized by default)
+
+Usage:
+    from src.utils.provider_limiter import provider_slot
+
+    with provider_slot("deepseek"):
+        analysis = analyze_with_triangulation(...)
+
+Unknown provider names are not limited. In serial mode the semaphores are
+never contended, so wrapping a call costs a single uncontended acquire.
+
+V1.0: Initial implementation
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+try:
+    from config.settings import PROVIDER_CONCURRENCY_LIMITS
+except ImportError:
+    PROVIDER_CONCURRENCY_LIMITS = {"fotmob": 2, "search": 3, "deepseek": 2, "telegram": 1}
+
+
+class ProviderLimiter:
+    """
+    Thread-safe registry of named semaphores, one per external provider.
+
+    Also tracks how long callers waited for a slot so the scheduler can
+    report which provider is the bottleneck of a cycle.
+    """
+
+    def __init__(self, limits: Optional[dict[str, int]] = None):
+        self._limits = dict(limits if limits is not None else PROVIDER_CONCURRENCY_LIMITS)
+        self._semaphores = {
+            name: threading.BoundedSemaphore(max(1, int(limit)))
+            for name, limit in self._limits.items()
+        }
+        self._stats_lock = threading.Lock()
+        self._calls: dict[str, int] = dict.fromkeys(self._limits, 0)
+        self._wait_seconds: dict[str, float] = dict.fromkeys(self._limits, 0.0)
+        self._in_flight: dict[str, int] = dict.fromkeys(self._limits, 0)
+
+    @contextmanager
+    def slot(self, provider: str) -> Iterator[None]:
+        """Hold one concurrency slot for ``provider`` for the duration of the block."""
+        semaphore = self._semaphores.get(provider)
+        if semaphore is None:
+            yield
+            return
+
+        start = time.monotonic()
+        semaphore.acquire()
+        waited = time.monotonic() - start
+        with self._stats_lock:
+            self._calls[provider] += 1
+            self._wait_seconds[provider] += waited
+            self._in_flight[provider] += 1
+        try:
+            yield
+        finally:
+            with self._stats_lock:
+                self._in_flight[provider] -= 1
+            semaphore.release()
+
+    def get_limit(self, provider: str) -> Optional[int]:
+        """Return the configured limit for a provider (None if unlimited)."""
+        return self._limits.get(provider)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return per-provider call counts, cumulative wait time and in-flight calls."""
+        with self._stats_lock:
+            return {
+                name: {
+                    "limit": self._limits[name],
+                    "calls": self._calls[name],
+                    "wait_seconds": round(self._wait_seconds[name], 3),
+                    "in_flight": self._in_flight[name],
+                }
+                for name in self._limits
+            }
+
+    def reset_stats(self) -> None:
+        """Reset call/wait counters (in-flight counts are left untouched)."""
+        with self._stats_lock:
+            for name in self._limits:
+                self._calls[name] = 0
+                self._wait_seconds[name] = 0.0
+
+
+# Singleton instance
+_provider_limiter: Optional[ProviderLimiter] = None
+_provider_limiter_lock = threading.Lock()
+
+
+def get_provider_limiter() -> ProviderLimiter:
+    """Get the process-wide ProviderLimiter singleton."""
+    global _provider_limiter
+    if _provider_limiter is None:
+        with _provider_limiter_lock:
+            if _provider_limiter is None:
+                _provider_limiter = ProviderLimiter()
+    return _provider_limiter
+
+
+def provider_slot(provider: str):
+    """Shortcut for ``get_provider_limiter().slot(provider)``."""
+    return get_provider_limiter().slot(provider)
@@ -0,0 +1,436 @@
+"""
+EarlyBird Provider Response Cache V1.0
+
+Shared cache for paid LLM/search provider responses (DeepSeek, Tavily,
+Brave, Perplexity).
+
+Each provider used to keep its own in-memory dict: DeepSeek sorted the whole
+dict for LRU eviction past 1000 entries, Tavily only dropped expired entries,
+Brave and Perplexity did not cache at all, and everything was lost on
+restart although every call costs quota. This module provides:
+
+- Canonical keys: Unicode NFKC, casefolded, whitespace collapsed, and team
+  names / aliases (TeamNameIndex + static TEAM_ALIASES) replaced by their
+  canonical form, so "Man Utd  injuries" and "manchester united injuries"
+  share an entry. Request parameters are part of the key, order-independent.
+- Per-provider TTL policies (ResponseCachePolicy), including the quota cost
+  of one call so hits translate into quota saved.
+- In-memory LRU front (OrderedDict: O(1) get / insert / evict).
+- Optional SQLite/WAL second tier (PersistentCacheTier), so a restart serves
+  cached responses instead of paying for them again.
+- Hit/miss/quota-saved counters per provider, exported to the orchestration
+  metrics DB by OrchestrationMetricsCollector.
+
+Values must be JSON-serializable to reach the disk tier (providers store
+plain dicts / lists / strings).
+
+Usage:
+    cache = get_response_cache()
+    key = cache.make_key("tavily", query, search_depth="basic", max_results=5)
+    cached = cache.get("tavily", key)
+    if cached is None:
+        cached = call_api(...)
+        cache.set("tavily", key, cached)
+
+V1.0: Initial implementation
+"""
+
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Optional
+
+from config.settings import (
+    BRAVE_CACHE_TTL_SECONDS,
+    DEEPSEEK_CACHE_TTL_SECONDS,
+    PERPLEXITY_CACHE_TTL_SECONDS,
+    RESPONSE_CACHE_MEMORY_ENTRIES,
+    RESPONSE_CACHE_PERSISTENT_ENABLED,
+    RESPONSE_CACHE_PERSISTENT_MAX_ENTRIES,
+    RESPONSE_CACHE_PERSISTENT_PATH,
+    TAVILY_CACHE_TTL_SECONDS,
+)
+from src.utils.persistent_cache import PersistentCacheTier
+from src.utils.team_name_index import TeamNameIndex, get_team_name_index, normalize_team_key
+from src.utils.text_normalizer import TEAM_ALIASES, normalize_unicode
+
+logger = logging.getLogger(__name__)
+
+# ============================================
+# CONFIGURATION
+# ============================================
+
+
+@dataclass(frozen=True)
+class ResponseCachePolicy:
+    """How long a provider's responses stay valid and what one call costs."""
+
+    ttl_seconds: int
+    quota_cost: float = 1.0  # API calls / credits saved per hit
+
+
+DEFAULT_POLICY = ResponseCachePolicy(ttl_seconds=1800)
+
+PROVIDER_POLICIES: dict[str, ResponseCachePolicy] = {
+    "deepseek": ResponseCachePolicy(ttl_seconds=DEEPSEEK_CACHE_TTL_SECONDS),
+    "tavily": ResponseCachePolicy(ttl_seconds=TAVILY_CACHE_TTL_SECONDS),
+    "brave": ResponseCachePolicy(ttl_seconds=BRAVE_CACHE_TTL_SECONDS),
+    "perplexity": ResponseCachePolicy(ttl_seconds=PERPLEXITY_CACHE_TTL_SECONDS),
+}
+
+# Longest team name / alias phrase (in tokens) looked up while canonicalizing
+MAX_ALIAS_PHRASE_TOKENS = 4
+# Single-token aliases shorter than this are ignored ("sep", "fla", "gala" are
+# common words or abbreviations far more often than team names)
+MIN_SINGLE_TOKEN_ALIAS_LEN = 5
+
+_WHITESPACE = re.compile(r"\s+")
+_EDGE_PUNCTUATION = re.compile(r"^(\W*)(.*?)(\W*)$", re.DOTALL)
+
+
+# ============================================
+# CANONICAL KEYS
+# ============================================
+
+
+@lru_cache(maxsize=16384)
+def _token_form(token: str) -> str:
+    return normalize_team_key(token)
+
+
+class QueryCanonicalizer:
+    """
+    Canonical form of a query / prompt for cache keys.
+
+    Team phrases (up to MAX_ALIAS_PHRASE_TOKENS tokens, longest match first)
+    found in the static alias table or the team-name index are replaced by
+    the normalized canonical team name; edge punctuation (quotes, commas) of
+    a replaced phrase is kept. Everything else is only casefolded and
+    whitespace-collapsed, so punctuation that changes a search (quoted
+    phrases, operators) still yields a different key.
+    """
+
+    def __init__(
+        self,
+        team_index: Optional[TeamNameIndex] = None,
+        team_index_factory: Optional[Callable[[], Optional[TeamNameIndex]]] = None,
+        static_aliases: dict[str, list[str]] = TEAM_ALIASES,
+        max_phrase_tokens: int = MAX_ALIAS_PHRASE_TOKENS,
+    ):
+        """
+        Args:
+            team_index: Team-name index to resolve aliases with
+            team_index_factory: Called once on first use when team_index is None
+            static_aliases: canonical name -> aliases (text_normalizer.TEAM_ALIASES)
+            max_phrase_tokens: Longest phrase looked up
+        """
+        self._team_index = team_index
+        self._team_index_factory = team_index_factory
+        self.max_phrase_tokens = max_phrase_tokens
+        self._static_forms: dict[str, str] = {}
+        for canonical, aliases in static_aliases.items():
+            canonical_form = normalize_team_key(canonical)
+            for alias in (canonical, *aliases):
+                form = normalize_team_key(alias)
+                if self._usable_form(form):
+                    self._static_forms.setdefault(form, canonical_form)
+        self._canonical_forms: dict[str, str] = {}
+
+    @staticmethod
+    def _usable_form(form: str) -> bool:
+        return bool(form) and (" " in form or len(form) >= MIN_SINGLE_TOKEN_ALIAS_LEN)
+
+    def _index(self) -> Optional[TeamNameIndex]:
+        if self._team_index is None and self._team_index_factory is not None:
+            factory, self._team_index_factory = self._team_index_factory, None
+            try:
+                self._team_index = factory()
+            except Exception as e:
+                logger.debug(f"[RESPONSE-CACHE] Team index unavailable: {e}")
+        return self._team_index
+
+    def _resolve_form(self, form: str, index: Optional[TeamNameIndex]) -> Optional[str]:
+        if not self._usable_form(form):
+            return None
+        static = self._static_forms.get(form)
+        name = index.owner_of_form(static or form) if index is not None else None
+        if name is None:
+            return static
+        canonical = self._canonical_forms.get(name)
+        if canonical is None:
+            canonical = self._canonical_forms[name] = normalize_team_key(name)
+        return canonical
+
+    def canonicalize(self, text: Optional[str]) -> str:
+        """Canonical form of text (empty string for None / blank)."""
+        if not text:
+            return ""
+        tokens = _WHITESPACE.sub(" ", normalize_unicode(text).casefold()).strip().split(" ")
+        if tokens == [""]:
+            return ""
+        forms = [_token_form(token) for token in tokens]
+        index = self._index()
+
+        out: list[str] = []
+        i = 0
+        while i < len(tokens):
+            replaced = False
+            if forms[i]:
+                longest = min(self.max_phrase_tokens, len(tokens) - i)
+                for size in range(longest, 0, -1):
+                    window = forms[i : i + size]
+                    if not all(window):
+                        continue
+                    canonical = self._resolve_form(" ".join(window), index)
+                    if canonical is None:
+                        continue
+                    leading = _EDGE_PUNCTUATION.match(tokens[i]).group(1)
+                    trailing = _EDGE_PUNCTUATION.match(tokens[i + size - 1]).group(3)
+                    out.append(f"{leading}{canonical}{trailing}")
+                    i += size
+                    replaced = True
+                    break
+            if not replaced:
+                out.append(tokens[i])
+                i += 1
+        return " ".join(out)
+
+
+# ============================================
+# CACHE
+# ============================================
+
+
+class ResponseCache:
+    """
+    Provider response cache: in-memory LRU over an optional SQLite tier.
+
+    Thread-safe: the memory tier and counters share one lock; disk access is
+    serialized by PersistentCacheTier.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        memory_entries: int = RESPONSE_CACHE_MEMORY_ENTRIES,
+        persistent_max_entries: int = RESPONSE_CACHE_PERSISTENT_MAX_ENTRIES,
+        policies: Optional[dict[str, ResponseCachePolicy]] = None,
+        canonicalizer: Optional[QueryCanonicalizer] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Args:
+            db_path: SQLite file for the persistent tier (None = memory only)
+            memory_entries: LRU bound of the memory tier
+            persistent_max_entries: Row bound of the persistent tier
+            policies: provider -> policy (defaults to PROVIDER_POLICIES)
+            canonicalizer: Query canonicalizer (defaults to static aliases only)
+            clock: Wall-clock source (tests)
+        """
+        self.memory_entries = max(1, memory_entries)
+        self.policies = dict(PROVIDER_POLICIES if policies is None else policies)
+        self.canonicalizer = canonicalizer or QueryCanonicalizer()
+        self._clock = clock
+        self._lock = threading.Lock()
+        # key -> (value, expires_at), least recently used first
+        self._memory: OrderedDict[str, tuple[Any, float]] = OrderedDict()
+        self._stats: dict[str, dict[str, float]] = {}
+        self._persistent = (
+            PersistentCacheTier(db_path, max_entries=persistent_max_entries) if db_path else None
+        )
+
+    def policy(self, provider: str) -> ResponseCachePolicy:
+        return self.policies.get(provider, DEFAULT_POLICY)
+
+    @property
+    def persistent(self) -> bool:
+        return self._persistent is not None and self._persistent.available
+
+    # ---------- keys ----------
+
+    def canonicalize(self, text: Optional[str]) -> str:
+        return self.canonicalizer.canonicalize(text)
+
+    def make_key(self, provider: str, *texts: Optional[str], **params: Any) -> str:
+        """
+        Cache key for a provider call.
+
+        Args:
+            provider: Provider name (also the key prefix)
+            *texts: Query / prompt texts, canonicalized
+            **params: Other request parameters, compared as-is (order-independent)
+
+        Returns:
+            "<provider>:<sha256>"
+        """
+        canonical = "\x1f".join(self.canonicalize(text) for text in texts)
+        material = f"{canonical}\x1e{json.dumps(params, sort_keys=True, default=str)}"
+        return f"{provider}:{hashlib.sha256(material.encode()).hexdigest()}"
+
+    # ---------- lookups ----------
+
+    def _count(self, provider: str, counter: str, amount: float = 1) -> None:
+        stats = self._stats.get(provider)
+        if stats is None:
+            stats = self._stats[provider] = {
+                "hits": 0,
+                "memory_hits": 0,
+                "disk_hits": 0,
+                "misses": 0,
+                "writes": 0,
+                "quota_saved": 0.0,
+            }
+        stats[counter] += amount
+
+    def _remember_locked(self, key: str, value: Any, expires_at: float) -> None:
+        self._memory[key] = (value, expires_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, provider: str, key: str, quota_cost: Optional[float] = None) -> Any:
+        """
+        Cached response, or None on miss / expiry.
+
+        Args:
+            provider: Provider name (selects the stats bucket)
+            key: Key from make_key()
+            quota_cost: Quota one call would have cost (defaults to the policy's)
+        """
+        cost = self.policy(provider).quota_cost if quota_cost is None else quota_cost
+        now = self._clock()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if entry[1] > now:
+                    self._memory.move_to_end(key)
+                    self._count(provider, "hits")
+                    self._count(provider, "memory_hits")
+                    self._count(provider, "quota_saved", cost)
+                    return entry[0]
+                del self._memory[key]
+
+        record = self._persistent.get(key) if self._persistent is not None else None
+        with self._lock:
+            if record is not None and record.stale_until > now:
+                self._remember_locked(key, record.value, record.stale_until)
+                self._count(provider, "hits")
+                self._count(provider, "disk_hits")
+                self._count(provider, "quota_saved", cost)
+                return record.value
+            self._count(provider, "misses")
+        return None
+
+    def set(self, provider: str, key: str, value: Any, ttl_seconds: Optional[int] = None) -> None:
+        """Store a response for the provider's TTL (or ttl_seconds)."""
+        if value is None:
+            return
+        ttl = self.policy(provider).ttl_seconds if ttl_seconds is None else ttl_seconds
+        expires_at = self._clock() + ttl
+        with self._lock:
+            self._remember_locked(key, value, expires_at)
+            self._count(provider, "writes")
+        if self._persistent is not None:
+            self._persistent.set(key, value, expires_at, expires_at)
+
+    def contains(self, key: str) -> bool:
+        """True if key is in the memory tier (expired or not)."""
+        with self._lock:
+            return key in self._memory
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            self._memory.pop(key, None)
+        if self._persistent is not None:
+            self._persistent.delete(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+        if self._persistent is not None:
+            self._persistent.clear()
+
+    def size(self) -> int:
+        with self._lock:
+            return len(self._memory)
+
+    # ---------- stats ----------
+
+    def provider_stats(self, provider: str) -> dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats.get(provider, {}))
+        lookups = stats.get("hits", 0) + stats.get("misses", 0)
+        stats["hit_rate_percent"] = round(stats.get("hits", 0) / lookups * 100, 2) if lookups else 0
+        return stats
+
+    def get_stats(self) -> dict[str, Any]:
+        """Per-provider counters plus tier sizes (exported to orchestration metrics)."""
+        with self._lock:
+            providers = list(self._stats)
+            memory_size = len(self._memory)
+        stats: dict[str, Any] = {
+            "providers": {provider: self.provider_stats(provider) for provider in providers},
+            "memory_entries": memory_size,
+            "persistent": self._persistent.get_stats() if self._persistent is not None else None,
+        }
+        totals = {"hits": 0, "misses": 0, "quota_saved": 0.0}
+        for provider_stats in stats["providers"].values():
+            for counter in totals:
+                totals[counter] += provider_stats.get(counter, 0)
+        stats.update(totals)
+        return stats
+
+    def close(self) -> None:
+        if self._persistent is not None:
+            self._persistent.close()
+
+
+# ============================================
+# SINGLETON INSTANCE
+# ============================================
+
+_response_cache: Optional[ResponseCache] = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """Get or create the shared provider response cache (double-checked locking)."""
+    global _response_cache
+    if _response_cache is None:
+        with _response_cache_lock:
+            if _response_cache is None:
+                db_path = (
+                    RESPONSE_CACHE_PERSISTENT_PATH if RESPONSE_CACHE_PERSISTENT_ENABLED else None
+                )
+                _response_cache = ResponseCache(
+                    db_path=db_path,
+                    canonicalizer=QueryCanonicalizer(
+                        team_index_factory=lambda: get_team_name_index(refresh=False)
+                    ),
+                )
+                logger.info(
+                    "💾 [RESPONSE-CACHE] Initialized "
+                    f"({'persistent: ' + db_path if db_path else 'memory only'})"
+                )
+    return _response_cache
+
+
+def peek_response_cache() -> Optional[ResponseCache]:
+    """The shared cache if a provider has created it, else None (metrics export)."""
+    return _response_cache
+
+
+def reset_response_cache() -> None:
+    """Drop the shared instance (test isolation)."""
+    global _response_cache
+    with _response_cache_lock:
+        if _response_cache is not None:
+            _response_cache.close()
+        _response_cache = None
@@ -28,6 +28,9 @@ Features:
 V1.0: Initial implementation for unified deduplication.
 
 Phase 1 Critical Fix: Added Unicode normalization for consistent text handling
+
+V15.0: Fuzzy (simhash) lookups use a banded index (SimhashIndex) instead of a
+linear Hamming scan over every cached simhash.
 """
 
 import hashlib
@@ -35,11 +38,20 @@ import logging
 import os
 import re
 import threading
-from collections import OrderedDict
+from collections import Counter, OrderedDict
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Any
 from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -132,6 +144,50 @@ def compute_content_hash(content: str, prefix_length: int = 1000) -> str:
     return hashlib.sha256(prefix.encode("utf-8", errors="ignore")).hexdigest()[:16]
 
 
+# V15.0: Simhash tokenization + bounded LRU of per-token hashes (tokens repeat across articles)
+_SIMHASH_TOKEN_PATTERN = re.compile(r"\b\w{3,}\b")  # Words with 3+ chars
+SIMHASH_TOKEN_CACHE_SIZE = 65536
+_SIMHASH_SHIFTS = np.arange(64, dtype=np.uint64) if NUMPY_AVAILABLE else None
+
+
+@lru_cache(maxsize=SIMHASH_TOKEN_CACHE_SIZE)
+def _token_hash64(token: str) -> int:
+    """Low 64 bits of the token's MD5 (same bits the original per-token loop used)."""
+    return int.from_bytes(hashlib.md5(token.encode("utf-8")).digest()[8:], "big")
+
+
+def _tokenize_for_simhash(content: str) -> list[str]:
+    return _SIMHASH_TOKEN_PATTERN.findall(content.lower())
+
+
+def _simhash_from_counts(counts: Counter, total: int) -> int:
+    """Build a 64-bit simhash from token counts (bit set if more than half the tokens set it)."""
+    if NUMPY_AVAILABLE:
+        hashes = np.fromiter(
+            (_token_hash64(token) for token in counts), dtype=np.uint64, count=len(counts)
+        )
+        weights = np.fromiter(counts.values(), dtype=np.int64, count=len(counts))
+        bits = ((hashes[:, None] >> _SIMHASH_SHIFTS) & np.uint64(1)).astype(np.int64)
+        return _pack_simhash_bits(2 * (weights @ bits) > total)
+
+    ones = [0] * 64
+    for token, weight in counts.items():
+        word_hash = _token_hash64(token)
+        for i in range(64):
+            if word_hash >> i & 1:
+                ones[i] += weight
+    simhash = 0
+    for i in range(64):
+        if 2 * ones[i] > total:
+            simhash |= 1 << i
+    return simhash
+
+
+def _pack_simhash_bits(bit_set) -> int:
+    """Pack a 64-element boolean array (index = bit position) into an int."""
+    return int.from_bytes(np.packbits(bit_set[::-1]).tobytes(), "big")
+
+
 def compute_simhash(content: str, hash_bits: int = 64) -> int:
     """
     V7.3: Compute simhash for fuzzy content matching.
@@ -145,6 +201,9 @@ def compute_simhash(content: str, hash_bits: int = 64) -> int:
     3. For each bit position, sum +1 if bit is 1, -1 if bit is 0
     4. Final hash: bit is 1 if sum > 0, else 0
 
+    V15.0: Same output, computed per unique token with cached token hashes
+    and NumPy bit accumulation instead of a 64-step loop per word.
+
     Args:
         content: Text content to hash
         hash_bits: Number of bits in hash (default 64)
@@ -155,29 +214,23 @@ def compute_simhash(content: str, hash_bits: int = 64) -> int:
     if not content:
         return 0
 
-    # Normalize and tokenize
-    content_lower = content.lower()
-    # Remove punctuation and split into words
-    words = re.findall(r"\b\w{3,}\b", content_lower)  # Words with 3+ chars
-
+    words = _tokenize_for_simhash(content)
     if not words:
         return 0
 
-    # Initialize bit sums
-    bit_sums = [0] * hash_bits
+    if hash_bits == 64:
+        return _simhash_from_counts(Counter(words), len(words))
 
+    # Non-default widths: original per-bit accumulation over the full MD5
+    bit_sums = [0] * hash_bits
     for word in words:
-        # Hash the word
         word_hash = int(hashlib.md5(word.encode("utf-8")).hexdigest(), 16)
-
-        # Update bit sums
         for i in range(hash_bits):
             if word_hash & (1 << i):
                 bit_sums[i] += 1
             else:
                 bit_sums[i] -= 1
 
-    # Build final hash
     simhash = 0
     for i in range(hash_bits):
         if bit_sums[i] > 0:
@@ -186,6 +239,49 @@ def compute_simhash(content: str, hash_bits: int = 64) -> int:
     return simhash
 
 
+def compute_simhashes(contents: list[str | None]) -> list[int]:
+    """
+    V15.0: Bulk compute_simhash() for a whole scan batch.
+
+    Each distinct token in the batch is hashed once and its bits unpacked
+    once; every content then sums the bit rows of its tokens. Output is
+    identical to calling compute_simhash() on each item (0 for empty items).
+
+    Args:
+        contents: Text contents (None/empty allowed)
+
+    Returns:
+        List of simhashes aligned with ``contents``
+    """
+    if not NUMPY_AVAILABLE:
+        return [compute_simhash(content) for content in contents]
+
+    token_lists = [_tokenize_for_simhash(content) if content else [] for content in contents]
+
+    vocabulary: dict[str, int] = {}
+    for tokens in token_lists:
+        for token in tokens:
+            if token not in vocabulary:
+                vocabulary[token] = len(vocabulary)
+    if not vocabulary:
+        return [0] * len(contents)
+
+    hashes = np.fromiter(
+        (_token_hash64(token) for token in vocabulary), dtype=np.uint64, count=len(vocabulary)
+    )
+    bits = ((hashes[:, None] >> _SIMHASH_SHIFTS) & np.uint64(1)).astype(np.int32)
+
+    simhashes = []
+    for tokens in token_lists:
+        if not tokens:
+            simhashes.append(0)
+            continue
+        rows = np.fromiter((vocabulary[t] for t in tokens), dtype=np.intp, count=len(tokens))
+        ones = bits[rows].sum(axis=0)
+        simhashes.append(_pack_simhash_bits(2 * ones > len(tokens)))
+    return simhashes
+
+
 def hamming_distance(hash1: int, hash2: int) -> int:
     """
     Compute Hamming distance between two hashes.
@@ -200,12 +296,97 @@ def hamming_distance(hash1: int, hash2: int) -> int:
     Returns:
         Number of differing bits
     """
-    xor = hash1 ^ hash2
-    distance = 0
-    while xor:
-        distance += xor & 1
-        xor >>= 1
-    return distance
+    return (hash1 ^ hash2).bit_count()
+
+
+class SimhashIndex:
+    """
+    V15.0: Banded (pigeonhole) index for near-duplicate simhash lookups.
+
+    The hash is split into ``max_distance + 1`` disjoint bit bands. Two hashes
+    within ``max_distance`` differing bits must agree exactly on at least one
+    band, so a lookup only has to compare against hashes sharing a band value
+    instead of scanning the whole cache. With the default 64 bits and
+    threshold 3 this gives 4 bands x 16 bits.
+
+    Not thread-safe on its own: SharedContentCache guards it with its lock.
+    """
+
+    def __init__(self, hash_bits: int = 64, max_distance: int = 3):
+        self.hash_bits = hash_bits
+        self.max_distance = max_distance
+
+        num_bands = max_distance + 1
+        base, extra = divmod(hash_bits, num_bands)
+        self._bands: list[tuple[int, int]] = []  # (shift, mask)
+        shift = 0
+        for i in range(num_bands):
+            width = base + (1 if i < extra else 0)
+            self._bands.append((shift, (1 << width) - 1))
+            shift += width
+
+        # One table per band: band value -> simhashes having that value
+        self._tables: list[dict[int, set[int]]] = [{} for _ in self._bands]
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _keys(self, simhash: int):
+        for shift, mask in self._bands:
+            yield (simhash >> shift) & mask
+
+    def add(self, simhash: int) -> None:
+        """Index a simhash (no-op if already present)."""
+        added = False
+        for table, key in zip(self._tables, self._keys(simhash), strict=True):
+            bucket = table.setdefault(key, set())
+            if simhash not in bucket:
+                bucket.add(simhash)
+                added = True
+        if added:
+            self._size += 1
+
+    def remove(self, simhash: int) -> None:
+        """Remove a simhash from the index (no-op if absent)."""
+        removed = False
+        for table, key in zip(self._tables, self._keys(simhash), strict=True):
+            bucket = table.get(key)
+            if bucket and simhash in bucket:
+                bucket.discard(simhash)
+                removed = True
+                if not bucket:
+                    del table[key]
+        if removed:
+            self._size -= 1
+
+    def candidates(self, simhash: int) -> set[int]:
+        """Return every indexed simhash that shares at least one band with ``simhash``."""
+        found: set[int] = set()
+        for table, key in zip(self._tables, self._keys(simhash), strict=True):
+            bucket = table.get(key)
+            if bucket:
+                found.update(bucket)
+        return found
+
+    def query(self, simhash: int) -> list[tuple[int, int]]:
+        """
+        Return (simhash, distance) pairs within max_distance, closest first.
+
+        Exact: every hash within max_distance is guaranteed to be a candidate.
+        """
+        matches = []
+        for candidate in self.candidates(simhash):
+            distance = (candidate ^ simhash).bit_count()
+            if distance <= self.max_distance:
+                matches.append((candidate, distance))
+        matches.sort(key=lambda item: item[1])
+        return matches
+
+    def clear(self) -> None:
+        for table in self._tables:
+            table.clear()
+        self._size = 0
 
 
 class SharedContentCache:
@@ -269,6 +450,9 @@ class SharedContentCache:
         # V7.3: Simhash cache for fuzzy matching: simhash -> (timestamp, source, content_preview)
         self._simhash_cache: OrderedDict[int, tuple[datetime, str, str]] = OrderedDict()
 
+        # V15.0: Banded index over _simhash_cache keys (kept in sync by _store/_remove_simhash)
+        self._simhash_index = SimhashIndex(max_distance=self.SIMHASH_THRESHOLD)
+
         # V14.0 COVE FIX: Use single threading.RLock for all operations (fixes race condition between async and sync)
         # RLock allows the same thread to acquire the lock multiple times (useful for methods that call other methods)
         self._lock = threading.RLock()
@@ -284,7 +468,11 @@ class SharedContentCache:
         }
 
     def is_duplicate(
-        self, content: str | None = None, url: str | None = None, source: str = "unknown"
+        self,
+        content: str | None = None,
+        url: str | None = None,
+        source: str = "unknown",
+        simhash: int | None = None,
     ) -> bool:
         """
         Check if content or URL is a duplicate.
@@ -298,6 +486,7 @@ class SharedContentCache:
             content: Text content to check (optional)
             url: URL to check (optional)
             source: Source component for statistics
+            simhash: Precomputed compute_simhash(content) (e.g. from compute_simhashes())
 
         Returns:
             True if duplicate, False otherwise
@@ -350,32 +539,60 @@ class SharedContentCache:
 
             # V7.3: Check simhash (fuzzy match)
             if content and self._enable_fuzzy:
-                content_simhash = compute_simhash(content)
+                content_simhash = compute_simhash(content) if simhash is None else simhash
                 if content_simhash:
-                    for cached_simhash, (cached_time, cached_source, preview) in list(
-                        self._simhash_cache.items()
-                    ):
-                        # Check expiration
-                        if now - cached_time > timedelta(hours=self._ttl_hours):
-                            del self._simhash_cache[cached_simhash]
-                            continue
-
-                        # Check similarity
-                        distance = hamming_distance(content_simhash, cached_simhash)
-                        if distance <= self.SIMHASH_THRESHOLD:
-                            self._simhash_cache.move_to_end(cached_simhash)
-                            self._stats[source]["duplicates"] += 1
-                            self._stats[source]["fuzzy_matches"] += 1
-                            logger.debug(
-                                f"🔄 [SHARED-CACHE] Fuzzy duplicate detected "
-                                f"(distance={distance}, original: {cached_source})"
-                            )
-                            return True
+                    match = self._find_similar_simhash(content_simhash, now)
+                    if match:
+                        distance, cached_source = match
+                        self._stats[source]["duplicates"] += 1
+                        self._stats[source]["fuzzy_matches"] += 1
+                        logger.debug(
+                            f"🔄 [SHARED-CACHE] Fuzzy duplicate detected "
+                            f"(distance={distance}, original: {cached_source})"
+                        )
+                        return True
 
             return False
 
+    def _find_similar_simhash(self, content_simhash: int, now: datetime) -> tuple[int, str] | None:
+        """
+        V15.0: Find a live cached simhash within SIMHASH_THRESHOLD (caller holds the lock).
+
+        Uses the banded index, so only hashes sharing a band are compared.
+        Expired candidates found along the way are removed.
+
+        Returns:
+            (distance, original_source) of the closest live match, or None
+        """
+        ttl = timedelta(hours=self._ttl_hours)
+        for cached_simhash, distance in self._simhash_index.query(content_simhash):
+            cached_time, cached_source, _preview = self._simhash_cache[cached_simhash]
+            if now - cached_time > ttl:
+                self._remove_simhash(cached_simhash)
+                continue
+            self._simhash_cache.move_to_end(cached_simhash)
+            return distance, cached_source
+        return None
+
+    def _store_simhash(self, content_simhash: int, now: datetime, source: str, preview: str):
+        """V15.0: Insert a simhash into cache + index, evicting LRU entries at capacity."""
+        while len(self._simhash_cache) >= self._max_entries // 3:
+            oldest, _ = self._simhash_cache.popitem(last=False)
+            self._simhash_index.remove(oldest)
+        self._simhash_cache[content_simhash] = (now, source, preview)
+        self._simhash_index.add(content_simhash)
+
+    def _remove_simhash(self, cached_simhash: int) -> None:
+        """V15.0: Remove a simhash from cache + index."""
+        self._simhash_cache.pop(cached_simhash, None)
+        self._simhash_index.remove(cached_simhash)
+
     def mark_seen(
-        self, content: str | None = None, url: str | None = None, source: str = "unknown"
+        self,
+        content: str | None = None,
+        url: str | None = None,
+        source: str = "unknown",
+        simhash: int | None = None,
     ) -> None:
         """
         Mark content and/or URL as seen.
@@ -387,6 +604,7 @@ class SharedContentCache:
             content: Text content to mark
             url: URL to mark
             source: Source component for statistics
+            simhash: Precomputed compute_simhash(content) (e.g. from compute_simhashes())
         V14.0 COVE FIX: Made synchronous to use threading.RLock for thread-safe concurrent access
         """
         if not content and not url:
@@ -411,15 +629,11 @@ class SharedContentCache:
 
                 # V7.3: Add simhash for fuzzy matching
                 if self._enable_fuzzy:
-                    content_simhash = compute_simhash(content)
+                    content_simhash = compute_simhash(content) if simhash is None else simhash
                     if content_simhash:
-                        # Evict oldest if at capacity
-                        while len(self._simhash_cache) >= self._max_entries // 3:
-                            self._simhash_cache.popitem(last=False)
-
-                        # Store with content preview for debugging
+                        # Store with content preview for debugging (evicts oldest at capacity)
                         preview = content[:100] if content else ""
-                        self._simhash_cache[content_simhash] = (now, source, preview)
+                        self._store_simhash(content_simhash, now, source, preview)
 
             # Add URL
             if url:
@@ -434,7 +648,11 @@ class SharedContentCache:
             self._stats[source]["added"] += 1
 
     def check_and_mark(
-        self, content: str | None = None, url: str | None = None, source: str = "unknown"
+        self,
+        content: str | None = None,
+        url: str | None = None,
+        source: str = "unknown",
+        simhash: int | None = None,
     ) -> bool:
         """
         Atomic check-and-mark operation.
@@ -448,6 +666,7 @@ class SharedContentCache:
             content: Text content
             url: URL
             source: Source component
+            simhash: Precomputed compute_simhash(content) (e.g. from compute_simhashes())
 
         Returns:
             True if duplicate (skip processing), False if new (proceed)
@@ -495,25 +714,13 @@ class SharedContentCache:
                         del self._url_cache[normalized_url]
 
             # V7.3: Check simhash (fuzzy match)
+            content_simhash = 0
             if not is_dup and content and self._enable_fuzzy:
-                content_simhash = compute_simhash(content)
-                if content_simhash:
-                    for cached_simhash, (cached_time, cached_source, preview) in list(
-                        self._simhash_cache.items()
-                    ):
-                        # Check expiration
-                        if now - cached_time > timedelta(hours=self._ttl_hours):
-                            del self._simhash_cache[cached_simhash]
-                            continue
-
-                        # Check similarity
-                        distance = hamming_distance(content_simhash, cached_simhash)
-                        if distance <= self.SIMHASH_THRESHOLD:
-                            self._simhash_cache.move_to_end(cached_simhash)
-                            self._stats[source]["duplicates"] += 1
-                            self._stats[source]["fuzzy_matches"] += 1
-                            is_dup = True
-                            break
+                content_simhash = compute_simhash(content) if simhash is None else simhash
+                if content_simhash and self._find_similar_simhash(content_simhash, now):
+                    self._stats[source]["duplicates"] += 1
+                    self._stats[source]["fuzzy_matches"] += 1
+                    is_dup = True
 
             # Mark as seen if not duplicate
             if not is_dup:
@@ -527,15 +734,10 @@ class SharedContentCache:
                             self._content_cache.popitem(last=False)
                         self._content_cache[content_hash] = (now, source)
 
-                    # V7.3: Add simhash for fuzzy matching
-                    if self._enable_fuzzy:
-                        content_simhash = compute_simhash(content)
-                        if content_simhash:
-                            # Evict oldest if at capacity
-                            while len(self._simhash_cache) >= self._max_entries // 3:
-                                self._simhash_cache.popitem(last=False)
-                            preview = content[:100] if content else ""
-                            self._simhash_cache[content_simhash] = (now, source, preview)
+                    # V7.3: Add simhash for fuzzy matching (computed during the check above)
+                    if self._enable_fuzzy and content_simhash:
+                        preview = content[:100] if content else ""
+                        self._store_simhash(content_simhash, now, source, preview)
 
                 if url:
                     normalized_url = normalize_url(url)
@@ -590,7 +792,7 @@ class SharedContentCache:
                 if now - ts > timedelta(hours=self._ttl_hours)
             ]
             for sh in expired_simhash:
-                del self._simhash_cache[sh]
+                self._remove_simhash(sh)
                 removed += 1
 
         if removed > 0:
@@ -626,6 +828,7 @@ class SharedContentCache:
             self._content_cache.clear()
             self._url_cache.clear()
             self._simhash_cache.clear()  # V7.3
+            self._simhash_index.clear()  # V15.0
 
     def size(self) -> int:
         """
@@ -638,7 +841,11 @@ class SharedContentCache:
     # V14.0 COVE FIX: Async wrappers for backward compatibility with async code (e.g., News Radar)
     # These use asyncio.to_thread() to call the synchronous methods from async contexts
     async def is_duplicate_async(
-        self, content: str | None = None, url: str | None = None, source: str = "unknown"
+        self,
+        content: str | None = None,
+        url: str | None = None,
+        source: str = "unknown",
+        simhash: int | None = None,
     ) -> bool:
         """
         Async wrapper for is_duplicate for async contexts.
@@ -646,10 +853,14 @@ class SharedContentCache:
         """
         import asyncio
 
-        return await asyncio.to_thread(self.is_duplicate, content, url, source)
+        return await asyncio.to_thread(self.is_duplicate, content, url, source, simhash)
 
     async def mark_seen_async(
-        self, content: str | None = None, url: str | None = None, source: str = "unknown"
+        self,
+        content: str | None = None,
+        url: str | None = None,
+        source: str = "unknown",
+        simhash: int | None = None,
     ) -> None:
         """
         Async wrapper for mark_seen for async contexts.
@@ -657,10 +868,14 @@ class SharedContentCache:
         """
         import asyncio
 
-        await asyncio.to_thread(self.mark_seen, content, url, source)
+        await asyncio.to_thread(self.mark_seen, content, url, source, simhash)
 
     async def check_and_mark_async(
-        self, content: str | None = None, url: str | None = None, source: str = "unknown"
+        self,
+        content: str | None = None,
+        url: str | None = None,
+        source: str = "unknown",
+        simhash: int | None = None,
     ) -> bool:
         """
         Async wrapper for check_and_mark for async contexts.
@@ -668,7 +883,7 @@ class SharedContentCache:
         """
         import asyncio
 
-        return await asyncio.to_thread(self.check_and_mark, content, url, source)
+        return await asyncio.to_thread(self.check_and_mark, content, url, source, simhash)
 
     # V14.0 COVE FIX: Backward compatibility aliases for sync methods
     # These are kept for backward compatibility with existing code that uses _sync suffix
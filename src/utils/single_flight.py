@@ -0,0 +1,129 @@
+"""
+EarlyBird Single-Flight V1.0
+
+Coalesces concurrent identical calls into one execution.
+
+When several threads ask for the same key while a call for that key is still
+running, only the first thread (the leader) executes the function; the others
+wait and receive the leader's result (or its exception). Nothing is cached:
+once the call finishes, the next request for the key executes again, so this
+sits in front of the HTTP layer and behind any TTL cache.
+
+Usage:
+    flight = SingleFlight(name="fotmob")
+    resp = flight.do(url, lambda: session.get(url))
+    flight.get_stats()  # {"executions": ..., "coalesced": ..., ...}
+
+V1.0: Initial implementation
+"""
+
+import logging
+import threading
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class _Call:
+    """One in-flight execution shared by its leader and waiters."""
+
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+        self.waiters = 0
+
+
+@dataclass
+class SingleFlightStats:
+    """Counters for a SingleFlight group."""
+
+    executions: int = 0  # Calls that actually ran
+    coalesced: int = 0  # Calls served by another caller's execution (requests saved)
+    max_waiters: int = 0  # Largest number of callers sharing one execution
+
+    def saved_pct(self) -> float:
+        total = self.executions + self.coalesced
+        return (self.coalesced / total * 100) if total > 0 else 0.0
+
+
+class SingleFlight:
+    """
+    Thread-safe single-flight group keyed by any hashable value.
+
+    Thread Safety:
+        do() may be called from any thread; the function runs in the leader's
+        thread, outside the group lock.
+    """
+
+    def __init__(self, name: str = "default"):
+        self.name = name
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+        self._stats = SingleFlightStats()
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """
+        Run func() once for all concurrent callers with the same key.
+
+        Args:
+            key: Identity of the call (e.g. the request URL)
+            func: Zero-argument callable executed by the leader
+
+        Returns:
+            func()'s result (shared by every caller of this flight)
+
+        Raises:
+            Whatever func() raised, re-raised in every caller of this flight
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = _Call()
+                self._calls[key] = call
+                self._stats.executions += 1
+                leader = True
+            else:
+                call.waiters += 1
+                self._stats.coalesced += 1
+                self._stats.max_waiters = max(self._stats.max_waiters, call.waiters)
+                leader = False
+
+        if not leader:
+            logger.debug(f"🔗 [{self.name.upper()}] Joined in-flight call: {str(key)[:80]}")
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+            call.done.set()
+
+    def in_flight(self) -> int:
+        """Number of keys currently executing."""
+        with self._lock:
+            return len(self._calls)
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "name": self.name,
+                "executions": self._stats.executions,
+                "coalesced": self._stats.coalesced,
+                "saved_pct": round(self._stats.saved_pct(), 1),
+                "max_waiters": self._stats.max_waiters,
+                "in_flight": len(self._calls),
+            }
@@ -19,20 +19,35 @@ Stale-While-Revalidate (SWR):
 This reduces API calls by ~85% while maintaining data freshness
 when it matters most (close to kickoff).
 
+V2.2: O(1) eviction. Entries live in an OrderedDict kept in LRU order and a
+min-heap of expiry times, so get/set/evict are amortized O(1) (expired entries
+are popped from the heap in O(log n)) instead of sorting/scanning the whole
+cache on every insert past capacity. An optional max_bytes bound (approximate
+payload size) keeps memory predictable.
+
+V2.3: Optional persistent second tier (src/utils/persistent_cache.py). SWR
+writes go through to disk and in-memory misses are served from disk, so a
+warm restart serves fresh/stale entries instead of re-fetching everything.
+
 Author: EarlyBird AI
 Version: 2.0 - Added SWR support
 """
 
 import functools
+import heapq
 import logging
+import sys
 import threading
 import time
+from collections import OrderedDict
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from threading import Lock, Thread
 from typing import Any, Optional
 
+from src.utils.persistent_cache import PersistentCacheTier, PersistentRecord
+
 # V2.1: Import tenacity for retry logic
 try:
     from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
@@ -84,6 +99,29 @@ SWR_ENABLED = True
 # Maximum number of concurrent background refresh threads
 SWR_MAX_BACKGROUND_THREADS = 10
 
+# V2.2: Depth limit when estimating payload sizes for max_bytes (deeper levels are ignored)
+SIZE_ESTIMATE_MAX_DEPTH = 8
+
+
+def estimate_size(value: Any, _depth: int = 0) -> int:
+    """
+    V2.2: Approximate memory footprint of a cached payload in bytes.
+
+    Walks dicts/lists/tuples/sets (FotMob JSON payloads) with sys.getsizeof.
+    Shared sub-objects are counted each time they appear, so the estimate
+    errs on the high side.
+    """
+    size = sys.getsizeof(value)
+    if _depth >= SIZE_ESTIMATE_MAX_DEPTH:
+        return size
+    if isinstance(value, dict):
+        for k, v in value.items():
+            size += estimate_size(k, _depth + 1) + estimate_size(v, _depth + 1)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            size += estimate_size(item, _depth + 1)
+    return size
+
 
 @dataclass
 class CacheEntry:
@@ -95,6 +133,13 @@ class CacheEntry:
     match_time: Optional[datetime] = None
     cache_key: str = ""
     is_stale: bool = False  # V2.0: Track if this is a stale entry
+    size_bytes: int = 0  # V2.2: Estimated payload size (only tracked when max_bytes is set)
+    heap_seq: int = 0  # V2.2: Sequence of this entry's expiry heap item
+
+    @property
+    def expires_at(self) -> float:
+        """Unix timestamp after which the entry is expired."""
+        return self.created_at + self.ttl_seconds
 
     def is_expired(self) -> bool:
         """Check if entry has expired."""
@@ -123,6 +168,7 @@ class CacheMetrics:
     gets: int = 0
     invalidations: int = 0
     evictions: int = 0  # V2.1: Track evictions (consolidated from _stats)
+    persistent_hits: int = 0  # V2.3: Memory misses served from the persistent tier
 
     # Background refresh
     background_refreshes: int = 0
@@ -152,7 +198,13 @@ class SmartCache:
     """
 
     def __init__(
-        self, name: str = "default", max_size: int = MAX_CACHE_SIZE, swr_enabled: bool = SWR_ENABLED
+        self,
+        name: str = "default",
+        max_size: int = MAX_CACHE_SIZE,
+        swr_enabled: bool = SWR_ENABLED,
+        max_bytes: int | None = None,
+        size_func: Callable[[Any], int] = estimate_size,
+        persistent_tier: Optional[PersistentCacheTier] = None,
     ):
         """
         Initialize cache.
@@ -161,11 +213,26 @@ class SmartCache:
             name: Cache name for logging
             max_size: Maximum number of entries
             swr_enabled: Enable Stale-While-Revalidate (default: True)
+            max_bytes: V2.2: Optional bound on the estimated size of cached payloads
+                       (None or 0 = entry count bound only). SWR fresh/stale twins
+                       share one payload but are counted separately.
+            size_func: V2.2: Payload size estimator used when max_bytes is set
+            persistent_tier: V2.3: Optional on-disk tier behind the SWR entries
         """
         self.name = name
         self.max_size = max_size
-        self._cache: dict[str, CacheEntry] = {}
+        self.max_bytes = max_bytes or None
+        self._size_func = size_func
+        # V2.2: LRU order (least recently used first) + expiry heap of (expires_at, seq, key).
+        # Heap items hold no entry reference, so replaced payloads are freed immediately.
+        self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._expiry_heap: list[tuple[float, int, str]] = []
+        self._heap_seq = 0
+        self._total_bytes = 0
         self._lock = Lock()
+        self._persistent = (
+            persistent_tier if persistent_tier and persistent_tier.available else None
+        )
 
         # V2.0: SWR support
         self.swr_enabled = swr_enabled
@@ -216,27 +283,64 @@ class SmartCache:
         logger.debug(f"📦 Cache TTL: {ttl // 60}min (tier={tier}, {hours_until:.1f}h to match)")
         return ttl
 
+    def _store(self, key: str, entry: CacheEntry) -> None:
+        """V2.2: Insert/replace an entry as most recently used (caller holds the lock)."""
+        self._remove(key)
+        if self.max_bytes is not None:
+            if not entry.size_bytes:
+                entry.size_bytes = self._size_func(entry.data)
+            self._total_bytes += entry.size_bytes
+        self._cache[key] = entry
+        self._heap_seq += 1
+        entry.heap_seq = self._heap_seq
+        heapq.heappush(self._expiry_heap, (entry.expires_at, self._heap_seq, key))
+
+        # Replaced/removed entries leave heap tuples behind; rebuild when they dominate
+        if len(self._expiry_heap) > 2 * len(self._cache) + 64:
+            self._expiry_heap = [t for t in self._expiry_heap if not self._is_stale_heap_item(t)]
+            heapq.heapify(self._expiry_heap)
+
+    def _is_stale_heap_item(self, item: tuple[float, int, str]) -> bool:
+        """V2.2: True if the heap item's key was removed or stored again since the push."""
+        entry = self._cache.get(item[2])
+        return entry is None or entry.heap_seq != item[1]
+
+    def _remove(self, key: str) -> CacheEntry | None:
+        """V2.2: Remove an entry (its heap tuple is skipped lazily; caller holds the lock)."""
+        entry = self._cache.pop(key, None)
+        if entry is not None:
+            self._total_bytes -= entry.size_bytes
+        return entry
+
     def _evict_expired(self) -> int:
         """
         Remove expired entries.
 
+        V2.2: Pops the expiry heap instead of scanning every entry.
+
         Returns:
             Number of entries evicted
         """
-        expired_keys = [key for key, entry in self._cache.items() if entry.is_expired()]
+        now = time.time()
+        evicted = 0
+        heap = self._expiry_heap
+        while heap and heap[0][0] < now:
+            item = heapq.heappop(heap)
+            if not self._is_stale_heap_item(item):
+                self._remove(item[2])
+                evicted += 1
 
-        for key in expired_keys:
-            del self._cache[key]
+        if evicted:
+            self._metrics.evictions += evicted
+            logger.debug(f"🧹 Evicted {evicted} expired entries from {self.name}")
 
-        if expired_keys:
-            self._metrics.evictions += len(expired_keys)
-            logger.debug(f"🧹 Evicted {len(expired_keys)} expired entries from {self.name}")
-
-        return len(expired_keys)
+        return evicted
 
     def _evict_oldest(self, count: int = 1) -> int:
         """
-        Remove oldest entries when cache is full.
+        Remove least recently used entries when cache is full.
+
+        V2.2: O(1) per entry (front of the LRU-ordered dict).
 
         Args:
             count: Number of entries to remove
@@ -244,21 +348,48 @@ class SmartCache:
         Returns:
             Number of entries evicted
         """
-        if not self._cache:
-            return 0
-
-        # Sort by creation time
-        sorted_entries = sorted(self._cache.items(), key=lambda x: x[1].created_at)
-
-        # Remove oldest
         removed = 0
-        for key, _ in sorted_entries[:count]:
-            del self._cache[key]
+        while self._cache and removed < count:
+            key = next(iter(self._cache))
+            self._remove(key)
             removed += 1
 
         self._metrics.evictions += removed
         return removed
 
+    def _make_room(self, *keys: str) -> None:
+        """V2.2: Evict expired, then LRU entries so ``keys`` fit (caller holds the lock)."""
+        self._evict_expired()
+        incoming = sum(1 for key in keys if key not in self._cache)
+        overflow = len(self._cache) + incoming - self.max_size
+        if overflow > 0:
+            self._evict_oldest(count=overflow)
+
+    def _measure(self, value: Any) -> int | None:
+        """
+        V2.2: Estimate a payload's size once per set().
+
+        Returns:
+            Size in bytes (0 without a byte limit), or None if the payload alone
+            exceeds max_bytes and must not be cached
+        """
+        if self.max_bytes is None:
+            return 0
+        size = self._size_func(value)
+        return size if size <= self.max_bytes else None
+
+    def _enforce_byte_limit(self) -> None:
+        """V2.2: Evict LRU entries until the estimated payload size fits max_bytes."""
+        if self.max_bytes is None:
+            return
+        evicted = 0
+        while self._cache and self._total_bytes > self.max_bytes:
+            self._remove(next(iter(self._cache)))
+            evicted += 1
+        if evicted:
+            self._metrics.evictions += evicted
+            logger.debug(f"🧹 Evicted {evicted} entries from {self.name} (byte limit)")
+
     def get(self, key: str) -> Any | None:
         """
         Get value from cache.
@@ -277,11 +408,12 @@ class SmartCache:
                 return None
 
             if entry.is_expired():
-                del self._cache[key]
+                self._remove(key)
                 self._metrics.misses += 1
                 logger.debug(f"📦 Cache EXPIRED: {key[:50]}...")
                 return None
 
+            self._cache.move_to_end(key)  # V2.2: Most recently used
             self._metrics.hits += 1
             remaining = entry.time_remaining()
             logger.debug(f"📦 Cache HIT: {key[:50]}... (TTL: {remaining // 60:.0f}min)")
@@ -317,13 +449,14 @@ class SmartCache:
                 logger.debug(f"📦 Cache SKIP (None value): {key[:50]}...")
                 return False
 
-            # Evict expired entries first
-            self._evict_expired()
+            # V2.2: Never evict live entries for a payload that cannot fit anyway
+            size_bytes = self._measure(value)
+            if size_bytes is None:
+                logger.debug(f"📦 Cache SKIP (larger than max_bytes): {key[:50]}...")
+                return False
 
-            # Evict oldest if at capacity (ensure at least 1 eviction)
-            if len(self._cache) >= self.max_size:
-                evict_count = max(1, self.max_size // 10)  # At least 1
-                self._evict_oldest(count=evict_count)
+            # V2.2: Evict expired entries, then LRU entries if at capacity
+            self._make_room(key)
 
             # Calculate TTL
             ttl = ttl_override if ttl_override is not None else self._calculate_ttl(match_time)
@@ -334,13 +467,18 @@ class SmartCache:
                 return False  # FIX: Return False to signal not cached
 
             # Store entry
-            self._cache[key] = CacheEntry(
-                data=value,
-                created_at=time.time(),
-                ttl_seconds=ttl,
-                match_time=match_time,
-                cache_key=key,
+            self._store(
+                key,
+                CacheEntry(
+                    data=value,
+                    created_at=time.time(),
+                    ttl_seconds=ttl,
+                    match_time=match_time,
+                    cache_key=key,
+                    size_bytes=size_bytes,
+                ),
             )
+            self._enforce_byte_limit()
 
             logger.debug(f"📦 Cache SET: {key[:50]}... (TTL: {ttl // 60}min)")
             return True
@@ -355,9 +493,10 @@ class SmartCache:
         Returns:
             True if entry was removed
         """
+        if self._persistent is not None:
+            self._persistent.delete(key.removesuffix(":stale"))
         with self._lock:
-            if key in self._cache:
-                del self._cache[key]
+            if self._remove(key) is not None:
                 self._metrics.invalidations += 1
                 return True
             return False
@@ -372,11 +511,13 @@ class SmartCache:
         Returns:
             Number of entries removed
         """
+        if self._persistent is not None:
+            self._persistent.delete_matching(pattern)
         with self._lock:
             keys_to_remove = [key for key in self._cache.keys() if pattern in key]
 
             for key in keys_to_remove:
-                del self._cache[key]
+                self._remove(key)
 
             if keys_to_remove:
                 self._metrics.invalidations += len(keys_to_remove)
@@ -390,9 +531,13 @@ class SmartCache:
         Returns:
             Number of entries cleared
         """
+        if self._persistent is not None:
+            self._persistent.clear()
         with self._lock:
             count = len(self._cache)
             self._cache.clear()
+            self._expiry_heap.clear()
+            self._total_bytes = 0
             logger.info(f"🧹 Cache {self.name} cleared ({count} entries)")
             return count
 
@@ -454,6 +599,7 @@ class SmartCache:
             # 1. Check for fresh value
             fresh_entry = self._cache.get(key)
             if fresh_entry is not None and not fresh_entry.is_expired():
+                self._cache.move_to_end(key)  # V2.2: Most recently used
                 self._metrics.hits += 1
                 latency_ms = (time.time() - start_time) * 1000
                 self._metrics.avg_cached_latency_ms = self._metrics.update_avg_latency(
@@ -466,6 +612,7 @@ class SmartCache:
             stale_key = f"{key}:stale"
             stale_entry = self._cache.get(stale_key)
             if stale_entry is not None and not stale_entry.is_expired():
+                self._cache.move_to_end(stale_key)  # V2.2: Most recently used
                 self._metrics.hits += 1
                 self._metrics.stale_hits += 1
                 latency_ms = (time.time() - start_time) * 1000
@@ -483,7 +630,16 @@ class SmartCache:
             self._trigger_background_refresh(key, fetch_func, ttl, stale_ttl, match_time)
             return stale_data, False
 
-        # 3. No value available - fetch synchronously
+        # V2.3: 3. Memory miss - try the persistent tier (warm restart)
+        if self._persistent is not None:
+            record = self._persistent.get(key)
+            if record is not None and self._hydrate(key, record, start_time):
+                if record.is_fresh():
+                    return record.value, True
+                self._trigger_background_refresh(key, fetch_func, ttl, stale_ttl, match_time)
+                return record.value, False
+
+        # 4. No value available - fetch synchronously
         self._metrics.misses += 1
         try:
             # V2.1: Use retry logic if tenacity is available
@@ -530,44 +686,113 @@ class SmartCache:
             return False
 
         with self._lock:
-            # Evict expired entries first
-            self._evict_expired()
+            size_bytes = self._measure(value)
+            if size_bytes is None:
+                logger.debug(f"📦 [SWR] SKIP (larger than max_bytes): {key[:50]}...")
+                return False
 
-            # Evict oldest if at capacity
-            if len(self._cache) >= self.max_size:
-                evict_count = max(1, self.max_size // 10)
-                self._evict_oldest(count=evict_count)
+            # V2.2: Evict expired entries, then LRU entries so fresh + stale both fit
+            stale_key = f"{key}:stale"
+            self._make_room(key, stale_key)
 
             # Calculate stale TTL if not provided
             if stale_ttl is None:
                 stale_ttl = ttl * SWR_TTL_MULTIPLIER
 
             # Store fresh entry
-            self._cache[key] = CacheEntry(
-                data=value,
-                created_at=time.time(),
-                ttl_seconds=ttl,
-                match_time=match_time,
-                cache_key=key,
-                is_stale=False,
+            self._store(
+                key,
+                CacheEntry(
+                    data=value,
+                    created_at=time.time(),
+                    ttl_seconds=ttl,
+                    match_time=match_time,
+                    cache_key=key,
+                    is_stale=False,
+                    size_bytes=size_bytes,
+                ),
             )
-
-            # Store stale entry (with longer TTL)
-            stale_key = f"{key}:stale"
-            self._cache[stale_key] = CacheEntry(
-                data=value,
-                created_at=time.time(),
-                ttl_seconds=stale_ttl,
-                match_time=match_time,
-                cache_key=stale_key,
-                is_stale=True,
+            # Store stale entry (with longer TTL) last: under pressure the fresh twin goes first
+            self._store(
+                stale_key,
+                CacheEntry(
+                    data=value,
+                    created_at=time.time(),
+                    ttl_seconds=stale_ttl,
+                    match_time=match_time,
+                    cache_key=stale_key,
+                    is_stale=True,
+                    size_bytes=size_bytes,
+                ),
             )
 
+            self._enforce_byte_limit()
+
             # Increment sets counter once per SWR operation (creates 2 entries: fresh + stale)
             self._metrics.sets += 1
 
             logger.debug(f"📦 [SWR] SET: {key[:50]}... (fresh: {ttl}s, stale: {stale_ttl}s)")
-            return True
+            stored = key in self._cache
+
+        # V2.3: Write-through outside the lock (disk I/O must not block readers)
+        if stored and self._persistent is not None:
+            now = time.time()
+            self._persistent.set(key, value, now + ttl, now + stale_ttl)
+        return stored
+
+    def _hydrate(self, key: str, record: PersistentRecord, start_time: float) -> bool:
+        """
+        V2.3: Copy a persistent record back into memory with its remaining windows.
+
+        Returns:
+            True if the record was usable and is now cached in memory
+        """
+        now = time.time()
+        if not record.is_usable(now):
+            return False
+
+        with self._lock:
+            size_bytes = self._measure(record.value)
+            if size_bytes is None:
+                return False
+            stale_key = f"{key}:stale"
+            self._make_room(key, stale_key)
+            if record.is_fresh(now):
+                self._store(
+                    key,
+                    CacheEntry(
+                        data=record.value,
+                        created_at=now,
+                        ttl_seconds=int(record.fresh_until - now),
+                        cache_key=key,
+                        size_bytes=size_bytes,
+                    ),
+                )
+            self._store(
+                stale_key,
+                CacheEntry(
+                    data=record.value,
+                    created_at=now,
+                    ttl_seconds=int(record.stale_until - now),
+                    cache_key=stale_key,
+                    is_stale=True,
+                    size_bytes=size_bytes,
+                ),
+            )
+            self._enforce_byte_limit()
+
+            self._metrics.hits += 1
+            self._metrics.persistent_hits += 1
+            if not record.is_fresh(now):
+                self._metrics.stale_hits += 1
+            latency_ms = (time.time() - start_time) * 1000
+            self._metrics.avg_cached_latency_ms = self._metrics.update_avg_latency(
+                self._metrics.avg_cached_latency_ms, latency_ms, self._metrics.hits
+            )
+
+        state = "FRESH" if record.is_fresh(now) else "STALE"
+        logger.debug(f"📦 [SWR] DISK {state} HIT: {key[:50]}... ({latency_ms:.1f}ms)")
+        return True
 
     def _trigger_background_refresh(
         self,
@@ -629,6 +854,8 @@ class SmartCache:
                 sets=self._metrics.sets,
                 gets=self._metrics.gets,
                 invalidations=self._metrics.invalidations,
+                evictions=self._metrics.evictions,
+                persistent_hits=self._metrics.persistent_hits,
                 background_refreshes=self._metrics.background_refreshes,
                 background_refresh_failures=self._metrics.background_refresh_failures,
             )
@@ -637,6 +864,7 @@ class SmartCache:
         """Get cache statistics."""
         # V2.0: Get SWR metrics BEFORE acquiring lock to avoid deadlock
         swr_metrics = self.get_swr_metrics()
+        persistent_stats = self._persistent.get_stats() if self._persistent else None
 
         with self._lock:
             total = swr_metrics.hits + swr_metrics.misses
@@ -646,6 +874,8 @@ class SmartCache:
                 "name": self.name,
                 "size": len(self._cache),
                 "max_size": self.max_size,
+                "size_bytes": self._total_bytes if self.max_bytes is not None else None,
+                "max_bytes": self.max_bytes,
                 "hits": swr_metrics.hits,
                 "misses": swr_metrics.misses,
                 "evictions": swr_metrics.evictions,
@@ -658,6 +888,8 @@ class SmartCache:
                 "background_refreshes": swr_metrics.background_refreshes,
                 "background_refresh_failures": swr_metrics.background_refresh_failures,
                 "invalidations": swr_metrics.invalidations,
+                "persistent_hits": swr_metrics.persistent_hits,
+                "persistent": persistent_stats,
             }
 
 
@@ -0,0 +1,546 @@
+"""
+EarlyBird Team Name Index V1.0
+
+Shared, precomputed index for team-name matching.
+
+Team-name resolution used to score every known name on every lookup
+(SequenceMatcher + thefuzz over the full candidate list, a DB query plus a
+full scan per radar article, a regex per known club per article). The index
+keeps, for every canonical team:
+
+- Normalized forms (accent/unicode folded, lowercase, punctuation stripped)
+  of the canonical name and its aliases
+- A token inverted list (token -> forms)
+- Character n-gram blocking (n-gram -> forms)
+
+A lookup resolves exact forms in O(1); otherwise it scores only a small
+candidate set: forms containing every query token plus the forms sharing
+the most n-grams with the query (Dice-ranked). Scoring reuses the exact
+fuzzy_match_team() scorer, so accuracy stays comparable while throughput no
+longer depends on the number of known teams.
+
+The shared instance is built from TeamAlias rows (api_name, search_name,
+suffix-stripped name, fotmob_id) and the static FotMob mapping, and is kept
+current incrementally: ORM insert/update/delete events patch single entries,
+and a periodic diff-based sync catches bulk writes that bypass the ORM (bulk
+writers call invalidate_team_name_index() so the next lookup syncs at once).
+
+Usage:
+    index = get_team_name_index()
+    index.match("Sao Paulo")           # ("São Paulo FC", 0.92) or None
+    index.get_fotmob_id("Galatasaray SK")
+
+V1.0: Initial implementation
+"""
+
+import logging
+import re
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from difflib import SequenceMatcher
+from typing import Any, Optional
+
+from src.utils.text_normalizer import normalize_for_matching
+
+try:
+    from thefuzz import fuzz as thefuzz_fuzz
+
+    _THEFUZZ_AVAILABLE = True
+except ImportError:
+    thefuzz_fuzz = None
+    _THEFUZZ_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# ============================================
+# CONFIGURATION
+# ============================================
+
+TEAM_INDEX_NGRAM_SIZE = 3
+# N-gram ranked candidates scored per lookup (token-subset candidates are always added)
+TEAM_INDEX_MAX_CANDIDATES = 24
+# Seconds between diff-based syncs of the shared index with TeamAlias
+TEAM_INDEX_REFRESH_SECONDS = 300
+
+_PUNCTUATION = re.compile(r"[^\w\s]")
+_WHITESPACE = re.compile(r"\s+")
+
+# Suffixes stripped by team_alias_utils._normalize_team_name (kept in sync)
+_TEAM_SUFFIXES = (" FC", " SK", " Club", " AS", " AC", " FK", " SC", " Calcio", " Spor")
+
+
+def normalize_team_key(name: Optional[str]) -> str:
+    """Normalized form used as index key: folded, lowercase, no punctuation."""
+    if not name:
+        return ""
+    text = _PUNCTUATION.sub(" ", normalize_for_matching(name))
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def _ngrams(form: str, size: int = TEAM_INDEX_NGRAM_SIZE) -> set[str]:
+    padded = f" {form} "
+    if len(padded) <= size:
+        return {padded}
+    return {padded[i : i + size] for i in range(len(padded) - size + 1)}
+
+
+def score_team_candidate(search: str, candidate: str) -> tuple[float, bool]:
+    """
+    Score a candidate the way fuzzy_match_team() does.
+
+    Args:
+        search: Query, lowercased and stripped
+        candidate: Candidate, lowercased and stripped
+
+    Returns:
+        (score in 0..1, definitive) - definitive is True for an exact match or a
+        shared first word of 4+ characters, which fuzzy_match_team() accepts
+        immediately
+    """
+    if search == candidate:
+        return 1.0, True
+
+    search_words = search.split()
+    cand_words = candidate.split()
+    if search_words and cand_words and search_words[0] == cand_words[0]:
+        if len(search_words[0]) >= 4:
+            return 1.0, True
+
+    best = 0.0
+    search_tokens = set(search_words)
+    cand_tokens = set(cand_words)
+    overlap = len(search_tokens & cand_tokens)
+    if overlap >= 1 and overlap >= len(search_tokens) * 0.5:
+        best = overlap / max(len(search_tokens), len(cand_tokens))
+
+    if _THEFUZZ_AVAILABLE and thefuzz_fuzz is not None:
+        try:
+            best = max(best, thefuzz_fuzz.token_set_ratio(search, candidate) / 100.0)
+        except Exception as e:
+            logger.debug(f"thefuzz matching failed, using difflib fallback: {e}")
+
+    return max(best, SequenceMatcher(None, search, candidate).ratio()), False
+
+
+def token_set_score(search: str, candidate: str) -> tuple[float, bool]:
+    """thefuzz token_set_ratio (0..1), falling back to SequenceMatcher."""
+    if search == candidate:
+        return 1.0, True
+    if _THEFUZZ_AVAILABLE and thefuzz_fuzz is not None:
+        return thefuzz_fuzz.token_set_ratio(search, candidate) / 100.0, False
+    return SequenceMatcher(None, search, candidate).ratio(), False
+
+
+@dataclass(frozen=True)
+class TeamIndexEntry:
+    """A canonical team and the names it is known by."""
+
+    name: str
+    aliases: frozenset[str] = field(default_factory=frozenset)
+    fotmob_id: Optional[int] = None
+
+    def forms(self) -> set[str]:
+        forms = {normalize_team_key(self.name)}
+        forms.update(normalize_team_key(alias) for alias in self.aliases)
+        forms.discard("")
+        return forms
+
+
+class TeamNameIndex:
+    """
+    Incremental team-name index with token and n-gram blocking.
+
+    Thread Safety:
+        All public methods take an internal lock; scoring runs on a snapshot
+        of the candidate set outside the lock.
+    """
+
+    def __init__(
+        self,
+        ngram_size: int = TEAM_INDEX_NGRAM_SIZE,
+        max_candidates: int = TEAM_INDEX_MAX_CANDIDATES,
+    ):
+        self.ngram_size = ngram_size
+        self.max_candidates = max_candidates
+        self._lock = threading.Lock()
+        self._entries: dict[str, TeamIndexEntry] = {}
+        self._entry_forms: dict[str, set[str]] = {}
+        # form -> canonical names (insertion ordered, first wins on ties)
+        self._owners: dict[str, dict[str, None]] = {}
+        self._by_token: dict[str, set[str]] = {}
+        self._by_ngram: dict[str, set[str]] = {}
+        self._form_ngram_counts: dict[str, int] = {}
+        self._stats = {"lookups": 0, "exact_hits": 0, "candidates_scored": 0}
+
+    # ---------- maintenance ----------
+
+    def _index_form(self, form: str) -> None:
+        for token in form.split():
+            self._by_token.setdefault(token, set()).add(form)
+        grams = _ngrams(form, self.ngram_size)
+        self._form_ngram_counts[form] = len(grams)
+        for gram in grams:
+            self._by_ngram.setdefault(gram, set()).add(form)
+
+    def _unindex_form(self, form: str) -> None:
+        self._form_ngram_counts.pop(form, None)
+        for token in form.split():
+            bucket = self._by_token.get(token)
+            if bucket is not None:
+                bucket.discard(form)
+                if not bucket:
+                    del self._by_token[token]
+        for gram in _ngrams(form, self.ngram_size):
+            bucket = self._by_ngram.get(gram)
+            if bucket is not None:
+                bucket.discard(form)
+                if not bucket:
+                    del self._by_ngram[gram]
+
+    def _remove_locked(self, name: str) -> bool:
+        if self._entries.pop(name, None) is None:
+            return False
+        for form in self._entry_forms.pop(name, ()):
+            owners = self._owners.get(form)
+            if owners is None:
+                continue
+            owners.pop(name, None)
+            if not owners:
+                del self._owners[form]
+                self._unindex_form(form)
+        return True
+
+    def _add_locked(self, entry: TeamIndexEntry) -> bool:
+        if self._entries.get(entry.name) == entry:
+            return False
+        self._remove_locked(entry.name)
+        forms = entry.forms()
+        self._entries[entry.name] = entry
+        self._entry_forms[entry.name] = forms
+        for form in forms:
+            owners = self._owners.get(form)
+            if owners is None:
+                self._owners[form] = {entry.name: None}
+                self._index_form(form)
+            else:
+                owners[entry.name] = None
+        return True
+
+    def add(self, name: str, aliases: Iterable[str] = (), fotmob_id: Optional[int] = None) -> bool:
+        """
+        Add or replace a team.
+
+        Returns:
+            True if the index changed
+        """
+        if not name:
+            return False
+        entry = TeamIndexEntry(
+            name=name, aliases=frozenset(a for a in aliases if a), fotmob_id=fotmob_id
+        )
+        with self._lock:
+            return self._add_locked(entry)
+
+    def remove(self, name: str) -> bool:
+        with self._lock:
+            return self._remove_locked(name)
+
+    def sync(self, entries: Iterable[TeamIndexEntry], prune: bool = True) -> dict[str, int]:
+        """
+        Incrementally reconcile the index with a full list of entries.
+
+        Only added/changed entries are (re)indexed; with prune=True, entries
+        missing from the list are removed.
+
+        Returns:
+            {"added": n, "updated": n, "removed": n}
+        """
+        counts = {"added": 0, "updated": 0, "removed": 0}
+        with self._lock:
+            seen = set()
+            for entry in entries:
+                seen.add(entry.name)
+                existed = entry.name in self._entries
+                if self._add_locked(entry):
+                    counts["updated" if existed else "added"] += 1
+            if prune:
+                for name in [n for n in self._entries if n not in seen]:
+                    self._remove_locked(name)
+                    counts["removed"] += 1
+        return counts
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._entry_forms.clear()
+            self._owners.clear()
+            self._by_token.clear()
+            self._by_ngram.clear()
+            self._form_ngram_counts.clear()
+
+    # ---------- lookups ----------
+
+    def _candidates_locked(self, form: str) -> list[str]:
+        tokens = form.split()
+        token_hits: Optional[set[str]] = None
+        for token in tokens:
+            bucket = self._by_token.get(token, set())
+            token_hits = set(bucket) if token_hits is None else token_hits & bucket
+            if not token_hits:
+                break
+
+        query_grams = _ngrams(form, self.ngram_size)
+        shared: Counter[str] = Counter()
+        for gram in query_grams:
+            bucket = self._by_ngram.get(gram)
+            if bucket:
+                shared.update(bucket)
+
+        # Dice coefficient on n-gram sets: long forms sharing common n-grams don't dominate
+        q = len(query_grams)
+        counts = self._form_ngram_counts
+        ranked = sorted(shared, key=lambda f: -2.0 * shared[f] / (q + counts[f]))
+        ranked = ranked[: self.max_candidates]
+
+        candidates = dict.fromkeys(ranked)
+        if token_hits:
+            candidates.update(dict.fromkeys(sorted(token_hits)))
+        return list(candidates)
+
+    def lookup_all(self, name: str) -> list[str]:
+        """All canonical names whose name/alias normalizes to the same form."""
+        form = normalize_team_key(name)
+        with self._lock:
+            return list(self._owners.get(form, ()))
+
+    def lookup_exact(self, name: str) -> Optional[str]:
+        """Canonical name whose name/alias normalizes to the same form, or None."""
+        owners = self.lookup_all(name)
+        return owners[0] if owners else None
+
+    def owner_of_form(self, form: str) -> Optional[str]:
+        """Canonical name for an already normalized form (no normalization, no fuzzy)."""
+        with self._lock:
+            owners = self._owners.get(form)
+            return next(iter(owners)) if owners else None
+
+    def get_entry(self, name: str) -> Optional[TeamIndexEntry]:
+        canonical = self.lookup_exact(name)
+        with self._lock:
+            return self._entries.get(canonical) if canonical else None
+
+    def get_fotmob_id(self, name: str) -> Optional[int]:
+        entry = self.get_entry(name)
+        return entry.fotmob_id if entry else None
+
+    def match(
+        self,
+        query: str,
+        threshold: float = 0.6,
+        scorer: Callable[[str, str], tuple[float, bool]] = score_team_candidate,
+        allowed: Optional[set[str]] = None,
+    ) -> Optional[tuple[str, float]]:
+        """
+        Best canonical team for query, scoring only the blocked candidate set.
+
+        Args:
+            query: Raw team name
+            threshold: Minimum score (0..1)
+            scorer: (normalized query, normalized form) -> (score, definitive)
+            allowed: Optional set of canonical names to restrict results to
+
+        Returns:
+            (canonical name, score) or None
+        """
+        form = normalize_team_key(query)
+        if not form:
+            return None
+
+        with self._lock:
+            self._stats["lookups"] += 1
+            owners = self._owners.get(form)
+            if owners:
+                for owner in owners:
+                    if allowed is None or owner in allowed:
+                        self._stats["exact_hits"] += 1
+                        return owner, 1.0
+            candidates = [
+                (cand, [o for o in self._owners[cand] if allowed is None or o in allowed])
+                for cand in self._candidates_locked(form)
+            ]
+            self._stats["candidates_scored"] += len(candidates)
+
+        best: Optional[tuple[str, float]] = None
+        for cand, owners in candidates:
+            if not owners:
+                continue
+            score, definitive = scorer(form, cand)
+            if definitive:
+                return owners[0], score
+            if best is None or score > best[1]:
+                best = (owners[0], score)
+
+        if best is not None and best[1] >= threshold:
+            return best
+        return None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats.update(
+                teams=len(self._entries),
+                forms=len(self._owners),
+                tokens=len(self._by_token),
+                ngrams=len(self._by_ngram),
+            )
+        lookups = stats["lookups"] - stats["exact_hits"]
+        stats["avg_candidates"] = round(stats["candidates_scored"] / lookups, 1) if lookups else 0.0
+        return stats
+
+
+# ============================================
+# SHARED INDEX (TeamAlias + FotMob mapping)
+# ============================================
+
+_team_index: Optional[TeamNameIndex] = None
+_team_index_lock = threading.Lock()
+_team_index_synced_at = 0.0
+_team_alias_events_registered = False
+
+
+def _strip_team_suffixes(name: str) -> str:
+    clean = name
+    for suffix in _TEAM_SUFFIXES:
+        clean = clean.replace(suffix, "")
+    return clean.strip()
+
+
+def _entry_from_alias(api_name: str, search_name: Optional[str], fotmob_id: Any) -> TeamIndexEntry:
+    aliases = {search_name or "", _strip_team_suffixes(api_name)}
+    aliases.discard(api_name)
+    try:
+        parsed_id = int(fotmob_id) if fotmob_id else None
+    except (TypeError, ValueError):
+        parsed_id = None
+    return TeamIndexEntry(
+        name=api_name, aliases=frozenset(a for a in aliases if a), fotmob_id=parsed_id
+    )
+
+
+def load_team_index_entries() -> tuple[list[TeamIndexEntry], bool]:
+    """
+    Read TeamAlias rows and the static FotMob mapping as index entries.
+
+    Returns:
+        (entries, db_ok); db_ok is False if the TeamAlias query failed, in
+        which case entries holds only the static mapping
+    """
+    entries: dict[str, TeamIndexEntry] = {}
+    try:
+        from src.ingestion.fotmob_team_mapping import TEAM_FOTMOB_IDS
+
+        for name, fotmob_id in TEAM_FOTMOB_IDS.items():
+            entries[name] = _entry_from_alias(name, None, fotmob_id)
+    except ImportError:
+        pass
+
+    try:
+        from src.database.models import TeamAlias, get_db_session
+
+        with get_db_session() as db:
+            rows = db.query(TeamAlias.api_name, TeamAlias.search_name, TeamAlias.fotmob_id).all()
+        for api_name, search_name, fotmob_id in rows:
+            if api_name:
+                entries[api_name] = _entry_from_alias(api_name, search_name, fotmob_id)
+    except Exception as e:
+        logger.warning(f"⚠️ [TEAM-INDEX] TeamAlias load failed, keeping DB aliases: {e}")
+        return list(entries.values()), False
+    return list(entries.values()), True
+
+
+def _register_team_alias_events(index: TeamNameIndex) -> None:
+    """Patch single entries when TeamAlias rows change through the ORM."""
+    global _team_alias_events_registered
+    if _team_alias_events_registered:
+        return
+    try:
+        from sqlalchemy import event
+
+        from src.database.models import TeamAlias
+    except ImportError:
+        return
+
+    def _upsert(mapper, connection, target):
+        if target.api_name:
+            entry = _entry_from_alias(target.api_name, target.search_name, target.fotmob_id)
+            index.add(entry.name, entry.aliases, entry.fotmob_id)
+
+    def _delete(mapper, connection, target):
+        if target.api_name:
+            index.remove(target.api_name)
+
+    event.listen(TeamAlias, "after_insert", _upsert)
+    event.listen(TeamAlias, "after_update", _upsert)
+    event.listen(TeamAlias, "after_delete", _delete)
+    _team_alias_events_registered = True
+
+
+def refresh_team_name_index(force: bool = False) -> dict[str, int]:
+    """
+    Diff-sync the shared index with TeamAlias (at most every TEAM_INDEX_REFRESH_SECONDS).
+
+    If the TeamAlias query fails, nothing is pruned and the refresh is not
+    recorded, so the next lookup retries.
+
+    Returns:
+        Sync counts ({} if skipped)
+    """
+    global _team_index_synced_at
+    index = get_team_name_index(refresh=False)
+    previous_sync = _team_index_synced_at
+    if not force and time.monotonic() - previous_sync < TEAM_INDEX_REFRESH_SECONDS:
+        return {}
+    _team_index_synced_at = time.monotonic()
+    entries, db_ok = load_team_index_entries()
+    if not db_ok:
+        _team_index_synced_at = previous_sync
+    counts = index.sync(entries, prune=db_ok)
+    if any(counts.values()):
+        logger.info(
+            f"🔎 [TEAM-INDEX] Synced: +{counts['added']} ~{counts['updated']} "
+            f"-{counts['removed']} ({len(index)} teams)"
+        )
+    return counts
+
+
+def invalidate_team_name_index() -> None:
+    """Make the next lookup re-sync with TeamAlias (call after bulk alias writes)."""
+    global _team_index_synced_at
+    _team_index_synced_at = 0.0
+
+
+def get_team_name_index(refresh: bool = True) -> TeamNameIndex:
+    """Get the shared TeamAlias/FotMob team-name index (built on first use)."""
+    global _team_index, _team_index_synced_at
+    if _team_index is None:
+        with _team_index_lock:
+            if _team_index is None:
+                index = TeamNameIndex()
+                entries, db_ok = load_team_index_entries()
+                index.sync(entries)
+                _register_team_alias_events(index)
+                # Without the TeamAlias rows, the first refresh retries right away
+                _team_index_synced_at = time.monotonic() if db_ok else 0.0
+                _team_index = index
+                logger.info(f"🔎 [TEAM-INDEX] Built with {len(index)} teams")
+                return index
+    if refresh:
+        refresh_team_name_index()
+    return _team_index
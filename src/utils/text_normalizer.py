@@ -1,5 +1,5 @@
 """
-Text Normalizer V1.1 - Intelligent Text Processing for Multi-Language Support
+Text Normalizer V1.2 - Intelligent Text Processing for Multi-Language Support
 
 Provides utilities for:
 - Unicode normalization (NFKC)
@@ -11,6 +11,9 @@ Provides utilities for:
 Used by: verification_layer.py, OptimizedResponseParser
 
 Requirements: Supports all leagues (Turkey, Greece, Japan, China, Brazil, etc.)
+
+V1.2: get_team_aliases() uses a reverse alias map instead of re-normalizing
+      every alias on each call
 """
 
 import re
@@ -247,13 +250,20 @@ TEAM_ALIASES: dict[str, list[str]] = {
 }
 
 
+# V1.2: normalized alias -> alias list, built on first use (first canonical wins)
+_ALIAS_LOOKUP: dict[str, list[str]] | None = None
+
+
 def get_team_aliases(team_name: str) -> list[str]:
     """Get all known aliases for a team name."""
-    team_lower = normalize_for_matching(team_name)
-    for canonical, aliases in TEAM_ALIASES.items():
-        if team_lower in [normalize_for_matching(a) for a in aliases]:
-            return aliases
-    return [team_name]
+    global _ALIAS_LOOKUP
+    if _ALIAS_LOOKUP is None:
+        lookup: dict[str, list[str]] = {}
+        for aliases in TEAM_ALIASES.values():
+            for alias in aliases:
+                lookup.setdefault(normalize_for_matching(alias), aliases)
+        _ALIAS_LOOKUP = lookup
+    return _ALIAS_LOOKUP.get(normalize_for_matching(team_name), [team_name])
 
 
 def find_team_in_text(team_name: str, text: str, threshold: int = 75) -> tuple[bool, int]:
@@ -0,0 +1,330 @@
+"""
+EarlyBird Upcoming Match Index V1.0
+
+Shared in-memory snapshot of the matches kicking off in the next few days.
+
+Team -> upcoming match resolution used to be a DB round-trip per lookup, made
+independently by several components:
+
+- telegram_listener.has_upcoming_match(): one query per candidate team name,
+  and extract_team_names_from_text() yields dozens of them per message
+- RadarLightEnricher.find_upcoming_match(): one query per radar alert
+- NitterFallbackScraper: one query per relevant tweet
+- NewsRadarMonitor: upcoming teams for fuzzy matching and source context,
+  and the league of the match for each radar handoff
+
+The index loads the matches of the next UPCOMING_MATCH_HORIZON_HOURS with one
+query and keeps them as immutable UpcomingMatch records (attribute names match
+the Match model, so callers using getattr() accept either), with:
+
+- normalized team name and alias forms -> matches (O(1) exact lookups)
+- match id -> match, league -> matches (sorted by kickoff)
+
+The snapshot is rebuilt every UPCOMING_MATCH_REFRESH_SECONDS, and right away
+after invalidate_upcoming_match_index(), which ingest_fixtures calls after
+writing fixtures. Lookups read the current snapshot without locking.
+
+Usage:
+    index = get_upcoming_match_index()
+    index.find_team("Galatasaray", end=now + timedelta(hours=48))
+    index.upcoming(league="soccer_turkey_super_league", start=now, end=now + timedelta(hours=72))
+
+V1.0: Initial implementation
+"""
+
+import bisect
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+
+from src.utils.team_name_index import normalize_team_key
+from src.utils.text_normalizer import get_team_aliases
+
+logger = logging.getLogger(__name__)
+
+# ============================================
+# CONFIGURATION
+# ============================================
+
+# Kickoff window loaded into the index (covers the widest caller, News Radar's 96h)
+UPCOMING_MATCH_HORIZON_HOURS = 96
+# Seconds between snapshot rebuilds
+UPCOMING_MATCH_REFRESH_SECONDS = 300
+# Seconds before retrying after a failed load
+UPCOMING_MATCH_RETRY_SECONDS = 30
+
+
+@dataclass(frozen=True)
+class UpcomingMatch:
+    """Detached copy of the Match columns needed for team -> match resolution."""
+
+    id: str
+    league: Optional[str]
+    home_team: str
+    away_team: str
+    start_time: datetime  # naive UTC, as stored in the DB
+    current_draw_odd: Optional[float] = None
+    opening_draw_odd: Optional[float] = None
+
+
+def _naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    if value is not None and value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _team_forms(team: str) -> set[str]:
+    """Normalized keys a team is known by: its name plus text_normalizer aliases."""
+    forms = {normalize_team_key(team)}
+    forms.update(normalize_team_key(alias) for alias in get_team_aliases(team))
+    forms.discard("")
+    return forms
+
+
+class _Snapshot:
+    """Immutable lookup tables over one load of upcoming matches."""
+
+    def __init__(self, matches: Iterable[UpcomingMatch]):
+        self.matches = sorted(matches, key=lambda m: (m.start_time, m.id))
+        self.starts = [m.start_time for m in self.matches]
+        self.by_id = {m.id: m for m in self.matches}
+        self.by_league: dict[str, list[UpcomingMatch]] = {}
+        self.by_form: dict[str, list[UpcomingMatch]] = {}
+        teams: dict[str, list[UpcomingMatch]] = {}
+        for match in self.matches:
+            if match.league:
+                self.by_league.setdefault(match.league, []).append(match)
+            for team in (match.home_team, match.away_team):
+                teams.setdefault(team, []).append(match)
+        by_form: dict[str, dict[str, UpcomingMatch]] = {}
+        for team, team_matches in teams.items():
+            for form in _team_forms(team):
+                by_form.setdefault(form, {}).update((m.id, m) for m in team_matches)
+        for form, form_matches in by_form.items():
+            self.by_form[form] = sorted(form_matches.values(), key=lambda m: (m.start_time, m.id))
+        # (lowercased name, matches) for the legacy substring lookups
+        self.teams_lower = [(team.lower(), team_matches) for team, team_matches in teams.items()]
+
+
+def load_upcoming_matches(
+    horizon_hours: float = UPCOMING_MATCH_HORIZON_HOURS,
+) -> list[UpcomingMatch]:
+    """Read the matches kicking off between now and now + horizon_hours."""
+    from src.database.models import Match, get_db_session
+
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    with get_db_session() as db:
+        rows = (
+            db.query(
+                Match.id,
+                Match.league,
+                Match.home_team,
+                Match.away_team,
+                Match.start_time,
+                Match.current_draw_odd,
+                Match.opening_draw_odd,
+            )
+            .filter(Match.start_time >= now)
+            .filter(Match.start_time <= now + timedelta(hours=horizon_hours))
+            .all()
+        )
+    return [
+        UpcomingMatch(
+            id=row[0],
+            league=row[1],
+            home_team=row[2],
+            away_team=row[3],
+            start_time=_naive_utc(row[4]),
+            current_draw_odd=row[5],
+            opening_draw_odd=row[6],
+        )
+        for row in rows
+        if row[0] and row[2] and row[3] and row[4]
+    ]
+
+
+class UpcomingMatchIndex:
+    """
+    Periodically reloaded team/league/id index over upcoming matches.
+
+    Thread-safe: a reload builds a new _Snapshot and swaps it in; readers use
+    whichever snapshot was current when their lookup started.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[], Iterable[UpcomingMatch]] = load_upcoming_matches,
+        refresh_seconds: float = UPCOMING_MATCH_REFRESH_SECONDS,
+        retry_seconds: float = UPCOMING_MATCH_RETRY_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._loader = loader
+        self.refresh_seconds = refresh_seconds
+        self.retry_seconds = retry_seconds
+        self._clock = clock
+        self._snapshot = _Snapshot(())
+        self._next_load_at = 0.0  # load on first lookup
+        self._generation = 0  # bumped by invalidate()
+        self._lock = threading.Lock()
+        self._stats = {"loads": 0, "load_failures": 0, "invalidations": 0, "lookups": 0}
+
+    # ============================================
+    # REFRESH
+    # ============================================
+
+    def invalidate(self) -> None:
+        """Reload on the next lookup (fixtures were written)."""
+        self._generation += 1
+        self._next_load_at = 0.0
+        self._stats["invalidations"] += 1
+
+    def refresh(self) -> bool:
+        """Reload the snapshot now. Keeps the previous one if the load fails."""
+        with self._lock:
+            return self._refresh_locked()
+
+    def _refresh_locked(self) -> bool:
+        generation = self._generation
+        try:
+            snapshot = _Snapshot(self._loader())
+        except Exception as e:
+            self._stats["load_failures"] += 1
+            self._next_load_at = self._clock() + self.retry_seconds
+            logger.warning(f"⚠️ [MATCH-INDEX] Load failed, keeping previous snapshot: {e}")
+            return False
+        self._snapshot = snapshot
+        if generation == self._generation:
+            self._next_load_at = self._clock() + self.refresh_seconds
+        # else: invalidated while loading, the load may predate the write
+        self._stats["loads"] += 1
+        logger.debug(f"📅 [MATCH-INDEX] Loaded {len(snapshot.matches)} upcoming matches")
+        return True
+
+    def _current(self) -> _Snapshot:
+        if self._clock() >= self._next_load_at:
+            with self._lock:
+                # Double-checked: another thread may have reloaded meanwhile
+                if self._clock() >= self._next_load_at:
+                    self._refresh_locked()
+        self._stats["lookups"] += 1
+        return self._snapshot
+
+    # ============================================
+    # LOOKUPS
+    # ============================================
+
+    @staticmethod
+    def _in_window(
+        matches: Iterable[UpcomingMatch], start: Optional[datetime], end: Optional[datetime]
+    ) -> list[UpcomingMatch]:
+        start, end = _naive_utc(start), _naive_utc(end)
+        return [
+            m
+            for m in matches
+            if (start is None or m.start_time >= start) and (end is None or m.start_time <= end)
+        ]
+
+    def get(self, match_id: str) -> Optional[UpcomingMatch]:
+        """Upcoming match by id (None if unknown or outside the horizon)."""
+        return self._current().by_id.get(match_id)
+
+    def upcoming(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        league: Optional[str] = None,
+    ) -> list[UpcomingMatch]:
+        """
+        Matches kicking off in [start, end], optionally in one league, by kickoff.
+
+        Windows are clipped to the loaded horizon. Aware datetimes are
+        converted to UTC; naive ones are taken as UTC.
+        """
+        snapshot = self._current()
+        if league is not None:
+            return self._in_window(snapshot.by_league.get(league, ()), start, end)
+        lo = 0 if start is None else bisect.bisect_left(snapshot.starts, _naive_utc(start))
+        hi = (
+            len(snapshot.matches)
+            if end is None
+            else bisect.bisect_right(snapshot.starts, _naive_utc(end))
+        )
+        return snapshot.matches[lo:hi]
+
+    def find_team(
+        self, team_name: str, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> list[UpcomingMatch]:
+        """Matches of a team by normalized name or alias (exact form), by kickoff."""
+        form = normalize_team_key(team_name)
+        if not form:
+            return []
+        return self._in_window(self._current().by_form.get(form, ()), start, end)
+
+    def find_team_substring(
+        self, team_name: str, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> list[UpcomingMatch]:
+        """
+        Matches where the name and a team name contain one another (lowercase).
+
+        The containment rule of the old per-lookup queries, evaluated on the
+        snapshot; exact name/alias hits are included. Sorted by kickoff.
+        """
+        team_lower = team_name.lower().strip()
+        if not team_lower:
+            return []
+        snapshot = self._current()
+        found: dict[str, UpcomingMatch] = {
+            m.id: m for m in snapshot.by_form.get(normalize_team_key(team_name), ())
+        }
+        for name_lower, matches in snapshot.teams_lower:
+            if team_lower in name_lower or name_lower in team_lower:
+                found.update((m.id, m) for m in matches)
+        ordered = sorted(found.values(), key=lambda m: (m.start_time, m.id))
+        return self._in_window(ordered, start, end)
+
+    def team_names(
+        self, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> set[str]:
+        """Home and away team names of the matches in [start, end]."""
+        return {team for m in self.upcoming(start, end) for team in (m.home_team, m.away_team)}
+
+    def __len__(self) -> int:
+        return len(self._current().matches)
+
+    def get_stats(self) -> dict[str, Any]:
+        snapshot = self._snapshot
+        return {
+            **self._stats,
+            "matches": len(snapshot.matches),
+            "leagues": len(snapshot.by_league),
+            "team_forms": len(snapshot.by_form),
+        }
+
+
+# ============================================
+# SHARED INDEX
+# ============================================
+
+_upcoming_match_index: Optional[UpcomingMatchIndex] = None
+_upcoming_match_index_lock = threading.Lock()
+
+
+def get_upcoming_match_index() -> UpcomingMatchIndex:
+    """Get the shared upcoming-match index (loaded on first lookup)."""
+    global _upcoming_match_index
+    if _upcoming_match_index is None:
+        with _upcoming_match_index_lock:
+            # Double-checked locking pattern for thread safety
+            if _upcoming_match_index is None:
+                _upcoming_match_index = UpcomingMatchIndex()
+    return _upcoming_match_index
+
+
+def invalidate_upcoming_match_index() -> None:
+    """Mark the shared index stale (call after writing fixtures). No-op if never used."""
+    if _upcoming_match_index is not None:
+        _upcoming_match_index.invalidate()
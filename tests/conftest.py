@@ -48,6 +48,16 @@ project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
+# Keep the FotMob SWR cache, the provider response cache, the settlement result
+# store and the scanners' fetch state memory-only in tests: a shared on-disk tier
+# would leak cached responses between tests and runs. The optimizer keeps its JSON
+# backend so tests never write to data/earlybird.db.
+os.environ.setdefault("FOTMOB_SWR_PERSISTENT_ENABLED", "false")
+os.environ.setdefault("RESPONSE_CACHE_PERSISTENT_ENABLED", "false")
+os.environ.setdefault("SETTLEMENT_RESULT_STORE_ENABLED", "false")
+os.environ.setdefault("FETCH_STATE_PERSISTENT_ENABLED", "false")
+os.environ.setdefault("OPTIMIZER_STATE_BACKEND", "json")
+
 
 # ============================================
 # PYTEST MARKERS
@@ -677,3 +687,19 @@ def reset_global_state():
         reset_ai_response_stats()
     except (ImportError, AttributeError):
         pass
+
+    # Reset the shared provider response cache (cached API responses)
+    try:
+        from src.utils.response_cache import reset_response_cache
+
+        reset_response_cache()
+    except ImportError:
+        pass
+
+    # Reset the scanners' fetch state (ETag/Last-Modified/fingerprints)
+    try:
+        from src.utils.fetch_state import reset_fetch_state_stores
+
+        reset_fetch_state_stores()
+    except ImportError:
+        pass
@@ -0,0 +1,165 @@
+"""
+Tests for the V1.1 indexed DiscoveryQueue (team index + expiry heap).
+
+Verifies that pop_for_match() returns exactly what the previous full-queue
+scan returned, that eviction/clear/expiry keep the indexes consistent, and
+benchmarks 500 match lookups against 10k queued discoveries.
+
+Run with: pytest tests/test_discovery_queue_index.py -v -s
+"""
+
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.utils.discovery_queue import DiscoveryQueue
+
+TEAMS = [
+    "Arsenal",
+    "Inter",
+    "Internazionale",
+    "Inter Miami",
+    "Manchester United",
+    "Manchester City",
+    "Man Utd",
+    "Galatasaray",
+    "Fenerbahçe",
+    "AEK Athens",
+    "AEK",
+    "Olympiacos",
+    "PSV",
+    "FC Porto",
+    "Real Madrid",
+    "Real Sociedad",
+    "Celtic",
+    "Rangers",
+]
+LEAGUES = ["soccer_epl", "soccer_italy_serie_a", "soccer_turkey_super_league", "GLOBAL"]
+
+
+def _linear_scan(queue: DiscoveryQueue, team_names, league_key):
+    """Pre-V1.1 pop_for_match() selection: scan everything in queue order."""
+    leagues = {league_key, "GLOBAL"}
+    return [
+        item.uuid
+        for item in queue.get_all_items()
+        if item.league_key in leagues
+        and not item.is_expired(queue.ttl_hours)
+        and item.matches_team(team_names)
+    ]
+
+
+def _fill(queue: DiscoveryQueue, n: int, seed: int = 1, teams=TEAMS):
+    rng = random.Random(seed)
+    for i in range(n):
+        team = rng.choice(teams)
+        if rng.random() < 0.1:
+            team = f"  {team.upper()} "
+        queue.push(
+            data={"title": f"News {i}"},
+            league_key=rng.choice(LEAGUES),
+            team=team if rng.random() > 0.05 else "",
+            category="INJURY",
+            confidence=0.5,
+        )
+
+
+class TestIndexedLookup:
+    def test_matches_linear_scan(self):
+        queue = DiscoveryQueue(max_entries=5000)
+        _fill(queue, 3000)
+        rng = random.Random(2)
+        queries = [
+            ["Inter", "Milan"],
+            ["Internazionale"],
+            ["Man"],
+            ["manchester united", "Manchester City"],
+            ["AEK Athens FC"],
+            ["PS"],
+            ["a"],
+            ["", "  "],
+            ["Unknown Team"],
+        ]
+        queries += [rng.sample(TEAMS, 2) for _ in range(50)]
+
+        for names in queries:
+            for league in LEAGUES:
+                expected = _linear_scan(queue, names, league)
+                results = queue.pop_for_match("m1", names, league)
+                assert [r["_uuid"] for r in results] == expected
+
+    def test_expired_items_are_popped_from_heap(self):
+        queue = DiscoveryQueue(ttl_hours=1)
+        old = datetime.now(timezone.utc) - timedelta(hours=2)
+        queue.push(data={}, league_key="soccer_epl", team="Arsenal", discovered_at=old)
+        fresh_uuid = queue.push(data={}, league_key="soccer_epl", team="Arsenal")
+
+        results = queue.pop_for_match("m1", ["Arsenal"], "soccer_epl")
+
+        assert [r["_uuid"] for r in results] == [fresh_uuid]
+        assert queue.size() == 1
+        assert queue.get_stats()["total_expired"] == 1
+
+    def test_eviction_keeps_indexes_consistent(self):
+        queue = DiscoveryQueue(max_entries=50)
+        _fill(queue, 500, seed=3)
+
+        assert queue.size() == 50
+        assert queue.get_stats()["total_evicted"] == 450
+        live = {item.uuid for item in queue.get_all_items()}
+        indexed = set().union(*queue._by_team.values())
+        assert indexed <= live
+        assert sum(queue._team_lengths.values()) == sum(len(u) for u in queue._by_team.values())
+
+    def test_clear_league_removes_from_team_index(self):
+        queue = DiscoveryQueue()
+        queue.push(data={}, league_key="soccer_epl", team="Arsenal")
+        global_uuid = queue.push(data={}, league_key="GLOBAL", team="Arsenal")
+
+        assert queue.clear("soccer_epl") == 1
+        results = queue.pop_for_match("m1", ["Arsenal"], "soccer_epl")
+        assert [r["_uuid"] for r in results] == [global_uuid]
+
+        queue.clear()
+        assert queue.pop_for_match("m1", ["Arsenal"], "soccer_epl") == []
+        assert queue._by_team == {} and queue._by_ngram == {}
+
+    def test_cleanup_compacts_stale_heap_entries(self):
+        queue = DiscoveryQueue(max_entries=10)
+        _fill(queue, 1000, seed=4)
+        queue.cleanup_expired()
+        assert len(queue._expiry_heap) == queue.size()
+
+
+@pytest.mark.performance
+class TestDiscoveryQueueBenchmark:
+    """Benchmark: indexed lookups vs full scan, 10k discoveries x 500 matches."""
+
+    def test_benchmark_10k_discoveries_500_matches(self):
+        teams = [f"Club {i} Athletic" for i in range(2000)] + TEAMS
+        queue = DiscoveryQueue(max_entries=10_000)
+        _fill(queue, 10_000, seed=2026, teams=teams)
+        rng = random.Random(7)
+        matches = [
+            (rng.choice(teams), rng.choice(teams), rng.choice(LEAGUES[:3])) for _ in range(500)
+        ]
+
+        start = time.perf_counter()
+        expected = [_linear_scan(queue, [home, away], league) for home, away, league in matches]
+        scan_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        indexed = [
+            [r["_uuid"] for r in queue.pop_for_match(f"m{i}", [home, away], league)]
+            for i, (home, away, league) in enumerate(matches)
+        ]
+        index_s = time.perf_counter() - start
+
+        print(
+            f"\n📊 DiscoveryQueue 10k items / 500 matches: scan={scan_s * 1000:.0f}ms "
+            f"indexed={index_s * 1000:.0f}ms speedup={scan_s / max(index_s, 1e-9):.1f}x"
+        )
+        assert indexed == expected
+        assert index_s < scan_s
@@ -0,0 +1,278 @@
+"""
+Tests for the V1.0 per-URL fetch state store (conditional fetches).
+
+Covers:
+1. fetch_if_changed(): validators sent as If-None-Match / If-Modified-Since,
+   304 and identical bytes are skips, new bytes are changes
+2. Validators are committed only after a successful extraction
+3. URLs that keep failing the probe are only re-probed periodically
+4. Change rates and suggested scan intervals; state survives a restart
+5. News Radar: unchanged pages skip extraction and the content pipeline
+6. Browser Monitor: unchanged pages skip extraction and analysis
+7. Benchmark: scan of 100 mostly-unchanged sources, full fetch vs conditional
+
+Run with: pytest tests/test_fetch_state.py -v -s
+"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+import src.services.browser_monitor as browser_monitor
+import src.services.news_radar as news_radar
+from src.services.browser_monitor import BrowserMonitor, MonitoredSource
+from src.services.news_radar import ContentExtractor, NewsRadarMonitor, RadarSource
+from src.utils.fetch_state import FetchStateStore, fetch_if_changed
+
+ARTICLE = "<html><body><article>" + "Striker ruled out with a hamstring injury. " * 20
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, body=b"", headers=None):
+        self.status_code = status_code
+        self.content = body
+        self.text = body.decode("utf-8")
+        self.headers = headers or {}
+
+
+class FakeSite:
+    """HTTP client serving pages that honour conditional requests like a real server."""
+
+    def __init__(self, etag=True, latency=0.0):
+        self.pages: dict[str, bytes] = {}
+        self.etag = etag
+        self.latency = latency
+        self.requests: list[tuple[str, dict]] = []
+
+    def get_sync(self, url, *, rate_limit_key, use_fingerprint, timeout, max_retries, headers):
+        self.requests.append((url, dict(headers)))
+        if self.latency:
+            time.sleep(self.latency)
+        body = self.pages.get(url)
+        if body is None:
+            return FakeResponse(403)
+        tag = f'"{hash(body)}"'
+        if self.etag and headers.get("If-None-Match") == tag:
+            return FakeResponse(304)
+        return FakeResponse(200, body, {"ETag": tag} if self.etag else {})
+
+
+def _probe(site, url, store):
+    return fetch_if_changed(site, url, store, rate_limit_key="conditional_fetch")
+
+
+class TestFetchIfChanged:
+    def test_etag_round_trip(self):
+        site, store = FakeSite(), FetchStateStore("test")
+        site.pages["https://a"] = b"v1"
+
+        first = _probe(site, "https://a", store)
+        assert first.changed and first.text == "v1"
+        store.commit(first)
+
+        second = _probe(site, "https://a", store)
+        assert site.requests[-1][1]["If-None-Match"] == first.etag
+        assert second.skip and second.status == "not_modified"
+
+        site.pages["https://a"] = b"v2"
+        assert _probe(site, "https://a", store).changed
+
+    def test_identical_bytes_without_validators(self):
+        site, store = FakeSite(etag=False), FetchStateStore("test")
+        site.pages["https://a"] = b"same"
+        store.commit(_probe(site, "https://a", store))
+
+        probe = _probe(site, "https://a", store)
+        assert "If-None-Match" not in site.requests[-1][1]
+        assert probe.status == "unchanged" and probe.text is None
+
+    def test_validators_only_committed_after_extraction(self):
+        site, store = FakeSite(), FetchStateStore("test")
+        site.pages["https://a"] = b"v1"
+
+        _probe(site, "https://a", store)  # extraction failed: no commit
+        assert _probe(site, "https://a", store).changed
+        assert store.get("https://a").etag is None
+
+    def test_network_error_is_a_failed_probe(self):
+        store = FetchStateStore("test")
+        client = MagicMock()
+        client.get_sync.side_effect = ConnectionError("reset")
+
+        probe = _probe(client, "https://a", store)
+        assert probe.status == "failed" and not probe.skip
+        assert store.get("https://a").checks == 0
+
+    def test_failing_urls_are_reprobed_periodically(self):
+        site, store = FakeSite(), FetchStateStore("test")  # no page: 403
+        for _ in range(3):
+            assert store.should_probe("https://waf")
+            _probe(site, "https://waf", store)
+
+        decisions = [store.should_probe("https://waf") for _ in range(10)]
+        assert decisions == [False] * 9 + [True]
+
+
+class TestChangeRates:
+    def test_rates_and_suggested_intervals(self):
+        site, store = FakeSite(), FetchStateStore("test")
+        site.pages = {"https://fast": b"0", "https://slow": b"static"}
+        for i in range(20):
+            site.pages["https://fast"] = str(i).encode()
+            for url in site.pages:
+                probe = _probe(site, url, store)
+                store.commit(probe)
+
+        rates = store.get_source_change_rates({"https://fast": 5, "https://slow": 5})
+        assert rates["https://fast"]["change_rate"] == 1.0
+        assert rates["https://fast"]["suggested_interval_minutes"] == 5
+        assert rates["https://slow"]["changes"] == 1
+        assert rates["https://slow"]["not_modified"] == 19
+        assert rates["https://slow"]["suggested_interval_minutes"] == 20  # capped at 4x
+        assert store.get_stats()["skip_rate_percent"] == pytest.approx(47.5)
+
+    def test_state_survives_restart(self, tmp_path):
+        path = str(tmp_path / "fetch_state.db")
+        site = FakeSite()
+        site.pages["https://a"] = b"v1"
+        first = FetchStateStore("news_radar", db_path=path)
+        first.commit(_probe(site, "https://a", first))
+        first.close()
+
+        second = FetchStateStore("news_radar", db_path=path)
+        assert second.persistent
+        assert _probe(site, "https://a", second).skip
+        assert FetchStateStore("browser_monitor", db_path=path).get("https://a").etag is None
+
+
+def _radar_extractor(site, monkeypatch) -> ContentExtractor:
+    monkeypatch.setattr(news_radar, "get_http_client", lambda: site)
+    extractor = ContentExtractor(fetch_state=FetchStateStore("news_radar"))
+    extractor._article_reader = None
+    extractor._extract_with_trafilatura = lambda html: html
+    extractor._extract_with_browser = AsyncMock(return_value=None)
+    return extractor
+
+
+class TestNewsRadar:
+    async def test_unchanged_pages_skip_pipeline(self, monkeypatch):
+        site = FakeSite()
+        sources = [RadarSource(url=f"https://n{i}.example.com", name=f"s{i}") for i in range(3)]
+        for source in sources:
+            site.pages[source.url] = ARTICLE.encode()
+
+        monitor = NewsRadarMonitor(use_supabase=False)
+        monitor._running = True
+        monitor._config.sources = sources
+        monitor._extractor = _radar_extractor(site, monkeypatch)
+        pipeline = AsyncMock(return_value=0)
+        monitor._run_content_pipeline = pipeline
+
+        await monitor.scan_cycle()
+        assert len(pipeline.await_args.args[0]) == 3
+
+        site.pages[sources[1].url] = (ARTICLE + " Update: back in training.").encode()
+        for source in sources:
+            source.last_scanned = None
+        await monitor.scan_cycle()
+
+        assert [s.url for s, _, _ in pipeline.await_args.args[0]] == [sources[1].url]
+        assert all(s.last_scanned for s in sources)
+        assert all(monitor._get_circuit_breaker(s.url).failure_count == 0 for s in sources)
+        stats = monitor.get_stats()
+        assert stats["extractor_stats"]["unchanged_skips"] == 2
+        assert stats["source_change_rates"][sources[0].url]["not_modified"] == 1
+
+    async def test_blocked_probe_falls_back_to_http_extraction(self, monkeypatch):
+        site = FakeSite()
+        extractor = _radar_extractor(site, monkeypatch)
+        extractor._extract_with_http = AsyncMock(return_value="text via Scrapling")
+
+        contents, unchanged = await extractor.extract_batch_if_changed(["https://waf.example.com"])
+
+        assert contents == {"https://waf.example.com": "text via Scrapling"}
+        assert not unchanged
+
+
+class TestBrowserMonitor:
+    async def test_unchanged_page_is_not_extracted_or_analyzed(self, monkeypatch):
+        site = FakeSite()
+        site.pages["https://b.example.com"] = ARTICLE.encode()
+        monkeypatch.setattr(browser_monitor, "get_http_client", lambda: site)
+        monitor = BrowserMonitor()
+        monitor._fetch_state = FetchStateStore("browser_monitor")
+        monitor._extract_with_trafilatura = lambda html: html
+        monitor._extract_with_retry = AsyncMock(return_value=(None, False))
+        monitor._analyze_and_create_news = AsyncMock(return_value=None)
+        source = MonitoredSource(url="https://b.example.com", league_key="soccer_epl")
+
+        assert await monitor.scan_source(source) == (None, True)
+        assert await monitor.scan_source(source) == (None, True)
+
+        assert monitor._analyze_and_create_news.await_count == 1
+        monitor._extract_with_retry.assert_not_awaited()
+        stats = monitor.get_stats()
+        assert stats["unchanged_skips"] == 1
+        rates = stats["source_change_rates"]["https://b.example.com"]
+        assert (rates["changes"], rates["not_modified"]) == (1, 1)
+        assert "suggested_interval_minutes" not in rates  # not a configured source
+
+
+@pytest.mark.performance
+class TestFetchStateBenchmark:
+    """Benchmark: 100 sources, 5 changed since the last scan; 5ms per response, 20ms extraction."""
+
+    async def test_benchmark_full_vs_conditional(self, monkeypatch):
+        urls = [f"https://news{i}.example.com" for i in range(100)]
+        site = FakeSite(latency=0.005)
+        site.pages = {url: ARTICLE.encode() for url in urls}
+        extracted = [0]
+
+        def extract(html):
+            extracted[0] += 1
+            time.sleep(0.02)  # Trafilatura on a news page
+            return html
+
+        extractor = _radar_extractor(site, monkeypatch)
+        extractor._extract_with_trafilatura = extract
+        await extractor.extract_batch_if_changed(urls, max_concurrent=10)  # warm validators
+        for url in urls[:5]:
+            site.pages[url] += b" update"
+
+        extracted[0] = 0
+        start = time.perf_counter()
+        contents, unchanged = await extractor.extract_batch_if_changed(urls, max_concurrent=10)
+        conditional_s = time.perf_counter() - start
+        conditional_extractions = extracted[0]
+
+        # Pre-V16.1: every page fetched and extracted in full
+        extractor._fetch_state = None
+        extracted[0] = 0
+
+        async def full_fetch(url):
+            response = await asyncio.to_thread(
+                site.get_sync,
+                url,
+                rate_limit_key="",
+                use_fingerprint=False,
+                timeout=1,
+                max_retries=0,
+                headers={},
+            )
+            return extract(response.text)
+
+        extractor._extract_with_http = full_fetch
+        start = time.perf_counter()
+        await extractor.extract_batch_http(urls, max_concurrent=10)
+        full_s = time.perf_counter() - start
+
+        print(
+            f"\n📊 100 sources, 5 changed: full={full_s * 1000:.0f}ms "
+            f"({extracted[0]} extractions) conditional={conditional_s * 1000:.0f}ms "
+            f"({conditional_extractions} extractions, {len(unchanged)} skipped)"
+        )
+        assert len(unchanged) == 95 and len(contents) == 5
+        assert conditional_extractions == 5
+        assert conditional_s < full_s
@@ -0,0 +1,179 @@
+"""
+Tests for the bulk upsert path of ingest_fixtures().
+
+Covers:
+1. INSERT ... ON CONFLICT keeps opening_* odds and NULL-safe current odds
+2. Aliases are created once with executemany (existing ones untouched)
+3. A full run writes matches, snapshots and aliases with a constant number of
+   statements, independent of the number of events
+
+Run with: pytest tests/test_ingest_fixtures_bulk.py -v -s
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+import src.ingestion.ingest_fixtures as ingest
+from src.analysis.market_intelligence import OddsSnapshot
+from src.database.models import Base, Match, TeamAlias
+from src.ingestion.odds_key_rotator import OddsKeyRotator
+
+
+@pytest.fixture
+def session_factory(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'ingest.db'}")
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    monkeypatch.setattr(ingest, "SessionLocal", factory)
+    factory.engine = engine
+    yield factory
+    engine.dispose()
+
+
+def _row(match_id, home=1.9, draw=3.4, away=4.0, over=None, **extra):
+    row = {
+        "id": match_id,
+        "league": "soccer_turkey_super_league",
+        "home_team": "Galatasaray",
+        "away_team": "Fenerbahce",
+        "start_time": datetime(2026, 10, 20, 18, 0),
+        "last_updated": datetime.now(timezone.utc),
+        "is_sharp_drop": False,
+    }
+    for prefix in ("opening", "current"):
+        row.update(
+            {
+                f"{prefix}_home_odd": home,
+                f"{prefix}_draw_odd": draw,
+                f"{prefix}_away_odd": away,
+                f"{prefix}_over_2_5": over,
+                f"{prefix}_under_2_5": None,
+                f"{prefix}_btts_yes": None,
+                f"{prefix}_btts_no": None,
+            }
+        )
+    for column in ingest._REFRESHED_COLUMNS:
+        row.setdefault(column, None)
+    row.update(extra)
+    return row
+
+
+def _event(i, start):
+    outcomes = [
+        {"name": f"Home {i}", "price": 2.0},
+        {"name": "Draw", "price": 3.3},
+        {"name": f"Away {i}", "price": 3.6},
+    ]
+    return {
+        "id": f"evt{i}",
+        "commence_time": start.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "home_team": f"Home {i}",
+        "away_team": f"Away {i}",
+        "bookmakers": [
+            {"key": "pinnacle", "markets": [{"key": "h2h", "outcomes": outcomes}]},
+        ],
+    }
+
+
+class TestUpsertMatchRows:
+    def test_conflict_preserves_opening_and_null_current(self, session_factory):
+        db = session_factory()
+        ingest._upsert_match_rows(db, [_row("m1", over=1.8)])
+        db.commit()
+
+        ingest._upsert_match_rows(
+            db, [_row("m1", home=1.6, draw=None, over=None, sharp_bookie="pinnacle")]
+        )
+        db.commit()
+
+        match = db.query(Match).filter(Match.id == "m1").one()
+        assert (match.opening_home_odd, match.current_home_odd) == (1.9, 1.6)
+        assert match.current_draw_odd == 3.4  # NULL from the feed keeps the last value
+        assert (match.opening_over_2_5, match.current_over_2_5) == (1.8, 1.8)
+        assert match.sharp_bookie == "pinnacle"
+        db.close()
+
+    def test_batches_larger_than_batch_size(self, session_factory, monkeypatch):
+        monkeypatch.setattr(ingest, "UPSERT_BATCH_SIZE", 7)
+        db = session_factory()
+        assert ingest._upsert_match_rows(db, [_row(f"m{i}") for i in range(30)]) == 30
+        db.commit()
+        assert db.query(Match).count() == 30
+        db.close()
+
+
+class TestInsertMissingTeamAliases:
+    def test_only_missing_aliases_are_created(self, session_factory):
+        db = session_factory()
+        db.add(TeamAlias(api_name="Galatasaray", search_name="Galatasaray"))
+        db.commit()
+
+        created = ingest._insert_missing_team_aliases(
+            db, ["Galatasaray", "Fenerbahce", "Fenerbahce", None]
+        )
+        db.commit()
+
+        assert created == 1
+        assert sorted(a.api_name for a in db.query(TeamAlias)) == ["Fenerbahce", "Galatasaray"]
+        db.close()
+
+
+class TestIngestFixturesBulk:
+    @pytest.fixture
+    def fake_api(self, monkeypatch):
+        start = datetime.now(timezone.utc) + timedelta(hours=24)
+        events = [_event(i, start) for i in range(120)]
+        response = MagicMock(status_code=200)
+        response.json.return_value = events
+        session = MagicMock()
+        session.get.return_value = response
+
+        monkeypatch.setattr(ingest, "_get_session", lambda: session)
+        rotator = OddsKeyRotator(["test-key"])
+        monkeypatch.setattr(ingest, "get_odds_key_rotator", lambda: rotator)
+        monkeypatch.setattr(
+            ingest,
+            "check_quota_status",
+            lambda: {"remaining": 400, "used": "0", "emergency_mode": False},
+        )
+        return events
+
+    def test_run_uses_constant_number_of_statements(self, session_factory, fake_api):
+        statements = []
+        event.listen(
+            session_factory.engine,
+            "before_cursor_execute",
+            lambda conn, cursor, sql, params, context, executemany: statements.append(sql),
+        )
+
+        ingest.ingest_fixtures(target_leagues=["soccer_turkey_super_league"], force_all=True)
+        first_run = len(statements)
+        statements.clear()
+
+        fake_api[0]["bookmakers"][0]["markets"][0]["outcomes"][0]["price"] = 1.5
+        ingest.ingest_fixtures(target_leagues=["soccer_turkey_super_league"], force_all=True)
+
+        print(f"\n📊 120 events: {first_run} statements (first run), {len(statements)} (update)")
+        assert first_run < 15 and len(statements) < 15
+
+        db = session_factory()
+        assert db.query(Match).count() == 120
+        assert db.query(OddsSnapshot).count() == 240
+        assert db.query(TeamAlias).count() == 240
+        match = db.query(Match).filter(Match.id == "evt0").one()
+        assert (match.opening_home_odd, match.current_home_odd) == (2.0, 1.5)
+        db.close()
+
+    def test_new_aliases_invalidate_team_name_index(self, session_factory, fake_api, monkeypatch):
+        invalidations = []
+        monkeypatch.setattr(ingest, "invalidate_team_name_index", lambda: invalidations.append(1))
+
+        ingest.ingest_fixtures(target_leagues=["soccer_turkey_super_league"], force_all=True)
+        assert invalidations == [1]
+
+        ingest.ingest_fixtures(target_leagues=["soccer_turkey_super_league"], force_all=True)
+        assert invalidations == [1]  # no new aliases, index left alone
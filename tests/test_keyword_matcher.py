@@ -0,0 +1,233 @@
+"""
+Tests for the V1.0 single-pass KeywordMatcher and the content filters using it.
+
+Covers:
+1. Boundary modes (word / auto / prefix), keyword precedence, case equivalences
+2. Per-category counts and spans equal the findall()/finditer() of the
+   pre-V1.11 RelevanceAnalyzer regexes; known clubs equal the per-club loop
+3. Filters on the shared scan: PositiveNewsFilter keyword check, ExclusionFilter,
+   TweetRelevanceFilter, NewsRadarMonitor._has_football_keywords()
+4. Benchmark: multilingual corpus, per-list regex passes vs one scan
+
+Run with: pytest tests/test_keyword_matcher.py -v -s
+"""
+
+import random
+import re
+import time
+
+import pytest
+
+from src.config.exclusion_lists import (
+    EXCLUDED_CATEGORIES,
+    EXCLUDED_OTHER_SPORTS,
+    EXCLUDED_SPORTS,
+)
+from src.utils.content_analysis import (
+    FOOTBALL_KEYWORDS,
+    ExclusionFilter,
+    PositiveNewsFilter,
+    RelevanceAnalyzer,
+    get_content_matcher,
+    scan_content,
+)
+from src.utils.keyword_matcher import KeywordMatcher, is_non_latin
+
+CATEGORY_LISTS = {
+    "INJURY": RelevanceAnalyzer.INJURY_KEYWORDS,
+    "SUSPENSION": RelevanceAnalyzer.SUSPENSION_KEYWORDS,
+    "NATIONAL_TEAM": RelevanceAnalyzer.NATIONAL_TEAM_KEYWORDS,
+    "CUP_ABSENCE": RelevanceAnalyzer.CUP_ABSENCE_KEYWORDS,
+    "YOUTH_CALLUP": RelevanceAnalyzer.YOUTH_CALLUP_KEYWORDS,
+    "GENERAL_SPORTS": RelevanceAnalyzer.GENERAL_SPORTS_KEYWORDS,
+    "LOGISTICAL_CRISIS": RelevanceAnalyzer.LOGISTICAL_CRISIS_KEYWORDS,
+}
+
+MULTILINGUAL_SENTENCES = [
+    "Galatasaray striker ruled out for three weeks with a hamstring injury, coach confirms.",
+    "O Flamengo confirmou que o atacante está lesionado e desfalca o time contra o Palmeiras.",
+    "El delantero de Boca Juniors fue sancionado y se perderá el partido ante River Plate.",
+    "Ο Ολυμπιακός ανακοίνωσε τραυματισμό του επιθετικού πριν το ντέρμπι με τον ΠΑΟΚ.",
+    "上海申花 前锋 受伤 缺阵 本周 联赛 比赛 教练 确认。",
+    "ヴィッセル神戸 の FW が 負傷 で 欠場 する 見込み。",
+    "Der Stürmer von Salzburg fällt verletzt aus und verpasst das Spiel am Wochenende.",
+    "KASIMPAŞA'NIN GOLCÜSÜ SAKATLIK NEDENİYLE KADRODA YOK.",
+]
+
+
+def _reference_pattern(keywords):
+    """Pre-V1.11 RelevanceAnalyzer._compile_pattern(), kept as the equivalence oracle."""
+    boundary_kw = [re.escape(kw) for kw in keywords if not is_non_latin(kw)]
+    no_boundary_kw = [re.escape(kw) for kw in keywords if is_non_latin(kw)]
+    parts = []
+    if boundary_kw:
+        parts.append(r"\b(?:" + "|".join(boundary_kw) + r")\b")
+    if no_boundary_kw:
+        parts.append(r"(?:" + "|".join(no_boundary_kw) + r")")
+    return re.compile("|".join(parts), re.IGNORECASE)
+
+
+def _reference_first_club(content):
+    for club in RelevanceAnalyzer.KNOWN_CLUBS:
+        if re.search(r"\b" + re.escape(club) + r"\b", content, re.IGNORECASE):
+            return club
+    return None
+
+
+def _random_texts(count, seed):
+    rng = random.Random(seed)
+    vocab = [kw for keywords in CATEGORY_LISTS.values() for kw in keywords]
+    vocab += RelevanceAnalyzer.KNOWN_CLUBS + PositiveNewsFilter.POSITIVE_KEYWORDS
+    filler = (
+        "the striker was said today , . ! ( - outs injuryx 上海 的 球员 και ο Αθήνα der hoje"
+    ).split()
+    texts = []
+    for _ in range(count):
+        words = [
+            rng.choice(vocab if rng.random() < 0.4 else filler) for _ in range(rng.randint(0, 30))
+        ]
+        text = rng.choice([" ", "", ". "]).join(words)
+        texts.append(text.upper() if rng.random() < 0.3 else text)
+    return texts
+
+
+class TestKeywordMatcher:
+    def test_boundary_modes(self):
+        matcher = KeywordMatcher()
+        matcher.add("WORD", ["out", "ruled out"], boundary="word")
+        matcher.add("AUTO", ["strike", "受伤", "τραυματισμός"], boundary="auto")
+        matcher.add("PREFIX", ["match"], boundary="prefix")
+
+        scan = matcher.scan("Striker ruled OUT, outside 前锋受伤 matches")
+        assert scan.spans("WORD") == [(8, 17)]  # "ruled OUT", not "outside"
+        assert scan.first("AUTO") == "受伤"  # no \b for CJK, "Striker" is not "strike"
+        assert scan.has("PREFIX")
+        assert not matcher.scan("rematch").has("PREFIX")
+
+    def test_first_listed_keyword_wins_at_a_position(self):
+        matcher = KeywordMatcher()
+        matcher.add("A", ["ruled", "ruled out"])
+        scan = matcher.scan("ruled out")
+        assert scan.first("A") == "ruled" and scan.count("A") == 1
+
+    def test_best_is_first_listed_match_anywhere(self):
+        matcher = KeywordMatcher()
+        matcher.add("TEAM", ["PSV", "AEK Athens"])
+        scan = matcher.scan("AEK Athens beat PSV")
+        assert scan.first("TEAM") == "AEK Athens"
+        assert scan.best("TEAM") == "PSV" and scan.best_span("TEAM") == (16, 19)
+
+    def test_case_equivalences_of_ignorecase(self):
+        matcher = KeywordMatcher()
+        matcher.add("TR", ["sakatlık"])
+        matcher.add("GR", ["τραυματίας"], boundary="auto")
+        assert matcher.scan("SAKATLIK").has("TR")
+        assert matcher.scan("ΤΡΑΥΜΑΤΊΑΣ").has("GR")  # final sigma
+
+    def test_duplicate_category_rejected(self):
+        matcher = KeywordMatcher()
+        matcher.add("A", ["x"])
+        with pytest.raises(ValueError):
+            matcher.add("A", ["y"])
+
+
+class TestEquivalenceWithRegexes:
+    @pytest.mark.parametrize("seed", [3, 11])
+    def test_category_spans_match_findall(self, seed):
+        patterns = {c: _reference_pattern(kw) for c, kw in CATEGORY_LISTS.items()}
+        for text in _random_texts(800, seed) + MULTILINGUAL_SENTENCES:
+            scan = scan_content(text)
+            for category, pattern in patterns.items():
+                assert scan.spans(category) == [m.span() for m in pattern.finditer(text)], (
+                    category,
+                    text,
+                )
+
+    def test_known_club_matches_per_club_loop(self):
+        for text in _random_texts(300, 17) + MULTILINGUAL_SENTENCES:
+            assert scan_content(text).best("KNOWN_CLUB") == _reference_first_club(text)
+
+
+class TestFiltersOnSharedScan:
+    def test_positive_news_keyword_check(self):
+        pnf = PositiveNewsFilter()
+        for text in ["Great atmosphere today", "Salah is back in training", "", "Nunez OUT"]:
+            assert bool(scan_content(text).has("POSITIVE")) == bool(
+                text and pnf._positive_pattern.search(text)
+            )
+        assert not pnf.is_positive_news("Nunez is ruled out of the derby")
+        assert pnf.get_positive_reason("Nunez is ruled out of the derby") is None
+
+    def test_exclusion_filter(self):
+        ef = ExclusionFilter()
+        all_excluded = EXCLUDED_SPORTS + EXCLUDED_CATEGORIES + EXCLUDED_OTHER_SPORTS
+        pattern = re.compile(r"\b(" + "|".join(map(re.escape, all_excluded)) + r")\b", re.I)
+        for text in ["NBA Basketball finals tonight", "Derby tonight", "women's league"]:
+            assert ef.is_excluded(text) == bool(pattern.search(text))
+        assert ef.get_exclusion_reason("NBA Basketball finals") == "nba"
+
+    def test_tweet_filter_injury_and_suspension(self):
+        from src.services.tweet_relevance_filter import TweetRelevanceFilter
+
+        tweet_filter = TweetRelevanceFilter()
+        assert tweet_filter.analyze("Osimhen injured, out for the derby")["topics"] == ["injury"]
+        assert tweet_filter.analyze("Icardi suspended after red card")["score"] == 0.8
+        assert tweet_filter.analyze("Great atmosphere today")["score"] == 0.1
+
+    def test_football_keywords(self):
+        from src.services.news_radar import NewsRadarMonitor
+
+        monitor = object.__new__(NewsRadarMonitor)
+        assert monitor._has_football_keywords("Three matches postponed")
+        assert monitor._has_football_keywords("Partido suspendido")
+        assert not monitor._has_football_keywords("Weather forecast for the weekend")
+
+    def test_scan_is_shared_between_filters(self):
+        text = "Flamengo atacante lesionado, fora do jogo contra o Palmeiras. " * 3
+        scan_content.cache_clear()
+        ExclusionFilter().is_excluded(text)
+        PositiveNewsFilter().is_positive_news(text)
+        RelevanceAnalyzer().analyze(text)
+        info = scan_content.cache_info()
+        assert info.misses == 1 and info.hits >= 2
+
+
+@pytest.mark.performance
+class TestKeywordMatcherBenchmark:
+    """Benchmark: 50 multilingual articles (~3 KB), every keyword list."""
+
+    def test_benchmark_regex_passes_vs_single_scan(self):
+        rng = random.Random(1)
+        docs = [" ".join(rng.choice(MULTILINGUAL_SENTENCES) for _ in range(30)) for _ in range(50)]
+        patterns = [_reference_pattern(kw) for kw in CATEGORY_LISTS.values()]
+        club_patterns = [
+            re.compile(r"\b" + re.escape(club.lower()) + r"\b")
+            for club in RelevanceAnalyzer.KNOWN_CLUBS
+        ]
+        all_excluded = EXCLUDED_SPORTS + EXCLUDED_CATEGORIES + EXCLUDED_OTHER_SPORTS
+        exclusion = re.compile(r"\b(" + "|".join(map(re.escape, all_excluded)) + r")\b", re.I)
+
+        # Pre-V1.11: one findall per category, a regex per club, exclusion and football checks
+        def regex_passes(doc):
+            counts = [len(p.findall(doc)) for p in patterns]
+            lowered = doc.lower()
+            club = next((p for p in club_patterns if p.search(lowered)), None)
+            return counts, club, exclusion.search(doc), any(k in lowered for k in FOOTBALL_KEYWORDS)
+
+        matcher = get_content_matcher()
+        start = time.perf_counter()
+        for doc in docs:
+            regex_passes(doc)
+        regex_s = time.perf_counter() - start
+        start = time.perf_counter()
+        for doc in docs:
+            matcher.scan(doc)
+        scan_s = time.perf_counter() - start
+
+        megabytes = sum(len(doc.encode()) for doc in docs) / 1e6
+        print(
+            f"\n📊 {len(docs)} multilingual articles: regex passes={regex_s * 1000:.1f}ms "
+            f"({megabytes / regex_s:.2f} MB/s), single scan={scan_s * 1000:.1f}ms "
+            f"({megabytes / scan_s:.2f} MB/s, {regex_s / scan_s:.1f}x)"
+        )
+        assert scan_s < regex_s
@@ -0,0 +1,218 @@
+"""
+Tests for the V15.0 Match Analysis Scheduler and Provider Limiter.
+
+Covers:
+1. Kickoff-time priority ordering
+2. Parallel execution with one session per worker
+3. Per-cycle deadline (deferred matches are skipped, not analyzed)
+4. Per-provider concurrency limits
+
+Run with: pytest tests/test_match_scheduler.py -v
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from src.core.match_scheduler import MatchAnalysisScheduler, MatchJob
+from src.utils.provider_limiter import ProviderLimiter
+
+KICKOFF = datetime(2026, 3, 1, 18, 0)
+
+
+def _make_match(match_id: str, hours_ahead: float):
+    return SimpleNamespace(
+        id=match_id,
+        home_team=f"Home {match_id}",
+        away_team=f"Away {match_id}",
+        league="soccer_test_league",
+        start_time=KICKOFF + timedelta(hours=hours_ahead),
+    )
+
+
+class _FakeSession:
+    """Minimal session that resolves matches from a shared dict."""
+
+    def __init__(self, matches: dict, opened: list):
+        self._matches = matches
+        self.closed = False
+        opened.append(self)
+
+    def get(self, model, match_id):
+        return self._matches.get(match_id)
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+class _FakeEngine:
+    """Analysis engine stub that records call order and concurrency."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls: list[str] = []
+        self.sessions: set[int] = set()
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def analyze_match(self, match, fotmob, now_utc, db_session, context_label, nitter_intel):
+        with self._lock:
+            self.calls.append(match.id)
+            self.sessions.add(id(db_session))
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        return {
+            "alert_sent": match.id == "m1",
+            "score": 8.5 if match.id == "m1" else 5.0,
+            "market": None,
+            "error": None,
+            "news_count": 2,
+        }
+
+
+def _build(matches, engine, **kwargs):
+    by_id = {m.id: m for m in matches}
+    opened: list = []
+    scheduler = MatchAnalysisScheduler(
+        analysis_engine=engine,
+        fotmob=MagicMock(),
+        session_factory=lambda: _FakeSession(by_id, opened),
+        **kwargs,
+    )
+    return scheduler, opened
+
+
+class TestMatchAnalysisScheduler:
+    def test_serial_mode_respects_kickoff_priority(self):
+        matches = [_make_match("m3", 30), _make_match("m1", 2), _make_match("m2", 10)]
+        engine = _FakeEngine()
+        scheduler, opened = _build(matches, engine, max_workers=1)
+
+        results, stats = scheduler.run(matches, datetime.now(timezone.utc), "TIER1")
+
+        assert engine.calls == ["m1", "m2", "m3"]
+        assert [r["match_id"] for r in results] == ["m1", "m2", "m3"]
+        assert stats.completed == 3
+        assert stats.alerts_sent == 1
+        assert all(s.closed for s in opened)
+
+    def test_parallel_mode_overlaps_matches_with_separate_sessions(self):
+        matches = [_make_match(f"m{i}", i) for i in range(1, 9)]
+        engine = _FakeEngine(delay=0.1)
+        scheduler, opened = _build(matches, engine, max_workers=4)
+
+        start = time.monotonic()
+        results, stats = scheduler.run(matches, datetime.now(timezone.utc), "TIER1")
+        elapsed = time.monotonic() - start
+
+        assert len(results) == 8
+        assert stats.completed == 8
+        assert engine.max_active > 1
+        assert engine.max_active <= 4
+        assert len(engine.sessions) == 8  # One session per job
+        assert elapsed < 0.8 * 8 * 0.1  # Well below the serial wall time
+        assert results[0]["home_team"] == "Home m1"
+
+    def test_deadline_defers_remaining_matches(self):
+        matches = [_make_match("m1", 1), _make_match("m2", 2)]
+        engine = _FakeEngine()
+        scheduler, _ = _build(matches, engine, max_workers=2, cycle_deadline_seconds=0)
+
+        results, stats = scheduler.run(matches, datetime.now(timezone.utc), "TIER2")
+
+        assert engine.calls == []
+        assert stats.skipped_deadline == 2
+        assert stats.completed == 0  # main.py counts only completed matches as processed
+        assert all(r["skipped"] for r in results)
+        assert all(r["alert_sent"] is False for r in results)
+
+    def test_engine_crash_is_isolated(self):
+        matches = [_make_match("m1", 1), _make_match("m2", 2)]
+        engine = _FakeEngine()
+        original = engine.analyze_match
+
+        def flaky(match, **kwargs):
+            if match.id == "m2":
+                raise RuntimeError("boom")
+            return original(match, **kwargs)
+
+        engine.analyze_match = flaky
+        scheduler, _ = _build(matches, engine, max_workers=2)
+
+        results, stats = scheduler.run(matches, datetime.now(timezone.utc), "TIER1")
+
+        assert results[0]["error"] is None
+        assert results[1]["error"] == "boom"
+        assert stats.errors == 1
+
+    def test_nitter_intel_lookup_is_passed_through(self):
+        matches = [_make_match("m1", 1)]
+        engine = MagicMock()
+        engine.analyze_match.return_value = {
+            "alert_sent": False,
+            "score": 0.0,
+            "market": None,
+            "error": None,
+            "news_count": 0,
+        }
+        scheduler, _ = _build(
+            matches,
+            engine,
+            max_workers=1,
+            intel_lookup=lambda match_id: {"intel": f"intel-{match_id}", "handle": "@x"},
+        )
+
+        scheduler.run(matches, datetime.now(timezone.utc), "TIER1")
+
+        assert engine.analyze_match.call_args.kwargs["nitter_intel"] == "intel-m1"
+
+    def test_match_job_without_kickoff_sorts_last(self):
+        no_kickoff = SimpleNamespace(id="x", home_team="A", away_team="B", league="l")
+        jobs = sorted([MatchJob.from_match(no_kickoff), MatchJob.from_match(_make_match("m1", 5))])
+        assert [j.match_id for j in jobs] == ["m1", "x"]
+
+
+class TestProviderLimiter:
+    def test_limit_bounds_concurrency(self):
+        limiter = ProviderLimiter({"deepseek": 2})
+        active = 0
+        max_active = 0
+        lock = threading.Lock()
+
+        def call():
+            nonlocal active, max_active
+            with limiter.slot("deepseek"):
+                with lock:
+                    active += 1
+                    max_active = max(max_active, active)
+                time.sleep(0.05)
+                with lock:
+                    active -= 1
+
+        threads = [threading.Thread(target=call) for _ in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert max_active == 2
+        stats = limiter.get_stats()["deepseek"]
+        assert stats["calls"] == 6
+        assert stats["in_flight"] == 0
+        assert stats["wait_seconds"] > 0
+
+    def test_unknown_provider_is_unlimited(self):
+        limiter = ProviderLimiter({"telegram": 1})
+        with limiter.slot("not-configured"):
+            pass
+        assert limiter.get_limit("not-configured") is None
+        assert "not-configured" not in limiter.get_stats()
@@ -0,0 +1,137 @@
+"""
+Tests for the V15.0 vectorized batch Poisson engine (math_engine.py).
+
+Verifies that MathPredictor.simulate_batch() matches the scalar
+simulate_match() path row by row, and benchmarks both on 10k fixtures.
+
+Run with: pytest tests/test_math_engine_batch.py -v -s
+"""
+
+import random
+import time
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.analysis.math_engine import MathPredictor, batch_poisson  # noqa: E402
+
+LEAGUES = [
+    "soccer_turkey_super_league",
+    "soccer_germany_bundesliga",
+    "soccer_italy_serie_a",
+    None,
+    "soccer_unknown_league",
+]
+
+
+def _random_fixtures(n: int, seed: int = 42):
+    rng = random.Random(seed)
+    rows = [
+        (
+            rng.uniform(0.0, 3.5),
+            rng.uniform(0.0, 3.5),
+            rng.uniform(0.0, 3.5),
+            rng.uniform(0.0, 3.5),
+            rng.choice(LEAGUES),
+        )
+        for _ in range(n)
+    ]
+    return [list(col) for col in zip(*rows, strict=True)]
+
+
+def _assert_matches_scalar(batch, index, scalar):
+    assert batch.home_win_prob[index] == pytest.approx(scalar.home_win_prob, abs=1e-12)
+    assert batch.draw_prob[index] == pytest.approx(scalar.draw_prob, abs=1e-12)
+    assert batch.away_win_prob[index] == pytest.approx(scalar.away_win_prob, abs=1e-12)
+    assert batch.over_25_prob[index] == pytest.approx(scalar.over_25_prob, abs=1e-12)
+    assert batch.under_25_prob[index] == pytest.approx(scalar.under_25_prob, abs=1e-12)
+    assert batch.btts_prob[index] == pytest.approx(scalar.btts_prob, abs=1e-12)
+    assert batch.home_lambda[index] == pytest.approx(scalar.home_lambda, abs=1e-12)
+    assert batch.away_lambda[index] == pytest.approx(scalar.away_lambda, abs=1e-12)
+    assert batch.most_likely_scores()[index] == scalar.most_likely_score
+
+
+class TestBatchPoissonEquivalence:
+    """simulate_batch() must reproduce simulate_match() for every fixture."""
+
+    def test_matches_scalar_path_with_league_keys(self):
+        hs, hc, as_, ac, keys = _random_fixtures(500)
+        batch = batch_poisson(hs, hc, as_, ac, league_keys=keys)
+
+        assert len(batch) == 500
+        assert batch.valid.all()
+        for i in range(500):
+            scalar = MathPredictor(league_key=keys[i]).simulate_match(hs[i], hc[i], as_[i], ac[i])
+            _assert_matches_scalar(batch, i, scalar)
+
+    @pytest.mark.parametrize("use_dixon_coles", [True, False])
+    @pytest.mark.parametrize("apply_home_advantage", [True, False])
+    def test_matches_scalar_path_flags(self, use_dixon_coles, apply_home_advantage):
+        hs, hc, as_, ac, _ = _random_fixtures(100, seed=7)
+        predictor = MathPredictor(league_avg=1.5, league_key="soccer_greece_super_league")
+        batch = predictor.simulate_batch(
+            hs,
+            hc,
+            as_,
+            ac,
+            max_goals=8,
+            use_dixon_coles=use_dixon_coles,
+            apply_home_advantage=apply_home_advantage,
+        )
+        for i in range(100):
+            scalar = predictor.simulate_match(
+                hs[i],
+                hc[i],
+                as_[i],
+                ac[i],
+                max_goals=8,
+                use_dixon_coles=use_dixon_coles,
+                apply_home_advantage=apply_home_advantage,
+            )
+            _assert_matches_scalar(batch, i, scalar)
+            assert batch.to_result(i).most_likely_score == scalar.most_likely_score
+
+    def test_invalid_rows_flagged(self):
+        batch = batch_poisson([1.5, None, 1.2], [1.0, 1.0, -0.5], [1.1, 1.1, 1.0], [1.3, 1.3, 1.0])
+
+        assert batch.valid.tolist() == [True, False, False]
+        assert np.isnan(batch.home_win_prob[1])
+        assert batch.most_likely_scores()[1:] == ["", ""]
+        assert batch.to_result(1) is None
+        assert batch.to_result(0) is not None
+
+    def test_empty_batch(self):
+        batch = batch_poisson([], [], [], [])
+        assert len(batch) == 0
+
+    def test_mismatched_league_keys_rejected(self):
+        with pytest.raises(ValueError):
+            batch_poisson([1.0, 1.0], [1.0, 1.0], [1.0, 1.0], [1.0, 1.0], league_keys=[None])
+
+
+@pytest.mark.performance
+class TestBatchPoissonBenchmark:
+    """Benchmark: batch engine vs scalar simulate_match() on 10k fixtures."""
+
+    def test_benchmark_10k_fixtures(self):
+        n = 10_000
+        hs, hc, as_, ac, keys = _random_fixtures(n, seed=2026)
+        predictors = {key: MathPredictor(league_key=key) for key in LEAGUES}
+
+        start = time.perf_counter()
+        scalar = [predictors[keys[i]].simulate_match(hs[i], hc[i], as_[i], ac[i]) for i in range(n)]
+        scalar_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        batch = batch_poisson(hs, hc, as_, ac, league_keys=keys)
+        batch_s = time.perf_counter() - start
+
+        print(
+            f"\n📊 Poisson 10k fixtures: scalar={scalar_s * 1000:.0f}ms "
+            f"batch={batch_s * 1000:.0f}ms speedup={scalar_s / max(batch_s, 1e-9):.1f}x"
+        )
+
+        for i in range(0, n, 997):
+            _assert_matches_scalar(batch, i, scalar[i])
+        assert batch_s < scalar_s
@@ -2048,6 +2048,26 @@ def test_positive_news_filter_get_reason():
     assert reason is None
 
 
+def test_positive_news_filter_sentence_split():
+    """V1.7: Sentence split no longer raises re.error; abbreviations do not end a sentence."""
+    from src.utils.content_analysis import PositiveNewsFilter
+
+    pnf = PositiveNewsFilter()
+
+    assert pnf._split_into_sentences("He played vs. Arsenal last week. Then he rested!") == [
+        "He played vs. Arsenal last week",
+        "Then he rested!",
+    ]
+
+    # Filtered now (the split used to raise, so nothing was filtered)
+    assert pnf.is_positive_news("Salah returns to training. Klopp is pleased.") is True
+    assert pnf.get_positive_reason("Salah is back in training this week.") == "back in training"
+
+    # Still let through: a negative in the same sentence, or only in another one
+    assert pnf.is_positive_news("Salah returns to training but Nunez is ruled out.") is False
+    assert pnf.is_positive_news("Salah returns to training.\nNunez is ruled out.") is True
+
+
 def test_positive_news_filter_singleton():
     """Test get_positive_news_filter returns singleton."""
     from src.utils.content_analysis import get_positive_news_filter
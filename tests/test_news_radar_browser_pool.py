@@ -0,0 +1,264 @@
+"""
+Tests for the V16.0 News Radar browser fallback pool.
+
+Covers:
+1. extract_batch_http() runs browser fallbacks in parallel, bounded by the pool size
+2. Pages get the per-page navigation timeout and stealth setup once, on creation
+3. Page recycling after N navigations; pages are discarded on errors and when
+   the browser has been recreated (their contexts are closed)
+4. Memory back-off: idle pages are closed and the pool runs one page at a time
+5. shutdown() closes pooled pages
+6. Benchmark: sequential browser fallback vs pool
+
+Run with: pytest tests/test_news_radar_browser_pool.py -v -s
+"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.services.news_radar import BrowserPagePool, ContentExtractor
+
+
+class FakePage:
+    def __init__(self, browser: "FakeBrowser"):
+        self.browser = browser
+        self.closed = False
+        self.visited: list[str] = []
+        self.navigation_timeout = None
+        self.stealth_applied = 0
+
+    def set_default_navigation_timeout(self, timeout_ms):
+        self.navigation_timeout = timeout_ms
+
+    def set_default_timeout(self, timeout_ms):
+        pass
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    async def goto(self, url, timeout=None, wait_until=None):
+        self.visited.append(url)
+        if url == "about:blank":
+            return
+        browser = self.browser
+        browser.active += 1
+        browser.peak = max(browser.peak, browser.active)
+        try:
+            await asyncio.sleep(browser.latency)
+            if url in browser.failing:
+                raise RuntimeError("net::ERR_CONNECTION_RESET")
+        finally:
+            browser.active -= 1
+
+    async def content(self):
+        return "<html></html>"
+
+    async def inner_text(self, selector):
+        return f"text of {self.visited[-1]}"
+
+
+class FakeContext:
+    def __init__(self, browser: "FakeBrowser"):
+        self.browser = browser
+        self.closed = False
+        self.pages: list[FakePage] = []
+
+    async def new_page(self):
+        page = FakePage(self.browser)
+        self.pages.append(page)
+        return page
+
+    async def close(self):
+        self.closed = True
+        for page in self.pages:
+            page.closed = True
+
+
+class FakeBrowser:
+    def __init__(self, latency=0.0, failing=()):
+        self.latency = latency
+        self.failing = set(failing)
+        self.contexts: list[FakeContext] = []
+        self.active = 0
+        self.peak = 0
+
+    def is_connected(self) -> bool:
+        return True
+
+    async def new_context(self, viewport=None):
+        context = FakeContext(self)
+        self.contexts.append(context)
+        return context
+
+
+def _pool(browser, memory=lambda: 50.0, **kwargs) -> BrowserPagePool:
+    async def get_browser():
+        return browser[0] if isinstance(browser, list) else browser
+
+    return BrowserPagePool(get_browser, memory_check=memory, memory_poll_seconds=0.01, **kwargs)
+
+
+def _extractor(browser: FakeBrowser, pool_size: int = 3) -> ContentExtractor:
+    extractor = ContentExtractor(page_timeout=7, browser_pool_size=pool_size)
+    extractor._browser = browser
+    extractor._browser_lock = asyncio.Lock()
+    extractor._extract_with_http = AsyncMock(return_value=None)
+    extractor._extract_with_trafilatura = lambda html: None
+    return extractor
+
+
+async def _use(pool: BrowserPagePool, url: str = "https://x"):
+    async with pool.page() as page:
+        await page.goto(url)
+        return page
+
+
+class TestBatchBrowserFallback:
+    async def test_fallbacks_run_in_parallel_up_to_pool_size(self):
+        browser = FakeBrowser(latency=0.02)
+        extractor = _extractor(browser, pool_size=3)
+        urls = [f"https://waf{i}.example.com" for i in range(9)]
+
+        results = await extractor.extract_batch_http(urls)
+
+        assert results == {url: f"text of {url}" for url in urls}
+        assert browser.peak == 3
+        stats = extractor.get_stats()
+        assert stats["browser_extractions"] == 9
+        assert stats["browser_pool_pages_created"] == 3
+        assert stats["browser_pool_in_use"] == 0
+
+    async def test_pages_get_timeout_and_stealth_once(self):
+        browser = FakeBrowser()
+        extractor = _extractor(browser, pool_size=1)
+        stealth = AsyncMock()
+        extractor._apply_stealth = stealth
+
+        for i in range(3):
+            assert await extractor._extract_with_browser(f"https://s{i}.example.com")
+
+        page = browser.contexts[0].pages[0]
+        assert page.navigation_timeout == 7000
+        assert stealth.await_count == 1
+        assert page.visited[:2] == ["https://s0.example.com", "about:blank"]
+
+    async def test_failed_page_returns_none_and_others_succeed(self):
+        browser = FakeBrowser(failing={"https://bad.example.com"})
+        extractor = _extractor(browser)
+        urls = ["https://ok1.example.com", "https://bad.example.com", "https://ok2.example.com"]
+
+        results = await extractor.extract_batch_http(urls)
+
+        assert results["https://bad.example.com"] is None
+        assert results["https://ok1.example.com"] and results["https://ok2.example.com"]
+        assert extractor.get_stats()["browser_pool_pages_discarded"] == 1
+
+
+class TestPageLifecycle:
+    async def test_recycled_after_max_navigations(self):
+        browser = FakeBrowser()
+        pool = _pool(browser, size=1, max_navigations=2)
+
+        for _ in range(5):
+            await _use(pool)
+
+        stats = pool.get_stats()
+        assert (stats["pages_created"], stats["pages_recycled"]) == (3, 2)
+        assert [c.closed for c in browser.contexts] == [True, True, False]
+
+    async def test_error_discards_page(self):
+        browser = FakeBrowser(failing={"https://bad"})
+        pool = _pool(browser, size=1)
+
+        with pytest.raises(RuntimeError):
+            await _use(pool, "https://bad")
+        await _use(pool)
+
+        assert browser.contexts[0].closed
+        assert pool.get_stats()["pages_created"] == 2
+
+    async def test_pages_of_replaced_browser_are_discarded(self):
+        browsers = [FakeBrowser()]
+        pool = _pool(browsers, size=1)
+        await _use(pool)
+
+        browsers[0] = FakeBrowser()  # _recreate_browser_internal()
+        page = await _use(pool)
+
+        assert page.browser is browsers[0]
+        assert pool.get_stats()["idle"] == 1
+
+    async def test_no_browser_yields_none(self):
+        pool = _pool(None)
+        async with pool.page() as page:
+            assert page is None
+        assert pool.get_stats()["in_use"] == 0
+
+
+class TestMemoryBackoff:
+    async def test_high_memory_runs_one_page_at_a_time(self):
+        browser = FakeBrowser(latency=0.01)
+        memory = [50.0]
+        pool = _pool(browser, memory=lambda: memory[0], size=4)
+        await asyncio.gather(*(_use(pool) for _ in range(4)))
+        assert pool.get_stats()["idle"] == 4
+
+        memory[0] = 90.0
+        browser.peak = 0
+        await asyncio.gather(*(_use(pool) for _ in range(4)))
+
+        stats = pool.get_stats()
+        assert browser.peak == 1
+        assert stats["memory_backoffs"] >= 1
+        assert stats["idle"] == 0  # idle pages closed, returned pages not kept
+        assert all(c.closed for c in browser.contexts)
+
+        memory[0] = 60.0
+        browser.peak = 0
+        await asyncio.gather(*(_use(pool) for _ in range(4)))
+        assert browser.peak == 4
+
+
+class TestShutdown:
+    async def test_shutdown_closes_pool(self):
+        browser = FakeBrowser()
+        extractor = _extractor(browser)
+        await extractor.extract_batch_http(["https://a.example.com", "https://b.example.com"])
+        browser.is_connected = lambda: False
+        extractor._browser = None  # keep shutdown() away from the fake browser object
+
+        pool = extractor._page_pool
+        await extractor.shutdown()
+
+        assert extractor._page_pool is None
+        assert pool.get_stats()["idle"] == 0
+        assert all(c.closed for c in browser.contexts)
+
+
+@pytest.mark.performance
+class TestBrowserPoolBenchmark:
+    """Benchmark: 12 WAF-blocked URLs, 50ms page load each."""
+
+    async def test_benchmark_sequential_vs_pool(self):
+        urls = [f"https://waf{i}.example.com" for i in range(12)]
+
+        # Pre-V16.0 fallback: one page at a time
+        extractor = _extractor(FakeBrowser(latency=0.05), pool_size=1)
+        start = time.perf_counter()
+        await extractor.extract_batch_http(urls)
+        sequential_s = time.perf_counter() - start
+
+        extractor = _extractor(FakeBrowser(latency=0.05), pool_size=4)
+        start = time.perf_counter()
+        results = await extractor.extract_batch_http(urls)
+        pool_s = time.perf_counter() - start
+
+        print(
+            f"\n📊 12 browser fallbacks, 50ms each: sequential={sequential_s * 1000:.0f}ms "
+            f"pool(4)={pool_s * 1000:.0f}ms ({sequential_s / pool_s:.1f}x)"
+        )
+        assert all(results.values())
+        assert pool_s < sequential_s / 2
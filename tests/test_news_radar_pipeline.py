@@ -0,0 +1,270 @@
+"""
+Tests for the V16.0 News Radar content pipeline.
+
+Covers:
+1. scan_cycle() hands extracted pages to the pipeline; breakers and last_scanned
+   are updated per source as before
+2. Prefilter runs on every page; DeepSeek analyses overlap up to
+   NEWS_RADAR_ANALYSIS_CONCURRENCY
+3. Per-stage throughput stats in get_stats(); stage errors don't stop the cycle
+4. TelegramAlerter serializes concurrent sends
+5. DeepSeekFallback rate limit holds for concurrent analyses
+6. Benchmark: 200 sources, sequential processing vs pipeline
+
+Run with: pytest tests/test_news_radar_pipeline.py -v -s
+"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+import src.services.news_radar as news_radar
+from src.services.news_radar import (
+    DeepSeekFallback,
+    NewsRadarMonitor,
+    PrefilteredContent,
+    RadarAlert,
+    RadarSource,
+    TelegramAlerter,
+)
+from src.utils.high_value_detector import SignalResult
+
+
+class FakeAlerter:
+    def __init__(self):
+        self.sent: list[str] = []
+
+    async def send_alert(self, alert: RadarAlert) -> bool:
+        self.sent.append(alert.source_url)
+        return True
+
+    def get_stats(self) -> dict[str, int]:
+        return {"alerts_sent": len(self.sent)}
+
+
+class FakeExtractor:
+    def __init__(self, contents: dict[str, str | None]):
+        self.contents = contents
+
+    async def extract_batch_if_changed(self, urls, max_concurrent=5):
+        return {url: self.contents.get(url) for url in urls}, set()
+
+    def get_stats(self) -> dict[str, int]:
+        return {}
+
+
+def _alert(url: str, confidence: float = 0.6) -> RadarAlert:
+    return RadarAlert(
+        source_name="test",
+        source_url=url,
+        affected_team="Team",
+        category="INJURY",
+        betting_impact="HIGH",
+        summary="summary",
+        confidence=confidence,
+    )
+
+
+def _sources(n: int) -> list[RadarSource]:
+    return [RadarSource(url=f"https://news{i}.example.com", name=f"src{i}") for i in range(n)]
+
+
+class PipelineMonitor(NewsRadarMonitor):
+    """Monitor with the two content stages replaced by timed fakes."""
+
+    def __init__(self, analysis_seconds=0.0, passes=lambda url: True, fails=()):
+        super().__init__(use_supabase=False)
+        self._running = True
+        self._alerter = FakeAlerter()
+        self.analysis_seconds = analysis_seconds
+        self.passes = passes
+        self.fails = set(fails)
+        self.prefiltered: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _prefilter_content(self, content, source, url, simhash=None):
+        self.prefiltered.append(url)
+        if url in self.fails:
+            raise RuntimeError("cache failure")
+        if not self.passes(url):
+            return None
+        return PrefilteredContent(source, url, content, content, SignalResult(detected=False))
+
+    async def _analyze_content(self, prepared):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.analysis_seconds)
+            if prepared.url in self.fails:
+                raise RuntimeError("deepseek down")
+            return _alert(prepared.url)
+        finally:
+            self.in_flight -= 1
+
+
+class TestScanCycle:
+    async def test_extracted_pages_go_through_pipeline(self):
+        sources = _sources(4)
+        monitor = PipelineMonitor()
+        monitor._config.sources = sources
+        monitor._extractor = FakeExtractor(
+            {s.url: f"page {i} " * 50 for i, s in enumerate(sources) if i != 2}
+        )
+
+        alerts = await monitor.scan_cycle()
+
+        assert alerts == 3
+        assert sorted(monitor._alerter.sent) == sorted(
+            s.url for i, s in enumerate(sources) if i != 2
+        )
+        assert sources[2].last_scanned is None
+        assert monitor._get_circuit_breaker(sources[2].url).failure_count == 1
+        assert all(s.last_scanned for i, s in enumerate(sources) if i != 2)
+
+        stats = monitor.get_stats()
+        assert stats["urls_scanned"] == 4
+        assert stats["alerts_sent"] == 3
+        assert stats["pipeline_stats"]["prefilter"]["items_in"] == 3
+        assert stats["pipeline_stats"]["delivery"]["items_out"] == 3
+
+    async def test_high_confidence_alerts_are_handed_off(self, monkeypatch):
+        monitor = PipelineMonitor()
+        handoff = MagicMock()
+
+        async def fake_handoff(alert, content):
+            handoff(alert.source_url)
+
+        monkeypatch.setattr(monitor, "_handoff_to_main_pipeline", fake_handoff)
+        assert await monitor._deliver_alert(_alert("https://a", confidence=0.9), "text")
+        assert await monitor._deliver_alert(_alert("https://b", confidence=0.5), "text")
+        handoff.assert_called_once_with("https://a")
+
+
+class TestContentPipeline:
+    async def test_analyses_overlap_up_to_limit(self, monkeypatch):
+        monkeypatch.setattr(news_radar, "NEWS_RADAR_ANALYSIS_CONCURRENCY", 4)
+        monitor = PipelineMonitor(analysis_seconds=0.02)
+        extracted = [(s, "content", None) for s in _sources(20)]
+
+        assert await monitor._run_content_pipeline(extracted) == 20
+        assert monitor.max_in_flight == 4
+
+        analysis = monitor.get_stats()["pipeline_stats"]["analysis"]
+        assert analysis["items_in"] == analysis["items_out"] == 20
+        assert analysis["avg_in_flight"] > 2
+        assert analysis["items_per_second"] > 0
+
+    async def test_prefilter_runs_on_every_page(self):
+        monitor = PipelineMonitor(
+            passes=lambda url: url.endswith(("0.example.com", "5.example.com"))
+        )
+        sources = _sources(20)
+
+        assert await monitor._run_content_pipeline([(s, "c", None) for s in sources]) == 4
+        assert monitor.prefiltered == [s.url for s in sources]
+        prefilter = monitor.get_stats()["pipeline_stats"]["prefilter"]
+        assert (prefilter["items_in"], prefilter["items_out"]) == (20, 4)
+
+    async def test_stage_errors_are_counted_and_isolated(self):
+        sources = _sources(6)
+        monitor = PipelineMonitor(fails={sources[1].url})
+
+        # sources[1] fails in the prefilter; the others are analyzed and delivered
+        assert await monitor._run_content_pipeline([(s, "c", None) for s in sources]) == 5
+        assert monitor.get_stats()["pipeline_stats"]["prefilter"]["errors"] == 1
+
+    async def test_stop_event_skips_pending_analyses(self, monkeypatch):
+        monkeypatch.setattr(news_radar, "NEWS_RADAR_ANALYSIS_CONCURRENCY", 1)
+        monitor = PipelineMonitor(analysis_seconds=0.01)
+
+        async def deliver_and_stop(alert, content):
+            monitor._stop_event.set()
+            return True
+
+        monitor._deliver_alert = deliver_and_stop
+        assert await monitor._run_content_pipeline([(s, "c", None) for s in _sources(5)]) == 1
+
+    async def test_process_content_runs_both_stages(self):
+        monitor = PipelineMonitor()
+        source = _sources(1)[0]
+        alert = await monitor._process_content("text", source, source.url)
+        assert alert.source_url == source.url
+        monitor.passes = lambda url: False
+        assert await monitor._process_content("text", source, source.url) is None
+
+
+class TestTelegramAlerterSerialization:
+    async def test_concurrent_sends_are_serialized(self, monkeypatch):
+        lock = threading.Lock()
+        active = [0]
+        peak = [0]
+
+        def fake_post(url, json, timeout):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            threading.Event().wait(0.02)
+            with lock:
+                active[0] -= 1
+            response = MagicMock()
+            response.status_code = 200
+            return response
+
+        monkeypatch.setattr(news_radar.requests, "post", fake_post)
+        alerter = TelegramAlerter(token="t", chat_id="c")
+
+        results = await asyncio.gather(*(alerter.send_alert(_alert(f"u{i}")) for i in range(5)))
+
+        assert all(results)
+        assert peak[0] == 1
+        assert alerter.get_stats()["alerts_sent"] == 5
+
+
+class TestDeepSeekRateLimit:
+    async def test_concurrent_calls_are_spaced(self):
+        deepseek = DeepSeekFallback(min_interval=0.05)
+        starts: list[float] = []
+
+        async def call():
+            await deepseek._wait_for_rate_limit()
+            starts.append(time.time())
+
+        await asyncio.gather(*(call() for _ in range(4)))
+
+        gaps = [b - a for a, b in zip(sorted(starts), sorted(starts)[1:], strict=False)]
+        assert min(gaps) >= 0.045
+
+
+@pytest.mark.performance
+class TestPipelineBenchmark:
+    """Benchmark: 200 sources, 10ms DeepSeek latency each."""
+
+    async def test_benchmark_sequential_vs_pipeline(self, monkeypatch):
+        monkeypatch.setattr(news_radar, "NEWS_RADAR_ANALYSIS_CONCURRENCY", 8)
+        extracted = [(s, "content", None) for s in _sources(200)]
+
+        # Pre-V16.0 scan_cycle: _process_content + send, one source after another
+        monitor = PipelineMonitor(analysis_seconds=0.01)
+        start = time.perf_counter()
+        for source, content, simhash in extracted:
+            alert = await monitor._process_content(content, source, source.url, simhash)
+            await monitor._deliver_alert(alert, content)
+        sequential_s = time.perf_counter() - start
+
+        monitor = PipelineMonitor(analysis_seconds=0.01)
+        start = time.perf_counter()
+        assert await monitor._run_content_pipeline(extracted) == 200
+        pipeline_s = time.perf_counter() - start
+
+        stats = monitor.get_stats()["pipeline_stats"]
+        print(
+            f"\n📊 200 sources, 10ms analysis: sequential={sequential_s * 1000:.0f}ms "
+            f"pipeline={pipeline_s * 1000:.0f}ms ({sequential_s / pipeline_s:.1f}x), "
+            f"analysis {stats['analysis']['items_per_second']}/s, "
+            f"avg in flight {stats['analysis']['avg_in_flight']}"
+        )
+        assert pipeline_s < sequential_s / 3
@@ -0,0 +1,267 @@
+"""
+Tests for the V1.0 parallel Nitter scrape scheduler.
+
+Covers:
+1. TokenBucket refill and waiting
+2. Handles are spread over all healthy instances in parallel
+3. Circuit breakers: a worker stops when its instance goes unhealthy and the
+   other instances take over its handles; soft reset when none is healthy
+4. Per-handle retry budget and cycle metrics
+5. NitterFallbackScraper.scrape_accounts() uses the scheduler (cache first,
+   output order kept, instance failures recorded)
+6. Benchmark: 30 handles on 3 instances, serial loop vs scheduler
+
+Run with: pytest tests/test_nitter_scheduler.py -v -s
+"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.services.nitter_fallback_scraper import (
+    CIRCUIT_BREAKER_CONFIG,
+    NitterCache,
+    NitterFallbackScraper,
+    ScrapedTweet,
+)
+from src.services.nitter_scheduler import NitterScrapeScheduler, TokenBucket
+
+INSTANCES = ["https://a.nitter", "https://b.nitter", "https://c.nitter"]
+
+
+class FakeInstances:
+    """Instances with breaker state and a scripted attempt coroutine."""
+
+    def __init__(self, instances=INSTANCES, latency=0.0, failing=(), broken=()):
+        self.healthy = dict.fromkeys(instances, True)
+        self.latency = latency
+        self.failing = set(failing)  # handles that always fail
+        self.broken = set(broken)  # instances whose requests always fail
+        self.calls: list[tuple[str, str]] = []
+        self.active = 0
+        self.peak = 0
+
+    async def attempt(self, handle, instance):
+        self.calls.append((handle, instance))
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.active -= 1
+        if handle in self.failing or instance in self.broken:
+            if instance in self.broken:
+                self.healthy[instance] = False  # breaker opens on first failure
+            return None
+        return [f"tweet from {handle}"]
+
+    def get_instances(self):
+        return [url for url, ok in self.healthy.items() if ok]
+
+    def is_available(self, url):
+        return self.healthy.get(url, False)
+
+
+def _scheduler(fake, **kwargs) -> NitterScrapeScheduler:
+    kwargs.setdefault("min_interval_seconds", 0)
+    kwargs.setdefault("jitter_seconds", 0)
+    return NitterScrapeScheduler(
+        attempt=fake.attempt,
+        get_instances=fake.get_instances,
+        is_available=fake.is_available,
+        **kwargs,
+    )
+
+
+class TestTokenBucket:
+    async def test_refill_and_wait(self):
+        clock = [0.0]
+        sleeps: list[float] = []
+
+        async def sleep(seconds):
+            sleeps.append(seconds)
+            clock[0] += seconds
+
+        bucket = TokenBucket(rate=0.5, clock=lambda: clock[0], sleep=sleep)
+        assert bucket.try_acquire()
+        assert not bucket.try_acquire()
+
+        clock[0] += 1.0
+        assert await bucket.acquire() == pytest.approx(1.0)
+        assert sleeps == [pytest.approx(1.0)]
+
+        clock[0] += 10.0  # capacity 1: no burst after idling
+        assert bucket.try_acquire()
+        assert not bucket.try_acquire()
+
+
+class TestScheduling:
+    async def test_handles_spread_over_instances(self):
+        fake = FakeInstances(latency=0.01)
+        handles = [f"h{i}" for i in range(12)]
+
+        results = await _scheduler(fake).run(handles)
+
+        assert results == {h: [f"tweet from {h}"] for h in handles}
+        assert fake.peak == 3
+        per_instance = {url: sum(1 for _, i in fake.calls if i == url) for url in INSTANCES}
+        assert all(count >= 3 for count in per_instance.values())
+
+    async def test_per_instance_rate_limit(self):
+        fake = FakeInstances(instances=INSTANCES[:1])
+        scheduler = _scheduler(fake, min_interval_seconds=0.02)
+
+        start = time.perf_counter()
+        await scheduler.run(["h1", "h2", "h3", "h4"])
+        elapsed = time.perf_counter() - start
+
+        assert elapsed >= 0.055  # 3 waits of 20ms after the first request
+        assert scheduler.get_stats()["last_cycle"]["instances"][INSTANCES[0]][
+            "throttled_seconds"
+        ] == pytest.approx(0.06, abs=0.01)
+
+
+class TestCircuitBreakers:
+    async def test_unhealthy_instance_stops_and_others_take_over(self):
+        fake = FakeInstances(latency=0.005, broken={INSTANCES[1]})
+        handles = [f"h{i}" for i in range(9)]
+
+        scheduler = _scheduler(fake)
+        results = await scheduler.run(handles)
+
+        assert all(results[h] for h in handles)
+        assert sum(1 for _, i in fake.calls if i == INSTANCES[1]) == 1
+        cycle = scheduler.get_stats()["last_cycle"]
+        assert cycle["instances"][INSTANCES[1]]["failures"] == 1
+        assert (cycle["succeeded"], cycle["retries"]) == (9, 1)
+
+    async def test_soft_reset_once_when_none_healthy(self):
+        fake = FakeInstances()
+        fake.healthy = dict.fromkeys(INSTANCES, False)
+        resets = []
+
+        def soft_reset():
+            resets.append(1)
+            fake.healthy[INSTANCES[0]] = True
+            return 1
+
+        results = await _scheduler(fake, on_exhausted=soft_reset).run(["h1", "h2"])
+
+        assert resets == [1]
+        assert results == {"h1": ["tweet from h1"], "h2": ["tweet from h2"]}
+
+    async def test_no_instances_gives_up(self):
+        fake = FakeInstances()
+        fake.healthy = dict.fromkeys(INSTANCES, False)
+        scheduler = _scheduler(fake, on_exhausted=lambda: 0)
+
+        assert await scheduler.run(["h1"]) == {"h1": []}
+        assert scheduler.get_stats()["last_cycle"]["given_up"] == 1
+
+
+class TestRetryBudget:
+    async def test_failing_handle_uses_its_own_budget(self):
+        fake = FakeInstances(failing={"bad"})
+        scheduler = _scheduler(fake, retry_budget=4)
+
+        results = await scheduler.run(["ok1", "bad", "ok2"])
+
+        assert results["bad"] == [] and results["ok1"] and results["ok2"]
+        bad_calls = [i for h, i in fake.calls if h == "bad"]
+        assert len(bad_calls) == 4
+        assert len(set(bad_calls)) > 1  # retries move to other instances
+
+        cycle = scheduler.get_stats()["last_cycle"]
+        assert (cycle["attempts"], cycle["retries"], cycle["given_up"]) == (6, 3, 1)
+        assert cycle["succeeded"] == 2
+        assert cycle["peak_parallel_instances"] == 3
+
+
+def _scraper(tmp_path, fake) -> NitterFallbackScraper:
+    scraper = NitterFallbackScraper()
+    scraper._cache = NitterCache(cache_file=str(tmp_path / "nitter_cache.json"))
+    scraper._ensure_browser = AsyncMock(return_value=True)
+    scraper._scheduler.min_interval_seconds = 0
+    scraper._scheduler.jitter_seconds = 0
+
+    async def scrape_once(handle_clean, instance_url, attempt_info=""):
+        tweets = await fake.attempt(handle_clean, instance_url)
+        if tweets is None:
+            scraper._mark_instance_failure(instance_url, "HTTP503")
+            return None, Exception("HTTP503"), False
+        scraper._mark_instance_success(instance_url)
+        scraped = [ScrapedTweet(f"@{handle_clean}", "2026-01-01", t, ["injury"]) for t in tweets]
+        return scraped, None, False
+
+    scraper._scrape_once = scrape_once
+    return scraper
+
+
+class TestScraperIntegration:
+    async def test_scrape_accounts_uses_scheduler(self, tmp_path):
+        instances = list(NitterFallbackScraper()._instance_health)
+        fake = FakeInstances(instances=instances, latency=0.005)
+        scraper = _scraper(tmp_path, fake)
+        scraper._cache.set("cached", [{"date": "d", "content": "from cache", "topics": []}])
+
+        result = await scraper.scrape_accounts(["@h1", "@cached", "@h2", "@h3", "@h1"])
+
+        assert [a["handle"] for a in result["accounts"]] == ["@h1", "@cached", "@h2", "@h3"]
+        assert result["accounts"][1]["posts"][0]["content"] == "from cache"
+        assert {h for h, _ in fake.calls} == {"h1", "h2", "h3"}
+        assert result["stats"]["cycle"]["handles"] == 3
+        assert scraper.get_stats()["scheduler"]["cycles"] == 1
+
+    async def test_failed_instance_is_skipped_by_breaker(self, tmp_path):
+        instances = list(NitterFallbackScraper()._instance_health)
+        fake = FakeInstances(instances=instances, latency=0.002)
+        fake.broken = {instances[0]}
+        fake.healthy = {}  # breaker state lives in the scraper
+        scraper = _scraper(tmp_path, fake)
+        fake.get_instances = scraper._get_healthy_instances
+
+        result = await scraper.scrape_accounts([f"@h{i}" for i in range(12)])
+
+        assert all(a["posts"] for a in result["accounts"])
+        assert scraper.get_stats()["instance_health"][instances[0]]["healthy"] is False
+        broken_calls = sum(1 for _, i in fake.calls if i == instances[0])
+        assert broken_calls == CIRCUIT_BREAKER_CONFIG["failure_threshold"]
+
+
+@pytest.mark.performance
+class TestSchedulerBenchmark:
+    """Benchmark: 30 handles, 3 healthy instances, 30ms page load, 10ms per-instance pause."""
+
+    async def test_benchmark_serial_vs_parallel(self):
+        handles = [f"h{i}" for i in range(30)]
+
+        # Pre-V14.1 scrape_accounts: one handle after another with a pause in between
+        fake = FakeInstances(latency=0.03)
+        start = time.perf_counter()
+        for i, handle in enumerate(handles):
+            await fake.attempt(handle, INSTANCES[i % 3])
+            await asyncio.sleep(0.01)
+        serial_s = time.perf_counter() - start
+
+        fake = FakeInstances(latency=0.03)
+        scheduler = _scheduler(fake, min_interval_seconds=0.01)
+        start = time.perf_counter()
+        await scheduler.run(handles)
+        parallel_s = time.perf_counter() - start
+
+        fake = FakeInstances(instances=INSTANCES[:1], latency=0.03)
+        start = time.perf_counter()
+        await _scheduler(fake, min_interval_seconds=0.01).run(handles)
+        one_instance_s = time.perf_counter() - start
+
+        cycle = scheduler.get_stats()["last_cycle"]
+        print(
+            f"\n📊 30 handles: serial={serial_s * 1000:.0f}ms "
+            f"scheduler(3 instances)={parallel_s * 1000:.0f}ms ({serial_s / parallel_s:.1f}x), "
+            f"scheduler(1 instance)={one_instance_s * 1000:.0f}ms, "
+            f"{cycle['handles_per_second']} handles/s"
+        )
+        assert parallel_s < serial_s / 2
+        assert parallel_s < one_instance_s / 2
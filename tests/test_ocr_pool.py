@@ -0,0 +1,374 @@
+"""
+Tests for the V1.0 OCR worker pool and content-hash result cache.
+
+Covers:
+1. image_fingerprint(): equal for identical bytes, different for two lineup
+   cards on the same template with different names
+2. OcrResultCache: exact hits, TTL, LRU bound
+3. crop_to_text_region(): crops flat margins, leaves busy images alone
+4. OcrWorkerPool: real worker processes, bounded in-flight jobs, timeout
+5. process_squad_image_async(): same validation as process_squad_image(),
+   reposted images skip OCR, failures return None (transient ones raised on request)
+6. telegram_listener._ocr_channel_photos(): a channel's photos are OCR'd concurrently
+7. Benchmark: 8 images, blocking OCR in the event loop vs the pool
+
+Tesseract is faked (pytesseract.image_to_string), so the pool runs in thread
+mode wherever OCR itself is exercised.
+
+Run with: pytest tests/test_ocr_pool.py -v -s
+"""
+
+import asyncio
+import os
+import threading
+import time
+from io import BytesIO
+from types import SimpleNamespace
+
+import pytest
+from PIL import Image, ImageDraw
+
+from src.analysis import image_ocr
+from src.analysis.image_ocr import crop_to_text_region, process_squad_image
+from src.analysis.ocr_pool import (
+    OcrPoolFullError,
+    OcrResultCache,
+    OcrWorkerPool,
+    image_fingerprint,
+    process_squad_image_async,
+)
+
+SQUAD_TEXT = "GALATASARAY SQUAD LIST: ICARDI OUT INJURED, MERTENS SUSPENDED"
+
+
+def _lineup_image(seed: int = 0, size=(1200, 900)) -> Image.Image:
+    """A lineup-like graphic: flat background, a header bar and rows of 'text'."""
+    img = Image.new("RGB", size, (20 + seed * 40 % 200, 40, 90))
+    draw = ImageDraw.Draw(img)
+    draw.rectangle((100, 80, 1100, 180), fill=(230, 200, 40))
+    for row in range(11):
+        y = 240 + row * 55
+        width = 300 + ((row * 37 + seed * 91) % 500)
+        draw.rectangle((150, y, 150 + width, y + 30), fill=(240, 240, 240))
+    return img
+
+
+def _lineup_card(team: str, players: list[str]) -> Image.Image:
+    """A lineup card on a fixed template: same layout, only the names differ."""
+    img = Image.new("RGB", (1200, 900), (20, 40, 90))
+    draw = ImageDraw.Draw(img)
+    draw.rectangle((100, 80, 1100, 180), fill=(230, 200, 40))
+    draw.text((120, 110), team, fill=(0, 0, 0))
+    for row, player in enumerate(players):
+        draw.text((150, 240 + row * 55), player, fill=(240, 240, 240))
+    return img
+
+
+def _encode(img: Image.Image, fmt="PNG", **kwargs) -> bytes:
+    buffer = BytesIO()
+    img.save(buffer, format=fmt, **kwargs)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def fake_tesseract(monkeypatch):
+    """Replace Tesseract with a fake returning SQUAD_TEXT after `delay` seconds."""
+    state = SimpleNamespace(calls=0, delay=0.0, text=SQUAD_TEXT, lock=threading.Lock())
+
+    def image_to_string(img, lang=None, config=None, timeout=0):
+        with state.lock:
+            state.calls += 1
+        time.sleep(state.delay)
+        return f"  {state.text.lower()}\n"
+
+    monkeypatch.setattr(image_ocr.pytesseract, "image_to_string", image_to_string)
+    return state
+
+
+@pytest.fixture
+def thread_pool():
+    pool = OcrWorkerPool(max_workers=4, queue_depth=4, timeout_seconds=5, use_processes=False)
+    yield pool
+    pool.shutdown()
+
+
+class TestImageFingerprint:
+    def test_identical_bytes_share_a_fingerprint(self, tmp_path):
+        data = _encode(_lineup_image())
+        path = tmp_path / "squad.png"
+        path.write_bytes(data)
+
+        assert image_fingerprint(data) == image_fingerprint(str(path))
+        assert image_fingerprint(f"file://{path}") == image_fingerprint(data)
+
+    def test_same_template_different_text(self):
+        galatasaray = _lineup_card("GALATASARAY", ["MUSLERA", "ICARDI", "TORREIRA"])
+        fenerbahce = _lineup_card("FENERBAHCE", ["LIVAKOVIC", "DZEKO", "FRED"])
+
+        assert image_fingerprint(_encode(galatasaray)) != image_fingerprint(_encode(fenerbahce))
+
+
+class TestOcrResultCache:
+    def test_exact_hits_only(self):
+        cache = OcrResultCache()
+        cache.put("aa" * 16, "TEXT")
+
+        assert cache.get("aa" * 16) == "TEXT"
+        assert cache.get("ab" * 16) is None
+
+        stats = cache.get_stats()
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+
+    def test_ttl_and_lru_bound(self):
+        now = [0.0]
+        cache = OcrResultCache(max_entries=2, ttl_seconds=10, clock=lambda: now[0])
+        cache.put("a", "a")
+        cache.put("b", "b")
+        cache.get("a")
+        cache.put("c", "c")  # evicts b, the least recently used
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "a"
+
+        now[0] = 11.0
+        assert cache.get("a") is None
+        assert cache.get_stats()["entries"] == 1
+
+
+class TestCropToTextRegion:
+    def test_crops_flat_margins(self):
+        img = Image.new("L", (2000, 1500), 255)
+        ImageDraw.Draw(img).rectangle((800, 600, 1200, 800), fill=0)
+
+        cropped = crop_to_text_region(img)
+
+        assert cropped.size[0] < 500 and cropped.size[1] < 300
+
+    def test_busy_image_unchanged(self):
+        img = Image.effect_noise((400, 300), 100)
+        assert crop_to_text_region(img) is img
+
+
+class TestOcrWorkerPool:
+    async def test_runs_in_worker_processes(self):
+        pool = OcrWorkerPool(max_workers=2, queue_depth=0, timeout_seconds=60)
+        try:
+            pids = await asyncio.gather(pool.run(os.getpid), pool.run(os.getpid))
+        finally:
+            pool.shutdown()
+
+        assert os.getpid() not in pids
+        assert pool.get_stats()["processes"] is True
+
+    async def test_in_flight_bound(self, thread_pool):
+        thread_pool.max_workers, thread_pool.queue_depth = 1, 1
+        jobs = [asyncio.ensure_future(thread_pool.run(time.sleep, 0.05)) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        with pytest.raises(OcrPoolFullError):
+            await thread_pool.run(time.sleep, 0)
+        await asyncio.gather(*jobs)
+        await thread_pool.run(time.sleep, 0)  # slots freed
+
+        stats = thread_pool.get_stats()
+        assert (stats["completed"], stats["rejected"], stats["in_flight"]) == (3, 1, 0)
+
+    async def test_timeout(self, thread_pool):
+        thread_pool.timeout_seconds = 0.02
+
+        with pytest.raises(asyncio.TimeoutError):
+            await thread_pool.run(time.sleep, 0.2)
+        assert thread_pool.get_stats()["timeouts"] == 1
+
+
+class TestProcessSquadImageAsync:
+    async def test_matches_blocking_version_and_caches(self, tmp_path, fake_tesseract, thread_pool):
+        path = tmp_path / "squad.png"
+        _lineup_image().save(path)
+        repost = tmp_path / "repost.png"
+        repost.write_bytes(path.read_bytes())  # forwarded photo: same bytes
+        cache = OcrResultCache()
+
+        blocking = process_squad_image(f"file://{path}")
+        first = await process_squad_image_async(f"file://{path}", pool=thread_pool, cache=cache)
+        second = await process_squad_image_async(f"file://{repost}", pool=thread_pool, cache=cache)
+
+        assert first == blocking == SQUAD_TEXT
+        assert second == SQUAD_TEXT
+        assert fake_tesseract.calls == 2  # blocking + first; the repost hit the cache
+        assert cache.get_stats()["hits"] == 1
+
+    async def test_same_template_other_team_is_ocrd_again(
+        self, tmp_path, fake_tesseract, thread_pool
+    ):
+        galatasaray = tmp_path / "gs.png"
+        _lineup_card("GALATASARAY", ["MUSLERA", "ICARDI"]).save(galatasaray)
+        fenerbahce = tmp_path / "fb.png"
+        _lineup_card("FENERBAHCE", ["LIVAKOVIC", "DZEKO"]).save(fenerbahce)
+        cache = OcrResultCache()
+
+        await process_squad_image_async(str(galatasaray), pool=thread_pool, cache=cache)
+        fake_tesseract.text = "FENERBAHCE SQUAD LIST: DZEKO OUT INJURED, FRED SUSPENDED"
+        second = await process_squad_image_async(str(fenerbahce), pool=thread_pool, cache=cache)
+
+        assert fake_tesseract.calls == 2
+        assert second == fake_tesseract.text
+
+    async def test_cached_text_is_validated_per_message(
+        self, tmp_path, fake_tesseract, thread_pool
+    ):
+        fake_tesseract.text = "%% ~~"  # noise: only a team channel accepts it
+        path = tmp_path / "squad.png"
+        _lineup_image().save(path)
+        cache = OcrResultCache()
+        team_channel = {"type": "team", "team": "Galatasaray"}
+
+        assert await process_squad_image_async(str(path), pool=thread_pool, cache=cache) is None
+        cached = await process_squad_image_async(
+            str(path), channel_info=team_channel, pool=thread_pool, cache=cache
+        )
+
+        assert fake_tesseract.calls == 1
+        assert cached == process_squad_image(str(path), channel_info=team_channel)
+
+    async def test_failures_return_none(self, tmp_path, thread_pool):
+        bad = tmp_path / "not_an_image.jpg"
+        bad.write_bytes(b"not an image")
+        cache = OcrResultCache()
+
+        assert await process_squad_image_async(str(bad), pool=thread_pool, cache=cache) is None
+        assert (
+            await process_squad_image_async(
+                str(tmp_path / "missing.jpg"), pool=thread_pool, cache=cache
+            )
+            is None
+        )
+        assert cache.get_stats()["entries"] == 0
+
+    async def test_transient_failures_raised_on_request(self, tmp_path):
+        path = tmp_path / "squad.png"
+        _lineup_image().save(path)
+
+        async def full(*args):
+            raise OcrPoolFullError("8 OCR jobs in flight")
+
+        pool = SimpleNamespace(run=full, timeout_seconds=5)
+        cache = OcrResultCache()
+
+        assert await process_squad_image_async(str(path), pool=pool, cache=cache) is None
+        with pytest.raises(OcrPoolFullError):
+            await process_squad_image_async(str(path), pool=pool, cache=cache, raise_transient=True)
+        assert cache.get_stats()["entries"] == 0
+
+
+class TestTelegramPrefetch:
+    async def test_channel_photos_ocr_concurrently(self, tmp_path, monkeypatch):
+        from src.processing import telegram_listener
+
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "temp").mkdir()
+        active = {"now": 0, "peak": 0}
+
+        async def fake_ocr(image_url, channel_info=None, raise_transient=False):
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+            await asyncio.sleep(0.01)
+            active["now"] -= 1
+            return f"OCR {os.path.basename(image_url)}"
+
+        class FakeClient:
+            async def download_media(self, photo, path):
+                _lineup_image().save(path, format="JPEG")
+
+        monkeypatch.setattr(telegram_listener, "process_squad_image_async", fake_ocr)
+        date = SimpleNamespace(timestamp=lambda: 1_700_000_000)
+        messages = [
+            SimpleNamespace(id=i, photo=object() if i != 2 else None, date=date)
+            for i in range(1, 5)
+        ]
+        for msg in messages:
+            msg.date = SimpleNamespace(timestamp=lambda i=msg.id: 1_700_000_000 + i)
+
+        results = await telegram_listener._ocr_channel_photos(
+            FakeClient(), messages, "insider", {"type": "insider"}
+        )
+
+        assert sorted(results) == [1, 3, 4]
+        assert results[3] == (
+            "./temp/insider_1700000003.jpg",
+            "OCR insider_1700000003.jpg",
+            False,
+        )
+        assert active["peak"] == 3
+
+
+@pytest.mark.performance
+class TestOcrPoolBenchmark:
+    """Benchmark: 8 squad images (4 distinct, each forwarded once), 60ms fake Tesseract."""
+
+    async def test_benchmark_blocking_vs_pool(self, tmp_path, fake_tesseract):
+        fake_tesseract.delay = 0.06
+        paths = []
+        for i in range(8):
+            path = tmp_path / f"img{i}.jpg"
+            if i < 4:
+                _lineup_image(seed=i).save(path, quality=90)
+            else:
+                path.write_bytes((tmp_path / f"img{i - 4}.jpg").read_bytes())
+            paths.append(f"file://{path}")
+
+        async def measure(coro):
+            """Wall time and worst event-loop stall (10ms ticker) while coro runs."""
+            stalls = []
+            done = False
+
+            async def ticker():
+                while not done:
+                    tick = time.perf_counter()
+                    await asyncio.sleep(0.01)
+                    stalls.append(time.perf_counter() - tick - 0.01)
+
+            task = asyncio.ensure_future(ticker())
+            await asyncio.sleep(0)
+            start = time.perf_counter()
+            await coro
+            elapsed = time.perf_counter() - start
+            done = True
+            await task
+            return elapsed, max(stalls)
+
+        # Pre-V12.5 fetch_squad_images: blocking OCR per message inside the event loop
+        async def blocking():
+            for path in paths:
+                process_squad_image(path)
+
+        blocking_s, blocking_stall = await measure(blocking())
+        blocking_calls = fake_tesseract.calls
+
+        fake_tesseract.calls = 0
+        pool = OcrWorkerPool(max_workers=4, queue_depth=8, timeout_seconds=5, use_processes=False)
+        cache = OcrResultCache()
+        try:
+            pool_s, pool_stall = await measure(
+                asyncio.gather(
+                    *(process_squad_image_async(p, pool=pool, cache=cache) for p in paths[:4])
+                )
+            )
+            repost_s, _ = await measure(
+                asyncio.gather(
+                    *(process_squad_image_async(p, pool=pool, cache=cache) for p in paths[4:])
+                )
+            )
+        finally:
+            pool.shutdown()
+
+        print(
+            f"\n📊 8 images: blocking={blocking_s * 1000:.0f}ms "
+            f"(loop stalled {blocking_stall * 1000:.0f}ms, {blocking_calls} OCR runs); "
+            f"pool={(pool_s + repost_s) * 1000:.0f}ms "
+            f"(loop stalled {pool_stall * 1000:.0f}ms, {fake_tesseract.calls} OCR runs, "
+            f"reposts {repost_s * 1000:.0f}ms from cache)"
+        )
+        assert fake_tesseract.calls == 4
+        assert pool_s + repost_s < blocking_s / 2
+        assert pool_stall < blocking_stall / 4
@@ -0,0 +1,128 @@
+"""
+Tests for the V1.0 OddsKeyRotator and the concurrent league fetch stage.
+
+Covers:
+1. Quota tracking from x-requests-remaining / x-requests-used headers
+2. Concurrent 429s on the same key rotate exactly once
+3. fetch_leagues_concurrently() rotates keys on 429 and isolates failures
+4. Wall time of a multi-league fetch ~ slowest league, not the sum
+
+Run with: pytest tests/test_odds_key_rotator.py -v -s
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+import src.ingestion.ingest_fixtures as ingest
+from src.ingestion.odds_key_rotator import OddsKeyRotator
+
+
+def _response(status=200, events=None, remaining="450", used="50"):
+    response = MagicMock(status_code=status, text="error")
+    response.headers = {"x-requests-remaining": remaining, "x-requests-used": used}
+    response.json.return_value = events if events is not None else []
+    return response
+
+
+class TestOddsKeyRotator:
+    def test_quota_headers_are_tracked_per_key(self):
+        rotator = OddsKeyRotator(["k1", "k2"])
+        assert rotator.record_response("k1", {"x-requests-remaining": "20000.0"}) == 20000
+        rotator.record_response("k2", {"x-requests-remaining": "12", "x-requests-used": "488"})
+
+        status = rotator.get_status()
+        assert status["remaining"] == {"key_1": 20000, "key_2": 12}
+        assert status["used"] == {"key_2": 488}
+        assert status["total_remaining"] == 20012
+
+    def test_zero_remaining_retires_key(self):
+        rotator = OddsKeyRotator(["k1", "k2"])
+        rotator.record_response("k1", {"x-requests-remaining": "0"})
+        assert rotator.get_current_key() == "k2"
+        assert rotator.get_status()["exhausted_keys"] == [1]
+
+    def test_concurrent_exhaustion_rotates_once(self):
+        rotator = OddsKeyRotator(["k1", "k2", "k3"])
+        barrier = threading.Barrier(8)
+
+        def report():
+            barrier.wait()
+            rotator.mark_exhausted("k1")
+
+        threads = [threading.Thread(target=report) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(5)
+
+        assert rotator.get_current_key() == "k2"
+        assert rotator.get_status()["available_keys"] == 2
+
+    def test_all_exhausted_and_reset(self):
+        rotator = OddsKeyRotator(["k1", "k2"])
+        rotator.mark_exhausted("k1")
+        rotator.mark_exhausted("k2")
+        assert rotator.get_current_key() is None
+        assert not rotator.is_available()
+
+        rotator.reset()
+        assert rotator.get_current_key() == "k1"
+
+    def test_falls_back_to_single_key(self):
+        rotator = OddsKeyRotator([], fallback_key="single")
+        assert rotator.get_current_key() == "single"
+        assert OddsKeyRotator(["", " "], fallback_key="").get_current_key() is None
+
+
+class TestConcurrentLeagueFetch:
+    @pytest.fixture
+    def rotator(self, monkeypatch):
+        rotator = OddsKeyRotator(["k1", "k2"])
+        monkeypatch.setattr(ingest, "get_odds_key_rotator", lambda: rotator)
+        monkeypatch.setattr(ingest.time, "sleep", lambda s: None)
+        return rotator
+
+    def _install_session(self, monkeypatch, handler):
+        session = MagicMock()
+        session.get.side_effect = handler
+        monkeypatch.setattr(ingest, "_get_session", lambda: session)
+        return session
+
+    def test_429_rotates_and_failures_are_isolated(self, monkeypatch, rotator):
+        def handler(url, params, timeout):
+            if params["apiKey"] == "k1":
+                return _response(429)
+            if "broken" in url:
+                return _response(500)
+            return _response(events=[{"id": url}])
+
+        self._install_session(monkeypatch, handler)
+        results = ingest.fetch_leagues_concurrently(
+            ["soccer_a", "soccer_broken", "soccer_b"], max_workers=3
+        )
+
+        assert results["soccer_a"] == [{"id": f"{ingest.BASE_URL}/soccer_a/odds"}]
+        assert results["soccer_b"] is not None
+        assert results["soccer_broken"] is None
+        assert rotator.get_status()["exhausted_keys"] == [1]
+
+    def test_wall_time_is_close_to_slowest_league(self, monkeypatch, rotator):
+        delay = 0.2
+        leagues = [f"soccer_league_{i}" for i in range(8)]
+
+        def handler(url, params, timeout):
+            threading.Event().wait(delay)  # time.sleep is patched out by the fixture
+            return _response(events=[])
+
+        self._install_session(monkeypatch, handler)
+        start = time.perf_counter()
+        results = ingest.fetch_leagues_concurrently(leagues, max_workers=8)
+        elapsed = time.perf_counter() - start
+
+        print(f"\n📊 8 leagues x {delay}s: {elapsed:.2f}s concurrent vs {8 * delay:.1f}s serial")
+        assert len(results) == 8 and all(r == [] for r in results.values())
+        assert elapsed < 3 * delay
+        assert rotator.get_status()["calls"]["key_1"] == 8
@@ -0,0 +1,195 @@
+"""
+Tests for the V1.0 SQLite optimizer state store.
+
+Covers:
+1. Round trip of the optimizer data tree through optimizer_stats rows
+2. Saves upsert only the rows touched since the last save, in one transaction
+3. One-time migration from optimizer_weights.json into an empty store
+4. stats_drawer reads the store when the SQLite backend is active
+5. Benchmark: save time with hundreds of strategies, JSON rewrite vs row upserts
+
+Run with: pytest tests/test_optimizer_state_store.py -v -s
+"""
+
+import json
+import random
+import time
+
+import pytest
+from sqlalchemy import create_engine, event
+
+import src.analysis.optimizer as optimizer_module
+from src.analysis.optimizer import StrategyOptimizer
+from src.database.optimizer_state_model import (
+    SCOPE_DRIVER,
+    SCOPE_MARKET,
+    OptimizerStateStore,
+    optimizer_state_keys,
+)
+
+LEAGUES = ["soccer_epl", "soccer_spain_la_liga", "soccer_turkey_super_league"]
+MARKETS = ["Over 2.5 Goals", "Home Win", "BTTS", "Under 2.5 Goals"]
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'state.db'}")
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def store(engine):
+    return OptimizerStateStore(bind=engine)
+
+
+def _count_statements(engine):
+    statements = []
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda conn, cursor, sql, params, context, executemany: statements.append(
+            (sql, len(params) if executemany else 1)
+        ),
+    )
+    return statements
+
+
+def _settle(optimizer, n, seed=1, leagues=LEAGUES, markets=MARKETS):
+    rng = random.Random(seed)
+    for _ in range(n):
+        win = rng.random() < 0.5
+        optimizer.record_bet_result(
+            rng.choice(leagues),
+            rng.choice(markets),
+            "WIN" if win else "LOSS",
+            odds=round(rng.uniform(1.5, 3.5), 2),
+            driver=rng.choice(["INJURY_INTEL", "SHARP_MONEY"]),
+            expansion_type=rng.choice([None, "GOALS", "CORNERS"]),
+        )
+
+
+class TestOptimizerStateStore:
+    def test_round_trip(self, tmp_path, store):
+        optimizer = StrategyOptimizer(weights_file=str(tmp_path / "w.json"))
+        _settle(optimizer, 200)
+
+        assert store.load() is None
+        written = store.save(optimizer.data, optimizer_state_keys(optimizer.data))
+        assert written == store.count() == len(optimizer_state_keys(optimizer.data))
+        assert store.load() == json.loads(json.dumps(optimizer.data))
+
+    def test_only_dirty_rows_are_written(self, tmp_path, engine, store):
+        optimizer = StrategyOptimizer(weights_file=str(tmp_path / "w.json"), state_store=store)
+        _settle(optimizer, 300)
+        assert optimizer._save_data()
+        total_rows = store.count()
+
+        statements = _count_statements(engine)
+        optimizer.record_bet_result("soccer_epl", "Home Win", "WIN", odds=2.1, driver="SHARP_MONEY")
+        assert optimizer._dirty_keys == {
+            (SCOPE_MARKET, "soccer_epl", "1X2"),
+            (SCOPE_DRIVER, "", "SHARP_MONEY"),
+        }
+        assert optimizer._save_data()
+
+        upserts = [n for sql, n in statements if "INSERT INTO optimizer_stats" in sql]
+        print(f"\n📊 1 bet after 300: {upserts} row upserts of {total_rows} rows")
+        assert upserts == [3]  # market + driver + global, one executemany
+        assert optimizer._dirty_keys == set()
+
+        reloaded = StrategyOptimizer(weights_file=str(tmp_path / "w.json"), state_store=store)
+        assert reloaded.data == json.loads(json.dumps(optimizer.data))
+        assert not (tmp_path / "w.json").exists()
+
+    def test_failed_save_keeps_rows_dirty(self, tmp_path, store, monkeypatch):
+        optimizer = StrategyOptimizer(weights_file=str(tmp_path / "w.json"), state_store=store)
+        _settle(optimizer, 5)
+        dirty = set(optimizer._dirty_keys)
+
+        def fail(data, keys):
+            raise RuntimeError("database is locked")
+
+        monkeypatch.setattr(store, "save", fail)
+        assert not optimizer._save_data()
+        assert optimizer._dirty_keys == dirty
+
+
+class TestJsonMigration:
+    def test_migrates_once_from_json(self, tmp_path, store):
+        weights_file = str(tmp_path / "optimizer_weights.json")
+        legacy = StrategyOptimizer(weights_file=weights_file)
+        _settle(legacy, 120)
+        assert legacy._save_data()
+
+        migrated = StrategyOptimizer(weights_file=weights_file, state_store=store)
+        assert migrated.data == legacy.data
+        assert store.count() == len(optimizer_state_keys(legacy.data))
+
+        # The JSON file is kept as a backup but no longer read
+        with open(weights_file, "w") as f:
+            json.dump({"version": "3.0", "stats": {}, "drivers": {}, "global": {}}, f)
+        again = StrategyOptimizer(weights_file=weights_file, state_store=store)
+        assert again.data["global"]["total_bets"] == 120
+
+    def test_store_failure_falls_back_to_json(self, tmp_path, store, monkeypatch):
+        weights_file = str(tmp_path / "optimizer_weights.json")
+        legacy = StrategyOptimizer(weights_file=weights_file)
+        _settle(legacy, 20)
+        legacy._save_data()
+
+        def broken():
+            raise RuntimeError("no such table")
+
+        monkeypatch.setattr(store, "load", broken)
+        optimizer = StrategyOptimizer(weights_file=weights_file, state_store=store)
+        assert optimizer.data["global"]["total_bets"] == 20
+        assert optimizer._state_store is None
+
+
+class TestStatsDrawerReadsStore:
+    def test_stats_from_sqlite_backend(self, tmp_path, store, monkeypatch):
+        import config.settings as settings
+        import src.database.optimizer_state_model as state_model
+        from src.analysis import stats_drawer
+
+        optimizer = StrategyOptimizer(weights_file=str(tmp_path / "w.json"), state_store=store)
+        _settle(optimizer, 40)
+        optimizer._save_data()
+
+        monkeypatch.setattr(settings, "OPTIMIZER_STATE_BACKEND", "sqlite")
+        monkeypatch.setattr(state_model, "get_optimizer_state_store", lambda: store)
+        monkeypatch.setattr(stats_drawer, "OPTIMIZER_WEIGHTS_FILE", str(tmp_path / "none.json"))
+
+        stats = stats_drawer.get_stats_data()
+        assert stats["total_bets"] == 40
+        assert stats["wins"] + stats["losses"] == 40
+
+
+@pytest.mark.performance
+class TestStateStoreBenchmark:
+    """Benchmark: 400 strategies, saving after each of 50 settled bets."""
+
+    def test_benchmark_json_vs_rows(self, tmp_path, store, monkeypatch):
+        leagues = [f"soccer_league_{i}" for i in range(100)]
+        seed_optimizer = StrategyOptimizer(weights_file=str(tmp_path / "seed.json"))
+        _settle(seed_optimizer, 8000, leagues=leagues)
+        store.save(seed_optimizer.data, optimizer_state_keys(seed_optimizer.data))
+        seed_optimizer._save_data()
+        monkeypatch.setattr(optimizer_module, "OPTIMIZER_STATE_BACKEND", "json")
+
+        def run(optimizer):
+            start = time.perf_counter()
+            for i in range(50):
+                _settle(optimizer, 1, seed=i, leagues=leagues)
+                assert optimizer._save_data()
+            return time.perf_counter() - start
+
+        json_s = run(StrategyOptimizer(weights_file=str(tmp_path / "seed.json")))
+        rows_s = run(StrategyOptimizer(weights_file=str(tmp_path / "seed.json"), state_store=store))
+
+        print(
+            f"\n📊 {store.count()} state rows, 50 saves: JSON rewrite={json_s * 1000:.0f}ms "
+            f"SQLite rows={rows_s * 1000:.0f}ms ({json_s / max(rows_s, 1e-9):.1f}x)"
+        )
+        assert rows_s < json_s
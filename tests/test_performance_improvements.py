@@ -486,36 +486,19 @@ class TestMemoryCleanup:
         """Test that cleanup_expired removes old items."""
         from datetime import timedelta
 
-        from src.utils.discovery_queue import DiscoveryItem, DiscoveryQueue
+        from src.utils.discovery_queue import DiscoveryQueue
 
         queue = DiscoveryQueue(ttl_hours=1)  # 1 hour TTL
 
-        # Push an item
+        # Push an item discovered 2 hours ago (already past the TTL)
         queue.push(
             data={"title": "Test"},
             league_key="soccer_epl",
             category="OTHER",
             confidence=0.5,
+            discovered_at=datetime.now(timezone.utc) - timedelta(hours=2),
         )
 
-        # Manually expire the item by modifying discovered_at
-        with queue._lock:
-            if queue._queue:
-                old_time = datetime.now(timezone.utc) - timedelta(hours=2)
-                queue._queue[0] = DiscoveryItem(
-                    uuid=queue._queue[0].uuid,
-                    league_key=queue._queue[0].league_key,
-                    team=queue._queue[0].team,
-                    title=queue._queue[0].title,
-                    snippet=queue._queue[0].snippet,
-                    url=queue._queue[0].url,
-                    source_name=queue._queue[0].source_name,
-                    category=queue._queue[0].category,
-                    confidence=queue._queue[0].confidence,
-                    discovered_at=old_time,  # 2 hours ago
-                    data=queue._queue[0].data,
-                )
-
         # Cleanup should remove expired item
         removed = queue.cleanup_expired()
         assert removed == 1
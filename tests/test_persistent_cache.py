@@ -0,0 +1,152 @@
+"""
+Tests for the V1.0 PersistentCacheTier and the SmartCache V2.3 disk tier.
+
+Covers:
+1. Compressed round-trip with fresh/stale windows
+2. Pruning (expired rows + max_entries) and filtering
+3. Warm restart: a new SmartCache serves fresh/stale entries from disk
+4. Degrading to memory-only when the file cannot be opened
+
+Run with: pytest tests/test_persistent_cache.py -v
+"""
+
+import threading
+import time
+
+import pytest
+
+from src.utils.persistent_cache import PersistentCacheTier
+from src.utils.smart_cache import SmartCache
+
+TEAM = {
+    "details": {"id": 8634, "name": "Barcelona"},
+    "squad": [{"name": f"P{i}"} for i in range(30)],
+}
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "cache" / "fotmob_swr.db")
+
+
+def _fail_fetch():
+    raise AssertionError("fetch_func called despite a warm persistent tier")
+
+
+class TestPersistentCacheTier:
+    def test_round_trip_is_compressed(self, db_path):
+        tier = PersistentCacheTier(db_path)
+        now = time.time()
+        assert tier.set("team_details:8634", TEAM, now + 60, now + 180) is True
+
+        record = tier.get("team_details:8634")
+        assert record.value == TEAM
+        assert record.is_fresh() and record.is_usable()
+
+        payload = tier._conn.execute("SELECT payload FROM cache_entries").fetchone()[0]
+        assert len(payload) < len(str(TEAM))
+
+    def test_records_past_stale_window_are_ignored_and_pruned(self, db_path):
+        tier = PersistentCacheTier(db_path)
+        now = time.time()
+        tier.set("old", {"x": 1}, now - 20, now - 10)
+        tier.set("stale", {"x": 2}, now - 10, now + 60)
+
+        assert tier.get("old") is None
+        record = tier.get("stale")
+        assert record.value == {"x": 2} and not record.is_fresh()
+
+        assert tier.prune() == 1
+        assert tier.size() == 1
+
+    def test_max_entries_keeps_most_recent(self, db_path):
+        tier = PersistentCacheTier(db_path, max_entries=3)
+        now = time.time()
+        for i in range(5):
+            tier.set(f"k{i}", i, now + 60, now + 120)
+            time.sleep(0.002)
+
+        tier.prune()
+        assert tier.size() == 3
+        assert tier.get("k0") is None and tier.get("k4").value == 4
+
+    def test_filtered_and_unserializable_values_are_skipped(self, db_path):
+        tier = PersistentCacheTier(db_path, should_persist=lambda v: not v.get("error"))
+        now = time.time()
+        assert tier.set("err", {"error": True, "error_msg": "403"}, now + 60, now + 120) is False
+        assert tier.set("obj", {"when": object()}, now + 60, now + 120) is False
+        assert tier.size() == 0
+        assert tier.get_stats()["skipped"] == 2
+
+    def test_delete_matching_escapes_like_wildcards(self, db_path):
+        tier = PersistentCacheTier(db_path)
+        now = time.time()
+        for key in ("team_details:1", "teamXdetails:2", "league_table:3"):
+            tier.set(key, 1, now + 60, now + 120)
+
+        assert tier.delete_matching("team_") == 1
+        assert tier.get("teamXdetails:2") is not None
+        assert tier.delete("league_table:3") is True
+        assert tier.clear() == 1
+
+    def test_unopenable_path_disables_tier(self, tmp_path):
+        blocker = tmp_path / "not_a_dir"
+        blocker.write_text("x")
+        tier = PersistentCacheTier(str(blocker / "cache.db"))
+
+        assert tier.available is False
+        assert tier.set("k", 1, time.time() + 60, time.time() + 120) is False
+        assert tier.get("k") is None
+
+        cache = SmartCache(name="mem_only", persistent_tier=tier)
+        assert cache.get_with_swr("k", lambda: 5, ttl=60) == (5, True)
+
+
+class TestSmartCacheWarmRestart:
+    def test_fresh_entry_served_after_restart(self, db_path):
+        first = SmartCache(name="fotmob_swr", persistent_tier=PersistentCacheTier(db_path))
+        assert first.get_with_swr("team_details:8634", lambda: TEAM, ttl=3600) == (TEAM, True)
+
+        restarted = SmartCache(name="fotmob_swr", persistent_tier=PersistentCacheTier(db_path))
+        assert restarted.get_with_swr("team_details:8634", _fail_fetch, ttl=3600) == (TEAM, True)
+
+        # Hydrated into memory: the next lookup does not touch disk
+        reads = restarted._persistent.get_stats()["reads"]
+        assert restarted.get_with_swr("team_details:8634", _fail_fetch, ttl=3600) == (TEAM, True)
+        assert restarted._persistent.get_stats()["reads"] == reads
+        assert restarted.get_stats()["persistent_hits"] == 1
+
+    def test_stale_entry_served_and_revalidated(self, db_path):
+        tier = PersistentCacheTier(db_path)
+        now = time.time()
+        tier.set("league_table:47", {"rev": 1}, now - 1, now + 3600)
+
+        refreshed = threading.Event()
+
+        def fetch():
+            refreshed.set()
+            return {"rev": 2}
+
+        cache = SmartCache(name="fotmob_swr", persistent_tier=PersistentCacheTier(db_path))
+        assert cache.get_with_swr("league_table:47", fetch, ttl=3600) == ({"rev": 1}, False)
+
+        assert refreshed.wait(5)
+        deadline = time.monotonic() + 5
+        while cache.get("league_table:47") is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert cache.get("league_table:47") == {"rev": 2}
+        assert cache.get_stats()["swr_stale_hit_rate_pct"] > 0
+        while tier.get("league_table:47").value != {"rev": 2} and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert tier.get("league_table:47").is_fresh()
+
+    def test_invalidate_and_clear_reach_disk(self, db_path):
+        tier = PersistentCacheTier(db_path)
+        cache = SmartCache(name="fotmob_swr", persistent_tier=tier)
+        cache.get_with_swr("match_details:1", lambda: {"id": 1}, ttl=60)
+        cache.get_with_swr("match_details:2", lambda: {"id": 2}, ttl=60)
+
+        cache.invalidate("match_details:1")
+        assert tier.get("match_details:1") is None
+        cache.clear()
+        assert tier.size() == 0
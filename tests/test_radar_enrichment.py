@@ -13,8 +13,8 @@ Tests:
 Author: EarlyBird AI
 """
 
-from datetime import datetime, timedelta
-from unittest.mock import Mock, patch
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
 
 import pytest
 
@@ -159,21 +159,27 @@ class TestRadarLightEnricher:
         enricher = RadarLightEnricher()
         enricher._db_available = True
 
-        # Mock the database query
-        mock_match = Mock()
-        mock_match.id = "test_match_123"
-        mock_match.home_team = "Galatasaray"
-        mock_match.away_team = "Fenerbahce"
-        mock_match.start_time = datetime.now() + timedelta(hours=24)
-        mock_match.league = "soccer_turkey_super_lig"
-        mock_match.current_draw_odd = 3.20
-        mock_match.opening_draw_odd = 3.50
-
-        with patch("src.database.models.SessionLocal") as mock_session_class:
-            mock_session = Mock()
-            mock_session_class.return_value = mock_session
-            mock_session.query.return_value.filter.return_value.all.return_value = [mock_match]
+        # Mock the upcoming-match index (V1.3: no per-alert DB query)
+        from src.utils.upcoming_match_index import UpcomingMatch, UpcomingMatchIndex
 
+        upcoming = UpcomingMatch(
+            id="test_match_123",
+            league="soccer_turkey_super_lig",
+            home_team="Galatasaray",
+            away_team="Fenerbahce",
+            start_time=datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(hours=24),
+            current_draw_odd=3.20,
+            opening_draw_odd=3.50,
+        )
+        index = UpcomingMatchIndex(loader=lambda: [upcoming])
+
+        with (
+            patch("src.utils.upcoming_match_index.get_upcoming_match_index", return_value=index),
+            patch(
+                "src.ingestion.league_manager.get_all_active_league_keys",
+                return_value=["soccer_turkey_super_lig"],
+            ),
+        ):
             result = enricher.find_upcoming_match("Galatasaray")
 
             # Should find the match
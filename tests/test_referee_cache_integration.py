@@ -23,6 +23,10 @@ import pytest
 
 from src.analysis.referee_cache import CACHE_TTL_DAYS, RefereeCache, get_referee_cache
 
+# V15.0: These tests inspect/edit the JSON file directly, so disable the
+# write-behind debounce and the throttled mtime check (see test_referee_cache_write_behind.py)
+WRITE_THROUGH = {"flush_delay_seconds": 0, "reload_check_seconds": 0}
+
 # ============================================
 # FIXTURES
 # ============================================
@@ -47,7 +51,7 @@ def referee_cache(temp_cache_dir):
     Create a RefereeCache instance with temporary cache file.
     """
     temp_dir, cache_file = temp_cache_dir
-    return RefereeCache(cache_file=cache_file, ttl_days=CACHE_TTL_DAYS)
+    return RefereeCache(cache_file=cache_file, ttl_days=CACHE_TTL_DAYS, **WRITE_THROUGH)
 
 
 @pytest.fixture
@@ -88,7 +92,7 @@ class TestRefereeCacheFileOperations:
         assert not cache_file.exists()
 
         # Initialize cache
-        cache = RefereeCache(cache_file=cache_file, ttl_days=7)
+        cache = RefereeCache(cache_file=cache_file, ttl_days=7, **WRITE_THROUGH)
 
         # Cache directory should be created
         assert cache_file.parent.exists()
@@ -144,11 +148,11 @@ class TestRefereeCacheFileOperations:
         temp_dir, cache_file = temp_cache_dir
 
         # Create first cache instance and write data
-        cache1 = RefereeCache(cache_file=cache_file, ttl_days=7)
+        cache1 = RefereeCache(cache_file=cache_file, ttl_days=7, **WRITE_THROUGH)
         cache1.set("Michael Oliver", sample_referee_stats)
 
         # Create second cache instance (simulates process restart)
-        cache2 = RefereeCache(cache_file=cache_file, ttl_days=7)
+        cache2 = RefereeCache(cache_file=cache_file, ttl_days=7, **WRITE_THROUGH)
 
         # Verify data persists
         retrieved = cache2.get("Michael Oliver")
@@ -246,7 +250,7 @@ class TestRefereeCacheTTL:
         temp_dir, cache_file = temp_cache_dir
 
         # Create cache with 1-day TTL
-        cache = RefereeCache(cache_file=cache_file, ttl_days=1)
+        cache = RefereeCache(cache_file=cache_file, ttl_days=1, **WRITE_THROUGH)
 
         # Set entry
         cache.set("Michael Oliver", sample_referee_stats)
@@ -270,7 +274,7 @@ class TestRefereeCacheTTL:
         temp_dir, cache_file = temp_cache_dir
 
         # Create cache with 1-day TTL
-        cache = RefereeCache(cache_file=cache_file, ttl_days=1)
+        cache = RefereeCache(cache_file=cache_file, ttl_days=1, **WRITE_THROUGH)
 
         # Set entry
         cache.set("Michael Oliver", sample_referee_stats)
@@ -294,7 +298,7 @@ class TestRefereeCacheTTL:
         temp_dir, cache_file = temp_cache_dir
 
         # Create cache with 1-day TTL
-        cache = RefereeCache(cache_file=cache_file, ttl_days=1)
+        cache = RefereeCache(cache_file=cache_file, ttl_days=1, **WRITE_THROUGH)
 
         # Set entry
         cache.set("Michael Oliver", sample_referee_stats)
@@ -320,7 +324,7 @@ class TestRefereeCacheTTL:
         temp_dir, cache_file = temp_cache_dir
 
         # Create cache with 30-day TTL
-        cache = RefereeCache(cache_file=cache_file, ttl_days=30)
+        cache = RefereeCache(cache_file=cache_file, ttl_days=30, **WRITE_THROUGH)
 
         # Set entry
         cache.set("Michael Oliver", sample_referee_stats)
@@ -387,7 +391,7 @@ class TestRefereeCacheStats:
         temp_dir, cache_file = temp_cache_dir
 
         # Create cache with 1-day TTL
-        cache = RefereeCache(cache_file=cache_file, ttl_days=1)
+        cache = RefereeCache(cache_file=cache_file, ttl_days=1, **WRITE_THROUGH)
 
         # Set two entries
         cache.set("Michael Oliver", sample_referee_stats)
@@ -412,7 +416,7 @@ class TestRefereeCacheStats:
 
     def test_get_stats_ttl_value(self, referee_cache):
         """Test that stats reports correct TTL value."""
-        cache = RefereeCache(cache_file=referee_cache.cache_file, ttl_days=14)
+        cache = RefereeCache(cache_file=referee_cache.cache_file, ttl_days=14, **WRITE_THROUGH)
         stats = cache.get_stats()
 
         assert stats["ttl_days"] == 14
@@ -523,7 +527,7 @@ class TestRefereeCacheErrorHandling:
             f.write("This is not valid JSON {{{")
 
         # Cache should handle gracefully
-        cache = RefereeCache(cache_file=cache_file, ttl_days=7)
+        cache = RefereeCache(cache_file=cache_file, ttl_days=7, **WRITE_THROUGH)
 
         # Should return None for any get operation
         retrieved = cache.get("Any Referee")
@@ -534,7 +538,7 @@ class TestRefereeCacheErrorHandling:
         temp_dir, cache_file = temp_cache_dir
 
         # Create cache
-        cache = RefereeCache(cache_file=cache_file, ttl_days=7)
+        cache = RefereeCache(cache_file=cache_file, ttl_days=7, **WRITE_THROUGH)
 
         # Make cache directory read-only (Unix-like systems only)
         try:
@@ -566,7 +570,7 @@ class TestRefereeCacheErrorHandling:
             json.dump(cache_data, f, indent=2, ensure_ascii=False)
 
         # Cache should handle gracefully
-        cache = RefereeCache(cache_file=cache_file, ttl_days=7)
+        cache = RefereeCache(cache_file=cache_file, ttl_days=7, **WRITE_THROUGH)
 
         # Should return None for malformed entry
         retrieved = cache.get("Michael Oliver")
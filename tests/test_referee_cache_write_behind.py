@@ -0,0 +1,183 @@
+"""
+Tests for the V15.0 in-memory RefereeCache with write-behind persistence.
+
+Covers:
+1. Lookups are served from memory (no file reads on the hot path)
+2. Debounced, batched, atomic writes
+3. Reload only when the file changes on disk (mtime/size/inode)
+4. Pending local writes survive an external reload
+5. A flush merges into entries written by another process meanwhile
+
+Run with: pytest tests/test_referee_cache_write_behind.py -v
+"""
+
+import json
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.analysis import referee_cache as referee_cache_module
+from src.analysis.referee_cache import RefereeCache
+
+STATS = {"name": "Michael Oliver", "cards_per_game": 5.2, "strictness": "strict"}
+
+
+@pytest.fixture
+def cache_file(tmp_path):
+    return tmp_path / "referee_stats.json"
+
+
+def _write_external(cache_file, data):
+    with open(cache_file, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+
+
+def _entry(stats, age_days=0.0):
+    cached_at = datetime.now(timezone.utc) - timedelta(days=age_days)
+    return {"cached_at": cached_at.isoformat(), "stats": stats, "referee_strictness": "strict"}
+
+
+class TestHotPath:
+    def test_get_does_not_read_file(self, cache_file, monkeypatch):
+        _write_external(cache_file, {"Michael Oliver": _entry(STATS)})
+        cache = RefereeCache(cache_file=cache_file, reload_check_seconds=60)
+
+        def fail_open(*args, **kwargs):
+            raise AssertionError("get() touched the cache file")
+
+        monkeypatch.setattr("builtins.open", fail_open)
+        for _ in range(1000):
+            assert cache.get("Michael Oliver") == STATS
+        assert cache.get_stats()["disk_reads"] == 1
+
+    def test_expiry_uses_parsed_timestamps(self, cache_file):
+        _write_external(
+            cache_file,
+            {
+                "Fresh": _entry({"cards_per_game": 4.0}),
+                "Old": _entry({"cards_per_game": 3.0}, age_days=8),
+                "Naive": {"cached_at": datetime.now().isoformat(), "stats": {"x": 1}},
+                "Broken": {"cached_at": "not-a-date", "stats": {"x": 2}},
+                "Missing": {"stats": {"x": 3}},
+            },
+        )
+        cache = RefereeCache(cache_file=cache_file, ttl_days=7)
+
+        assert cache.get("Fresh") == {"cards_per_game": 4.0}
+        assert cache.get("Old") is None
+        assert cache.get("Naive") == {"x": 1}
+        assert cache.get("Broken") is None
+        assert cache.get("Missing") is None
+
+        stats = cache.get_stats()
+        assert stats["total_entries"] == 5
+        assert stats["expired_entries"] == 2  # Old + Broken
+
+
+class TestWriteBehind:
+    def test_writes_are_debounced_and_batched(self, cache_file):
+        cache = RefereeCache(cache_file=cache_file, flush_delay_seconds=0.2)
+        for i in range(20):
+            cache.set(f"Referee {i}", {"cards_per_game": float(i)})
+
+        assert not cache_file.exists()
+        assert cache.get("Referee 7") == {"cards_per_game": 7.0}
+        assert cache.get_stats()["pending_writes"] == 20
+
+        deadline = time.monotonic() + 5
+        while cache.get_stats()["pending_writes"] and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+        stats = cache.get_stats()
+        assert stats["pending_writes"] == 0
+        assert stats["disk_writes"] == 1
+        with open(cache_file, encoding="utf-8") as f:
+            assert len(json.load(f)) == 20
+
+    def test_flush_is_atomic_and_leaves_no_temp_files(self, cache_file):
+        cache = RefereeCache(cache_file=cache_file, flush_delay_seconds=60)
+        cache.set("Michael Oliver", STATS)
+        assert cache.flush() is True
+
+        assert [p.name for p in cache_file.parent.iterdir()] == [cache_file.name]
+        reopened = RefereeCache(cache_file=cache_file)
+        assert reopened.get("Michael Oliver") == STATS
+
+    def test_failed_flush_keeps_changes_pending(self, cache_file, monkeypatch):
+        cache = RefereeCache(cache_file=cache_file, flush_delay_seconds=60)
+        cache.set("Michael Oliver", STATS)
+
+        def fail_replace(*args, **kwargs):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(referee_cache_module.os, "replace", fail_replace)
+        assert cache.flush() is False
+        assert cache.get_stats()["pending_writes"] == 1
+        assert [p.name for p in cache_file.parent.iterdir()] == []
+
+        monkeypatch.undo()
+        assert cache.flush() is True
+        assert cache.get_stats()["pending_writes"] == 0
+
+    def test_clear_cancels_pending_flush(self, cache_file):
+        cache = RefereeCache(cache_file=cache_file, flush_delay_seconds=0.1)
+        cache.set("Michael Oliver", STATS)
+        cache.clear()
+        time.sleep(0.3)
+        assert not cache_file.exists()
+
+
+class TestReload:
+    def test_reloads_only_when_file_changes(self, cache_file):
+        _write_external(cache_file, {"Michael Oliver": _entry(STATS)})
+        cache = RefereeCache(cache_file=cache_file, reload_check_seconds=0)
+
+        for _ in range(10):
+            cache.get("Michael Oliver")
+        assert cache.get_stats()["disk_reads"] == 1
+
+        _write_external(cache_file, {"Felix Brych": _entry({"cards_per_game": 2.8})})
+        assert cache.get("Felix Brych") == {"cards_per_game": 2.8}
+        assert cache.get("Michael Oliver") is None
+        assert cache.get_stats()["disk_reads"] == 2
+
+    def test_own_writes_do_not_trigger_reload(self, cache_file):
+        cache = RefereeCache(cache_file=cache_file, flush_delay_seconds=0, reload_check_seconds=0)
+        cache.set("Michael Oliver", STATS)
+        cache.set("Felix Brych", STATS)
+        cache.get("Michael Oliver")
+        assert cache.get_stats()["disk_reads"] == 0
+
+    def test_pending_writes_survive_external_reload(self, cache_file):
+        _write_external(cache_file, {"Felix Brych": _entry({"cards_per_game": 2.8})})
+        cache = RefereeCache(cache_file=cache_file, flush_delay_seconds=60, reload_check_seconds=0)
+        cache.set("Michael Oliver", STATS)
+
+        _write_external(
+            cache_file,
+            {
+                "Felix Brych": _entry({"cards_per_game": 3.1}),
+                "Daniele Orsato": _entry({"cards_per_game": 3.5}),
+            },
+        )
+
+        assert cache.get("Felix Brych") == {"cards_per_game": 3.1}
+        assert cache.get("Michael Oliver") == STATS
+        assert cache.flush() is True
+        with open(cache_file, encoding="utf-8") as f:
+            assert set(json.load(f)) == {"Felix Brych", "Daniele Orsato", "Michael Oliver"}
+
+    def test_flush_keeps_entries_written_by_another_process(self, cache_file):
+        first = RefereeCache(cache_file=cache_file, flush_delay_seconds=60)
+        second = RefereeCache(cache_file=cache_file, flush_delay_seconds=60)
+        first.set("Michael Oliver", STATS)
+        second.set("Felix Brych", {"cards_per_game": 2.8})
+
+        assert first.flush() is True
+        assert second.flush() is True
+
+        with open(cache_file, encoding="utf-8") as f:
+            assert set(json.load(f)) == {"Michael Oliver", "Felix Brych"}
+        assert second.get("Michael Oliver") == STATS
+        assert RefereeCache(cache_file=cache_file).get("Michael Oliver") == STATS
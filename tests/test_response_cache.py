@@ -0,0 +1,292 @@
+"""
+Tests for the V1.0 shared provider response cache.
+
+Covers:
+1. Canonical keys: whitespace, casing and team-alias variants share a key;
+   quoted phrases and request parameters still make a difference
+2. Per-provider TTL policies and O(1) LRU eviction of the memory tier
+3. SQLite tier: cached responses survive a restart (new cache instance)
+4. Hit/miss/quota-saved counters and their export to the orchestration metrics DB
+5. Providers: Tavily, Brave, DeepSeek and Perplexity serve variant queries from cache
+6. Benchmark: LRU eviction vs the old sort-the-whole-dict cleanup
+
+Run with: pytest tests/test_response_cache.py -v -s
+"""
+
+import json
+import sqlite3
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.utils.response_cache import (
+    QueryCanonicalizer,
+    ResponseCache,
+    ResponseCachePolicy,
+)
+from src.utils.team_name_index import TeamNameIndex
+
+
+@pytest.fixture
+def team_index():
+    index = TeamNameIndex()
+    index.add("Manchester United", aliases=["Man Utd", "Man United"])
+    index.add("Galatasaray SK", aliases=["Galatasaray"])
+    index.add("São Paulo FC", aliases=["Sao Paulo"])
+    return index
+
+
+@pytest.fixture
+def clock():
+    return [1_000_000.0]
+
+
+@pytest.fixture
+def cache(team_index, clock):
+    return ResponseCache(
+        db_path=None,
+        memory_entries=3,
+        canonicalizer=QueryCanonicalizer(team_index=team_index),
+        clock=lambda: clock[0],
+    )
+
+
+def _http_response(status_code=200, payload=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = payload or {}
+    return response
+
+
+class TestCanonicalKeys:
+    def test_whitespace_casing_and_aliases(self, cache):
+        variants = [
+            "Man Utd injuries",
+            "  man   UTD\tinjuries ",
+            "Manchester United injuries",
+            "MANCHESTER UNITED injuries",
+        ]
+        keys = {cache.make_key("tavily", q, search_depth="basic") for q in variants}
+        assert len(keys) == 1
+        assert cache.canonicalize(variants[0]) == "manchester united injuries"
+
+    def test_accents_and_static_aliases(self, cache):
+        canonical = cache.canonicalize("São Paulo lineup")
+        assert canonical == cache.canonicalize("Tricolor Paulista lineup") == "sao paulo fc lineup"
+        assert cache.canonicalize("Cimbom transfer news") == "galatasaray sk transfer news"
+
+    def test_edge_punctuation_and_quotes_are_kept(self, cache):
+        assert cache.canonicalize('"Man Utd" injury') == '"manchester united" injury'
+        assert cache.make_key("brave", '"Man Utd" injury') != cache.make_key(
+            "brave", "Man Utd injury"
+        )
+
+    def test_short_aliases_and_common_words_are_not_replaced(self, cache):
+        assert cache.canonicalize("Sep fixtures Fla") == "sep fixtures fla"
+
+    def test_parameters(self, cache):
+        key = cache.make_key("tavily", "q", search_depth="basic", max_results=5)
+        assert key == cache.make_key("tavily", "q", max_results=5, search_depth="basic")
+        assert key != cache.make_key("tavily", "q", search_depth="advanced", max_results=5)
+        assert key.startswith("tavily:")
+        assert cache.make_key("brave", "q") != cache.make_key("tavily", "q")
+
+
+class TestMemoryTier:
+    def test_provider_ttl_policies(self, cache, clock):
+        cache.policies = {
+            "fast": ResponseCachePolicy(ttl_seconds=60),
+            "slow": ResponseCachePolicy(ttl_seconds=3600),
+        }
+        cache.set("fast", "fast:k", "a")
+        cache.set("slow", "slow:k", "b")
+        clock[0] += 120
+
+        assert cache.get("fast", "fast:k") is None
+        assert cache.get("slow", "slow:k") == "b"
+        assert not cache.contains("fast:k")
+
+    def test_lru_eviction_keeps_recently_used(self, cache):
+        for key in ("a", "b", "c"):
+            cache.set("deepseek", key, key.upper())
+        assert cache.get("deepseek", "a") == "A"  # a becomes most recently used
+        cache.set("deepseek", "d", "D")
+
+        assert cache.size() == 3
+        assert not cache.contains("b")
+        assert [cache.get("deepseek", k) for k in ("a", "c", "d")] == ["A", "C", "D"]
+
+
+class TestPersistentTier:
+    def test_survives_restart(self, tmp_path):
+        path = str(tmp_path / "responses.db")
+        first = ResponseCache(db_path=path)
+        key = first.make_key("brave", "Galatasaray news", limit=5)
+        first.set("brave", key, [{"title": "t", "url": "u"}])
+        first.close()
+
+        second = ResponseCache(db_path=path)
+        assert second.persistent
+        assert second.get("brave", key) == [{"title": "t", "url": "u"}]
+        assert second.provider_stats("brave")["disk_hits"] == 1
+        assert second.get("brave", key) == [{"title": "t", "url": "u"}]
+        assert second.provider_stats("brave")["memory_hits"] == 1
+        second.close()
+
+    def test_unopenable_path_degrades_to_memory(self, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("x")
+        cache = ResponseCache(db_path=str(blocker / "responses.db"))
+        assert not cache.persistent
+        cache.set("tavily", "k", {"a": 1})
+        assert cache.get("tavily", "k") == {"a": 1}
+
+
+class TestMetrics:
+    def test_hits_misses_and_quota_saved(self, cache):
+        cache.set("tavily", "k", {"query": "q"})
+        cache.get("tavily", "k", quota_cost=2)
+        cache.get("tavily", "k")
+        cache.get("tavily", "missing")
+
+        stats = cache.provider_stats("tavily")
+        assert (stats["hits"], stats["misses"], stats["quota_saved"]) == (2, 1, 3)
+        assert stats["hit_rate_percent"] == pytest.approx(66.67)
+        assert cache.get_stats()["quota_saved"] == 3
+
+    def test_exported_to_orchestration_metrics_db(self, cache, tmp_path):
+        from src.alerting.orchestration_metrics import OrchestrationMetricsCollector
+
+        cache.set("deepseek", "k", "answer")
+        cache.get("deepseek", "k")
+        db_path = str(tmp_path / "metrics.db")
+        collector = OrchestrationMetricsCollector(db_path=db_path)
+
+        assert collector.record_response_cache_metrics(cache.get_stats())
+        with sqlite3.connect(db_path) as conn:
+            rows = conn.execute(
+                "SELECT metric_data FROM orchestration_metrics WHERE metric_type = ?",
+                ("response_cache",),
+            ).fetchall()
+        stored = json.loads(rows[0][0])
+        assert stored["providers"]["deepseek"]["hits"] == 1
+        assert stored["quota_saved"] == 1
+
+
+class TestProviders:
+    def test_tavily_variant_query_served_from_cache(self, cache, monkeypatch):
+        import src.ingestion.tavily_provider as tavily_module
+        from src.ingestion.tavily_key_rotator import TavilyKeyRotator
+
+        monkeypatch.setattr(tavily_module, "TAVILY_ENABLED", True)
+        monkeypatch.setattr(tavily_module, "TAVILY_RATE_LIMIT_SECONDS", 0)
+        provider = tavily_module.TavilyProvider(
+            key_rotator=TavilyKeyRotator(keys=["tvly-test-key"]), response_cache=cache
+        )
+        provider._shared_cache = None
+        provider._http_client = MagicMock()
+        provider._http_client.post_sync.return_value = _http_response(
+            payload={
+                "answer": "Out for 3 weeks",
+                "results": [{"title": "T", "url": "https://x", "content": "c", "score": 0.9}],
+            }
+        )
+
+        first = provider.search("Man Utd injury news", search_depth="advanced")
+        second = provider.search("manchester united  injury news", search_depth="advanced")
+
+        assert provider._http_client.post_sync.call_count == 1
+        assert second.answer == first.answer and second.results == first.results
+        assert cache.provider_stats("tavily")["quota_saved"] == 2
+
+    def test_brave_results_cached_as_copies(self, cache, monkeypatch):
+        import src.ingestion.brave_provider as brave_module
+
+        provider = brave_module.BraveSearchProvider()
+        provider._api_key = "brave-test-key"
+        provider._key_rotation_enabled = False
+        provider._response_cache = cache
+        provider._http_client = MagicMock()
+        provider._http_client.get_sync.return_value = _http_response(
+            payload={"web": {"results": [{"title": "T", "url": "https://x"}]}}
+        )
+
+        first = provider.search_news("Galatasaray transfer", limit=5)
+        first[0]["title"] = "mutated by caller"
+        second = provider.search_news("GALATASARAY   transfer", limit=5)
+
+        assert provider._http_client.get_sync.call_count == 1
+        assert second[0]["title"] == "T"
+
+    def test_deepseek_call_model_cached(self, cache):
+        from src.ingestion.deepseek_intel_provider import DeepSeekIntelProvider
+
+        provider = DeepSeekIntelProvider()
+        provider._response_cache = cache
+        provider._api_key = "or-test-key"
+        provider._last_request_time = 0.0
+        provider._http_client = MagicMock()
+        provider._http_client.post_sync.return_value = _http_response(
+            payload={"choices": [{"message": {"content": "analysis"}}]}
+        )
+
+        messages = [{"role": "user", "content": "Deep dive: Man Utd vs Galatasaray"}]
+        variant = [{"role": "user", "content": "deep dive:  Manchester United vs Galatasaray"}]
+        assert provider._call_model(provider._model_a, messages) == "analysis"
+        assert provider._call_model(provider._model_a, variant) == "analysis"
+        assert provider._call_model(provider._model_b, variant) == "analysis"
+
+        assert provider._http_client.post_sync.call_count == 2  # one per model
+        assert provider.get_cache_stats()["cache_hits"] == 1
+
+    def test_perplexity_results_cached(self, cache, monkeypatch):
+        import src.ingestion.perplexity_provider as perplexity_module
+
+        post = MagicMock(
+            return_value=_http_response(
+                payload={"choices": [{"message": {"content": '{"home_goals_avg": 1.5}'}}]}
+            )
+        )
+        monkeypatch.setattr(perplexity_module.requests, "post", post)
+        provider = perplexity_module.PerplexityProvider()
+        provider._response_cache = cache
+
+        first = provider._query_api_raw("Stats for Man Utd")
+        assert first["home_goals_avg"] == 1.5
+        first["home_goals_avg"] = 0
+        second = provider._query_api_raw("stats for manchester united")
+
+        assert post.call_count == 1
+        assert second["home_goals_avg"] == 1.5
+
+
+@pytest.mark.performance
+class TestResponseCacheBenchmark:
+    """Benchmark: 20000 inserts into a 1000-entry cache."""
+
+    def test_benchmark_lru_vs_sort_cleanup(self):
+        n, bound = 20000, 1000
+
+        # Pre-V12.7 DeepSeek cache: sort the whole dict by last access past the bound
+        start = time.perf_counter()
+        old: dict[str, tuple[str, float]] = {}
+        for i in range(n):
+            old[f"k{i}"] = ("v", time.monotonic())
+            if len(old) > bound:
+                for key, _ in sorted(old.items(), key=lambda x: x[1][1])[: len(old) - bound]:
+                    del old[key]
+        sort_s = time.perf_counter() - start
+
+        cache = ResponseCache(db_path=None, memory_entries=bound)
+        start = time.perf_counter()
+        for i in range(n):
+            cache.set("deepseek", f"k{i}", "v")
+        lru_s = time.perf_counter() - start
+
+        print(
+            f"\n📊 {n} inserts, bound {bound}: sort cleanup={sort_s * 1000:.0f}ms "
+            f"LRU={lru_s * 1000:.0f}ms ({sort_s / max(lru_s, 1e-9):.1f}x)"
+        )
+        assert cache.size() == bound
+        assert lru_s < sort_s
@@ -0,0 +1,227 @@
+"""
+Tests for the V1.0 RollingRiskMetrics and its use in StrategyOptimizer.
+
+Covers:
+1. Sharpe / Sortino / Max Drawdown match calc_sharpe / calc_sortino /
+   calc_max_drawdown on the same bounded window, bet after bet
+2. Zero-variance and no-downside branches survive sliding-window eviction
+3. Exponential decay: recency weighting and persisted accumulators
+4. StrategyOptimizer: stored metrics equal the full-window recomputation,
+   metrics rebuilt when the data is replaced, compact weights file
+5. Benchmark: settling thousands of bets, streaming vs full recomputation
+
+Run with: pytest tests/test_risk_metrics.py -v -s
+"""
+
+import json
+import random
+import time
+
+import pytest
+
+import src.analysis.optimizer as optimizer_module
+from src.analysis.optimizer import (
+    MAX_PNL_HISTORY,
+    MAX_RETURNS_HISTORY,
+    StrategyOptimizer,
+    calc_max_drawdown,
+    calc_sharpe,
+    calc_sortino,
+)
+from src.analysis.risk_metrics import RollingRiskMetrics
+
+
+def _random_returns(n, seed, win_rate=0.5):
+    rng = random.Random(seed)
+    return [round(rng.uniform(0.4, 3.5), 2) if rng.random() < win_rate else -1.0 for _ in range(n)]
+
+
+def _reference(returns, window=100):
+    """Window lists and metrics the pre-V15.0 optimizer computed after each bet."""
+    window_returns, pnl = [], []
+    for r in returns:
+        window_returns = (window_returns + [r])[-window:]
+        pnl = (pnl + [(pnl[-1] if pnl else 0) + r])[-window:]
+    return window_returns, pnl
+
+
+class TestRollingRiskMetrics:
+    @pytest.mark.parametrize("seed,win_rate", [(1, 0.5), (2, 0.3), (3, 0.7), (4, 0.9)])
+    def test_matches_full_window_recomputation(self, seed, win_rate):
+        returns = _random_returns(700, seed, win_rate)
+        metrics = RollingRiskMetrics([], [], returns_window=100, pnl_window=100)
+        window, pnl = [], []
+
+        for r in returns:
+            metrics.add(r)
+            window = (window + [r])[-100:]
+            pnl = (pnl + [(pnl[-1] if pnl else 0) + r])[-100:]
+
+            assert metrics.returns == window and metrics.pnl_history == pnl
+            assert metrics.sharpe() == pytest.approx(calc_sharpe(window), rel=1e-9, abs=1e-12)
+            assert metrics.sortino() == pytest.approx(calc_sortino(window), rel=1e-9, abs=1e-12)
+            assert metrics.max_drawdown() == pytest.approx(calc_max_drawdown(pnl), abs=1e-12)
+
+        assert metrics.drawdown_rescans < len(returns)
+
+    def test_consistent_returns_after_eviction(self):
+        metrics = RollingRiskMetrics([], None, returns_window=20)
+        for r in _random_returns(50, 9):
+            metrics.add(r)
+        for _ in range(20):
+            metrics.add(0.9)
+
+        assert metrics.returns == [0.9] * 20
+        assert calc_sharpe(metrics.returns) == metrics.sharpe() == 5.0
+        assert calc_sortino(metrics.returns) == metrics.sortino() == 5.0
+        assert metrics.max_drawdown() == 0.0  # no PnL tracked
+
+    def test_all_losses(self):
+        metrics = RollingRiskMetrics([], [], returns_window=15, pnl_window=15)
+        for _ in range(40):
+            metrics.add(-1.0)
+        assert metrics.sharpe() == calc_sharpe([-1.0] * 15) == 0.0
+        assert metrics.sortino() == calc_sortino([-1.0] * 15)
+        assert metrics.max_drawdown() == calc_max_drawdown(metrics.pnl_history) == 0.0
+
+    def test_rebuilds_from_existing_lists(self):
+        window, pnl = _reference(_random_returns(250, 5))
+        metrics = RollingRiskMetrics(list(window), list(pnl))
+        assert metrics.sharpe() == pytest.approx(calc_sharpe(window))
+        assert metrics.max_drawdown() == pytest.approx(calc_max_drawdown(pnl))
+        assert metrics.is_bound_to(metrics.returns, metrics.pnl_history)
+        assert not metrics.is_bound_to(list(window), metrics.pnl_history)
+
+    def test_decay_weights_recent_bets(self):
+        early_losses = [-1.0] * 60 + [1.0] * 40
+        plain = RollingRiskMetrics([], None)
+        decayed = RollingRiskMetrics([], None, decay_halflife=10)
+        for r in early_losses:
+            plain.add(r)
+            decayed.add(r)
+
+        assert plain.sharpe() == pytest.approx(calc_sharpe(early_losses))
+        assert decayed.sharpe() > plain.sharpe()
+
+    def test_decay_state_round_trip(self):
+        returns = _random_returns(120, 8)
+        first = RollingRiskMetrics([], None, decay_halflife=25)
+        for r in returns[:80]:
+            first.add(r)
+
+        resumed = RollingRiskMetrics(
+            list(first.returns), None, decay_halflife=25, decay_state=first.decay_state()
+        )
+        for r in returns[80:]:
+            first.add(r)
+            resumed.add(r)
+        assert resumed.sharpe() == pytest.approx(first.sharpe())
+        assert resumed.sortino() == pytest.approx(first.sortino())
+
+
+class TestOptimizerStreamingMetrics:
+    def _settle(self, optimizer, returns, league="soccer_epl", market="Over 2.5 Goals"):
+        for r in returns:
+            outcome = "WIN" if r > 0 else "LOSS"
+            optimizer.record_bet_result(league, market, outcome, odds=r + 1, driver="INJURY_INTEL")
+
+    def test_stored_metrics_match_recomputation(self, tmp_path):
+        optimizer = StrategyOptimizer(weights_file=str(tmp_path / "weights.json"))
+        returns = _random_returns(400, 21)
+        self._settle(optimizer, returns)
+
+        stats = optimizer.data["stats"]["soccer_epl"]["OVER"]
+        window, pnl = _reference(returns)
+        assert len(stats["returns"]) == MAX_RETURNS_HISTORY
+        assert len(stats["pnl_history"]) == MAX_PNL_HISTORY
+        assert stats["returns"] == pytest.approx(window)
+        assert stats["pnl_history"] == pytest.approx(pnl)
+        assert stats["sharpe"] == round(calc_sharpe(stats["returns"]), 3)
+        assert stats["sortino"] == round(calc_sortino(stats["returns"]), 3)
+        assert stats["max_drawdown"] == round(calc_max_drawdown(stats["pnl_history"]), 3)
+
+        driver = optimizer.data["drivers"]["INJURY_INTEL"]
+        assert driver["sortino"] == round(calc_sortino(driver["returns"]), 3)
+        assert "risk_decay" not in stats
+
+    def test_replaced_data_is_picked_up(self, tmp_path):
+        optimizer = StrategyOptimizer(weights_file=str(tmp_path / "weights.json"))
+        self._settle(optimizer, _random_returns(30, 2))
+
+        stats = optimizer.data["stats"]["soccer_epl"]["OVER"]
+        bet_return = (0.9 + 1) - 1  # what record_bet_result computes for odds 1.9
+        stats["returns"] = [bet_return] * 20
+        stats["pnl_history"] = [bet_return * (i + 1) for i in range(20)]
+        self._settle(optimizer, [0.9])
+
+        assert stats["returns"] == [bet_return] * 21
+        assert stats["sharpe"] == 5.0 and stats["max_drawdown"] == 0.0
+
+    def test_decay_state_is_persisted(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(optimizer_module, "OPTIMIZER_RISK_DECAY_HALFLIFE", 20)
+        optimizer = StrategyOptimizer(weights_file=str(tmp_path / "weights.json"))
+        self._settle(optimizer, _random_returns(50, 4))
+        assert set(optimizer.data["stats"]["soccer_epl"]["OVER"]["risk_decay"]) == {
+            "w",
+            "mean",
+            "m2",
+            "dw",
+            "dsq",
+        }
+
+    def test_weights_file_is_compact(self, tmp_path):
+        path = tmp_path / "weights.json"
+        optimizer = StrategyOptimizer(weights_file=str(path))
+        for league in ("soccer_epl", "soccer_spain_la_liga", "soccer_italy_serie_a"):
+            self._settle(optimizer, _random_returns(150, 3), league=league)
+        assert optimizer._save_data()
+
+        indented = len(json.dumps(optimizer.data, indent=2))
+        size = path.stat().st_size
+        print(f"\n📊 weights file: {size} bytes (indent=2 would be {indented})")
+        assert size < indented * 0.7
+        assert json.loads(path.read_text())["stats"]["soccer_epl"]["OVER"]["bets"] == 150
+
+
+@pytest.mark.performance
+class TestRiskMetricsBenchmark:
+    """Benchmark: 5000 bets through record_bet_result vs the pre-V15.0 recomputation."""
+
+    def test_benchmark_streaming_vs_recompute(self, tmp_path):
+        returns = _random_returns(5000, 77)
+
+        start = time.perf_counter()
+        window, pnl = [], []
+        for r in returns:
+            window.append(r)
+            if len(window) > MAX_RETURNS_HISTORY:
+                window = window[-MAX_RETURNS_HISTORY:]
+            pnl.append((pnl[-1] if pnl else 0) + r)
+            if len(pnl) > MAX_PNL_HISTORY:
+                pnl = pnl[-MAX_PNL_HISTORY:]
+            calc_sharpe(window), calc_sortino(window), calc_max_drawdown(pnl)
+        recompute_s = time.perf_counter() - start
+
+        metrics = RollingRiskMetrics([], [])
+        start = time.perf_counter()
+        for r in returns:
+            metrics.add(r)
+            metrics.sharpe(), metrics.sortino(), metrics.max_drawdown()
+        streaming_s = time.perf_counter() - start
+
+        optimizer = StrategyOptimizer(weights_file=str(tmp_path / "weights.json"))
+        start = time.perf_counter()
+        for r in returns:
+            optimizer.record_bet_result(
+                "soccer_epl", "Over 2.5", "WIN" if r > 0 else "LOSS", odds=r + 1
+            )
+        record_s = time.perf_counter() - start
+
+        print(
+            f"\n📊 5000 bets: recompute={recompute_s * 1000:.0f}ms "
+            f"streaming={streaming_s * 1000:.0f}ms "
+            f"({recompute_s / max(streaming_s, 1e-9):.1f}x, "
+            f"{metrics.drawdown_rescans} drawdown rescans, {metrics.resyncs} resyncs) "
+            f"record_bet_result={record_s * 1000:.0f}ms"
+        )
+        assert streaming_s < recompute_s
@@ -0,0 +1,247 @@
+"""
+Tests for the V1.0 settlement result store, concurrent fetch and bulk update.
+
+Covers:
+1. MatchResultStore keeps only terminal results (FINISHED with stats, CANCELLED)
+2. resolve_match_results() keeps input order, isolates failures and runs fetches
+   concurrently (wall time ~ slowest fetch, not the sum)
+3. A second run is served from the store with zero fetches
+4. apply_settlement_updates() writes heterogeneous column sets and skips missing rows
+5. SettlementService end to end: results, stats and outcomes written in bulk
+
+Run with: pytest tests/test_settlement_results.py -v -s
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+import src.core.settlement_service as settlement_service
+from src.analysis.settlement_results import (
+    MatchResultStore,
+    apply_settlement_updates,
+    match_stats_update,
+    resolve_match_results,
+)
+from src.database.models import Base, Match, NewsLog
+
+FINISHED = {"home_score": 2, "away_score": 1, "status": "FINISHED", "match_id": 4242}
+STATS = {"home_corners": 7, "away_corners": 3, "home_xg": 1.8}
+
+
+def _matches(n):
+    start = datetime(2026, 10, 10, 18, 0)
+    return [
+        {
+            "match_id": f"m{i}",
+            "home_team": f"Home {i}",
+            "away_team": f"Away {i}",
+            "start_time": start,
+        }
+        for i in range(n)
+    ]
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = MatchResultStore(str(tmp_path / "results.db"))
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'settle.db'}")
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    factory.engine = engine
+    yield factory
+    engine.dispose()
+
+
+class TestMatchResultStore:
+    def test_only_terminal_results_are_stored(self, store):
+        assert store.put("finished", FINISHED, STATS)
+        assert not store.put("no-stats", FINISHED, None)
+        assert not store.put("postponed", {"status": "POSTPONED", "home_score": 0})
+        assert store.put("cancelled", {"status": "CANCELLED", "home_score": 0, "away_score": 0})
+
+        stored = store.get("finished")
+        assert stored.from_store and stored.result == FINISHED and stored.match_stats == STATS
+        assert store.get("no-stats") is None and store.get("postponed") is None
+        assert store.get(None) is None
+
+    def test_insights_attach_to_stored_result(self, store):
+        assert not store.set_insights("missing", "text")
+        store.put("m1", FINISHED, STATS)
+        assert store.set_insights("m1", "Late winner")
+        assert store.get("m1").insights == "Late winner"
+        assert store.get("m1").match_stats == STATS
+
+    def test_survives_reopen(self, tmp_path):
+        path = str(tmp_path / "results.db")
+        first = MatchResultStore(path)
+        first.put("m1", FINISHED, STATS)
+        first.close()
+
+        second = MatchResultStore(path)
+        assert second.get("m1").result == FINISHED
+        second.close()
+
+
+class TestResolveMatchResults:
+    def test_order_failures_and_stats(self):
+        def fetch_result(home, away, start):
+            if home == "Home 1":
+                raise RuntimeError("FotMob down")
+            if home == "Home 2":
+                return None
+            return dict(FINISHED)
+
+        fetch_stats = MagicMock(return_value=STATS)
+        resolved = resolve_match_results(_matches(4), fetch_result, fetch_stats, max_workers=4)
+
+        assert [r.result is not None for r in resolved] == [True, False, False, True]
+        assert resolved[0].match_stats == STATS and not resolved[0].from_store
+        assert fetch_stats.call_count == 2
+
+    def test_wall_time_is_close_to_slowest_fetch(self):
+        delay = 0.2
+
+        def fetch_result(home, away, start):
+            threading.Event().wait(delay)
+            return dict(FINISHED)
+
+        start = time.perf_counter()
+        resolved = resolve_match_results(
+            _matches(8), fetch_result, lambda match_id: STATS, max_workers=8
+        )
+        elapsed = time.perf_counter() - start
+
+        print(f"\n📊 8 results x {delay}s: {elapsed:.2f}s concurrent vs {8 * delay:.1f}s serial")
+        assert all(r.result for r in resolved)
+        assert elapsed < 3 * delay
+
+    def test_second_run_is_served_from_store(self, store):
+        fetch_result = MagicMock(return_value=dict(FINISHED))
+        fetch_stats = MagicMock(return_value=STATS)
+        matches = _matches(5)
+
+        resolve_match_results(matches, fetch_result, fetch_stats, store=store)
+        assert fetch_result.call_count == 5
+
+        fetch_result.reset_mock()
+        fetch_stats.reset_mock()
+        resolved = resolve_match_results(matches, fetch_result, fetch_stats, store=store)
+
+        assert fetch_result.call_count == 0 and fetch_stats.call_count == 0
+        assert all(r.from_store and r.match_stats == STATS for r in resolved)
+
+    def test_postponed_results_are_fetched_again(self, store):
+        fetch_result = MagicMock(return_value={"status": "POSTPONED", "home_score": 0})
+        resolve_match_results(_matches(2), fetch_result, MagicMock(), store=store)
+        resolve_match_results(_matches(2), fetch_result, MagicMock(), store=store)
+        assert fetch_result.call_count == 4
+
+
+class TestApplySettlementUpdates:
+    def test_heterogeneous_rows_and_missing_ids(self, session_factory):
+        db = session_factory()
+        start = datetime(2026, 10, 10, 18, 0)
+        for i in range(3):
+            db.add(Match(id=f"m{i}", league="l", home_team="h", away_team="a", start_time=start))
+        db.flush()
+        logs = [NewsLog(match_id=f"m{i}", url="u", summary="s", score=8) for i in range(3)]
+        db.add_all(logs)
+        db.commit()
+        ids = [log.id for log in logs]
+
+        statements = []
+        event.listen(
+            session_factory.engine,
+            "before_cursor_execute",
+            lambda conn, cursor, sql, params, context, executemany: statements.append(sql),
+        )
+        counts = apply_settlement_updates(
+            db,
+            {"m0": match_stats_update(STATS), "m1": match_stats_update({}), "gone": {"home_xg": 1}},
+            {
+                ids[0]: {"outcome": "WIN", "outcome_explanation": "2-1", "clv_percent": 3.2},
+                ids[1]: {"combo_outcome": "LOSS"},
+                ids[2]: {"outcome": "LOSS", "line_movement_explanation": "steam"},
+                999999: {"outcome": "WIN"},
+            },
+        )
+        db.commit()
+
+        assert counts == (2, 3)
+        assert len(statements) <= 6
+        assert db.get(Match, "m0").home_corners == 7
+        assert db.get(Match, "m1").home_corners is None
+        first, second, third = (db.get(NewsLog, i) for i in ids)
+        assert (first.outcome, first.clv_percent) == ("WIN", 3.2)
+        assert (second.combo_outcome, second.outcome) == ("LOSS", None)
+        assert (third.outcome, third.line_movement_explanation) == ("LOSS", "steam")
+        db.close()
+
+
+class TestSettlementServiceBulk:
+    def test_settle_writes_results_in_bulk(self, session_factory, monkeypatch):
+        @contextmanager
+        def db_context():
+            db = session_factory()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        db = session_factory()
+        start = datetime.now(timezone.utc) - timedelta(hours=5)
+        for i in range(4):
+            db.add(
+                Match(
+                    id=f"m{i}",
+                    league="l",
+                    home_team=f"Home {i}",
+                    away_team=f"Away {i}",
+                    start_time=start,
+                    highest_score_sent=9.0,
+                )
+            )
+        db.flush()
+        for i in range(4):
+            db.add(
+                NewsLog(
+                    match_id=f"m{i}",
+                    url="u",
+                    summary="s",
+                    score=9,
+                    sent=True,
+                    recommended_market="Home Win",
+                )
+            )
+        db.commit()
+        db.close()
+
+        monkeypatch.setattr(settlement_service, "get_db_context", db_context)
+        monkeypatch.setattr(settlement_service, "get_match_result_store", lambda: None)
+        provider = MagicMock()
+        provider.get_match_stats.return_value = STATS
+        monkeypatch.setattr(settlement_service, "get_data_provider", lambda: provider)
+
+        service = settlement_service.SettlementService()
+        monkeypatch.setattr(service, "_get_match_result", lambda *args: dict(FINISHED))
+        monkeypatch.setattr(service, "_verify_telegram_predictions", lambda results: None)
+        stats = service.run_settlement(lookback_hours=48)
+
+        assert stats["settled"] == 4 and stats["wins"] == 4
+        db = session_factory()
+        assert {log.outcome for log in db.query(NewsLog)} == {"WIN"}
+        assert all(m.home_corners == 7 for m in db.query(Match))
+        db.close()
@@ -0,0 +1,219 @@
+"""
+Tests for the V15.0 banded SimhashIndex used by SharedContentCache.
+
+Verifies that indexed fuzzy lookups find exactly what the old linear
+Hamming scan found, that eviction/expiry keep the index in sync, and that
+lookups only touch a small candidate set regardless of cache size. Also
+checks that the fast/bulk compute_simhash paths match the original loop.
+
+Run with: pytest tests/test_shared_cache_simhash_index.py -v
+"""
+
+import hashlib
+import random
+import re
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.utils import shared_cache
+from src.utils.shared_cache import (
+    SharedContentCache,
+    SimhashIndex,
+    compute_simhash,
+    compute_simhashes,
+    hamming_distance,
+)
+
+
+def _flip_bits(value: int, positions) -> int:
+    for pos in positions:
+        value ^= 1 << pos
+    return value
+
+
+class TestSimhashIndex:
+    def test_band_layout_covers_all_bits(self):
+        index = SimhashIndex(hash_bits=64, max_distance=3)
+        assert len(index._bands) == 4
+        covered = 0
+        for shift, mask in index._bands:
+            covered |= mask << shift
+        assert covered == (1 << 64) - 1
+
+    def test_finds_every_hash_within_threshold(self):
+        rng = random.Random(3)
+        index = SimhashIndex(max_distance=3)
+        base = rng.getrandbits(64)
+        index.add(base)
+
+        for _ in range(200):
+            flips = rng.sample(range(64), rng.randint(0, 3))
+            probe = _flip_bits(base, flips)
+            assert index.query(probe) == [(base, len(flips))]
+
+    def test_ignores_hashes_beyond_threshold(self):
+        index = SimhashIndex(max_distance=3)
+        base = 0x0123456789ABCDEF
+        index.add(base)
+        # 4 flips, one per band: no band survives, and distance is over threshold anyway
+        probe = _flip_bits(base, [0, 16, 32, 48])
+        assert index.query(probe) == []
+
+    def test_matches_linear_scan(self):
+        rng = random.Random(11)
+        index = SimhashIndex(max_distance=3)
+        stored = [rng.getrandbits(64) for _ in range(2000)]
+        for value in stored:
+            index.add(value)
+
+        probes = [_flip_bits(rng.choice(stored), rng.sample(range(64), 2)) for _ in range(100)]
+        probes += [rng.getrandbits(64) for _ in range(100)]
+        for probe in probes:
+            expected = {h for h in stored if hamming_distance(h, probe) <= 3}
+            assert {h for h, _ in index.query(probe)} == expected
+
+    def test_remove_and_len(self):
+        index = SimhashIndex()
+        index.add(42)
+        index.add(42)
+        assert len(index) == 1
+        index.remove(42)
+        index.remove(42)
+        assert len(index) == 0
+        assert index.query(42) == []
+        assert all(not table for table in index._tables)
+
+    def test_candidate_set_stays_small(self):
+        rng = random.Random(5)
+        index = SimhashIndex()
+        for _ in range(20000):
+            index.add(rng.getrandbits(64))
+        # 16-bit bands: expected collisions per band ~ 20000 / 65536
+        sizes = [len(index.candidates(rng.getrandbits(64))) for _ in range(200)]
+        assert max(sizes) < 20
+
+
+class TestSharedCacheIndexIntegration:
+    ARTICLE = (
+        "Manchester United striker ruled out for three weeks with hamstring injury "
+        "ahead of the derby, manager confirms in press conference on Friday morning"
+    )
+
+    def test_fuzzy_duplicate_detected_via_index(self):
+        cache = SharedContentCache(max_entries=300)
+        cache.mark_seen(content=self.ARTICLE, source="news_radar")
+        near_copy = self.ARTICLE + " today"
+
+        if hamming_distance(compute_simhash(near_copy), compute_simhash(self.ARTICLE)) <= 3:
+            assert cache.is_duplicate(content=near_copy, source="browser_monitor")
+            assert cache.get_stats()["by_source"]["browser_monitor"]["fuzzy_matches"] == 1
+
+    def test_lru_eviction_removes_from_index(self):
+        cache = SharedContentCache(max_entries=30)  # 10 simhash slots
+        for i in range(25):
+            cache.mark_seen(content=f"unique article number {i} " * 20 + f"token{i}x{i * 7}")
+        assert len(cache._simhash_index) == len(cache._simhash_cache) <= 10
+
+    def test_expired_entries_removed_from_index(self):
+        cache = SharedContentCache(max_entries=300, ttl_hours=1)
+        cache.mark_seen(content=self.ARTICLE)
+        simhash = compute_simhash(self.ARTICLE)
+        _, source, preview = cache._simhash_cache[simhash]
+        cache._simhash_cache[simhash] = (
+            datetime.now(timezone.utc) - timedelta(hours=2),
+            source,
+            preview,
+        )
+        # Bypass the exact content hash so only the fuzzy path can match
+        cache._content_cache.clear()
+
+        assert cache.is_duplicate(content=self.ARTICLE) is False
+        assert simhash not in cache._simhash_cache
+        assert len(cache._simhash_index) == 0
+
+    def test_check_and_mark_and_clear_keep_index_in_sync(self):
+        cache = SharedContentCache(max_entries=300)
+        assert cache.check_and_mark(content=self.ARTICLE) is False
+        assert len(cache._simhash_index) == 1
+        cache._content_cache.clear()
+        assert cache.check_and_mark(content=self.ARTICLE) is True
+        cache.clear()
+        assert len(cache._simhash_index) == 0
+
+
+def _reference_simhash(content, hash_bits=64):
+    """Pre-V15.0 compute_simhash(), kept verbatim as the equivalence oracle."""
+    if not content:
+        return 0
+    words = re.findall(r"\b\w{3,}\b", content.lower())
+    if not words:
+        return 0
+    bit_sums = [0] * hash_bits
+    for word in words:
+        word_hash = int(hashlib.md5(word.encode("utf-8")).hexdigest(), 16)
+        for i in range(hash_bits):
+            if word_hash & (1 << i):
+                bit_sums[i] += 1
+            else:
+                bit_sums[i] -= 1
+    simhash = 0
+    for i in range(hash_bits):
+        if bit_sums[i] > 0:
+            simhash |= 1 << i
+    return simhash
+
+
+def _random_articles(n: int, seed: int = 9):
+    rng = random.Random(seed)
+    vocab = ["striker", "injury", "ruled", "out", "the", "and", "ΑΕΚ", "calciatore", "渋谷区"]
+    vocab += [f"word{i}" for i in range(400)]
+    return [" ".join(rng.choice(vocab) for _ in range(rng.randint(0, 600))) for _ in range(n)]
+
+
+class TestFastSimhash:
+    def test_matches_reference_implementation(self):
+        articles = _random_articles(200) + ["", "a b c", "Ab ab AB aB!", None]
+        for article in articles:
+            assert compute_simhash(article) == _reference_simhash(article)
+            assert compute_simhash(article, hash_bits=32) == _reference_simhash(article, 32)
+
+    def test_bulk_matches_single(self):
+        articles = _random_articles(150, seed=4) + [None, "", "xy"]
+        assert compute_simhashes(articles) == [_reference_simhash(a) for a in articles]
+        assert compute_simhashes([]) == []
+
+    def test_pure_python_fallback(self, monkeypatch):
+        monkeypatch.setattr(shared_cache, "NUMPY_AVAILABLE", False)
+        articles = _random_articles(50, seed=6)
+        assert [compute_simhash(a) for a in articles] == [_reference_simhash(a) for a in articles]
+        assert compute_simhashes(articles) == [_reference_simhash(a) for a in articles]
+
+    def test_precomputed_simhash_is_used(self):
+        article = TestSharedCacheIndexIntegration.ARTICLE
+        cache = SharedContentCache(max_entries=300)
+        assert cache.check_and_mark(content=article, simhash=0x1234) is False
+        assert 0x1234 in cache._simhash_cache
+
+        cache._content_cache.clear()
+        assert cache.is_duplicate(content="different text entirely here", simhash=0x1234)
+
+    @pytest.mark.performance
+    def test_benchmark_batch_simhash(self):
+        articles = _random_articles(500, seed=2026)
+
+        start = time.perf_counter()
+        expected = [_reference_simhash(a) for a in articles]
+        reference_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        bulk = compute_simhashes(articles)
+        bulk_s = time.perf_counter() - start
+
+        print(
+            f"\n📊 Simhash 500 articles: reference={reference_s * 1000:.0f}ms "
+            f"bulk={bulk_s * 1000:.0f}ms speedup={reference_s / max(bulk_s, 1e-9):.1f}x"
+        )
+        assert bulk == expected
+        assert bulk_s < reference_s
@@ -302,16 +302,15 @@ class TestDiscoveryQueue:
 
         queue = DiscoveryQueue(max_entries=100, ttl_hours=1)
 
-        # Add item
-        queue.push(data={}, league_key="soccer_epl", team="Arsenal")
+        # Add item discovered 2 hours ago (already past the TTL)
+        queue.push(
+            data={},
+            league_key="soccer_epl",
+            team="Arsenal",
+            discovered_at=datetime.now(timezone.utc) - timedelta(hours=2),
+        )
         assert queue.size() == 1
 
-        # Manually expire the item
-        with queue._lock:
-            if queue._queue:
-                item = queue._queue[0]
-                item.discovered_at = datetime.now(timezone.utc) - timedelta(hours=2)
-
         # Cleanup
         removed = queue.cleanup_expired()
         assert removed == 1
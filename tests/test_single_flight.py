@@ -0,0 +1,119 @@
+"""
+Tests for the V1.0 SingleFlight group and FotMob request coalescing.
+
+Covers:
+1. Concurrent identical calls share one execution (result and exception)
+2. Different keys and sequential calls still execute independently
+3. FotMobProvider sends one HTTP request per URL for a burst of callers
+
+Run with: pytest tests/test_single_flight.py -v
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.utils.single_flight import SingleFlight
+
+
+def _run_concurrently(n, target):
+    barrier = threading.Barrier(n)
+    results = [None] * n
+
+    def worker(i):
+        barrier.wait()
+        try:
+            results[i] = target()
+        except Exception as e:
+            results[i] = e
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(10)
+    return results
+
+
+class TestSingleFlight:
+    def test_concurrent_callers_share_one_execution(self):
+        flight = SingleFlight(name="test")
+        calls = []
+
+        def slow():
+            calls.append(1)
+            time.sleep(0.2)
+            return {"team": "Arsenal"}
+
+        results = _run_concurrently(8, lambda: flight.do("team:1", slow))
+
+        assert len(calls) == 1
+        assert all(r == {"team": "Arsenal"} for r in results)
+        stats = flight.get_stats()
+        assert stats["executions"] == 1
+        assert stats["coalesced"] == 7
+        assert stats["max_waiters"] == 7
+        assert stats["in_flight"] == 0
+
+    def test_exception_is_shared_and_key_released(self):
+        flight = SingleFlight()
+
+        def boom():
+            time.sleep(0.1)
+            raise RuntimeError("403")
+
+        results = _run_concurrently(4, lambda: flight.do("url", boom))
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert flight.get_stats()["executions"] == 1
+
+        # The failed flight is gone: the next call executes again
+        assert flight.do("url", lambda: "ok") == "ok"
+        assert flight.get_stats()["executions"] == 2
+
+    def test_distinct_keys_and_sequential_calls_are_not_coalesced(self):
+        flight = SingleFlight()
+        assert flight.do("a", lambda: 1) == 1
+        assert flight.do("a", lambda: 2) == 2
+        assert flight.do("b", lambda: 3) == 3
+        assert flight.get_stats()["coalesced"] == 0
+
+
+class TestFotMobCoalescing:
+    @pytest.fixture
+    def provider(self, monkeypatch):
+        from src.ingestion.data_provider import FotMobProvider
+
+        provider = FotMobProvider()
+        monkeypatch.setattr(provider, "_rate_limit", lambda: None)
+        return provider
+
+    def test_burst_of_identical_urls_sends_one_request(self, provider):
+        response = MagicMock(status_code=200)
+        response.json.return_value = {"details": {"id": 8634}}
+
+        def slow_get(url, timeout):
+            time.sleep(0.2)
+            return response
+
+        provider.session.get = MagicMock(side_effect=slow_get)
+        url = f"{provider.BASE_URL}/teams?id=8634"
+
+        results = _run_concurrently(6, lambda: provider._make_request_with_fallback(url))
+
+        assert provider.session.get.call_count == 1
+        assert all(r is response for r in results)
+        stats = provider.get_request_coalescing_stats()
+        assert stats["executions"] == 1
+        assert stats["coalesced"] == 5
+
+    def test_different_urls_are_fetched_separately(self, provider):
+        response = MagicMock(status_code=200)
+        provider.session.get = MagicMock(return_value=response)
+
+        provider._make_request_with_fallback(f"{provider.BASE_URL}/teams?id=1")
+        provider._make_request_with_fallback(f"{provider.BASE_URL}/teams?id=2")
+
+        assert provider.session.get.call_count == 2
+        assert provider.get_request_coalescing_stats()["coalesced"] == 0
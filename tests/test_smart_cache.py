@@ -11,6 +11,8 @@ Verifies:
 import time
 from datetime import datetime, timedelta, timezone
 
+import pytest
+
 
 class TestSmartCacheTTLCalculation:
     """Tests for TTL calculation based on match proximity."""
@@ -417,3 +419,170 @@ class TestCachedDecoratorKeyError:
         result2 = my_func(5)
         assert result2 == 10
         assert call_count == 2  # Called again because cache bypassed
+
+
+class TestSmartCacheV22Eviction:
+    """V2.2: LRU order, expiry heap and byte bound."""
+
+    def test_lru_entry_is_evicted_first(self):
+        """A recently read entry survives; the least recently used one is evicted."""
+        from src.utils.smart_cache import SmartCache
+
+        cache = SmartCache(name="test_lru", max_size=3)
+        for key in ("a", "b", "c"):
+            cache.set(key, key.upper())
+        cache.get("a")
+
+        cache.set("d", "D")
+
+        assert list(cache._cache) == ["c", "a", "d"]
+        assert cache.get("b") is None
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_expired_entries_popped_from_heap(self):
+        """Expired entries are removed on insert without touching live ones."""
+        from src.utils.smart_cache import SmartCache
+
+        cache = SmartCache(name="test_heap", max_size=100)
+        for i in range(10):
+            cache.set(f"old{i}", i, ttl_override=3600)
+            cache._cache[f"old{i}"].created_at -= 7200
+        cache._expiry_heap = [
+            (entry.expires_at, entry.heap_seq, key) for key, entry in cache._cache.items()
+        ]
+        cache.set("live", "x", ttl_override=3600)
+
+        assert list(cache._cache) == ["live"]
+        assert cache.get_swr_metrics().evictions == 10
+
+    def test_overwrites_do_not_grow_heap_unbounded(self):
+        """Replacing the same key repeatedly keeps the heap compact."""
+        from src.utils.smart_cache import SmartCache
+
+        cache = SmartCache(name="test_compact", max_size=10)
+        for i in range(1000):
+            cache.set("key", i, ttl_override=3600)
+
+        assert len(cache._cache) == 1
+        assert len(cache._expiry_heap) <= 2 * len(cache._cache) + 65
+        assert cache.get("key") == 999
+
+    def test_heap_does_not_keep_replaced_payloads_alive(self):
+        """Heap items carry no entry, so a replaced payload is released right away."""
+        import gc
+        import weakref
+
+        from src.utils.smart_cache import SmartCache
+
+        class Payload:
+            pass
+
+        cache = SmartCache(name="test_heap_refs", max_size=10)
+        payload = Payload()
+        ref = weakref.ref(payload)
+        cache.set("key", payload, ttl_override=3600)
+        del payload
+        cache.set("key", "replacement", ttl_override=3600)
+        gc.collect()
+
+        assert ref() is None
+        assert len(cache._expiry_heap) == 2  # the stale item is skipped lazily
+
+    def test_stale_heap_item_does_not_evict_replacement(self):
+        """An expired item of a replaced key leaves the newer entry in place."""
+        from src.utils.smart_cache import SmartCache
+
+        cache = SmartCache(name="test_heap_seq", max_size=10)
+        cache.set("key", "old", ttl_override=3600)
+        old_seq = cache._cache["key"].heap_seq
+        cache.set("key", "new", ttl_override=3600)
+        cache._expiry_heap = [(0.0, old_seq, "key")] + [
+            item for item in cache._expiry_heap if item[1] != old_seq
+        ]
+        cache._evict_expired()
+
+        assert cache.get("key") == "new"
+        assert cache.get_swr_metrics().evictions == 0
+
+    def test_byte_limit_evicts_lru_entries(self):
+        """max_bytes keeps the estimated payload size under the bound."""
+        from src.utils.smart_cache import SmartCache
+
+        cache = SmartCache(name="test_bytes", max_size=1000, max_bytes=1000, size_func=len)
+        for i in range(5):
+            assert cache.set(f"k{i}", "x" * 300) is True
+
+        stats = cache.get_stats()
+        assert stats["size"] == 3
+        assert stats["size_bytes"] == 900
+        assert list(cache._cache) == ["k2", "k3", "k4"]
+
+        # A single payload above the bound is rejected without evicting anything
+        assert cache.set("huge", "x" * 2000) is False
+        assert list(cache._cache) == ["k2", "k3", "k4"]
+
+        cache.invalidate("k4")
+        assert cache.get_stats()["size_bytes"] == 600
+        cache.clear()
+        assert cache.get_stats()["size_bytes"] == 0
+
+    def test_swr_pair_counts_against_capacity(self):
+        """SWR fresh + stale entries fit without over-evicting on refresh."""
+        from src.utils.smart_cache import SmartCache
+
+        cache = SmartCache(name="test_swr_lru", max_size=4, swr_enabled=True)
+        cache.get_with_swr("a", lambda: 1, ttl=60)
+        cache.get_with_swr("b", lambda: 2, ttl=60)
+        assert len(cache._cache) == 4
+
+        # Re-setting an existing key replaces its pair instead of evicting others
+        cache._set_with_swr("a", 10, ttl=60)
+        assert set(cache._cache) == {"a", "a:stale", "b", "b:stale"}
+
+        cache.get_with_swr("c", lambda: 3, ttl=60)
+        assert set(cache._cache) == {"a", "a:stale", "c", "c:stale"}
+
+    def test_estimate_size_walks_nested_payloads(self):
+        """estimate_size() grows with nested JSON content."""
+        from src.utils.smart_cache import estimate_size
+
+        small = {"team": {"id": 1, "players": []}}
+        large = {"team": {"id": 1, "players": [{"name": f"P{i}"} for i in range(100)]}}
+        assert estimate_size(large) > estimate_size(small) + 100 * 50
+
+
+@pytest.mark.performance
+class TestSmartCacheEvictionBenchmark:
+    """Benchmark: inserts past capacity, heap/LRU eviction vs pre-V2.2 sort."""
+
+    def test_benchmark_inserts_past_capacity(self):
+        from src.utils.smart_cache import SmartCache
+
+        capacity, inserts = 2000, 5000
+
+        # Pre-V2.2 behaviour: full expiry scan + sort by created_at on each overflow
+        legacy: dict = {}
+        start = time.perf_counter()
+        for i in range(inserts):
+            now = time.time()
+            for key in [k for k, (created, ttl) in legacy.items() if now - created > ttl]:
+                del legacy[key]
+            if len(legacy) >= capacity:
+                oldest = sorted(legacy, key=lambda k: legacy[k][0])[: max(1, capacity // 10)]
+                for key in oldest:
+                    del legacy[key]
+            legacy[f"k{i}"] = (now, 3600)
+        legacy_s = time.perf_counter() - start
+
+        cache = SmartCache(name="bench", max_size=capacity)
+        start = time.perf_counter()
+        for i in range(inserts):
+            cache.set(f"k{i}", i, ttl_override=3600)
+        heap_s = time.perf_counter() - start
+
+        print(
+            f"\n📊 SmartCache {inserts} inserts @ {capacity}: sort={legacy_s * 1000:.0f}ms "
+            f"heap={heap_s * 1000:.0f}ms speedup={legacy_s / max(heap_s, 1e-9):.1f}x"
+        )
+        assert len(cache._cache) == capacity
+        assert heap_s < legacy_s
@@ -377,13 +377,14 @@ class TestCacheRoundTripProperty:
         from src.ingestion.tavily_key_rotator import TavilyKeyRotator
         from src.ingestion.tavily_provider import TavilyProvider
 
-        # Skip if queries are the same
-        if query1.strip() == query2.strip():
-            return
-
         rotator = TavilyKeyRotator(keys=["tvly-test-key"])
         provider = TavilyProvider(key_rotator=rotator)
 
+        # Skip if queries are the same (casing / whitespace variants share a key)
+        canonicalize = provider._response_cache.canonicalize
+        if canonicalize(query1) == canonicalize(query2):
+            return
+
         key1 = provider._get_cache_key(query1, "basic", 5)
         key2 = provider._get_cache_key(query2, "basic", 5)
 
@@ -437,29 +438,28 @@ class TestCacheRoundTripProperty:
         When a cache entry has expired, _check_cache should return None.
         """
         from src.ingestion.tavily_key_rotator import TavilyKeyRotator
-        from src.ingestion.tavily_provider import CacheEntry, TavilyProvider, TavilyResponse
+        from src.ingestion.tavily_provider import TavilyProvider, TavilyResponse
+        from src.utils.response_cache import ResponseCache
 
+        clock = [datetime.now(timezone.utc).timestamp()]
+        cache = ResponseCache(db_path=None, clock=lambda: clock[0])
         rotator = TavilyKeyRotator(keys=["tvly-test-key"])
-        provider = TavilyProvider(key_rotator=rotator)
+        provider = TavilyProvider(key_rotator=rotator, response_cache=cache)
 
-        # Create an expired cache entry
+        # Cache an entry, then let 1 hour pass (30 minutes TTL)
         test_response = TavilyResponse(
             query="test query", answer="test answer", results=[], response_time=0.5
         )
-
-        cache_key = "test_expired_key"
-        provider._cache[cache_key] = CacheEntry(
-            response=test_response,
-            cached_at=datetime.now(timezone.utc) - timedelta(hours=1),  # 1 hour ago
-            ttl_seconds=1800,  # 30 minutes TTL
-        )
+        cache_key = provider._get_cache_key("test query", "basic", 5)
+        provider._update_cache(cache_key, test_response)
+        clock[0] += timedelta(hours=1).total_seconds()
 
         # Should return None for expired entry
         cached = provider._check_cache(cache_key)
         assert cached is None
 
         # Entry should be cleaned up
-        assert cache_key not in provider._cache
+        assert not cache.contains(cache_key)
 
 
 # ============================================
@@ -0,0 +1,266 @@
+"""
+Tests for the V1.0 TeamNameIndex and its users.
+
+Covers:
+1. Normalized forms, aliases, token/n-gram blocking and incremental sync
+2. fuzzy_match_team() keeps its pre-index behaviour (shared scorer)
+3. NewsRadarMonitor._fuzzy_match_team() resolves through the index
+4. Shared index refresh: a failed TeamAlias query prunes nothing and retries,
+   invalidate_team_name_index() forces the next lookup to sync
+5. Benchmark: accuracy and throughput vs a fuzzy_match_team() scan of all teams
+
+Run with: pytest tests/test_team_name_index.py -v -s
+"""
+
+import random
+import time
+from difflib import SequenceMatcher
+
+import pytest
+
+from src.ingestion.data_provider import fuzzy_match_team
+from src.utils import team_name_index
+from src.utils.team_name_index import (
+    TeamIndexEntry,
+    TeamNameIndex,
+    normalize_team_key,
+    token_set_score,
+)
+
+try:
+    from thefuzz import fuzz
+except ImportError:  # pragma: no cover - thefuzz is in requirements.txt
+    fuzz = None
+
+
+def _reference_fuzzy_match_team(search_name, candidates, threshold=0.6):
+    """Pre-V15.0 fuzzy_match_team(), kept verbatim as the equivalence oracle."""
+    if not candidates or not search_name:
+        return None
+    search_lower = search_name.lower().strip()
+    search_tokens = set(search_lower.split())
+    search_first = search_lower.split()[0] if search_lower else ""
+    best_match = None
+    best_score = 0
+    for candidate in candidates:
+        if not candidate:
+            continue
+        cand_lower = candidate.lower().strip()
+        cand_tokens = set(cand_lower.split())
+        if search_lower == cand_lower:
+            return candidate
+        cand_first = cand_lower.split()[0] if cand_lower else ""
+        if search_first and cand_first and search_first == cand_first and len(search_first) >= 4:
+            return candidate
+        overlap = len(search_tokens & cand_tokens)
+        if overlap >= 1 and overlap >= len(search_tokens) * 0.5:
+            token_score = overlap / max(len(search_tokens), len(cand_tokens))
+            if token_score > best_score:
+                best_score = token_score
+                best_match = candidate
+        if fuzz is not None:
+            fuzz_score = fuzz.token_set_ratio(search_lower, cand_lower) / 100.0
+            if fuzz_score > best_score:
+                best_score = fuzz_score
+                best_match = candidate
+        seq_score = SequenceMatcher(None, search_lower, cand_lower).ratio()
+        if seq_score > best_score:
+            best_score = seq_score
+            best_match = candidate
+    return best_match if best_score >= threshold else None
+
+
+class TestTeamNameIndex:
+    def test_normalized_forms(self):
+        assert normalize_team_key("  São Paulo F.C. ") == "sao paulo f c"
+        assert normalize_team_key("Beşiktaş JK") == "besiktas jk"
+        assert normalize_team_key(None) == ""
+
+    def test_exact_and_alias_lookups(self):
+        index = TeamNameIndex()
+        index.add("Galatasaray SK", aliases=["Galatasaray"], fotmob_id=8601)
+        index.add("Sao Paulo FC")
+
+        assert index.lookup_exact("GALATASARAY") == "Galatasaray SK"
+        assert index.get_fotmob_id("galatasaray sk") == 8601
+        assert index.match("São Paulo FC") == ("Sao Paulo FC", 1.0)
+        assert index.lookup_exact("Fenerbahce") is None
+
+    def test_fuzzy_match_scores_only_blocked_candidates(self):
+        index = TeamNameIndex()
+        for i in range(500):
+            index.add(f"Club {i} Athletic")
+        index.add("Sao Paulo FC")
+        index.add("Internacional")
+
+        name, score = index.match("Sao Paulo", scorer=token_set_score, threshold=0.8)
+        assert name == "Sao Paulo FC" and score >= 0.8
+        assert index.match("Internacionl")[0] == "Internacional"
+        assert index.match("Completely Unknown", scorer=token_set_score, threshold=0.8) is None
+        assert index.get_stats()["avg_candidates"] < 60
+
+    def test_allowed_restricts_results(self):
+        index = TeamNameIndex()
+        index.add("Inter Milan")
+        index.add("Inter Miami")
+        assert index.match("Inter Miami", allowed={"Inter Milan"})[0] == "Inter Milan"
+        assert index.match("Inter Miami", allowed=set()) is None
+
+    def test_incremental_sync_and_removal(self):
+        index = TeamNameIndex()
+        first = [TeamIndexEntry("Arsenal"), TeamIndexEntry("Chelsea", frozenset({"Chelsea FC"}))]
+        assert index.sync(first) == {"added": 2, "updated": 0, "removed": 0}
+        assert index.sync(first) == {"added": 0, "updated": 0, "removed": 0}
+
+        second = [TeamIndexEntry("Arsenal", fotmob_id=9825), TeamIndexEntry("Everton")]
+        assert index.sync(second) == {"added": 1, "updated": 1, "removed": 1}
+        assert index.lookup_exact("Chelsea FC") is None
+        assert all("chelsea fc" not in forms for forms in index._by_ngram.values())
+        assert index.get_fotmob_id("Arsenal") == 9825
+
+        index.remove("Arsenal")
+        index.remove("Everton")
+        assert index._by_token == {} and index._by_ngram == {} and index._owners == {}
+
+
+class TestSharedIndexRefresh:
+    def test_db_failure_keeps_aliases_and_retries(self, monkeypatch):
+        index = TeamNameIndex()
+        index.sync([TeamIndexEntry("Arsenal"), TeamIndexEntry("Galatasaray SK")])
+        monkeypatch.setattr(team_name_index, "_team_index", index)
+        monkeypatch.setattr(team_name_index, "_team_index_synced_at", 0.0)
+        static = [TeamIndexEntry("Arsenal", fotmob_id=9825)]
+        db_ok = {"value": False}
+        monkeypatch.setattr(
+            team_name_index, "load_team_index_entries", lambda: (static, db_ok["value"])
+        )
+
+        counts = team_name_index.refresh_team_name_index()
+
+        assert counts == {"added": 0, "updated": 1, "removed": 0}
+        assert index.lookup_exact("Galatasaray SK") is not None
+        assert team_name_index._team_index_synced_at == 0.0  # next lookup retries
+
+        db_ok["value"] = True
+        assert team_name_index.refresh_team_name_index()["removed"] == 1
+        assert index.lookup_exact("Galatasaray SK") is None
+        assert team_name_index._team_index_synced_at > 0.0
+
+    def test_invalidate_forces_next_lookup_to_sync(self, monkeypatch):
+        index = TeamNameIndex()
+        monkeypatch.setattr(team_name_index, "_team_index", index)
+        monkeypatch.setattr(team_name_index, "_team_index_synced_at", time.monotonic())
+        monkeypatch.setattr(
+            team_name_index, "load_team_index_entries", lambda: ([TeamIndexEntry("Rizespor")], True)
+        )
+
+        assert team_name_index.get_team_name_index().lookup_exact("Rizespor") is None
+        team_name_index.invalidate_team_name_index()
+        assert team_name_index.get_team_name_index().lookup_exact("Rizespor") is not None
+
+
+class TestFuzzyMatchTeamParity:
+    def test_matches_reference_implementation(self):
+        rng = random.Random(5)
+        names = [
+            "Manchester United",
+            "Manchester City",
+            "Real Madrid",
+            "Real Sociedad",
+            "Sao Paulo",
+            "Internacional",
+            "Inter",
+            "AEK Athens",
+            "PAOK",
+            "Galatasaray",
+            "Besiktas JK",
+            "Legia Warsaw",
+            "",
+        ]
+        queries = ["Man Utd", "Real", "Sao Paulo FC", "Inter Milan", "AEK", "Besiktas", "xyz"]
+        for _ in range(200):
+            candidates = rng.sample(names, rng.randint(1, len(names)))
+            for query in queries + [rng.choice(names)]:
+                for threshold in (0.3, 0.4, 0.6):
+                    assert fuzzy_match_team(query, candidates, threshold) == (
+                        _reference_fuzzy_match_team(query, candidates, threshold)
+                    )
+
+
+class TestNewsRadarFuzzyMatch:
+    def test_resolves_through_upcoming_team_index(self):
+        from src.services.news_radar import NewsRadarMonitor
+
+        monitor = object.__new__(NewsRadarMonitor)
+        monitor._upcoming_team_index = TeamNameIndex()
+        monitor._upcoming_team_index.sync(
+            TeamIndexEntry(name) for name in ["Sao Paulo FC", "Flamengo", "Palmeiras"]
+        )
+        monitor._upcoming_team_index_at = time.monotonic()
+
+        assert monitor._fuzzy_match_team("São Paulo") == "Sao Paulo FC"
+        assert monitor._fuzzy_match_team("flamengo") == "Flamengo"
+        assert monitor._fuzzy_match_team("Corinthians") == "Corinthians"
+        assert monitor._fuzzy_match_team("") == ""
+
+
+def _synthetic_teams(n, seed=2026):
+    rng = random.Random(seed)
+    prefixes = ["", "FC ", "AC ", "Real ", "Sporting ", "Dynamo ", "Atletico "]
+    suffixes = ["", " FC", " United", " City", " SK", " Athletic", " Rovers"]
+    syllables = ["ba", "ro", "na", "ki", "to", "le", "mi", "sa", "vo", "gra", "del", "pol"]
+    teams = set()
+    while len(teams) < n:
+        root = "".join(rng.choice(syllables) for _ in range(rng.randint(2, 4))).capitalize()
+        teams.add(f"{rng.choice(prefixes)}{root}{rng.choice(suffixes)}")
+    return sorted(teams)
+
+
+def _perturb(name, rng):
+    words = name.split()
+    choice = rng.random()
+    if choice < 0.3 and len(words) > 1:
+        return " ".join(words[:-1]) if rng.random() < 0.5 else " ".join(words[1:])
+    if choice < 0.6:
+        pos = rng.randrange(len(name))
+        return name[:pos] + name[pos + 1 :]
+    if choice < 0.8:
+        return name.upper()
+    return name.replace("o", "ó", 1)
+
+
+@pytest.mark.performance
+class TestTeamNameIndexBenchmark:
+    """Benchmark: 2000 known teams x 100 noisy lookups, index vs full scan."""
+
+    def test_benchmark_accuracy_and_throughput(self):
+        teams = _synthetic_teams(2000)
+        rng = random.Random(11)
+        truth = [rng.choice(teams) for _ in range(100)]
+        queries = [_perturb(name, rng) for name in truth]
+
+        start = time.perf_counter()
+        scanned = [fuzzy_match_team(q, teams) for q in queries]
+        scan_s = time.perf_counter() - start
+
+        index = TeamNameIndex()
+        build_start = time.perf_counter()
+        index.sync(TeamIndexEntry(name) for name in teams)
+        build_s = time.perf_counter() - build_start
+
+        start = time.perf_counter()
+        indexed = [index.match(q) for q in queries]
+        index_s = time.perf_counter() - start
+
+        def accuracy(results):
+            return sum(r == t for r, t in zip(results, truth, strict=True)) / len(truth)
+
+        scan_acc = accuracy(scanned)
+        index_acc = accuracy([r[0] if r else None for r in indexed])
+        print(
+            f"\n📊 TeamNameIndex 2000 teams / 100 lookups: scan={scan_s * 1000:.0f}ms "
+            f"(acc {scan_acc:.0%}) index={index_s * 1000:.0f}ms (acc {index_acc:.0%}) "
+            f"build={build_s * 1000:.0f}ms speedup={scan_s / max(index_s, 1e-9):.1f}x"
+        )
+        assert index_acc >= scan_acc - 0.05
+        assert index_s < scan_s
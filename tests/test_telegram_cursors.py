@@ -0,0 +1,234 @@
+"""
+Tests for V12.6 incremental Telegram polling (per-channel high-water marks).
+
+Covers:
+1. ChannelCursorStore: only moves forward, saves only when changed,
+   survives a restart, ignores a corrupt file
+2. fetch_squad_images(): asks for messages above the channel's cursor,
+   does not download/OCR/gate a message twice, advances only after a
+   channel's batch was evaluated, stays below a photo whose OCR failed
+   transiently
+3. Benchmark: 20 channels x 6 cycles with 1 new message per channel per
+   cycle, fixed last-10 fetch vs min_id fetch
+
+Run with: pytest tests/test_telegram_cursors.py -v -s
+"""
+
+import json
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+import src.database.models as models
+from src.processing import telegram_listener
+from src.processing.telegram_listener import ChannelCursorStore
+
+
+class FakeChannelClient:
+    """Channels with ascending message ids; every message has a photo."""
+
+    def __init__(self, channels, per_channel=15):
+        self.messages = {channel: list(range(1, per_channel + 1)) for channel in channels}
+        self.requests: list[tuple[str, int]] = []
+        self.downloads = 0
+        self.epoch = int(time.time()) - 3600  # message i is dated epoch + i
+
+    def post(self, channel, count=1):
+        ids = self.messages[channel]
+        ids.extend(range(ids[-1] + 1, ids[-1] + 1 + count))
+
+    async def get_messages(self, entity, limit=10, min_id=0):
+        self.requests.append((entity, min_id))
+        ids = [i for i in self.messages[entity] if i > min_id][-limit:]
+        return [
+            SimpleNamespace(
+                id=i,
+                photo=object(),
+                message=f"post {i}",
+                text=None,
+                date=datetime.fromtimestamp(self.epoch + i, timezone.utc),
+            )
+            for i in reversed(ids)  # newest first, like Telethon
+        ]
+
+    async def download_media(self, photo, path):
+        self.downloads += 1
+
+
+@pytest.fixture
+def listener(tmp_path, monkeypatch):
+    """fetch_squad_images() wired to fakes; returns the list of gated message texts."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(telegram_listener, "API_ID", 1)
+    monkeypatch.setattr(telegram_listener, "API_HASH", "hash")
+    monkeypatch.setattr(telegram_listener, "_TRUST_SCORE_AVAILABLE", False)
+    monkeypatch.setattr(
+        telegram_listener,
+        "_channel_cursors",
+        ChannelCursorStore(str(tmp_path / "cursors.json")),
+    )
+
+    class NoTeams:
+        def __enter__(self):
+            raise RuntimeError("no database in tests")
+
+        def __exit__(self, *exc):
+            return False
+
+    monkeypatch.setattr(models, "get_db_session", NoTeams)
+
+    async def entity(client, channel):
+        return channel
+
+    async def ocr(image_url, channel_info=None, raise_transient=False):
+        return None
+
+    gated: list[str] = []
+
+    def should_process(msg_date, text):
+        gated.append(text)
+        return False, None, "No upcoming match"
+
+    monkeypatch.setattr(telegram_listener, "get_channel_entity_safe", entity)
+    monkeypatch.setattr(telegram_listener, "process_squad_image_async", ocr)
+    monkeypatch.setattr(telegram_listener, "should_process_message", should_process)
+    return gated
+
+
+def _channels(monkeypatch, channels):
+    monkeypatch.setattr(telegram_listener, "get_all_telegram_channels", lambda: {"it": channels})
+
+
+class TestChannelCursorStore:
+    def test_advance_save_and_reload(self, tmp_path):
+        path = tmp_path / "cursors.json"
+        store = ChannelCursorStore(str(path))
+        store.advance("a", 10)
+        store.advance("a", 7)  # never backwards
+        store.save()
+        mtime = path.stat().st_mtime_ns
+
+        store.advance("a", 10)
+        store.save()  # unchanged: not rewritten
+
+        assert path.stat().st_mtime_ns == mtime
+        assert ChannelCursorStore(str(path)).get("a") == 10
+        assert ChannelCursorStore(str(path)).get("b") == 0
+
+    def test_corrupt_file_starts_over(self, tmp_path):
+        path = tmp_path / "cursors.json"
+        path.write_text("{not json")
+
+        store = ChannelCursorStore(str(path))
+        store.advance("a", 3)
+        store.save()
+
+        assert len(store) == 1
+        assert json.loads(path.read_text()) == {"channels": {"a": 3}}
+
+
+class TestIncrementalPolling:
+    async def test_seen_messages_are_not_fetched_again(self, listener, monkeypatch):
+        _channels(monkeypatch, ["insider_a", "insider_b"])
+        client = FakeChannelClient(["insider_a", "insider_b"])
+
+        await telegram_listener.fetch_squad_images(existing_client=client)
+        assert len(listener) == 20 and client.downloads == 20
+
+        client.post("insider_a", 2)
+        listener.clear()
+        await telegram_listener.fetch_squad_images(existing_client=client)
+
+        assert sorted(listener) == ["post 16", "post 17"]
+        assert client.downloads == 22
+        assert client.requests[-2:] == [("insider_a", 15), ("insider_b", 15)]
+
+        restarted = ChannelCursorStore(telegram_listener._channel_cursors.path)
+        assert restarted.get("insider_a") == 17
+
+    async def test_failed_batch_is_fetched_again(self, listener, monkeypatch):
+        _channels(monkeypatch, ["insider_a"])
+        client = FakeChannelClient(["insider_a"], per_channel=3)
+
+        def broken_gate(msg_date, text):
+            raise RuntimeError("database is locked")
+
+        monkeypatch.setattr(telegram_listener, "should_process_message", broken_gate)
+        await telegram_listener.fetch_squad_images(existing_client=client)
+
+        assert telegram_listener._channel_cursors.get("insider_a") == 0
+        assert client.requests == [("insider_a", 0)]
+
+    async def test_transient_ocr_failure_is_retried(self, listener, monkeypatch):
+        from src.analysis.ocr_pool import OcrPoolFullError
+
+        _channels(monkeypatch, ["insider_a"])
+        client = FakeChannelClient(["insider_a"], per_channel=5)
+        pool_full = {"busy": True}
+
+        async def ocr(image_url, channel_info=None, raise_transient=False):
+            if pool_full["busy"] and image_url.endswith(f"_{client.epoch + 3}.jpg"):
+                raise OcrPoolFullError("8 OCR jobs in flight")
+            return None
+
+        monkeypatch.setattr(telegram_listener, "process_squad_image_async", ocr)
+        await telegram_listener.fetch_squad_images(existing_client=client)
+
+        assert sorted(listener) == ["post 1", "post 2"]
+        assert telegram_listener._channel_cursors.get("insider_a") == 2
+
+        pool_full["busy"] = False
+        listener.clear()
+        await telegram_listener.fetch_squad_images(existing_client=client)
+
+        assert sorted(listener) == ["post 3", "post 4", "post 5"]
+        assert client.requests[-1] == ("insider_a", 2)
+        assert telegram_listener._channel_cursors.get("insider_a") == 5
+
+
+@pytest.mark.performance
+class TestIncrementalPollingBenchmark:
+    """Benchmark: 20 channels, 6 cycles, 1 new photo per channel per cycle, 1ms OCR."""
+
+    async def test_benchmark_fixed_window_vs_min_id(self, listener, monkeypatch, tmp_path):
+        channels = [f"channel_{i}" for i in range(20)]
+        _channels(monkeypatch, channels)
+
+        async def slow_ocr(image_url, channel_info=None, raise_transient=False):
+            time.sleep(0.001)  # stands in for download + OCR work per photo
+            return None
+
+        monkeypatch.setattr(telegram_listener, "process_squad_image_async", slow_ocr)
+
+        async def run_cycles(use_cursors):
+            client = FakeChannelClient(channels)
+            listener.clear()
+            monkeypatch.setattr(
+                telegram_listener, "_channel_cursors", ChannelCursorStore(str(tmp_path / "c.json"))
+            )
+            start = time.perf_counter()
+            for _ in range(6):
+                if not use_cursors:
+                    # Pre-V12.6 behaviour: every cycle starts from an empty cursor
+                    monkeypatch.setattr(
+                        telegram_listener, "_channel_cursors", ChannelCursorStore("/nonexistent")
+                    )
+                    telegram_listener._channel_cursors.save = lambda: None
+                await telegram_listener.fetch_squad_images(existing_client=client)
+                for channel in channels:
+                    client.post(channel)
+            return time.perf_counter() - start, len(listener)
+
+        fixed_s, fixed_evaluated = await run_cycles(use_cursors=False)
+        incremental_s, incremental_evaluated = await run_cycles(use_cursors=True)
+
+        print(
+            f"\n📊 20 channels x 6 cycles: last-10 fetch evaluated {fixed_evaluated} messages "
+            f"in {fixed_s * 1000:.0f}ms; min_id fetch evaluated {incremental_evaluated} "
+            f"in {incremental_s * 1000:.0f}ms ({fixed_s / incremental_s:.1f}x)"
+        )
+        assert fixed_evaluated == 20 * 10 * 6
+        assert incremental_evaluated == 20 * 10 + 20 * 5
+        assert incremental_s < fixed_s / 2
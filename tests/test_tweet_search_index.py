@@ -0,0 +1,286 @@
+"""
+Tests for the V15.1 TwitterIntelCache search index and append-only persistence.
+
+Covers:
+1. TweetSearchIndex: whole-word phrases, single-word prefixes (suffixed
+   Turkish forms), accent folding, topic bitmap,
+   CJK substring fallback, re-indexing replaced accounts
+2. search_intel(): entries written directly to _cache are picked up, league
+   filter keeps the account order, alias expansion
+3. get_cached_tweets_for_match(): one lookup for both teams and their aliases
+4. Persistence: changed accounts are appended, restart replays the log,
+   a truncated record is dropped, compaction, version 1 snapshots still load
+5. Benchmark: match lookups on 4000 tweets (scan vs index) and a one-account
+   save (full rewrite vs append)
+
+Run with: pytest tests/test_tweet_search_index.py -v -s
+"""
+
+import os
+import pickle
+import time
+
+import pytest
+
+from src.services.tweet_search_index import TweetSearchIndex, tokenize
+from src.services.twitter_intel_cache import (
+    CachedTweet,
+    TwitterIntelCache,
+    TwitterIntelCacheEntry,
+)
+
+
+def _entry(handle, *contents, topics=("injury",)):
+    return TwitterIntelCacheEntry(
+        handle=handle,
+        account_name=handle,
+        league_focus="test",
+        tweets=[
+            CachedTweet(handle=f"@{handle}", date="2026-10-01", content=c, topics=list(topics))
+            for c in contents
+        ],
+    )
+
+
+def _fresh_cache(path) -> TwitterIntelCache:
+    """Re-initialize the singleton on a temporary cache file."""
+    cache = TwitterIntelCache.__new__(TwitterIntelCache)
+    cache._initialized = False
+    cache.__init__()
+    cache.clear_cache()
+    cache._persisted = {}
+    cache._log_records = 0
+    cache._cache_file_path = str(path)
+    cache._load_from_disk()
+    return cache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return _fresh_cache(tmp_path / "twitter_cache.pkl")
+
+
+class TestTweetSearchIndex:
+    def test_whole_word_phrases_and_accents(self):
+        index = TweetSearchIndex()
+        index.put("a", _entry("a", "Fenerbahçe: Džeko out", "Real Madrid win", "Madrid real deal"))
+
+        assert [t.content for t in index.search(["fenerbahce"])] == ["Fenerbahçe: Džeko out"]
+        assert [t.content for t in index.search(["Real Madrid"])] == ["Real Madrid win"]
+        assert len(index.search(["Fener"])) == 1  # one word: matched as a word prefix
+        assert index.search(["bahce"]) == []
+        assert index.search(["Madrid win deal"]) == []  # phrases: whole words only
+        assert index.search(["!!!"]) == []
+
+    def test_single_word_matches_suffixed_forms(self):
+        index = TweetSearchIndex()
+        index.put(
+            "a",
+            _entry(
+                "a",
+                "Galatasaraylı taraftarlar derbiye hazır",
+                "Beşiktaşlı oyuncu sakatlandı",
+                "Galatasaray Kulübü açıklama yaptı",
+            ),
+        )
+
+        assert len(index.search(["Galatasaray"])) == 2
+        assert [t.content for t in index.search(["Besiktas"])] == ["Beşiktaşlı oyuncu sakatlandı"]
+        assert index.search(["Galatasaray Kulubu"])[0].content.startswith("Galatasaray Kulübü")
+        assert index.search(["Galatasaray taraftarlar"]) == []  # phrases stay whole-word
+
+        index.sync({})
+        index.put("b", _entry("b", "Besiktas news"))
+        assert [t.content for t in index.search(["Besiktas"])] == ["Besiktas news"]
+
+    def test_topic_bitmap(self):
+        index = TweetSearchIndex()
+        index.put("a", _entry("a", "Team news one", topics=["injury", "lineup"]))
+        index.put("b", _entry("b", "Team news two", topics=["transfer"]))
+
+        assert len(index.search(["team"], topics=["lineup", "suspension"])) == 1
+        assert index.search(["team"], topics=["unknown"]) == []
+        assert len(index.search(["team"], topics=[])) == 2
+
+    def test_cjk_queries_match_substrings(self):
+        index = TweetSearchIndex()
+        index.put("a", _entry("a", "浦和レッズの主力が負傷"))
+
+        assert len(index.search(["浦和"])) == 1
+
+    def test_reindex_replaced_account(self):
+        index = TweetSearchIndex()
+        index.put("a", _entry("a", "Icardi injured"))
+        index.sync({"a": _entry("a", "Mertens suspended")})
+
+        assert index.search(["icardi"]) == []
+        assert len(index.search(["mertens"])) == 1
+        assert index.sync({}) == 1
+        assert index.get_stats() == {"accounts": 0, "tweets": 0, "tokens": 0, "topics": 1}
+
+    def test_tokenize(self):
+        assert tokenize("Galatasaray's  ÇAĞLAR") == ["galatasaray", "s", "caglar"]
+
+
+class TestSearchIntel:
+    def test_direct_cache_writes_are_indexed(self, cache):
+        cache._cache["@rudygaletti"] = _entry("rudygaletti", "Galatasaray: Icardi out")
+        assert len(cache.search_intel("Galatasaray")) == 1
+
+        cache._cache["@rudygaletti"].tweets.append(CachedTweet("@x", "d", "Galatasaray again"))
+        assert len(cache.search_intel("galatasaray")) == 2
+        assert cache.get_cache_summary()["search_index"]["tweets"] == 2
+
+    def test_league_filter_keeps_account_order(self, cache):
+        with cache._cache_lock:
+            cache._store_entry("onuranli", _entry("onuranli", "Galatasaray lineup"))
+            cache._store_entry("other", _entry("other", "Galatasaray rumour"))
+            cache._store_entry("rudygaletti", _entry("rudygaletti", "Galatasaray injury"))
+
+        results = cache.search_intel("Galatasaray", league_key="soccer_turkey_super_league")
+
+        assert [t.content for t in results] == ["Galatasaray injury", "Galatasaray lineup"]
+        assert len(cache.search_intel("Galatasaray")) == 3
+
+    def test_alias_expansion(self, cache):
+        cache._cache["a"] = _entry("a", "Cimbom star doubtful for Sunday")
+
+        assert cache.search_intel("Galatasaray") == []
+        assert len(cache.search_intel("Galatasaray", expand_aliases=True)) == 1
+
+    def test_match_lookup_covers_both_teams_and_aliases(self, cache):
+        cache._cache["rudygaletti"] = _entry(
+            "rudygaletti", "Galatasaray v Fenerbahce: team news", "Kanarya injury", "Besiktas"
+        )
+        cache._cache["other"] = _entry("other", "Fenerbahce outside the league accounts")
+
+        tweets = cache.get_cached_tweets_for_match(
+            "Galatasaray", "Fenerbahce", "soccer_turkey_super_league"
+        )
+
+        assert [t["content"] for t in tweets] == [
+            "Galatasaray v Fenerbahce: team news",
+            "Kanarya injury",
+        ]
+        assert cache.get_cached_tweets_for_match("Galatasaray", "Fenerbahce", "unknown") == []
+
+
+class TestAppendOnlyPersistence:
+    def test_changed_accounts_are_appended(self, cache, tmp_path):
+        path = tmp_path / "twitter_cache.pkl"
+        with cache._cache_lock:
+            for i in range(10):
+                cache._store_entry(f"h{i}", _entry(f"h{i}", f"tweet {i}"))
+        cache._save_to_disk()  # no file yet: snapshot
+        snapshot_size = path.stat().st_size
+
+        with cache._cache_lock:
+            cache._store_entry("h3", _entry("h3", "Icardi ruled out"))
+            del cache._cache["h7"]
+        cache._save_to_disk()
+        cache._save_to_disk()  # nothing changed: nothing appended
+
+        assert cache._log_records == 2
+        assert 0 < path.stat().st_size - snapshot_size < snapshot_size / 2
+
+        reloaded = _fresh_cache(path)
+        assert sorted(reloaded.get_cached_intel()) == [f"h{i}" for i in range(10) if i != 7]
+        assert [t.handle for t in reloaded.search_intel("icardi")] == ["@h3"]
+        assert reloaded._pending_records() == []
+
+    def test_truncated_record_is_dropped(self, cache, tmp_path):
+        path = tmp_path / "twitter_cache.pkl"
+        cache._cache["h1"] = _entry("h1", "first")
+        cache._save_to_disk()
+        cache._cache["h2"] = _entry("h2", "second")
+        cache._save_to_disk()
+        good_size = path.stat().st_size
+        with open(path, "ab") as f:
+            f.write(pickle.dumps(("put", "h3", _entry("h3", "third")))[:20])
+
+        reloaded = _fresh_cache(path)
+
+        assert sorted(reloaded.get_cached_intel()) == ["h1", "h2"]
+        assert path.stat().st_size == good_size
+
+    def test_compaction(self, cache, tmp_path, monkeypatch):
+        import src.services.twitter_intel_cache as module
+
+        monkeypatch.setattr(module, "_COMPACT_MIN_RECORDS", 3)
+        cache._cache["h1"] = _entry("h1", "v0")
+        cache._save_to_disk()
+        for version in range(1, 5):
+            cache._cache["h1"] = _entry("h1", f"v{version}")
+            cache._save_to_disk()
+
+        assert cache._log_records < 3
+        with open(tmp_path / "twitter_cache.pkl", "rb") as f:
+            assert pickle.load(f)["__version__"] == 2
+        assert _fresh_cache(tmp_path / "twitter_cache.pkl")._cache["h1"].tweets[0].content == "v4"
+
+    def test_version_1_snapshot_loads(self, cache, tmp_path):
+        path = tmp_path / "twitter_cache.pkl"
+        with open(path, "wb") as f:
+            pickle.dump({"__version__": 1, "__cache__": {"h1": _entry("h1", "old")}}, f)
+
+        reloaded = _fresh_cache(path)
+        reloaded._cache["h2"] = _entry("h2", "new")
+        reloaded._save_to_disk()
+
+        assert sorted(_fresh_cache(path).get_cached_intel()) == ["h1", "h2"]
+
+
+@pytest.mark.performance
+class TestSearchIndexBenchmark:
+    """Benchmark: 200 accounts x 20 tweets; 100 match lookups; saving one changed account."""
+
+    def test_benchmark_scan_vs_index(self, cache, tmp_path):
+        teams = [f"Team{i} FC" for i in range(100)]
+        for a in range(200):
+            cache._cache[f"h{a}"] = _entry(
+                f"h{a}",
+                *(
+                    f"{teams[(a + t) % 100]} striker doubtful ahead of the weekend fixture"
+                    for t in range(20)
+                ),
+            )
+        entries = list(cache._cache.values())
+
+        # Pre-V15.1 search_intel: lower-case substring scan of every tweet, twice per match
+        start = time.perf_counter()
+        for i in range(100):
+            for team in (teams[i], teams[(i + 1) % 100]):
+                query = team.lower()
+                [t for e in entries for t in e.tweets if query in t.content.lower()]
+        scan_s = time.perf_counter() - start
+
+        cache.search_intel("warm-up")  # builds the index once
+        start = time.perf_counter()
+        for i in range(100):
+            for team in (teams[i], teams[(i + 1) % 100]):
+                cache.search_intel(team)
+        index_s = time.perf_counter() - start
+        assert len(cache.search_intel(teams[0])) == len(
+            [t for e in entries for t in e.tweets if "team0 fc" in t.content.lower()]
+        )
+
+        # Persistence: whole-cache pickle rewrite vs appending the changed account
+        cache._save_to_disk()
+        start = time.perf_counter()
+        with open(str(tmp_path / "full.pkl"), "wb") as f:
+            pickle.dump({"__version__": 1, "__cache__": cache._cache}, f)
+        os.replace(str(tmp_path / "full.pkl"), str(tmp_path / "full_final.pkl"))
+        rewrite_s = time.perf_counter() - start
+
+        cache._cache["h5"] = _entry("h5", "Team5 FC keeper injured")
+        start = time.perf_counter()
+        cache._save_to_disk()
+        append_s = time.perf_counter() - start
+
+        print(
+            f"\n📊 100 match lookups on 4000 tweets: scan={scan_s * 1000:.0f}ms "
+            f"index={index_s * 1000:.0f}ms ({scan_s / index_s:.1f}x); "
+            f"save one account: rewrite={rewrite_s * 1000:.1f}ms append={append_s * 1000:.1f}ms"
+        )
+        assert index_s < scan_s
+        assert append_s < rewrite_s
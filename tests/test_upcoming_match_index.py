@@ -0,0 +1,300 @@
+"""
+Tests for the V1.0 in-memory upcoming-match index.
+
+Covers:
+1. Lookups: team by normalized name or alias, substring rule of the old
+   queries, kickoff windows (naive and aware), league, id, team names
+2. Refresh: TTL reload, invalidate() reloads on the next lookup, a failed
+   load keeps the previous snapshot and retries later, an invalidation during
+   a load keeps the index stale
+3. load_upcoming_matches(): one query over the horizon, detached records
+4. telegram_listener.has_upcoming_match(): served by the index, active-scope
+   filter still applied
+5. Benchmark: 30 candidate team names per message, per-name DB query vs index
+
+Run with: pytest tests/test_upcoming_match_index.py -v -s
+"""
+
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import src.database.models as models
+import src.utils.upcoming_match_index as match_index
+from src.database.models import Base, Match
+from src.utils.upcoming_match_index import (
+    UpcomingMatch,
+    UpcomingMatchIndex,
+    load_upcoming_matches,
+)
+
+NOW = datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
+
+
+def _match(match_id, home, away, hours, league="soccer_turkey_super_league"):
+    return UpcomingMatch(
+        id=match_id,
+        league=league,
+        home_team=home,
+        away_team=away,
+        start_time=NOW + timedelta(hours=hours),
+    )
+
+
+MATCHES = [
+    _match("m1", "Galatasaray", "Fenerbahce", 30),
+    _match("m2", "Besiktas", "Trabzonspor", 10),
+    _match("m3", "Flamengo", "Palmeiras", 50, league="soccer_brazil_campeonato"),
+    _match("m4", "Galatasaray", "Besiktas", 90),
+]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def session_factory(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'matches.db'}")
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    monkeypatch.setattr(models, "SessionLocal", factory)
+    yield factory
+    engine.dispose()
+
+
+class TestLookups:
+    @pytest.fixture
+    def index(self):
+        return UpcomingMatchIndex(loader=lambda: list(MATCHES))
+
+    def test_find_team_by_name_and_alias(self, index):
+        assert [m.id for m in index.find_team("Galatasaray")] == ["m1", "m4"]
+        assert [m.id for m in index.find_team("cimbom")] == ["m1", "m4"]
+        assert [m.id for m in index.find_team("  FENERBAHÇE ")] == ["m1"]
+        assert index.find_team("Benfica") == []
+
+    def test_windows_accept_aware_datetimes(self, index):
+        aware_now = datetime.now(timezone(timedelta(hours=3)))
+
+        assert [
+            m.id for m in index.find_team("Galatasaray", end=aware_now + timedelta(hours=48))
+        ] == ["m1"]
+        assert [m.id for m in index.upcoming(start=NOW + timedelta(hours=20))] == ["m1", "m3", "m4"]
+        assert [m.id for m in index.upcoming(NOW, NOW + timedelta(hours=40))] == ["m2", "m1"]
+
+    def test_league_id_and_team_names(self, index):
+        assert [m.id for m in index.upcoming(league="soccer_turkey_super_league")] == [
+            "m2",
+            "m1",
+            "m4",
+        ]
+        assert index.upcoming(league="soccer_epl") == []
+        assert index.get("m3").home_team == "Flamengo"
+        assert index.get("missing") is None
+        assert index.team_names(NOW, NOW + timedelta(hours=40)) == {
+            "Besiktas",
+            "Trabzonspor",
+            "Galatasaray",
+            "Fenerbahce",
+        }
+        assert len(index) == 4
+
+    def test_substring_rule_of_the_old_queries(self, index):
+        # Name contained in a team, team contained in the name, and aliases
+        assert [m.id for m in index.find_team_substring("Galata")] == ["m1", "m4"]
+        assert [m.id for m in index.find_team_substring("Besiktas JK")] == ["m2", "m4"]
+        assert [m.id for m in index.find_team_substring("Kanarya")] == ["m1"]
+        assert index.find_team_substring("   ") == []
+
+
+class TestRefresh:
+    def test_reloads_after_ttl(self):
+        clock = FakeClock()
+        loads = []
+
+        def loader():
+            loads.append(clock.now)
+            return list(MATCHES[: len(loads)])
+
+        index = UpcomingMatchIndex(loader=loader, refresh_seconds=300, clock=clock)
+        assert len(index) == 1
+        clock.now = 299
+        assert len(index) == 1
+        clock.now = 300
+        assert len(index) == 2
+        assert loads == [0, 300]
+
+    def test_invalidate_reloads_on_next_lookup(self):
+        matches = [MATCHES[0]]
+        index = UpcomingMatchIndex(loader=lambda: list(matches), clock=FakeClock())
+        assert index.get("m2") is None
+
+        matches.append(MATCHES[1])
+        index.invalidate()
+
+        assert index.get("m2") is not None
+        assert index.get_stats()["loads"] == 2
+
+    def test_failed_load_keeps_snapshot_and_retries(self):
+        clock = FakeClock()
+        state = {"fail": False, "calls": 0}
+
+        def loader():
+            state["calls"] += 1
+            if state["fail"]:
+                raise RuntimeError("database is locked")
+            return list(MATCHES)
+
+        index = UpcomingMatchIndex(
+            loader=loader, refresh_seconds=300, retry_seconds=30, clock=clock
+        )
+        assert len(index) == 4
+
+        state["fail"] = True
+        clock.now = 300
+        assert len(index) == 4  # previous snapshot served
+        clock.now = 310
+        assert len(index) == 4
+        assert state["calls"] == 2  # no retry before retry_seconds
+
+        state["fail"] = False
+        clock.now = 330
+        assert len(index) == 4
+        assert state["calls"] == 3
+        assert index.get_stats()["load_failures"] == 1
+
+    def test_invalidation_during_load_stays_stale(self):
+        calls = []
+
+        def loader():
+            calls.append(1)
+            if len(calls) == 1:
+                index.invalidate()  # fixtures written while we were reading
+            return list(MATCHES)
+
+        index = UpcomingMatchIndex(loader=loader, clock=FakeClock())
+        len(index)
+        len(index)
+
+        assert len(calls) == 2
+
+    def test_shared_invalidate_is_noop_before_first_use(self, monkeypatch):
+        monkeypatch.setattr(match_index, "_upcoming_match_index", None)
+        match_index.invalidate_upcoming_match_index()
+
+        assert match_index._upcoming_match_index is None
+
+
+class TestLoadUpcomingMatches:
+    def test_loads_horizon_only(self, session_factory):
+        with session_factory() as db:
+            for match_id, hours in (("past", -2), ("soon", 5), ("later", 200)):
+                db.add(
+                    Match(
+                        id=match_id,
+                        league="soccer_epl",
+                        home_team=f"Home {match_id}",
+                        away_team=f"Away {match_id}",
+                        start_time=NOW + timedelta(hours=hours),
+                        current_draw_odd=3.2,
+                    )
+                )
+            db.commit()
+
+        matches = load_upcoming_matches(horizon_hours=96)
+
+        assert [m.id for m in matches] == ["soon"]
+        assert matches[0].current_draw_odd == 3.2
+        assert matches[0].start_time.tzinfo is None
+
+
+class TestTelegramTimeGate:
+    def test_has_upcoming_match_uses_index(self, monkeypatch):
+        from src.ingestion import league_manager
+        from src.processing import telegram_listener
+
+        index = UpcomingMatchIndex(
+            loader=lambda: [
+                _match("far", "Galatasaray", "Konyaspor", 80),
+                _match("br", "Gala FC", "Santos", 20, league="soccer_brazil_campeonato"),
+                _match("tr", "Galatasaray", "Fenerbahce", 30),
+            ]
+        )
+        monkeypatch.setattr(telegram_listener, "get_upcoming_match_index", lambda: index)
+        monkeypatch.setattr(
+            league_manager,
+            "is_in_active_scope",
+            lambda league: league == "soccer_turkey_super_league",
+        )
+
+        found, match = telegram_listener.has_upcoming_match("Gala", lookahead_hours=72)
+
+        assert found and match.id == "tr"  # "br" is out of scope, "far" out of window
+        assert telegram_listener.has_upcoming_match("Benfica") == (False, None)
+
+
+@pytest.mark.performance
+class TestUpcomingMatchIndexBenchmark:
+    """Benchmark: 400 upcoming matches, 30 candidate team names from one message."""
+
+    def test_benchmark_per_name_query_vs_index(self, session_factory):
+        with session_factory() as db:
+            for i in range(400):
+                db.add(
+                    Match(
+                        id=f"m{i}",
+                        league="soccer_turkey_super_league",
+                        home_team=f"Home Team {i}",
+                        away_team=f"Away Team {i}",
+                        start_time=NOW + timedelta(hours=1 + i % 90),
+                    )
+                )
+            db.commit()
+        names = [f"Candidate {i}" for i in range(29)] + ["Home Team 7"]
+        window = (NOW + timedelta(hours=2), NOW + timedelta(hours=72))
+
+        # Pre-V12.7 has_upcoming_match(): one query per name, substring check in Python
+        def per_name_query():
+            found = 0
+            for name in names:
+                with models.get_db_session() as db:
+                    rows = (
+                        db.query(Match)
+                        .filter(Match.start_time >= window[0], Match.start_time <= window[1])
+                        .all()
+                    )
+                    found += any(
+                        name.lower() in m.home_team.lower() or name.lower() in m.away_team.lower()
+                        for m in rows
+                    )
+            return found
+
+        start = time.perf_counter()
+        query_found = per_name_query()
+        query_s = time.perf_counter() - start
+
+        index = UpcomingMatchIndex()
+        start = time.perf_counter()
+        index_found = sum(bool(index.find_team_substring(name, *window)) for name in names)
+        first_s = time.perf_counter() - start  # includes the one snapshot load
+        start = time.perf_counter()
+        for name in names:
+            index.find_team_substring(name, *window)
+        warm_s = time.perf_counter() - start
+
+        print(
+            f"\n📊 30 names / 400 matches: per-name query={query_s * 1000:.1f}ms, "
+            f"index first message={first_s * 1000:.1f}ms (1 load), "
+            f"warm={warm_s * 1000:.2f}ms ({query_s / warm_s:.0f}x)"
+        )
+        assert query_found == index_found == 1
+        assert first_s < query_s / 5
+        assert warm_s < query_s / 20